@@ -21,7 +21,10 @@ from app.infrastructure.persistence.base import Base
 # Importar todos los modelos para que Base.metadata los reconozca
 from app.infrastructure.persistence.models import (
     user_model, project_model, ctf_model, writeup_model, 
-    attachment_model, contact_model, flag_submission_model
+    attachment_model, contact_model, flag_submission_model,
+    ctf_stats_model, ctf_search_model, ctf_skill_model, ctf_solve_model,
+    user_score_model, flag_submission_repeat_model, user_score_history_model,
+    ctf_neighbour_model, ctf_analytics_model
 )
 
 # Sobrescribir la URL de la base de datos con la de la configuración
@@ -0,0 +1,44 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: 3b9d2c4e7a10
+Revises: e2f72b1ae5f3
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9d2c4e7a10'
+down_revision: Union[str, None] = 'e2f72b1ae5f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_ctfs_status_created_at_id', 'ctfs', ['status', 'created_at', 'id'])
+    op.create_index('ix_ctfs_created_at_id', 'ctfs', ['created_at', 'id'])
+    op.create_index('ix_writeups_status_created_at_id', 'writeups', ['status', 'created_at', 'id'])
+    op.create_index('ix_writeups_created_at_id', 'writeups', ['created_at', 'id'])
+    op.create_index('ix_projects_status_order_id', 'projects', ['status', 'order', 'id'])
+    op.create_index('ix_projects_order_id', 'projects', ['order', 'id'])
+    op.create_index('ix_contacts_status_created_at_id', 'contacts', ['status', 'created_at', 'id'])
+    op.create_index('ix_contacts_created_at_id', 'contacts', ['created_at', 'id'])
+    op.create_index('ix_flag_submissions_ctf_submitted_at_id', 'flag_submissions', ['ctf_id', 'submitted_at', 'id'])
+    op.create_index('ix_flag_submissions_user_submitted_at_id', 'flag_submissions', ['user_id', 'submitted_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_flag_submissions_user_submitted_at_id', table_name='flag_submissions')
+    op.drop_index('ix_flag_submissions_ctf_submitted_at_id', table_name='flag_submissions')
+    op.drop_index('ix_contacts_created_at_id', table_name='contacts')
+    op.drop_index('ix_contacts_status_created_at_id', table_name='contacts')
+    op.drop_index('ix_projects_order_id', table_name='projects')
+    op.drop_index('ix_projects_status_order_id', table_name='projects')
+    op.drop_index('ix_writeups_created_at_id', table_name='writeups')
+    op.drop_index('ix_writeups_status_created_at_id', table_name='writeups')
+    op.drop_index('ix_ctfs_created_at_id', table_name='ctfs')
+    op.drop_index('ix_ctfs_status_created_at_id', table_name='ctfs')
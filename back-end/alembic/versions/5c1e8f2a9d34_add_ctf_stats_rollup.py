@@ -0,0 +1,38 @@
+"""add_ctf_stats_rollup
+
+Revision ID: 5c1e8f2a9d34
+Revises: 3b9d2c4e7a10
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e8f2a9d34'
+down_revision: Union[str, None] = '3b9d2c4e7a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # La fila se reconstruye en la primera lectura o escritura
+    op.create_table('ctf_stats',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.Column('solved', sa.Integer(), nullable=False),
+    sa.Column('total_points', sa.Integer(), nullable=False),
+    sa.Column('earned_points', sa.Integer(), nullable=False),
+    sa.Column('by_level', sa.Text(), nullable=True),
+    sa.Column('by_category', sa.Text(), nullable=True),
+    sa.Column('by_platform', sa.Text(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('ctf_stats')
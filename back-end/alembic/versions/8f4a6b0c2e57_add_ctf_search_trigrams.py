@@ -0,0 +1,58 @@
+"""add_ctf_search_trigrams
+
+Revision ID: 8f4a6b0c2e57
+Revises: 5c1e8f2a9d34
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.infrastructure.persistence.ctf_search import document_trigrams
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f4a6b0c2e57'
+down_revision: Union[str, None] = '5c1e8f2a9d34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    trigrams_table = op.create_table('ctf_search_trigrams',
+    sa.Column('ctf_id', sa.CHAR(length=36), nullable=False),
+    sa.Column('field', sa.String(length=16), nullable=False),
+    sa.Column('trigram', sa.String(length=3), nullable=False),
+    sa.ForeignKeyConstraint(['ctf_id'], ['ctfs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('ctf_id', 'field', 'trigram')
+    )
+    op.create_index('ix_ctf_search_trigrams_trigram', 'ctf_search_trigrams', ['trigram', 'ctf_id', 'field'])
+
+    # Indexar los CTFs existentes
+    ctfs = sa.table('ctfs',
+        sa.column('id', sa.CHAR(36)),
+        sa.column('title', sa.String),
+        sa.column('skills', sa.Text),
+        sa.column('platform', sa.String),
+        sa.column('description', sa.Text),
+    )
+    bind = op.get_bind()
+    for ctf_id, title, skills, platform, description in bind.execute(
+        sa.select(ctfs.c.id, ctfs.c.title, ctfs.c.skills, ctfs.c.platform, ctfs.c.description)
+    ):
+        grams = document_trigrams(title, json.loads(skills) if skills else [], platform, description)
+        rows = [
+            {'ctf_id': ctf_id, 'field': field, 'trigram': trigram}
+            for field, values in grams.items()
+            for trigram in values
+        ]
+        if rows:
+            op.bulk_insert(trigrams_table, rows)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ctf_search_trigrams_trigram', table_name='ctf_search_trigrams')
+    op.drop_table('ctf_search_trigrams')
@@ -0,0 +1,48 @@
+"""add_ctf_skills
+
+Revision ID: a6d3e9b1f472
+Revises: 8f4a6b0c2e57
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d3e9b1f472'
+down_revision: Union[str, None] = '8f4a6b0c2e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    skills_table = op.create_table('ctf_skills',
+    sa.Column('ctf_id', sa.CHAR(length=36), nullable=False),
+    sa.Column('skill', sa.String(length=100), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.ForeignKeyConstraint(['ctf_id'], ['ctfs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('ctf_id', 'skill')
+    )
+    op.create_index('ix_ctf_skills_skill_ctf_id', 'ctf_skills', ['skill', 'ctf_id'])
+
+    # Backfill desde la columna JSON ctfs.skills
+    ctfs = sa.table('ctfs', sa.column('id', sa.CHAR(36)), sa.column('skills', sa.Text))
+    rows = []
+    for ctf_id, skills in op.get_bind().execute(sa.select(ctfs.c.id, ctfs.c.skills)):
+        seen = set()
+        for name in json.loads(skills) if skills else []:
+            key = name.strip().lower()[:100]
+            if key and key not in seen:
+                seen.add(key)
+                rows.append({'ctf_id': ctf_id, 'skill': key, 'name': name.strip()[:100]})
+    if rows:
+        op.bulk_insert(skills_table, rows)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ctf_skills_skill_ctf_id', table_name='ctf_skills')
+    op.drop_table('ctf_skills')
@@ -0,0 +1,27 @@
+"""add_ctf_solves_solved_at_index
+
+Revision ID: a8e3f0c6d512
+Revises: f5c3a8d1e247
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8e3f0c6d512'
+down_revision: Union[str, None] = 'f5c3a8d1e247'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lectura de solves recientes del feed en vivo
+    op.create_index('ix_ctf_solves_solved_at', 'ctf_solves', ['solved_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ctf_solves_solved_at', table_name='ctf_solves')
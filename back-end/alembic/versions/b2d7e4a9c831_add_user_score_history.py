@@ -0,0 +1,57 @@
+"""add_user_score_history
+
+Revision ID: b2d7e4a9c831
+Revises: a8e3f0c6d512
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d7e4a9c831'
+down_revision: Union[str, None] = 'a8e3f0c6d512'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    history_table = op.create_table('user_score_history',
+    sa.Column('user_id', sa.CHAR(length=36), nullable=False),
+    sa.Column('bucket_start', sa.DateTime(), nullable=False),
+    sa.Column('total_points', sa.Integer(), nullable=False),
+    sa.Column('solved_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'bucket_start')
+    )
+
+    # Backfill: puntuación acumulada de cada usuario al cierre de cada hora con solves
+    solves = sa.table('ctf_solves', sa.column('ctf_id', sa.CHAR(36)),
+                      sa.column('user_id', sa.CHAR(36)), sa.column('solved_at', sa.DateTime))
+    ctfs = sa.table('ctfs', sa.column('id', sa.CHAR(36)), sa.column('points', sa.Integer))
+    rows = {}
+    totals = {}
+    for user_id, solved_at, points in op.get_bind().execute(
+        sa.select(solves.c.user_id, solves.c.solved_at, ctfs.c.points)
+        .select_from(solves.join(ctfs, ctfs.c.id == solves.c.ctf_id))
+        .where(solves.c.solved_at.isnot(None))
+        .order_by(solves.c.user_id, solves.c.solved_at)
+    ):
+        total, solved = totals.get(user_id, (0, 0))
+        totals[user_id] = (total + (points or 0), solved + 1)
+        hour = solved_at.replace(minute=0, second=0, microsecond=0)
+        rows[(user_id, hour)] = {
+            'user_id': user_id,
+            'bucket_start': hour,
+            'total_points': totals[user_id][0],
+            'solved_count': totals[user_id][1],
+        }
+    if rows:
+        op.bulk_insert(history_table, list(rows.values()))
+
+
+def downgrade() -> None:
+    op.drop_table('user_score_history')
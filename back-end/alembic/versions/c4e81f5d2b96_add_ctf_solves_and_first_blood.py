@@ -0,0 +1,66 @@
+"""add_ctf_solves_and_first_blood
+
+Revision ID: c4e81f5d2b96
+Revises: a6d3e9b1f472
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e81f5d2b96'
+down_revision: Union[str, None] = 'a6d3e9b1f472'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('ctf_solves',
+    sa.Column('ctf_id', sa.CHAR(length=36), nullable=False),
+    sa.Column('user_id', sa.CHAR(length=36), nullable=False),
+    sa.Column('solved_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['ctf_id'], ['ctfs.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('ctf_id', 'user_id')
+    )
+    op.create_index('ix_ctf_solves_user_solved_at', 'ctf_solves', ['user_id', 'solved_at'])
+
+    op.add_column('ctfs', sa.Column('first_blood_user_id', sa.CHAR(length=36), nullable=True))
+    op.add_column('ctfs', sa.Column('first_blood_at', sa.DateTime(), nullable=True))
+    op.create_foreign_key(
+        'fk_ctfs_first_blood_user_id_users', 'ctfs', 'users',
+        ['first_blood_user_id'], ['id'], ondelete='SET NULL',
+    )
+
+    # Backfill: primer acierto de cada usuario por CTF
+    op.execute(
+        "INSERT INTO ctf_solves (ctf_id, user_id, solved_at) "
+        "SELECT ctf_id, user_id, MIN(submitted_at) FROM flag_submissions "
+        "WHERE is_correct = 1 AND user_id IS NOT NULL AND submitted_at IS NOT NULL "
+        "GROUP BY ctf_id, user_id"
+    )
+    # solved_count pasa a ser el número de solves y el first blood el más antiguo
+    op.execute(
+        "UPDATE ctfs SET "
+        "solved_count = (SELECT COUNT(*) FROM ctf_solves s WHERE s.ctf_id = ctfs.id), "
+        "first_blood_at = (SELECT MIN(s.solved_at) FROM ctf_solves s WHERE s.ctf_id = ctfs.id)"
+    )
+    op.execute(
+        "UPDATE ctfs SET first_blood_user_id = ("
+        "SELECT MIN(s.user_id) FROM ctf_solves s "
+        "WHERE s.ctf_id = ctfs.id AND s.solved_at = ctfs.first_blood_at"
+        ") WHERE first_blood_at IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('fk_ctfs_first_blood_user_id_users', 'ctfs', type_='foreignkey')
+    op.drop_column('ctfs', 'first_blood_at')
+    op.drop_column('ctfs', 'first_blood_user_id')
+
+    op.drop_index('ix_ctf_solves_user_solved_at', table_name='ctf_solves')
+    op.drop_table('ctf_solves')
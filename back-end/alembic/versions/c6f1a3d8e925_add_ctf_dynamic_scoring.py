@@ -0,0 +1,32 @@
+"""add_ctf_dynamic_scoring
+
+Revision ID: c6f1a3d8e925
+Revises: b2d7e4a9c831
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6f1a3d8e925'
+down_revision: Union[str, None] = 'b2d7e4a9c831'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('ctfs', sa.Column('dynamic_scoring', sa.Boolean(), nullable=True))
+    op.add_column('ctfs', sa.Column('initial_points', sa.Integer(), nullable=True))
+    op.add_column('ctfs', sa.Column('minimum_points', sa.Integer(), nullable=True))
+    op.add_column('ctfs', sa.Column('decay_solves', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('ctfs', 'decay_solves')
+    op.drop_column('ctfs', 'minimum_points')
+    op.drop_column('ctfs', 'initial_points')
+    op.drop_column('ctfs', 'dynamic_scoring')
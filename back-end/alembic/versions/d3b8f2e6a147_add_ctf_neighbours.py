@@ -0,0 +1,35 @@
+"""add_ctf_neighbours
+
+Revision ID: d3b8f2e6a147
+Revises: c6f1a3d8e925
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3b8f2e6a147'
+down_revision: Union[str, None] = 'c6f1a3d8e925'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('ctf_neighbours',
+    sa.Column('ctf_id', sa.CHAR(length=36), nullable=False),
+    sa.Column('rank', sa.Integer(), nullable=False),
+    sa.Column('neighbour_id', sa.CHAR(length=36), nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.Column('computed_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['ctf_id'], ['ctfs.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['neighbour_id'], ['ctfs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('ctf_id', 'rank')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('ctf_neighbours')
@@ -0,0 +1,43 @@
+"""add_user_scores
+
+Revision ID: d7a2c9e4f318
+Revises: c4e81f5d2b96
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a2c9e4f318'
+down_revision: Union[str, None] = 'c4e81f5d2b96'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('user_scores',
+    sa.Column('user_id', sa.CHAR(length=36), nullable=False),
+    sa.Column('total_points', sa.Integer(), nullable=False),
+    sa.Column('solved_count', sa.Integer(), nullable=False),
+    sa.Column('last_solve_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_index('ix_user_scores_points_last_solve', 'user_scores', ['total_points', 'last_solve_at'])
+
+    # Backfill desde los solves existentes
+    op.execute(
+        "INSERT INTO user_scores (user_id, total_points, solved_count, last_solve_at) "
+        "SELECT s.user_id, COALESCE(SUM(c.points), 0), COUNT(*), MAX(s.solved_at) "
+        "FROM ctf_solves s JOIN ctfs c ON c.id = s.ctf_id "
+        "GROUP BY s.user_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_scores_points_last_solve', table_name='user_scores')
+    op.drop_table('user_scores')
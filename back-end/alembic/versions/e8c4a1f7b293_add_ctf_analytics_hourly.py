@@ -0,0 +1,37 @@
+"""add_ctf_analytics_hourly
+
+Revision ID: e8c4a1f7b293
+Revises: d3b8f2e6a147
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8c4a1f7b293'
+down_revision: Union[str, None] = 'd3b8f2e6a147'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('ctf_analytics_hourly',
+    sa.Column('ctf_id', sa.CHAR(length=36), nullable=False),
+    sa.Column('bucket_start', sa.DateTime(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('attempters', sa.Integer(), nullable=False),
+    sa.Column('new_attempters', sa.Integer(), nullable=False),
+    sa.Column('solves', sa.Integer(), nullable=False),
+    sa.Column('median_attempts_to_solve', sa.Float(), nullable=True),
+    sa.Column('median_seconds_to_solve', sa.Float(), nullable=True),
+    sa.ForeignKeyConstraint(['ctf_id'], ['ctfs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('ctf_id', 'bucket_start')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('ctf_analytics_hourly')
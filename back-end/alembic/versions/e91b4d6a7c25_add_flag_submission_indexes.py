@@ -0,0 +1,29 @@
+"""add_flag_submission_indexes
+
+Revision ID: e91b4d6a7c25
+Revises: d7a2c9e4f318
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e91b4d6a7c25'
+down_revision: Union[str, None] = 'd7a2c9e4f318'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (user_id, submitted_at) ya lo cubre ix_flag_submissions_user_submitted_at_id
+    op.create_index('ix_flag_submissions_ctf_correct_user', 'flag_submissions', ['ctf_id', 'is_correct', 'user_id'])
+    op.create_index('ix_flag_submissions_submitted_at', 'flag_submissions', ['submitted_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_flag_submissions_submitted_at', table_name='flag_submissions')
+    op.drop_index('ix_flag_submissions_ctf_correct_user', table_name='flag_submissions')
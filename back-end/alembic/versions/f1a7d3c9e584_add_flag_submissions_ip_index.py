@@ -0,0 +1,27 @@
+"""add_flag_submissions_ip_index
+
+Revision ID: f1a7d3c9e584
+Revises: e8c4a1f7b293
+Create Date: 2026-10-19 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a7d3c9e584'
+down_revision: Union[str, None] = 'e8c4a1f7b293'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Auditoría y exportación de intentos por IP
+    op.create_index('ix_flag_submissions_ip_submitted_at', 'flag_submissions', ['ip_address', 'submitted_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_flag_submissions_ip_submitted_at', table_name='flag_submissions')
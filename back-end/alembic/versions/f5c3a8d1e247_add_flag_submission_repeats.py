@@ -0,0 +1,37 @@
+"""add_flag_submission_repeats
+
+Revision ID: f5c3a8d1e247
+Revises: e91b4d6a7c25
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5c3a8d1e247'
+down_revision: Union[str, None] = 'e91b4d6a7c25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('flag_submission_repeats',
+    sa.Column('principal', sa.String(length=64), nullable=False),
+    sa.Column('ctf_id', sa.CHAR(length=36), nullable=False),
+    sa.Column('flag', sa.CHAR(length=64), nullable=False),
+    sa.Column('user_id', sa.CHAR(length=36), nullable=True),
+    sa.Column('ip_address', sa.String(length=45), nullable=True),
+    sa.Column('repeat_count', sa.Integer(), nullable=False),
+    sa.Column('last_repeat_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['ctf_id'], ['ctfs.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('principal', 'ctf_id', 'flag')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('flag_submission_repeats')
@@ -3,14 +3,16 @@ Dependencias de la capa API.
 Inyección de dependencias para FastAPI.
 """
 
-from typing import Generator, Optional
+from typing import Callable, Generator, Iterable, Iterator, Optional
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
-from ..core.database import get_db
+from ..core.config import settings
+from ..core.database import SessionLocal, get_db
+from ..core.submission_throttle import ThrottleKey, submission_throttle
 from ..domain.entities.user import User
 from ..domain.repositories.ctf_repo import CTFRepository
 from ..domain.repositories.writeup_repo import WriteupRepository
@@ -24,9 +26,13 @@ from ..domain.services.writeup_service import WriteupService
 from ..domain.services.auth_service import AuthService
 from ..domain.services.project_service import ProjectService
 from ..domain.services.flag_service import FlagService
+from ..domain.services.principal_cache import principal_cache
+from ..domain.services.submission_cache import submission_cache
 from ..domain.services.contact_service import ContactService
 from ..domain.services.attachment_service import AttachmentService
 from ..domain.services.portfolio_service import PortfolioService
+from ..application.use_cases.bulk_catalog import ExportCatalogUseCase
+from ..application.use_cases.export_submissions import ExportSubmissionsUseCase
 from ..infrastructure.persistence.repositories import (
     CTFSqlRepository,
     WriteupSqlRepository,
@@ -36,6 +42,10 @@ from ..infrastructure.persistence.repositories import (
     ContactSqlRepository,
     FlagSubmissionSqlRepository,
 )
+from ..infrastructure.archive import SubmissionArchive, submission_archive
+from ..infrastructure.catalog import CTFCatalogSnapshot, ctf_catalog
+from ..infrastructure.events import LiveFeed, live_feed
+from ..infrastructure.persistence.submission_journal import submission_journal
 from ..infrastructure.storage.local_storage import FileSystemStorage
 from ..domain.services.storage_service import StorageService
 from ..infrastructure.security.jwt_provider import JWTProvider
@@ -78,6 +88,22 @@ def get_writeup_repository(db: Session = Depends(get_db)) -> WriteupRepository:
     return WriteupSqlRepository(db)
 
 
+def get_ctf_catalog(
+    ctf_repo: CTFRepository = Depends(get_ctf_repository),
+    writeup_repo: WriteupRepository = Depends(get_writeup_repository),
+) -> Optional[CTFCatalogSnapshot]:
+    """
+    Obtiene la instantánea vigente del catálogo de CTFs en memoria.
+    
+    Devuelve None si CTF_CATALOG_INDEX_ENABLED está desactivado.
+    """
+    if not settings.CTF_CATALOG_INDEX_ENABLED:
+        return None
+    return ctf_catalog.snapshot(
+        lambda: (ctf_repo.get_catalog_rows(), writeup_repo.get_ctf_ids_with_writeup())
+    )
+
+
 def get_attachment_repository(db: Session = Depends(get_db)) -> AttachmentRepository:
     """Obtiene el repositorio de attachments."""
     return AttachmentSqlRepository(db)
@@ -89,8 +115,73 @@ def get_contact_repository(db: Session = Depends(get_db)) -> ContactRepository:
 
 
 def get_flag_submission_repository(db: Session = Depends(get_db)) -> FlagSubmissionRepository:
-    """Obtiene el repositorio de flag submissions."""
-    return FlagSubmissionSqlRepository(db)
+    """Obtiene el repositorio de flag submissions (con el diario de intentos si está activo)."""
+    journal = submission_journal if settings.FLAG_SUBMISSION_JOURNAL_ENABLED else None
+    return FlagSubmissionSqlRepository(db, journal=journal)
+
+
+def get_submission_archive() -> SubmissionArchive:
+    """Obtiene el archivo en disco de envíos antiguos."""
+    return submission_archive
+
+
+def get_live_feed() -> LiveFeed:
+    """Obtiene el feed en vivo del ranking y de los solves."""
+    return live_feed
+
+
+def get_session_factory() -> Callable[[], Session]:
+    """
+    Obtiene la factoría de sesiones para respuestas en streaming.
+    
+    La sesión de ``get_db`` se cierra antes de enviar el cuerpo de un
+    StreamingResponse, así que el generador abre y cierra la suya.
+    """
+    return SessionLocal
+
+
+def get_catalog_exporter(
+    session_factory: Callable[[], Session] = Depends(get_session_factory),
+) -> Callable[[Iterable[str]], Iterator[str]]:
+    """Obtiene un generador de la exportación JSONL del catálogo con sesión propia."""
+    def export(types: Iterable[str]) -> Iterator[str]:
+        db = session_factory()
+        try:
+            use_case = ExportCatalogUseCase(
+                CTFSqlRepository(db),
+                WriteupSqlRepository(db),
+                AttachmentSqlRepository(db),
+            )
+            yield from use_case.execute(types)
+        finally:
+            db.close()
+    return export
+
+
+def get_submission_exporter(
+    session_factory: Callable[[], Session] = Depends(get_session_factory),
+) -> Callable[..., Iterator[str]]:
+    """
+    Obtiene la exportación en streaming de intentos de flag con sesión propia.
+    
+    Los errores de parámetros (p. ej. formato desconocido) se lanzan al
+    llamar, antes de empezar la respuesta.
+    """
+    def export(format: str, **filters) -> Iterator[str]:
+        db = session_factory()
+        try:
+            chunks = ExportSubmissionsUseCase(FlagSubmissionSqlRepository(db)).execute(format, **filters)
+        except Exception:
+            db.close()
+            raise
+        
+        def stream() -> Iterator[str]:
+            try:
+                yield from chunks
+            finally:
+                db.close()
+        return stream()
+    return export
 
 
 # Service dependencies
@@ -127,8 +218,9 @@ def get_flag_service(
     ctf_repo: CTFRepository = Depends(get_ctf_repository),
     flag_submission_repo: FlagSubmissionRepository = Depends(get_flag_submission_repository),
 ) -> FlagService:
-    """Obtiene el servicio de flags."""
-    return FlagService(ctf_repo, flag_submission_repo)
+    """Obtiene el servicio de flags (con la caché de intentos repetidos si está activa)."""
+    cache = submission_cache if settings.FLAG_SUBMISSION_CACHE_ENABLED else None
+    return FlagService(ctf_repo, flag_submission_repo, submission_cache=cache)
 
 
 def get_contact_service(
@@ -182,6 +274,11 @@ async def get_current_user(
     1. Cookie HttpOnly (preferido para navegadores)
     2. Bearer token en header (para APIs externas/móviles)
     
+    El usuario verificado se guarda unos segundos en ``principal_cache``
+    por (usuario, token); en los aciertos de caché no se consulta la base
+    de datos y el usuario devuelto no trae ``hashed_password`` (si se
+    guarda, ``UserSqlRepository.save`` conserva el hash almacenado).
+    
     Raises:
         HTTPException: Si el token es inválido o el usuario no existe.
     """
@@ -210,6 +307,10 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    principal = principal_cache.get(token_data.user_id, token)
+    if principal is not None:
+        return principal.to_user()
+    
     user = user_repo.get_by_id(UUID(token_data.user_id))
     
     if not user:
@@ -225,6 +326,7 @@ async def get_current_user(
             detail="User is inactive",
         )
     
+    principal_cache.put(token, user)
     return user
 
 
@@ -249,6 +351,45 @@ async def get_current_user_optional(
         return None
 
 
+def check_submission_throttle(
+    ctf_id: UUID,
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    jwt_provider: JWTProvider = Depends(get_jwt_provider),
+) -> Optional[ThrottleKey]:
+    """
+    Aplica el throttle de envíos de flags antes de tocar la base de datos.
+    
+    La identidad sale de la firma del token (sin cargar el usuario) o de
+    la IP. Devuelve la clave con la que registrar el resultado, o None si
+    el throttle está desactivado.
+    
+    Raises:
+        HTTPException: 429 con ``Retry-After`` si la clave está en backoff.
+    """
+    if not settings.FLAG_THROTTLE_ENABLED:
+        return None
+    
+    token = request.cookies.get("access_token")
+    if not token and credentials:
+        token = credentials.credentials
+    token_data = jwt_provider.verify_access_token(token) if token else None
+    
+    key = submission_throttle.key(
+        ctf_id,
+        user_id=token_data.user_id if token_data else None,
+        ip_address=request.client.host if request.client else None,
+    )
+    retry_after = submission_throttle.check(key)
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Demasiados intentos fallidos en este reto. Espera antes de reintentar.",
+            headers={"Retry-After": str(retry_after)},
+        )
+    return key
+
+
 async def get_current_admin(
     current_user: User = Depends(get_current_user),
 ) -> User:
@@ -0,0 +1,84 @@
+"""
+Router de importación/exportación masiva del catálogo (solo admin).
+"""
+
+from typing import AsyncIterator, Callable, Iterable, Iterator, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from ...application.dto.bulk_dto import BulkImportReportDTO
+from ...application.use_cases.bulk_catalog import RECORD_KINDS, ImportCatalogUseCase
+from ...domain.entities.user import User
+from ...domain.repositories.attachment_repo import AttachmentRepository
+from ...domain.repositories.ctf_repo import CTFRepository
+from ...domain.repositories.writeup_repo import WriteupRepository
+from ...domain.services.ctf_service import CTFService
+from ..dependencies import (
+    get_attachment_repository,
+    get_catalog_exporter,
+    get_ctf_repository,
+    get_ctf_service,
+    get_current_admin,
+    get_writeup_repository,
+)
+
+router = APIRouter(prefix="/admin/catalog", tags=["Admin"])
+
+
+async def _request_lines(request: Request) -> AsyncIterator[bytes]:
+    """Divide el cuerpo de la petición en líneas sin cargarlo entero."""
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
+
+
+@router.get("/export")
+async def export_catalog(
+    types: Optional[str] = Query(None, description="Tipos separados por coma: ctf,attachment,writeup"),
+    exporter: Callable[[Iterable[str]], Iterator[str]] = Depends(get_catalog_exporter),
+    current_user: User = Depends(get_current_admin),
+):
+    """Exporta CTFs, adjuntos y writeups como JSONL en streaming (solo admin)."""
+    selected = [t.strip() for t in types.split(",") if t.strip()] if types else list(RECORD_KINDS)
+    unknown = set(selected) - set(RECORD_KINDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown record kinds: {sorted(unknown)}",
+        )
+
+    return StreamingResponse(
+        exporter(selected),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="catalog.jsonl"'},
+    )
+
+
+@router.post("/import", response_model=BulkImportReportDTO)
+async def import_catalog(
+    request: Request,
+    batch_size: int = Query(100, ge=1, le=5000),
+    ctf_repo: CTFRepository = Depends(get_ctf_repository),
+    writeup_repo: WriteupRepository = Depends(get_writeup_repository),
+    attachment_repo: AttachmentRepository = Depends(get_attachment_repository),
+    ctf_service: CTFService = Depends(get_ctf_service),
+    current_user: User = Depends(get_current_admin),
+):
+    """
+    Importa un cuerpo JSONL (upsert por ID) en lotes de ``batch_size`` (solo admin).
+
+    Las líneas inválidas se reportan con su número y no abortan la importación.
+    """
+    use_case = ImportCatalogUseCase(
+        ctf_repo, writeup_repo, attachment_repo, ctf_service, batch_size=batch_size
+    )
+    importer = use_case.start(user_id=current_user.id)
+    async for line in _request_lines(request):
+        importer.feed(line)
+    return importer.finish()
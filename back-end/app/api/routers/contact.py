@@ -13,6 +13,7 @@ from ...application.dto.contact_dto import (
 )
 from ...domain.entities.contact import ContactStatus
 from ...domain.services.contact_service import ContactService
+from ...core.pagination import parse_cursor, split_page
 from ..dependencies import get_contact_service, get_current_admin
 
 
@@ -78,6 +79,7 @@ async def list_contact_messages(
     status_filter: Optional[str] = None,
     skip: int = 0,
     limit: int = 20,
+    cursor: Optional[str] = None,
     contact_service: ContactService = Depends(get_contact_service),
 ) -> ContactListResponseDTO:
     """
@@ -86,6 +88,7 @@ async def list_contact_messages(
     - **status_filter**: Filtrar por estado (pending, read, replied)
     - **skip**: Número de registros a omitir
     - **limit**: Número máximo de registros
+    - **cursor**: Cursor opaco (`next_cursor`) de la página anterior; si se indica, se ignora `skip`
     """
     contact_status = None
     if status_filter:
@@ -97,12 +100,22 @@ async def list_contact_messages(
                 detail=f"Estado inválido: {status_filter}",
             )
     
-    contacts = contact_service.contact_repo.get_all(
+    try:
+        cursor_pos = parse_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    
+    contacts = contact_service.contact_repository.get_all(
         status=contact_status,
         skip=skip,
-        limit=limit,
+        limit=limit + 1,
+        cursor=cursor_pos,
     )
-    total = contact_service.contact_repo.count(status=contact_status)
+    contacts, next_cursor = split_page(contacts, limit, "created_at")
+    total = contact_service.contact_repository.count(status=contact_status)
     
     return ContactListResponseDTO(
         items=[
@@ -122,6 +135,7 @@ async def list_contact_messages(
         total=total,
         skip=skip,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -152,7 +166,7 @@ async def get_contact_message(
     """
     Obtiene un mensaje de contacto por su ID (solo admin).
     """
-    contact = contact_service.contact_repo.get_by_id(contact_id)
+    contact = contact_service.contact_repository.get_by_id(contact_id)
     if not contact:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -251,7 +265,7 @@ async def delete_contact_message(
     """
     Elimina un mensaje de contacto (solo admin).
     """
-    deleted = contact_service.contact_repo.delete(contact_id)
+    deleted = contact_service.contact_repository.delete(contact_id)
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
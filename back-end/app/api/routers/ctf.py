@@ -2,11 +2,14 @@
 Router de CTFs.
 """
 
+import asyncio
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Iterator, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
 
 from ...application.dto.ctf_dto import (
     CTFCreateDTO,
@@ -14,15 +17,28 @@ from ...application.dto.ctf_dto import (
     CTFResponseDTO,
     CTFListResponseDTO,
     CTFStatisticsDTO,
+    CTFStatisticsReconcileDTO,
+    CTFFacetsDTO,
 )
 from ...application.dto.flag_dto import (
+    CTFAnalyticsDTO,
+    CTFAnalyticsHourDTO,
     FlagSubmitDTO,
     FlagSubmitResponseDTO,
     LeaderboardEntryDTO,
     LeaderboardResponseDTO,
+    LeaderboardReconcileDTO,
+    RecommendationsResponseDTO,
+    RecommendedCTFDTO,
+    ScoreHistoryResponseDTO,
+    ScorePointDTO,
+    ScoreSeriesDTO,
     UserStatsDTO,
     SolvedCTFDTO,
+    SubmissionHistoryDTO,
+    SubmissionListResponseDTO,
 )
+from ...application.use_cases.export_submissions import EXPORT_FORMATS
 from ...application.use_cases import (
     CreateCTFUseCase,
     ListCTFsUseCase,
@@ -30,22 +46,39 @@ from ...application.use_cases import (
     UpdateCTFUseCase,
     DeleteCTFUseCase,
 )
+from ...core.config import settings
+from ...core.database import get_db
+from ...core.pagination import parse_cursor, split_page
+from ...core.submission_throttle import ThrottleKey, submission_throttle
 from ...core.security_middleware import limiter
 from ...domain.entities.user import User
 from ...domain.repositories.ctf_repo import CTFRepository
 from ...domain.repositories.writeup_repo import WriteupRepository
 from ...domain.repositories.flag_submission_repo import FlagSubmissionRepository
 from ...domain.services.ctf_service import CTFService
-from ...domain.services.flag_service import FlagService
+from ...domain.services.flag_service import FlagService, FlagVerdict
+from ...domain.services.regex_engine import regex_engine
+from ...domain.services.submission_cache import submission_cache
+from ...infrastructure.archive import SubmissionArchive
+from ...infrastructure.catalog import CTFCatalogSnapshot
+from ...infrastructure.events import LiveFeed, sse_frame
+from ...infrastructure.persistence.ctf_analytics import analytics_aggregator
+from ...infrastructure.persistence.recommendations import recommendation_job
+from ...infrastructure.persistence.submission_journal import submission_journal
 from ..dependencies import (
     get_ctf_repository,
     get_writeup_repository,
+    get_ctf_catalog,
     get_ctf_service,
     get_flag_service,
     get_current_user,
     get_current_admin,
     get_current_user_optional,
     get_flag_submission_repository,
+    get_submission_archive,
+    get_submission_exporter,
+    get_live_feed,
+    check_submission_throttle,
 )
 
 router = APIRouter(prefix="/ctfs", tags=["CTFs"])
@@ -58,8 +91,10 @@ async def list_all_ctfs_admin(
     level: Optional[str] = None,
     category: Optional[str] = None,
     platform: Optional[str] = None,
-    status: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
     search: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="Cursor opaco (next_cursor) de la página anterior"),
+    skill: Optional[str] = None,
     current_user: User = Depends(get_current_admin),
     ctf_repo: CTFRepository = Depends(get_ctf_repository),
     writeup_repo: WriteupRepository = Depends(get_writeup_repository),
@@ -67,15 +102,23 @@ async def list_all_ctfs_admin(
     """Lista TODOS los CTFs para administradores (incluye drafts y archivados)."""
     use_case = ListCTFsUseCase(ctf_repo, writeup_repo)
     
-    return use_case.execute_admin(
-        page=page,
-        size=size,
-        level=level,
-        category=category,
-        platform=platform,
-        status=status,
-        search=search,
-    )
+    try:
+        return use_case.execute_admin(
+            page=page,
+            size=size,
+            level=level,
+            category=category,
+            platform=platform,
+            status=status_filter,
+            search=search,
+            cursor=cursor,
+            skill=skill,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
 
 
 @router.get("", response_model=CTFListResponseDTO)
@@ -86,20 +129,69 @@ async def list_ctfs(
     category: Optional[str] = None,
     platform: Optional[str] = None,
     search: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="Cursor opaco (next_cursor) de la página anterior"),
+    skill: Optional[str] = None,
     ctf_repo: CTFRepository = Depends(get_ctf_repository),
     writeup_repo: WriteupRepository = Depends(get_writeup_repository),
+    catalog: Optional[CTFCatalogSnapshot] = Depends(get_ctf_catalog),
+    submission_repo: FlagSubmissionRepository = Depends(get_flag_submission_repository),
+    current_user: Optional[User] = Depends(get_current_user_optional),
 ):
-    """Lista CTFs con filtros y paginación."""
-    use_case = ListCTFsUseCase(ctf_repo, writeup_repo)
+    """
+    Lista CTFs con filtros y paginación.
     
-    return use_case.execute(
-        page=page,
-        size=size,
-        level=level,
-        category=category,
-        platform=platform,
-        search=search,
+    Admite paginación por página (`page`/`size`) o por cursor (`cursor`),
+    usando el `next_cursor` devuelto en la respuesta anterior. Si el catálogo
+    en memoria está habilitado, los listados sin búsqueda se sirven desde él.
+    Con sesión iniciada cada CTF incluye `solved_by_me`.
+    """
+    use_case = ListCTFsUseCase(
+        ctf_repo, writeup_repo, catalog=catalog, submission_repository=submission_repo
     )
+    
+    try:
+        return use_case.execute(
+            page=page,
+            size=size,
+            level=level,
+            category=category,
+            platform=platform,
+            search=search,
+            cursor=cursor,
+            skill=skill,
+            user_id=current_user.id if current_user else None,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.get("/facets", response_model=CTFFacetsDTO)
+async def get_facets(
+    level: Optional[str] = None,
+    category: Optional[str] = None,
+    platform: Optional[str] = None,
+    skill: Optional[str] = None,
+    ctf_repo: CTFRepository = Depends(get_ctf_repository),
+    writeup_repo: WriteupRepository = Depends(get_writeup_repository),
+):
+    """Cuenta los CTFs publicados por skill, nivel, categoría y plataforma según los filtros."""
+    use_case = ListCTFsUseCase(ctf_repo, writeup_repo)
+    
+    try:
+        return use_case.get_facets(
+            level=level,
+            category=category,
+            platform=platform,
+            skill=skill,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
 
 
 @router.get("/statistics", response_model=CTFStatisticsDTO)
@@ -112,6 +204,200 @@ async def get_statistics(
     return use_case.get_statistics()
 
 
+@router.post("/statistics/reconcile", response_model=CTFStatisticsReconcileDTO)
+async def reconcile_statistics(
+    repair: bool = Query(False),
+    ctf_repo: CTFRepository = Depends(get_ctf_repository),
+    current_user: User = Depends(get_current_admin),
+):
+    """Recalcula las estadísticas y las compara con el rollup (solo admin)."""
+    return ctf_repo.reconcile_statistics(repair=repair)
+
+
+@router.post("/admin/search/reindex")
+async def reindex_search(
+    ctf_repo: CTFRepository = Depends(get_ctf_repository),
+    current_user: User = Depends(get_current_admin),
+):
+    """Reconstruye el índice de búsqueda difusa de CTFs (solo admin)."""
+    return {"indexed": ctf_repo.rebuild_search_index()}
+
+
+@router.get("/admin/regex/metrics")
+async def regex_engine_metrics(
+    current_user: User = Depends(get_current_admin),
+):
+    """Métricas del motor de flags regex de este worker: evaluaciones, timeouts y reinicios (solo admin)."""
+    return regex_engine.metrics()
+
+
+@router.get("/admin/submissions/journal")
+async def submission_journal_metrics(
+    current_user: User = Depends(get_current_admin),
+):
+    """Métricas del diario de intentos incorrectos de este worker: encolados, lotes y rechazos (solo admin)."""
+    return {"enabled": submission_journal.running, **submission_journal.metrics()}
+
+
+@router.get("/admin/submissions/cache")
+async def submission_cache_metrics(
+    current_user: User = Depends(get_current_admin),
+):
+    """Métricas de la caché de intentos repetidos de este worker: aciertos, entradas y repeticiones pendientes (solo admin)."""
+    return {"enabled": settings.FLAG_SUBMISSION_CACHE_ENABLED, **submission_cache.metrics()}
+
+
+@router.get("/admin/submissions/throttle")
+async def submission_throttle_metrics(
+    current_user: User = Depends(get_current_admin),
+):
+    """Métricas del throttle de envíos de este worker: permitidos, bloqueados y claves activas (solo admin)."""
+    return {"enabled": settings.FLAG_THROTTLE_ENABLED, **submission_throttle.metrics()}
+
+
+@router.get("/admin/live")
+async def live_feed_metrics(
+    current_user: User = Depends(get_current_admin),
+    feed: LiveFeed = Depends(get_live_feed),
+):
+    """Métricas del feed en vivo de este worker: eventos, entregas, clientes conectados y descartados (solo admin)."""
+    return feed.bus.metrics()
+
+
+@router.get("/admin/recommendations")
+async def recommendation_job_metrics(
+    current_user: User = Depends(get_current_admin),
+):
+    """Métricas del job de recomendaciones de este worker: cálculos, saltados, filas y duración (solo admin)."""
+    return {"enabled": recommendation_job.running, **recommendation_job.metrics()}
+
+
+@router.post("/admin/recommendations/rebuild")
+async def rebuild_recommendations(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin),
+):
+    """Recalcula ya los CTFs vecinos de las recomendaciones (solo admin)."""
+    return {"neighbours": recommendation_job.run_once(db, force=True)}
+
+
+@router.get("/admin/analytics")
+async def analytics_aggregator_metrics(
+    current_user: User = Depends(get_current_admin),
+):
+    """Métricas del agregador de analíticas de este worker: pasadas, fallos, filas y duración (solo admin)."""
+    return {"enabled": analytics_aggregator.running, **analytics_aggregator.metrics()}
+
+
+@router.get("/recommendations/me", response_model=RecommendationsResponseDTO, tags=["Leaderboard"])
+async def get_my_recommendations(
+    limit: int = Query(10, ge=1, le=50, description="Número de CTFs"),
+    current_user: User = Depends(get_current_user),
+    submission_repo: FlagSubmissionRepository = Depends(get_flag_submission_repository),
+):
+    """
+    Recomienda los siguientes CTFs para el usuario autenticado.
+    
+    Se ordenan por parecido con los CTFs que ha resuelto (quién más los
+    resolvió y skills compartidas). Sin historial, o si no hay bastantes,
+    se completa con los CTFs más resueltos (`source: popular`).
+    """
+    items = submission_repo.get_recommendations(current_user.id, limit=limit)
+    return RecommendationsResponseDTO(items=[RecommendedCTFDTO(**item) for item in items])
+
+
+@router.get("/admin/submissions/export")
+async def export_submissions(
+    format: str = Query("ndjson", description="Formato: ndjson o csv"),
+    ctf_id: Optional[UUID] = Query(None),
+    user_id: Optional[UUID] = Query(None),
+    ip: Optional[str] = Query(None, max_length=45, description="Dirección IP exacta"),
+    since: Optional[datetime] = Query(None, description="Fecha mínima (incluida)"),
+    until: Optional[datetime] = Query(None, description="Fecha máxima (excluida)"),
+    current_user: User = Depends(get_current_admin),
+    exporter: Callable[..., Iterator[str]] = Depends(get_submission_exporter),
+):
+    """
+    Exporta los intentos de flag filtrados en streaming, más antiguos primero (requiere admin).
+    
+    Solo cubre flag_submissions; los intentos archivados se consultan en
+    /admin/submissions/archive. No incluye la flag enviada.
+    """
+    try:
+        body = exporter(
+            format,
+            ctf_id=ctf_id,
+            user_id=user_id,
+            ip_address=ip,
+            since=since,
+            until=until,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    
+    extension = "jsonl" if format == "ndjson" else format
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="flag_submissions.{extension}"'},
+    )
+
+
+@router.get("/admin/submissions/archive", response_model=SubmissionListResponseDTO)
+async def search_archived_submissions(
+    ctf_id: Optional[UUID] = Query(None),
+    user_id: Optional[UUID] = Query(None),
+    since: Optional[datetime] = Query(None, description="Fecha mínima (incluida)"),
+    until: Optional[datetime] = Query(None, description="Fecha máxima (excluida)"),
+    size: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor opaco (next_cursor) de la página anterior"),
+    current_user: User = Depends(get_current_admin),
+    archive: SubmissionArchive = Depends(get_submission_archive),
+):
+    """
+    Busca intentos de flag archivados (fuera de flag_submissions), más recientes primero.
+    
+    Recorre los segmentos en disco; filtrar por CTF, usuario o fechas
+    evita abrir los que no pueden contener resultados (requiere admin).
+    """
+    try:
+        cursor_pos = parse_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    
+    submissions = archive.scan(
+        ctf_id=ctf_id,
+        user_id=user_id,
+        since=since,
+        until=until,
+        cursor=cursor_pos,
+        limit=size + 1,
+    )
+    submissions, next_cursor = split_page(submissions, size, "submitted_at")
+    
+    return SubmissionListResponseDTO(
+        items=[
+            SubmissionHistoryDTO(
+                id=s.id,
+                ctf_id=s.ctf_id,
+                is_correct=s.is_correct,
+                submitted_at=s.submitted_at,
+                user_id=s.user_id,
+                ip_address=s.ip_address,
+            )
+            for s in submissions
+        ],
+        size=size,
+        next_cursor=next_cursor,
+    )
+
+
 @router.get("/{ctf_id}", response_model=CTFResponseDTO)
 async def get_ctf(
     ctf_id: UUID,
@@ -162,7 +448,13 @@ async def update_ctf(
     """Actualiza un CTF existente (requiere admin)."""
     use_case = UpdateCTFUseCase(ctf_repo, writeup_repo, ctf_service)
     
-    result = use_case.execute(ctf_id, data, user_id=current_user.id)
+    try:
+        result = use_case.execute(ctf_id, data, user_id=current_user.id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     
     if not result:
         raise HTTPException(
@@ -207,7 +499,7 @@ async def submit_flag(
     ctf_id: UUID,
     data: FlagSubmitDTO,
     request: Request,
-    ctf_repo: CTFRepository = Depends(get_ctf_repository),
+    throttle_key: Optional[ThrottleKey] = Depends(check_submission_throttle),
     flag_service: FlagService = Depends(get_flag_service),
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
@@ -217,41 +509,36 @@ async def submit_flag(
     - **flag**: La flag a verificar (formato: FLAG{...} o similar)
     
     Retorna si la flag es correcta y el mensaje correspondiente.
-    Funciona con o sin autenticación (usuario opcional).
+    Funciona con o sin autenticación (usuario opcional). Tras varios fallos
+    seguidos en el mismo reto responde 429 con ``Retry-After`` (backoff
+    exponencial) sin llegar a consultar la base de datos.
     """
-    # Obtener el CTF
-    ctf = ctf_repo.get_by_id(ctf_id)
-    if not ctf:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="CTF not found",
-        )
-    
-    # Verificar si el CTF está activo
-    if not ctf.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="This challenge is not active",
-        )
-    
     # Obtener IP del cliente
     ip_address = request.client.host if request.client else None
     user_id = current_user.id if current_user else None
     
     # Intentar enviar la flag
     try:
-        is_correct, message, points = flag_service.submit_flag(
+        verdict, message, points = flag_service.evaluate_flag(
             ctf_id=ctf_id,
             flag=data.flag,
             user_id=user_id,
             ip_address=ip_address,
         )
+        # Solo cuentan las flags evaluadas (no "ya resuelto", formato o no disponible)
+        if throttle_key is not None and verdict.evaluated:
+            submission_throttle.record(throttle_key, verdict is FlagVerdict.CORRECT)
         
         return FlagSubmitResponseDTO(
-            success=is_correct,
+            success=verdict is FlagVerdict.CORRECT,
             message=message,
             points=points,
         )
+    except LookupError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="CTF not found",
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -259,6 +546,79 @@ async def submit_flag(
         )
 
 
+@router.get("/{ctf_id}/submissions", response_model=SubmissionListResponseDTO)
+async def list_ctf_submissions(
+    ctf_id: UUID,
+    size: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor opaco (next_cursor) de la página anterior"),
+    current_user: User = Depends(get_current_admin),
+    submission_repo: FlagSubmissionRepository = Depends(get_flag_submission_repository),
+):
+    """Lista los intentos de flag de un CTF, más recientes primero (requiere admin)."""
+    try:
+        cursor_pos = parse_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    
+    submissions = submission_repo.get_by_ctf_id(ctf_id, limit=size + 1, cursor=cursor_pos)
+    submissions, next_cursor = split_page(submissions, size, "submitted_at")
+    
+    return SubmissionListResponseDTO(
+        items=[
+            SubmissionHistoryDTO(
+                id=s.id,
+                ctf_id=s.ctf_id,
+                is_correct=s.is_correct,
+                submitted_at=s.submitted_at,
+                user_id=s.user_id,
+                ip_address=s.ip_address,
+            )
+            for s in submissions
+        ],
+        size=size,
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/{ctf_id}/analytics", response_model=CTFAnalyticsDTO)
+async def get_ctf_analytics(
+    ctf_id: UUID,
+    since: Optional[datetime] = Query(None, description="Fecha mínima (UTC)"),
+    until: Optional[datetime] = Query(None, description="Fecha máxima (UTC, excluida)"),
+    current_user: User = Depends(get_current_admin),
+    ctf_repo: CTFRepository = Depends(get_ctf_repository),
+    submission_repo: FlagSubmissionRepository = Depends(get_flag_submission_repository),
+):
+    """
+    Analíticas de un CTF por hora: intentos, usuarios, solves, intentos
+    hasta acertar y tiempo desde el primer intento (requiere admin).
+    
+    Se sirven del rollup horario que mantiene el agregador en segundo
+    plano, así que la hora en curso puede ir unos minutos por detrás.
+    """
+    if ctf_repo.get_by_id(ctf_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="CTF not found"
+        )
+    
+    analytics = submission_repo.get_ctf_analytics(ctf_id, since=since, until=until)
+    
+    return CTFAnalyticsDTO(
+        ctf_id=str(ctf_id),
+        attempts=analytics['attempts'],
+        attempters=analytics['attempters'],
+        solves=analytics['solves'],
+        solve_rate=analytics['solve_rate'],
+        median_attempts_to_solve=analytics['median_attempts_to_solve'],
+        median_seconds_to_solve=analytics['median_seconds_to_solve'],
+        hours=[CTFAnalyticsHourDTO(**hour) for hour in analytics['hours']],
+    )
+
+
 @router.delete("/{ctf_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_ctf(
     ctf_id: UUID,
@@ -319,6 +679,103 @@ async def get_leaderboard(
     )
 
 
+@router.get("/leaderboard/history", response_model=ScoreHistoryResponseDTO, tags=["Leaderboard"])
+async def get_leaderboard_history(
+    top: int = Query(10, ge=1, le=50, description="Usuarios del ranking"),
+    bucket: str = Query("1h", description="Intervalo: 1h, 6h o 1d"),
+    since: Optional[datetime] = Query(None, description="Fecha mínima (UTC)"),
+    submission_repo: FlagSubmissionRepository = Depends(get_flag_submission_repository),
+):
+    """
+    Evolución de la puntuación de los primeros del ranking.
+    
+    Cada serie tiene un punto por intervalo con solves (puntuación al
+    cierre del intervalo); entre dos puntos la puntuación no cambia.
+    """
+    try:
+        history = submission_repo.get_score_history(limit=top, bucket=bucket, since=since)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    
+    series = [
+        ScoreSeriesDTO(
+            rank=entry['rank'],
+            user_id=entry['user_id'],
+            username=entry['username'],
+            total_points=entry['total_points'],
+            solved_count=entry['solved_count'],
+            points=[
+                ScorePointDTO(at=at, total_points=points, solved_count=solved)
+                for at, points, solved in entry['points']
+            ],
+        )
+        for entry in history
+    ]
+    
+    return ScoreHistoryResponseDTO(bucket=bucket, series=series, updated_at=datetime.utcnow())
+
+
+@router.get("/leaderboard/stream", tags=["Leaderboard"])
+async def stream_leaderboard(
+    top: int = Query(10, ge=1, le=100, description="Usuarios en la instantánea inicial"),
+    submission_repo: FlagSubmissionRepository = Depends(get_flag_submission_repository),
+    feed: LiveFeed = Depends(get_live_feed),
+):
+    """
+    Ranking y solves en vivo como Server-Sent Events.
+    
+    Envía primero un evento ``snapshot`` (top y solves recientes) y después
+    ``solve`` y ``leaderboard`` (deltas de posición) según se confirman.
+    Cada ``LIVE_FEED_HEARTBEAT_SECONDS`` sin eventos se envía un comentario
+    ``: ping``. Un cliente que no consume a tiempo recibe ``dropped`` y se
+    cierra su stream; el navegador se reconecta con EventSource.
+    """
+    # Suscribirse antes de leer el top para no perder eventos intermedios
+    subscription = feed.bus.subscribe()
+    if subscription is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many live clients",
+        )
+    try:
+        snapshot = feed.snapshot(submission_repo.get_leaderboard(limit=top))
+    except Exception:
+        feed.bus.unsubscribe(subscription)
+        raise
+    heartbeat = settings.LIVE_FEED_HEARTBEAT_SECONDS
+    
+    async def events():
+        try:
+            yield snapshot
+            while not subscription.dropped:
+                try:
+                    yield await asyncio.wait_for(subscription.queue.get(), heartbeat)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+            yield sse_frame("dropped", {"reason": "slow consumer"})
+        finally:
+            feed.bus.unsubscribe(subscription)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/leaderboard/reconcile", response_model=LeaderboardReconcileDTO, tags=["Leaderboard"])
+async def reconcile_leaderboard(
+    repair: bool = Query(False),
+    submission_repo: FlagSubmissionRepository = Depends(get_flag_submission_repository),
+    current_user: User = Depends(get_current_admin),
+):
+    """Recalcula las puntuaciones desde los solves y las compara con user_scores (solo admin)."""
+    return submission_repo.reconcile_scores(repair=repair)
+
+
 @router.get("/leaderboard/me", response_model=UserStatsDTO, tags=["Leaderboard"])
 async def get_my_stats(
     current_user: User = Depends(get_current_user),
@@ -18,6 +18,7 @@ from ...domain.entities.user import User
 from ...domain.entities.project import Project, ProjectStatus
 from ...domain.repositories.project_repo import ProjectRepository
 from ...domain.services.project_service import ProjectService
+from ...core.pagination import parse_cursor, split_page
 from ..dependencies import (
     get_project_repository,
     get_project_service,
@@ -32,15 +33,25 @@ router = APIRouter(prefix="/projects", tags=["Projects"])
 async def list_all_projects_admin(
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
-    status: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    cursor: Optional[str] = Query(None, description="Cursor opaco (next_cursor) de la página anterior"),
     current_user: User = Depends(get_current_admin),
     project_repo: ProjectRepository = Depends(get_project_repository),
 ):
     """Lista TODOS los proyectos para administradores (incluye drafts)."""
     skip = (page - 1) * size
     
-    project_status = ProjectStatus(status) if status else None
-    projects = project_repo.get_all(skip=skip, limit=size, status=project_status)
+    try:
+        project_status = ProjectStatus(status_filter) if status_filter else None
+        cursor_pos = parse_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    
+    projects = project_repo.get_all(skip=skip, limit=size + 1, status=project_status, cursor=cursor_pos)
+    projects, next_cursor = split_page(projects, size, "order")
     total = project_repo.count(status=project_status)
     
     items = [
@@ -70,6 +81,7 @@ async def list_all_projects_admin(
         page=page,
         size=size,
         pages=ceil(total / size) if size > 0 else 0,
+        next_cursor=next_cursor,
     )
 
 
@@ -79,17 +91,28 @@ async def list_projects(
     size: int = Query(10, ge=1, le=100),
     featured: Optional[bool] = None,
     technology: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="Cursor opaco (next_cursor) de la página anterior"),
     project_repo: ProjectRepository = Depends(get_project_repository),
 ):
-    """Lista proyectos con filtros y paginación."""
+    """Lista proyectos con filtros y paginación (por página o por cursor)."""
     skip = (page - 1) * size
+    next_cursor = None
+    
+    try:
+        cursor_pos = parse_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     
     if technology:
         projects = project_repo.get_by_technology(technology)
     elif featured:
         projects = project_repo.get_featured(limit=size)
     else:
-        projects = project_repo.get_published(skip=skip, limit=size)
+        projects = project_repo.get_published(skip=skip, limit=size + 1, cursor=cursor_pos)
+        projects, next_cursor = split_page(projects, size, "order")
     
     total = project_repo.count(status=ProjectStatus.PUBLISHED)
     
@@ -120,6 +143,7 @@ async def list_projects(
         page=page,
         size=size,
         pages=ceil(total / size) if size > 0 else 0,
+        next_cursor=next_cursor,
     )
 
 
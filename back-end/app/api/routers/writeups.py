@@ -31,6 +31,7 @@ from ...domain.services.writeup_service import WriteupService
 from ...domain.services.markdown_service import markdown_service, MarkdownRenderResult, TOCItem
 from ...domain.services.file_validator import FileValidator, FileValidationError
 from ...domain.services.storage_service import StorageService
+from ...core.pagination import parse_cursor, split_page
 from ..dependencies import (
     get_writeup_repository,
     get_ctf_repository,
@@ -255,16 +256,27 @@ async def list_writeups(
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
     search: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="Cursor opaco (next_cursor) de la página anterior"),
     writeup_repo: WriteupRepository = Depends(get_writeup_repository),
     writeup_service: WriteupService = Depends(get_writeup_service),
 ):
-    """Lista writeups con filtros y paginación."""
+    """Lista writeups con filtros y paginación (por página o por cursor)."""
     skip = (page - 1) * size
+    next_cursor = None
+    
+    try:
+        cursor_pos = parse_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     
     if search:
         writeups = writeup_repo.search(search)
     else:
-        writeups = writeup_repo.get_published(skip=skip, limit=size)
+        writeups = writeup_repo.get_published(skip=skip, limit=size + 1, cursor=cursor_pos)
+        writeups, next_cursor = split_page(writeups, size, "created_at")
     
     total = writeup_repo.count(status=WriteupStatus.PUBLISHED)
     
@@ -281,6 +293,7 @@ async def list_writeups(
         page=page,
         size=size,
         pages=ceil(total / size) if size > 0 else 0,
+        next_cursor=next_cursor,
     )
 
 
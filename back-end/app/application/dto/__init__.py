@@ -2,7 +2,7 @@
 Data Transfer Objects (DTOs) para la capa de aplicación.
 """
 
-from .ctf_dto import CTFCreateDTO, CTFUpdateDTO, CTFResponseDTO, CTFListResponseDTO, CTFStatisticsDTO
+from .ctf_dto import CTFCreateDTO, CTFUpdateDTO, CTFResponseDTO, CTFListResponseDTO, CTFStatisticsDTO, CTFStatisticsReconcileDTO, CTFFacetsDTO
 from .writeup_dto import WriteupCreateDTO, WriteupUpdateDTO, WriteupResponseDTO
 from .user_dto import UserCreateDTO, UserResponseDTO, TokenDTO
 from .project_dto import ProjectCreateDTO, ProjectUpdateDTO, ProjectResponseDTO
@@ -10,6 +10,7 @@ from .contact_dto import ContactCreateDTO, ContactResponseDTO, ContactListRespon
 from .attachment_dto import AttachmentCreateDTO, AttachmentResponseDTO, AttachmentListResponseDTO, AttachmentUploadResponseDTO
 from .portfolio_dto import PortfolioProfileDTO, HighlightDTO, ContactInfoDTO
 from .flag_dto import FlagSubmitDTO, FlagSubmitResponseDTO
+from .bulk_dto import CTFImportDTO, AttachmentImportDTO, WriteupImportDTO, BulkImportReportDTO
 
 __all__ = [
     # CTF
@@ -18,6 +19,8 @@ __all__ = [
     "CTFResponseDTO",
     "CTFListResponseDTO",
     "CTFStatisticsDTO",
+    "CTFStatisticsReconcileDTO",
+    "CTFFacetsDTO",
     # Writeup
     "WriteupCreateDTO",
     "WriteupUpdateDTO",
@@ -47,4 +50,9 @@ __all__ = [
     # Flag
     "FlagSubmitDTO",
     "FlagSubmitResponseDTO",
+    # Bulk
+    "CTFImportDTO",
+    "AttachmentImportDTO",
+    "WriteupImportDTO",
+    "BulkImportReportDTO",
 ]
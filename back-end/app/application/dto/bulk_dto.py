@@ -0,0 +1,78 @@
+"""
+DTOs para la importación/exportación masiva del catálogo (JSONL).
+
+Cada línea del fichero es un objeto JSON con un campo ``kind``
+(``ctf``, ``attachment`` o ``writeup``) y los campos del registro.
+Los DTOs de importación extienden los de creación, así que un registro
+se valida igual que si llegara por la API.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+from .ctf_dto import AttachmentDTO, CTFCreateDTO
+from .writeup_dto import WriteupCreateDTO
+
+
+class CTFImportDTO(CTFCreateDTO):
+    """CTF de una importación: admite ID, estado y flag ya hasheada."""
+
+    id: Optional[UUID] = None
+    status: Optional[str] = Field(None, description="draft, published, archived (por defecto según is_active)")
+    flag_hash: Optional[str] = Field(None, description="Hash (o patrón regex) ya calculado; tiene prioridad sobre flag")
+    solved: bool = False
+    solved_at: Optional[datetime] = None
+    solved_count: int = Field(default=0, ge=0)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class AttachmentImportDTO(AttachmentDTO):
+    """Metadatos de un adjunto de una importación."""
+
+    id: Optional[str] = None
+    ctf_id: UUID
+    url: Optional[str] = None
+    file_path: Optional[str] = None
+    checksum: Optional[str] = Field(None, max_length=64)
+    created_at: Optional[datetime] = None
+
+
+class WriteupImportDTO(WriteupCreateDTO):
+    """Writeup de una importación: admite ID, estado y fechas."""
+
+    id: Optional[UUID] = None
+    status: str = Field("draft", description="draft, published, archived")
+    views: int = Field(default=0, ge=0)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    published_at: Optional[datetime] = None
+
+
+class BulkImportErrorDTO(BaseModel):
+    """Error de una línea concreta del fichero importado."""
+    line: int
+    error: str
+
+
+class BulkImportReportDTO(BaseModel):
+    """Resumen de una importación masiva."""
+
+    processed: int = 0
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+    errors: List[BulkImportErrorDTO] = Field(default_factory=list)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "processed": 3,
+                "created": 1,
+                "updated": 1,
+                "failed": 1,
+                "errors": [{"line": 3, "error": "title: String should have at least 3 characters"}],
+            }
+        }
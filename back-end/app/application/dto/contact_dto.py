@@ -51,6 +51,7 @@ class ContactListResponseDTO(BaseModel):
     total: int
     skip: int = 0
     limit: int = 20
+    next_cursor: Optional[str] = None  # Cursor opaco para la siguiente página (keyset)
 
 
 class ProjectTypeDTO(BaseModel):
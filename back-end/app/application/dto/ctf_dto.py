@@ -3,7 +3,7 @@ DTOs para CTFs.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 from pydantic import BaseModel, Field, field_validator
 
@@ -27,6 +27,10 @@ class CTFCreateDTO(BaseModel):
     platform: Optional[str] = Field("Web", min_length=1, max_length=100)
     description: Optional[str] = None
     points: int = Field(default=0, ge=0, le=10000)
+    # Puntuación dinámica: points es el valor inicial y decae con los solves
+    dynamic_scoring: bool = False
+    minimum_points: Optional[int] = Field(None, ge=0, le=10000)
+    decay_solves: Optional[int] = Field(None, ge=1, le=100000, description="Solves hasta llegar al mínimo")
     machine_os: Optional[str] = None
     # Campos alineados con frontend
     skills: List[str] = Field(default_factory=list)
@@ -69,6 +73,9 @@ class CTFUpdateDTO(BaseModel):
     platform: Optional[str] = Field(None, min_length=1, max_length=100)
     description: Optional[str] = None
     points: Optional[int] = Field(None, ge=0, le=1000)
+    dynamic_scoring: Optional[bool] = None
+    minimum_points: Optional[int] = Field(None, ge=0, le=10000)
+    decay_solves: Optional[int] = Field(None, ge=1, le=100000)
     machine_os: Optional[str] = None
     skills: Optional[List[str]] = None
     hints: Optional[List[str]] = None
@@ -89,6 +96,10 @@ class CTFResponseDTO(BaseModel):
     platform: str
     description: Optional[str]
     points: int
+    dynamic_scoring: bool = False
+    initial_points: Optional[int] = None  # Solo con puntuación dinámica
+    minimum_points: Optional[int] = None
+    decay_solves: Optional[int] = None
     solved: bool
     solved_at: Optional[datetime]
     machine_os: Optional[str]
@@ -97,6 +108,8 @@ class CTFResponseDTO(BaseModel):
     hints: List[str]  # Solo primeras pistas, o vacío si no autenticado
     author: Optional[str]
     solved_count: int
+    first_blood_user_id: Optional[UUID] = None  # Primer usuario que lo resolvió
+    first_blood_at: Optional[datetime] = None
     is_active: bool
     attachments: List[AttachmentDTO] = []
     # Campos de sistema
@@ -104,6 +117,8 @@ class CTFResponseDTO(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime]
     has_writeup: bool = False
+    solved_by_me: Optional[bool] = None  # Solo en listados con usuario autenticado
+    score: Optional[float] = None  # Similitud (solo en resultados de búsqueda)
     
     class Config:
         from_attributes = True
@@ -117,6 +132,7 @@ class CTFListResponseDTO(BaseModel):
     page: int
     size: int
     pages: int
+    next_cursor: Optional[str] = None  # Cursor opaco para la siguiente página (keyset)
 
 
 class CTFStatisticsDTO(BaseModel):
@@ -129,3 +145,20 @@ class CTFStatisticsDTO(BaseModel):
     by_level: dict
     by_category: dict
     by_platform: dict
+
+
+class CTFFacetsDTO(BaseModel):
+    """DTO con el número de CTFs por valor de cada faceta."""
+    
+    skill: Dict[str, int]
+    level: Dict[str, int]
+    category: Dict[str, int]
+    platform: Dict[str, int]
+
+
+class CTFStatisticsReconcileDTO(BaseModel):
+    """DTO con el resultado de verificar el rollup de estadísticas."""
+    
+    consistent: bool
+    differences: dict
+    repaired: bool
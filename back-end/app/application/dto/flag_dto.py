@@ -37,11 +37,21 @@ class SubmissionHistoryDTO(BaseModel):
     ctf_id: UUID
     is_correct: bool
     submitted_at: datetime
+    user_id: Optional[UUID] = None
+    ip_address: Optional[str] = None
     
     class Config:
         from_attributes = True
 
 
+class SubmissionListResponseDTO(BaseModel):
+    """DTO para lista paginada (por cursor) de submissions."""
+    
+    items: List[SubmissionHistoryDTO]
+    size: int
+    next_cursor: Optional[str] = None
+
+
 # =============================================
 # DTOs para Leaderboard / Ranking
 # =============================================
@@ -87,6 +97,61 @@ class LeaderboardResponseDTO(BaseModel):
         }
 
 
+class ScorePointDTO(BaseModel):
+    """DTO para la puntuación de un usuario al cierre de un intervalo."""
+    
+    at: datetime
+    total_points: int
+    solved_count: int
+
+
+class ScoreSeriesDTO(BaseModel):
+    """DTO para la serie de puntuación de un usuario del ranking."""
+    
+    rank: int
+    user_id: str
+    username: str
+    total_points: int
+    solved_count: int
+    points: List[ScorePointDTO] = []
+
+
+class ScoreHistoryResponseDTO(BaseModel):
+    """DTO para la evolución de la puntuación de los primeros del ranking."""
+    
+    bucket: str
+    series: List[ScoreSeriesDTO]
+    updated_at: datetime
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "bucket": "1h",
+                "series": [
+                    {
+                        "rank": 1, "user_id": "...", "username": "hacker1",
+                        "total_points": 1500, "solved_count": 12,
+                        "points": [
+                            {"at": "2026-01-28T10:00:00", "total_points": 1200, "solved_count": 10},
+                            {"at": "2026-01-28T12:00:00", "total_points": 1500, "solved_count": 12}
+                        ]
+                    }
+                ],
+                "updated_at": "2026-01-28T12:30:00"
+            }
+        }
+
+
+class LeaderboardReconcileDTO(BaseModel):
+    """DTO con el resultado de verificar las puntuaciones por usuario."""
+    
+    consistent: bool
+    checked: int
+    mismatched: int
+    differences: dict
+    repaired: bool
+
+
 class SolvedCTFDTO(BaseModel):
     """DTO para un CTF resuelto por el usuario."""
     
@@ -121,3 +186,72 @@ class UserStatsDTO(BaseModel):
                 ]
             }
         }
+
+
+class RecommendedCTFDTO(BaseModel):
+    """DTO para un CTF recomendado."""
+    
+    id: str
+    title: str
+    points: int
+    category: str
+    level: str
+    score: float
+    source: str  # similar | popular
+
+
+class RecommendationsResponseDTO(BaseModel):
+    """DTO para las recomendaciones del usuario autenticado."""
+    
+    items: List[RecommendedCTFDTO]
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "items": [
+                    {"id": "...", "title": "Web Challenge 2", "points": 150, "category": "web", "level": "medium", "score": 1.42, "source": "similar"},
+                    {"id": "...", "title": "Crypto 101", "points": 100, "category": "crypto", "level": "easy", "score": 0.0, "source": "popular"}
+                ]
+            }
+        }
+
+
+class CTFAnalyticsHourDTO(BaseModel):
+    """DTO para los intentos y solves de un CTF en una hora."""
+    
+    bucket_start: datetime
+    attempts: int
+    attempters: int
+    new_attempters: int
+    solves: int
+    median_attempts_to_solve: Optional[float] = None
+    median_seconds_to_solve: Optional[float] = None
+
+
+class CTFAnalyticsDTO(BaseModel):
+    """DTO para las analíticas de un CTF en un rango de fechas."""
+    
+    ctf_id: str
+    attempts: int
+    attempters: int
+    solves: int
+    solve_rate: Optional[float] = None
+    median_attempts_to_solve: Optional[float] = None
+    median_seconds_to_solve: Optional[float] = None
+    hours: List[CTFAnalyticsHourDTO]
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "ctf_id": "123e4567-e89b-12d3-a456-426614174000",
+                "attempts": 420,
+                "attempters": 60,
+                "solves": 12,
+                "solve_rate": 0.2,
+                "median_attempts_to_solve": 6.0,
+                "median_seconds_to_solve": 1830.0,
+                "hours": [
+                    {"bucket_start": "2026-01-28T12:00:00", "attempts": 35, "attempters": 9, "new_attempters": 4, "solves": 2, "median_attempts_to_solve": 5.5, "median_seconds_to_solve": 1200.0}
+                ]
+            }
+        }
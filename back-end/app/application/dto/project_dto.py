@@ -79,6 +79,7 @@ class ProjectListResponseDTO(BaseModel):
     page: int
     size: int
     pages: int
+    next_cursor: Optional[str] = None  # Cursor opaco para la siguiente página (keyset)
 
 
 class ProjectSummaryDTO(BaseModel):
@@ -83,6 +83,7 @@ class WriteupListResponseDTO(BaseModel):
     page: int
     size: int
     pages: int
+    next_cursor: Optional[str] = None  # Cursor opaco para la siguiente página (keyset)
 
 
 class WriteupSummaryDTO(BaseModel):
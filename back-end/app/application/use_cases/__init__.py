@@ -10,6 +10,8 @@ from .update_ctf import UpdateCTFUseCase
 from .delete_ctf import DeleteCTFUseCase
 from .publish_writeup import PublishWriteupUseCase
 from .create_writeup import CreateWriteupUseCase
+from .bulk_catalog import ExportCatalogUseCase, ImportCatalogUseCase
+from .export_submissions import ExportSubmissionsUseCase
 
 __all__ = [
     "CreateCTFUseCase",
@@ -19,4 +21,7 @@ __all__ = [
     "DeleteCTFUseCase",
     "PublishWriteupUseCase",
     "CreateWriteupUseCase",
+    "ExportCatalogUseCase",
+    "ImportCatalogUseCase",
+    "ExportSubmissionsUseCase",
 ]
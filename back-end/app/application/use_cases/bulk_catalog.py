@@ -0,0 +1,410 @@
+"""
+Casos de uso: Importar y exportar el catálogo en JSONL.
+
+La exportación recorre los repositorios con cursores de servidor y emite
+una línea por registro, así que la memoria no depende del tamaño del
+catálogo. La importación valida cada línea con los DTOs de la API,
+acumula registros y los guarda en lotes de ``batch_size`` por
+transacción; si un lote falla se reintenta fila a fila para aislar las
+líneas culpables sin abortar el resto.
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from uuid import UUID, uuid4
+
+from pydantic import ValidationError
+
+from ..dto.bulk_dto import (
+    AttachmentImportDTO,
+    BulkImportErrorDTO,
+    BulkImportReportDTO,
+    CTFImportDTO,
+    WriteupImportDTO,
+)
+from ...domain.entities.attachment import Attachment, AttachmentType
+from ...domain.entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus
+from ...domain.entities.writeup import Writeup, WriteupStatus
+from ...domain.repositories.attachment_repo import AttachmentRepository
+from ...domain.repositories.ctf_repo import CTFRepository
+from ...domain.repositories.writeup_repo import WriteupRepository
+from ...domain.services.ctf_service import CTFService
+from ...domain.services.submission_cache import submission_cache
+
+
+# Orden de escritura: los adjuntos y writeups referencian CTFs
+RECORD_KINDS = ("ctf", "attachment", "writeup")
+
+# Errores detallados que se conservan en el informe (el resto solo cuenta)
+MAX_REPORTED_ERRORS = 1000
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if hasattr(value, "value"):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _error_message(exc: Exception) -> str:
+    """Mensaje corto de un error de validación o de base de datos."""
+    if isinstance(exc, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in err['loc']) or 'record'}: {err['msg']}"
+            for err in exc.errors()
+        )
+    return str(getattr(exc, "orig", None) or exc)
+
+
+class ExportCatalogUseCase:
+    """Caso de uso para exportar CTFs, adjuntos y writeups como JSONL."""
+
+    def __init__(
+        self,
+        ctf_repository: CTFRepository,
+        writeup_repository: WriteupRepository,
+        attachment_repository: AttachmentRepository,
+    ):
+        self.ctf_repository = ctf_repository
+        self.writeup_repository = writeup_repository
+        self.attachment_repository = attachment_repository
+
+    def execute(
+        self,
+        types: Iterable[str] = RECORD_KINDS,
+        batch_size: int = 500,
+    ) -> Iterator[str]:
+        """
+        Genera las líneas JSONL del catálogo.
+
+        Args:
+            types: Tipos de registro a exportar (se emiten siempre en el
+                orden ctf, attachment, writeup para que el fichero se
+                pueda reimportar tal cual).
+            batch_size: Filas leídas por viaje a la base de datos.
+        """
+        selected = set(types)
+        unknown = selected - set(RECORD_KINDS)
+        if unknown:
+            raise ValueError(f"Unknown record kinds: {sorted(unknown)}")
+
+        sources = {
+            "ctf": (self.ctf_repository.stream_all, self._ctf_record),
+            "attachment": (self.attachment_repository.stream_all, self._attachment_record),
+            "writeup": (self.writeup_repository.stream_all, self._writeup_record),
+        }
+        for kind in RECORD_KINDS:
+            if kind not in selected:
+                continue
+            stream, to_record = sources[kind]
+            for entity in stream(batch_size):
+                record = {"kind": kind, **to_record(entity)}
+                yield json.dumps(record, default=_json_default, ensure_ascii=False) + "\n"
+
+    def _ctf_record(self, ctf: CTF) -> Dict[str, Any]:
+        return {
+            "id": ctf.id,
+            "title": ctf.title,
+            "level": ctf.level,
+            "category": ctf.category,
+            "platform": ctf.platform,
+            "description": ctf.description,
+            # Con puntuación dinámica se exporta el valor inicial (el actual se recalcula)
+            "points": ctf.initial_points if ctf.dynamic_scoring else ctf.points,
+            "dynamic_scoring": ctf.dynamic_scoring,
+            "minimum_points": ctf.minimum_points if ctf.dynamic_scoring else None,
+            "decay_solves": ctf.decay_solves if ctf.dynamic_scoring else None,
+            "machine_os": ctf.machine_os,
+            "skills": ctf.skills,
+            "hints": ctf.hints,
+            "flag_hash": ctf.flag_hash,
+            "is_flag_regex": ctf.is_flag_regex,
+            "author": ctf.author,
+            "is_active": ctf.is_active,
+            "status": ctf.status,
+            "solved": ctf.solved,
+            "solved_at": ctf.solved_at,
+            "solved_count": ctf.solved_count,
+            "created_at": ctf.created_at,
+            "updated_at": ctf.updated_at,
+        }
+
+    def _attachment_record(self, attachment: Attachment) -> Dict[str, Any]:
+        return {
+            "id": attachment.id,
+            "ctf_id": attachment.ctf_id,
+            "name": attachment.name,
+            "type": attachment.type,
+            "url": attachment.url,
+            "file_path": attachment.file_path,
+            "size": attachment.size,
+            "mime_type": attachment.mime_type,
+            "checksum": attachment.checksum,
+            "created_at": attachment.created_at,
+        }
+
+    def _writeup_record(self, writeup: Writeup) -> Dict[str, Any]:
+        return {
+            "id": writeup.id,
+            "ctf_id": writeup.ctf_id,
+            "title": writeup.title,
+            "content": writeup.content,
+            "summary": writeup.summary,
+            "tools_used": writeup.tools_used,
+            "techniques": writeup.techniques,
+            "status": writeup.status,
+            "views": writeup.views,
+            "created_at": writeup.created_at,
+            "updated_at": writeup.updated_at,
+            "published_at": writeup.published_at,
+        }
+
+
+class CatalogImport:
+    """
+    Importación en curso.
+
+    Se alimenta línea a línea con ``feed`` (por ejemplo, mientras se lee el
+    cuerpo de una petición) y se cierra con ``finish``, que guarda el
+    último lote y devuelve el informe.
+    """
+
+    def __init__(self, use_case: "ImportCatalogUseCase", user_id: Optional[UUID] = None):
+        self.use_case = use_case
+        self.user_id = user_id
+        self.report = BulkImportReportDTO()
+        self.line_number = 0
+        self._pending: Dict[str, List[Tuple[int, Any]]] = {kind: [] for kind in RECORD_KINDS}
+        self._pending_count = 0
+
+    def feed(self, line: Union[str, bytes]) -> None:
+        """Valida una línea y la añade al lote en curso."""
+        self.line_number += 1
+        text = line.decode("utf-8", errors="replace") if isinstance(line, bytes) else line
+        text = text.strip()
+        if not text:
+            return
+
+        try:
+            records = self.use_case.parse_record(json.loads(text), self.user_id)
+        except (ValueError, TypeError) as e:
+            # JSONDecodeError y ValidationError son ValueError
+            self.report.processed += 1
+            self._fail(self.line_number, e)
+            return
+
+        for kind, entity in records:
+            self.report.processed += 1
+            self._pending[kind].append((self.line_number, entity))
+            self._pending_count += 1
+
+        if self._pending_count >= self.use_case.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Guarda el lote en curso (una transacción por tipo de registro)."""
+        for kind in RECORD_KINDS:
+            items = self._pending[kind]
+            if not items:
+                continue
+            save_many = self.use_case.savers[kind]
+            try:
+                self._count(save_many([entity for _, entity in items]), len(items))
+            except Exception:
+                # El lote se deshizo entero: reintentar fila a fila
+                for line_number, entity in items:
+                    try:
+                        self._count(save_many([entity]), 1)
+                    except Exception as e:
+                        self._fail(line_number, e)
+            if kind == "ctf":
+                # Un CTF importado puede sustituir la flag de uno existente
+                for _, ctf in items:
+                    submission_cache.invalidate_ctf(ctf.id)
+            self._pending[kind] = []
+        self._pending_count = 0
+
+    def finish(self) -> BulkImportReportDTO:
+        """Guarda lo pendiente y devuelve el informe."""
+        self.flush()
+        return self.report
+
+    def _count(self, created: int, total: int) -> None:
+        self.report.created += created
+        self.report.updated += total - created
+
+    def _fail(self, line_number: int, exc: Exception) -> None:
+        self.report.failed += 1
+        if len(self.report.errors) < MAX_REPORTED_ERRORS:
+            self.report.errors.append(
+                BulkImportErrorDTO(line=line_number, error=_error_message(exc))
+            )
+
+
+class ImportCatalogUseCase:
+    """Caso de uso para importar CTFs, adjuntos y writeups desde JSONL."""
+
+    def __init__(
+        self,
+        ctf_repository: CTFRepository,
+        writeup_repository: WriteupRepository,
+        attachment_repository: AttachmentRepository,
+        ctf_service: CTFService,
+        batch_size: int = 100,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        self.ctf_repository = ctf_repository
+        self.writeup_repository = writeup_repository
+        self.attachment_repository = attachment_repository
+        self.ctf_service = ctf_service
+        self.batch_size = batch_size
+        self.savers = {
+            "ctf": ctf_repository.save_many,
+            "attachment": attachment_repository.save_many,
+            "writeup": writeup_repository.save_many,
+        }
+
+    def execute(
+        self,
+        lines: Iterable[Union[str, bytes]],
+        user_id: Optional[UUID] = None,
+    ) -> BulkImportReportDTO:
+        """
+        Importa todas las líneas de un iterable (p. ej. un fichero abierto).
+
+        Args:
+            lines: Líneas JSONL.
+            user_id: Usuario que importa (creador/autor de los registros).
+
+        Returns:
+            Informe con los registros creados, actualizados y fallidos.
+        """
+        importer = self.start(user_id)
+        for line in lines:
+            importer.feed(line)
+        return importer.finish()
+
+    def start(self, user_id: Optional[UUID] = None) -> CatalogImport:
+        """Comienza una importación incremental."""
+        return CatalogImport(self, user_id)
+
+    def parse_record(self, record: Any, user_id: Optional[UUID] = None) -> List[Tuple[str, Any]]:
+        """
+        Valida un registro y lo convierte en entidades.
+
+        Un CTF puede traer sus adjuntos embebidos (como en la creación por
+        API); se devuelven como registros ``attachment`` independientes.
+
+        Raises:
+            ValueError: Si el registro es inválido.
+        """
+        if not isinstance(record, dict):
+            raise ValueError("Each line must be a JSON object")
+
+        kind = record.get("kind")
+        if kind == "ctf":
+            return self._parse_ctf(CTFImportDTO.model_validate(record), user_id)
+        if kind == "attachment":
+            return [("attachment", self._attachment(AttachmentImportDTO.model_validate(record), user_id))]
+        if kind == "writeup":
+            return [("writeup", self._writeup(WriteupImportDTO.model_validate(record), user_id))]
+        raise ValueError(f"Unknown record kind: {kind!r} (expected one of {', '.join(RECORD_KINDS)})")
+
+    def _parse_ctf(self, data: CTFImportDTO, user_id: Optional[UUID]) -> List[Tuple[str, Any]]:
+        errors = self.ctf_service.validate_ctf_data(
+            title=data.title,
+            level=data.level,
+            category=data.category,
+        )
+        if errors:
+            raise ValueError(f"Validation errors: {errors}")
+
+        points = data.points
+        if points == 0:
+            points = self.ctf_service.calculate_points(CTFLevel(data.level))
+
+        if data.status:
+            status = CTFStatus(data.status)
+        else:
+            status = CTFStatus.PUBLISHED if data.is_active else CTFStatus.DRAFT
+
+        ctf = CTF(
+            id=data.id or uuid4(),
+            title=data.title,
+            level=CTFLevel(data.level),
+            category=CTFCategory(data.category),
+            platform=data.platform,
+            description=data.description,
+            points=points,
+            solved=data.solved,
+            solved_at=data.solved_at,
+            machine_os=data.machine_os,
+            skills=data.skills,
+            hints=data.hints,
+            author=data.author,
+            solved_count=data.solved_count,
+            is_active=data.is_active,
+            status=status,
+            created_by_id=user_id,
+            updated_by_id=user_id,
+            created_at=data.created_at or datetime.utcnow(),
+            updated_at=data.updated_at,
+        )
+
+        if data.flag_hash and data.is_flag_regex:
+            # El "hash" de una flag regex es el patrón: se valida como en set_flag
+            ctf.set_flag(data.flag_hash, is_regex=True)
+        elif data.flag_hash:
+            ctf.flag_hash = data.flag_hash
+            ctf.is_flag_regex = False
+        elif data.flag:
+            ctf.set_flag(data.flag.strip(), is_regex=data.is_flag_regex)
+
+        if data.dynamic_scoring:
+            ctf.set_dynamic_scoring(points, data.minimum_points or 0, data.decay_solves)
+
+        records: List[Tuple[str, Any]] = [("ctf", ctf)]
+        for att_dto in data.attachments:
+            attachment = self._attachment(
+                AttachmentImportDTO(**att_dto.model_dump(), ctf_id=ctf.id),
+                user_id,
+            )
+            records.append(("attachment", attachment))
+        return records
+
+    def _attachment(self, data: AttachmentImportDTO, user_id: Optional[UUID]) -> Attachment:
+        return Attachment(
+            id=UUID(data.id) if data.id else uuid4(),
+            name=data.name,
+            type=AttachmentType(data.type),
+            ctf_id=data.ctf_id,
+            url=data.url,
+            file_path=data.file_path,
+            size=data.size,
+            mime_type=data.mime_type,
+            checksum=data.checksum,
+            uploaded_by=user_id,
+            created_at=data.created_at or datetime.utcnow(),
+        )
+
+    def _writeup(self, data: WriteupImportDTO, user_id: Optional[UUID]) -> Writeup:
+        return Writeup(
+            id=data.id or uuid4(),
+            title=data.title,
+            ctf_id=data.ctf_id,
+            content=data.content,
+            summary=data.summary,
+            tools_used=data.tools_used,
+            techniques=data.techniques,
+            status=WriteupStatus(data.status),
+            views=data.views,
+            author_id=user_id,
+            created_at=data.created_at or datetime.utcnow(),
+            updated_at=data.updated_at,
+            published_at=data.published_at,
+        )
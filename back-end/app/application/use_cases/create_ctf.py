@@ -100,6 +100,9 @@ class CreateCTFUseCase:
         if data.flag:
             ctf.set_flag(data.flag.strip(), is_regex=data.is_flag_regex)
         
+        if data.dynamic_scoring:
+            ctf.set_dynamic_scoring(points, data.minimum_points or 0, data.decay_solves)
+        
         # Persistir
         saved_ctf = self.ctf_repository.save(ctf)
         
@@ -131,6 +134,10 @@ class CreateCTFUseCase:
             platform=ctf.platform,
             description=ctf.description,
             points=ctf.points,
+            dynamic_scoring=ctf.dynamic_scoring,
+            initial_points=ctf.initial_points if ctf.dynamic_scoring else None,
+            minimum_points=ctf.minimum_points if ctf.dynamic_scoring else None,
+            decay_solves=ctf.decay_solves if ctf.dynamic_scoring else None,
             solved=ctf.solved,
             solved_at=ctf.solved_at,
             machine_os=ctf.machine_os,
@@ -138,6 +145,8 @@ class CreateCTFUseCase:
             hints=ctf.hints,
             author=ctf.author,
             solved_count=ctf.solved_count,
+            first_blood_user_id=ctf.first_blood_user_id,
+            first_blood_at=ctf.first_blood_at,
             is_active=ctf.is_active,
             attachments=attachment_dtos,
             status=ctf.status.value,
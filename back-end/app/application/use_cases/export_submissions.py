@@ -0,0 +1,104 @@
+"""
+Caso de uso: Exportar el registro de intentos de flag (NDJSON o CSV).
+
+Las filas llegan del repositorio como tuplas leídas con un cursor de
+servidor y se serializan por lotes: cada trozo emitido agrupa
+``batch_size`` líneas, así que la memoria no depende del número de
+intentos y el coste por fila es solo el formateo.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Iterator, Optional
+from uuid import UUID
+
+from ...domain.repositories.flag_submission_repo import FlagSubmissionRepository
+
+
+EXPORT_FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# Orden de las tuplas de ``FlagSubmissionRepository.stream_rows``
+EXPORT_COLUMNS = ("id", "ctf_id", "user_id", "ip_address", "is_correct", "submitted_at")
+
+
+class ExportSubmissionsUseCase:
+    """Caso de uso para exportar intentos de flag filtrados."""
+
+    def __init__(self, submission_repository: FlagSubmissionRepository):
+        self.submission_repository = submission_repository
+
+    def execute(
+        self,
+        format: str = "ndjson",
+        ctf_id: Optional[UUID] = None,
+        user_id: Optional[UUID] = None,
+        ip_address: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[str]:
+        """
+        Genera la exportación por trozos de ``batch_size`` filas.
+
+        El formato se valida al llamar (antes de empezar a enviar el
+        cuerpo); la lectura empieza al recorrer el iterador.
+
+        Raises:
+            ValueError: Si el formato no es ndjson ni csv.
+        """
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format '{format}'. Valid: {', '.join(EXPORT_FORMATS)}")
+
+        rows = self.submission_repository.stream_rows(
+            ctf_id=ctf_id,
+            user_id=user_id,
+            ip_address=ip_address,
+            since=since,
+            until=until,
+            batch_size=batch_size,
+        )
+        if format == "csv":
+            return self._csv(rows, batch_size)
+        return self._ndjson(rows, batch_size)
+
+    @staticmethod
+    def _ndjson(rows, batch_size: int) -> Iterator[str]:
+        lines = []
+        for id_, ctf_id, user_id, ip_address, is_correct, submitted_at in rows:
+            lines.append(json.dumps({
+                "id": id_,
+                "ctf_id": ctf_id,
+                "user_id": user_id,
+                "ip_address": ip_address,
+                "is_correct": bool(is_correct),
+                "submitted_at": submitted_at.isoformat() if submitted_at else None,
+            }))
+            if len(lines) >= batch_size:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _csv(rows, batch_size: int) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(EXPORT_COLUMNS)
+        pending = 0
+        for id_, ctf_id, user_id, ip_address, is_correct, submitted_at in rows:
+            writer.writerow((
+                id_, ctf_id, user_id or "", ip_address or "",
+                "true" if is_correct else "false",
+                submitted_at.isoformat() if submitted_at else "",
+            ))
+            pending += 1
+            if pending >= batch_size:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+        # Cabecera sola si no hay filas
+        if buffer.tell():
+            yield buffer.getvalue()
@@ -62,6 +62,10 @@ class GetCTFUseCase:
             platform=ctf.platform,
             description=ctf.description,
             points=ctf.points,
+            dynamic_scoring=ctf.dynamic_scoring,
+            initial_points=ctf.initial_points if ctf.dynamic_scoring else None,
+            minimum_points=ctf.minimum_points if ctf.dynamic_scoring else None,
+            decay_solves=ctf.decay_solves if ctf.dynamic_scoring else None,
             solved=ctf.solved,
             solved_at=ctf.solved_at,
             machine_os=ctf.machine_os,
@@ -69,6 +73,8 @@ class GetCTFUseCase:
             hints=ctf.hints,
             author=ctf.author,
             solved_count=ctf.solved_count,
+            first_blood_user_id=ctf.first_blood_user_id,
+            first_blood_at=ctf.first_blood_at,
             is_active=ctf.is_active,
             attachments=attachment_dtos,
             status=ctf.status.value,
@@ -2,13 +2,20 @@
 Caso de uso: Listar CTFs.
 """
 
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional
 from math import ceil
+from uuid import UUID
 
-from ..dto.ctf_dto import CTFResponseDTO, CTFListResponseDTO, CTFStatisticsDTO
+from ..dto.ctf_dto import CTFResponseDTO, CTFListResponseDTO, CTFStatisticsDTO, CTFFacetsDTO
+from ...core.pagination import parse_cursor, split_page
 from ...domain.entities.ctf import CTFLevel, CTFCategory, CTFStatus
 from ...domain.repositories.ctf_repo import CTFRepository
 from ...domain.repositories.writeup_repo import WriteupRepository
+from ...domain.repositories.flag_submission_repo import FlagSubmissionRepository
+from ...domain.services.solved_cache import SolvedSetCache, solved_set_cache
+
+if TYPE_CHECKING:
+    from ...infrastructure.catalog import CTFCatalogSnapshot
 
 
 class ListCTFsUseCase:
@@ -18,9 +25,17 @@ class ListCTFsUseCase:
         self,
         ctf_repository: CTFRepository,
         writeup_repository: WriteupRepository,
+        catalog: Optional["CTFCatalogSnapshot"] = None,
+        submission_repository: Optional[FlagSubmissionRepository] = None,
+        solved_cache: SolvedSetCache = solved_set_cache,
     ):
         self.ctf_repository = ctf_repository
         self.writeup_repository = writeup_repository
+        # Instantánea del catálogo en memoria (None = consultar la BD)
+        self.catalog = catalog
+        # Para solved_by_me (None = no se marca)
+        self.submission_repository = submission_repository
+        self.solved_cache = solved_cache
     
     def execute(
         self,
@@ -31,6 +46,9 @@ class ListCTFsUseCase:
         platform: Optional[str] = None,
         status: Optional[str] = None,
         search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        skill: Optional[str] = None,
+        user_id: Optional[UUID] = None,
     ) -> CTFListResponseDTO:
         """
         Ejecuta el caso de uso de listar CTFs.
@@ -43,20 +61,64 @@ class ListCTFsUseCase:
             platform: Filtro por plataforma.
             status: Filtro por estado.
             search: Término de búsqueda.
+            cursor: Cursor opaco de la página anterior (tiene prioridad sobre page).
+            skill: Filtro por skill (sin distinguir mayúsculas).
+            user_id: Usuario autenticado; si se indica, se marca ``solved_by_me``.
             
         Returns:
             Lista paginada de CTFs.
+            
+        Raises:
+            ValueError: Si el cursor o algún filtro es inválido.
         """
+        result = self._list(page, size, level, category, platform, status, search, cursor, skill)
+        if user_id is not None and self.submission_repository is not None:
+            solved = self._solved_by(user_id)
+            for item in result.items:
+                item.solved_by_me = str(item.id) in solved
+        return result
+    
+    def _list(
+        self,
+        page: int,
+        size: int,
+        level: Optional[str],
+        category: Optional[str],
+        platform: Optional[str],
+        status: Optional[str],
+        search: Optional[str],
+        cursor: Optional[str],
+        skill: Optional[str],
+    ) -> CTFListResponseDTO:
+        """Listado sin datos del usuario (BD, catálogo en memoria o búsqueda)."""
         skip = (page - 1) * size
+        cursor_pos = parse_cursor(cursor)
+        next_cursor = None
         
-        # Obtener CTFs según filtros
         if search:
-            ctfs = self.ctf_repository.search(search)
-        elif status:
+            return self._execute_search(
+                page, size, search,
+                status=CTFStatus(status) if status else CTFStatus.PUBLISHED,
+                level=level, category=category, platform=platform,
+                skill=skill, active_only=True,
+            )
+        
+        if self.catalog is not None and not status:
+            return self._execute_from_catalog(
+                page, size, cursor_pos, level, category, platform, skill
+            )
+        
+        # Obtener CTFs según filtros (size + 1 para saber si hay más páginas)
+        if status:
             ctf_status = CTFStatus(status)
-            ctfs = self.ctf_repository.get_all(skip=skip, limit=size, status=ctf_status)
+            ctfs = self.ctf_repository.get_all(
+                skip=skip, limit=size + 1, status=ctf_status, cursor=cursor_pos, skill=skill
+            )
         else:
-            ctfs = self.ctf_repository.get_published(skip=skip, limit=size)
+            ctfs = self.ctf_repository.get_published(
+                skip=skip, limit=size + 1, cursor=cursor_pos, skill=skill
+            )
+        ctfs, next_cursor = split_page(ctfs, size, "created_at")
         
         # Aplicar filtros adicionales en memoria (se podría optimizar en el repo)
         if level:
@@ -72,7 +134,8 @@ class ListCTFsUseCase:
         
         # Contar total
         total = self.ctf_repository.count(
-            status=CTFStatus(status) if status else CTFStatus.PUBLISHED
+            status=CTFStatus(status) if status else CTFStatus.PUBLISHED,
+            skill=skill,
         )
         
         # Convertir a DTOs
@@ -84,8 +147,18 @@ class ListCTFsUseCase:
             page=page,
             size=size,
             pages=ceil(total / size) if size > 0 else 0,
+            next_cursor=next_cursor,
         )
     
+    def _solved_by(self, user_id: UUID) -> FrozenSet[str]:
+        """CTFs resueltos por el usuario: de la caché o con una sola consulta."""
+        solved = self.solved_cache.get(user_id)
+        if solved is None:
+            solved = self.solved_cache.put(
+                user_id, self.submission_repository.get_solved_ctf_ids(user_id)
+            )
+        return solved
+    
     def execute_admin(
         self,
         page: int = 1,
@@ -95,6 +168,8 @@ class ListCTFsUseCase:
         platform: Optional[str] = None,
         status: Optional[str] = None,
         search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        skill: Optional[str] = None,
     ) -> CTFListResponseDTO:
         """
         Lista TODOS los CTFs para administradores (incluye drafts).
@@ -107,18 +182,33 @@ class ListCTFsUseCase:
             platform: Filtro por plataforma.
             status: Filtro por estado (draft, published, archived).
             search: Término de búsqueda.
+            cursor: Cursor opaco de la página anterior (tiene prioridad sobre page).
+            skill: Filtro por skill (sin distinguir mayúsculas).
             
         Returns:
             Lista paginada de CTFs.
+            
+        Raises:
+            ValueError: Si el cursor o algún filtro es inválido.
         """
         skip = (page - 1) * size
+        cursor_pos = parse_cursor(cursor)
+        next_cursor = None
         
-        # Obtener todos los CTFs (sin filtro de estado por defecto)
         if search:
-            ctfs = self.ctf_repository.search(search)
-        else:
-            ctf_status = CTFStatus(status) if status else None
-            ctfs = self.ctf_repository.get_all(skip=skip, limit=size, status=ctf_status)
+            return self._execute_search(
+                page, size, search,
+                status=CTFStatus(status) if status else None,
+                level=level, category=category, platform=platform,
+                skill=skill,
+            )
+        
+        # Obtener todos los CTFs (sin filtro de estado por defecto)
+        ctf_status = CTFStatus(status) if status else None
+        ctfs = self.ctf_repository.get_all(
+            skip=skip, limit=size + 1, status=ctf_status, cursor=cursor_pos, skill=skill
+        )
+        ctfs, next_cursor = split_page(ctfs, size, "created_at")
         
         # Aplicar filtros adicionales
         if level:
@@ -134,7 +224,8 @@ class ListCTFsUseCase:
         
         # Contar total (sin filtro de estado para admin)
         total = self.ctf_repository.count(
-            status=CTFStatus(status) if status else None
+            status=CTFStatus(status) if status else None,
+            skill=skill,
         )
         
         # Convertir a DTOs
@@ -146,13 +237,111 @@ class ListCTFsUseCase:
             page=page,
             size=size,
             pages=ceil(total / size) if size > 0 else 0,
+            next_cursor=next_cursor,
         )
     
-        solved_ctfs = self.ctf_repository.get_solved()
+    def _execute_search(
+        self,
+        page: int,
+        size: int,
+        search: str,
+        status: Optional[CTFStatus],
+        level: Optional[str],
+        category: Optional[str],
+        platform: Optional[str],
+        skill: Optional[str] = None,
+        active_only: bool = False,
+    ) -> CTFListResponseDTO:
+        """Búsqueda difusa paginada; los items incluyen su puntuación."""
+        results, total = self.ctf_repository.search_ranked(
+            search,
+            skip=(page - 1) * size,
+            limit=size,
+            status=status,
+            level=CTFLevel(level) if level else None,
+            category=CTFCategory(category) if category else None,
+            platform=platform,
+            active_only=active_only,
+            skill=skill,
+        )
         
-        return CTFStatisticsDTO(
+        items = []
+        for ctf, score in results:
+            dto = self._to_response_dto(ctf)
+            dto.score = score
+            items.append(dto)
+        
+        return CTFListResponseDTO(
+            items=items,
             total=total,
-            solved=len(solved_ctfs),
+            page=page,
+            size=size,
+            pages=ceil(total / size) if size > 0 else 0,
+        )
+    
+    def _execute_from_catalog(
+        self,
+        page: int,
+        size: int,
+        cursor_pos,
+        level: Optional[str],
+        category: Optional[str],
+        platform: Optional[str],
+        skill: Optional[str] = None,
+    ) -> CTFListResponseDTO:
+        """Resuelve el listado público desde el catálogo en memoria."""
+        result = self.catalog.query(
+            offset=(page - 1) * size,
+            limit=size,
+            cursor=cursor_pos,
+            level=CTFLevel(level).value if level else None,
+            category=CTFCategory(category).value if category else None,
+            platform=platform,
+            skill=skill,
+        )
+        
+        items = [
+            self._catalog_dto(row, has_writeup)
+            for row, has_writeup in zip(result.items, result.has_writeup)
+        ]
+        
+        return CTFListResponseDTO(
+            items=items,
+            total=result.total,
+            page=page,
+            size=size,
+            pages=ceil(result.total / size) if size > 0 else 0,
+            next_cursor=result.next_cursor,
+        )
+    
+    def get_facets(
+        self,
+        level: Optional[str] = None,
+        category: Optional[str] = None,
+        platform: Optional[str] = None,
+        skill: Optional[str] = None,
+    ) -> CTFFacetsDTO:
+        """
+        Obtiene los conteos por faceta de los CTFs publicados filtrados.
+        
+        Raises:
+            ValueError: Si el nivel o la categoría no son válidos.
+        """
+        facets = self.ctf_repository.get_facets(
+            level=CTFLevel(level) if level else None,
+            category=CTFCategory(category) if category else None,
+            platform=platform,
+            skill=skill,
+        )
+        return CTFFacetsDTO(**facets)
+    
+    def get_statistics(self) -> CTFStatisticsDTO:
+        """Obtiene estadísticas de CTFs publicados desde el rollup."""
+        stats = self.ctf_repository.get_statistics()
+        
+        return CTFStatisticsDTO(
+            total=stats.get("total", 0),
+            solved=stats.get("solved", 0),
             total_points=stats.get("total_points", 0),
             earned_points=stats.get("earned_points", 0),
             by_level=stats.get("by_level", {}),
@@ -160,10 +349,19 @@ class ListCTFsUseCase:
             by_platform=stats.get("by_platform", {}),
         )
     
-    def _to_response_dto(self, ctf) -> CTFResponseDTO:
+    @staticmethod
+    def _catalog_dto(row: Dict[str, Any], has_writeup: bool) -> CTFResponseDTO:
+        """Convierte una fila del catálogo en memoria a DTO de respuesta."""
+        dto = CTFResponseDTO(**row, has_writeup=has_writeup)
+        if not dto.dynamic_scoring:
+            dto.initial_points = dto.minimum_points = dto.decay_solves = None
+        return dto
+    
+    def _to_response_dto(self, ctf, has_writeup: Optional[bool] = None) -> CTFResponseDTO:
         """Convierte una entidad CTF a DTO de respuesta."""
         # Verificar si tiene writeup
-        writeup = self.writeup_repository.get_by_ctf_id(ctf.id)
+        if has_writeup is None:
+            has_writeup = self.writeup_repository.get_by_ctf_id(ctf.id) is not None
         
         return CTFResponseDTO(
             id=ctf.id,
@@ -173,6 +371,10 @@ class ListCTFsUseCase:
             platform=ctf.platform,
             description=ctf.description,
             points=ctf.points,
+            dynamic_scoring=ctf.dynamic_scoring,
+            initial_points=ctf.initial_points if ctf.dynamic_scoring else None,
+            minimum_points=ctf.minimum_points if ctf.dynamic_scoring else None,
+            decay_solves=ctf.decay_solves if ctf.dynamic_scoring else None,
             solved=ctf.solved,
             solved_at=ctf.solved_at,
             machine_os=ctf.machine_os,
@@ -180,9 +382,11 @@ class ListCTFsUseCase:
             hints=ctf.hints,
             author=ctf.author,
             solved_count=ctf.solved_count,
+            first_blood_user_id=ctf.first_blood_user_id,
+            first_blood_at=ctf.first_blood_at,
             is_active=ctf.is_active,
             status=ctf.status.value,
             created_at=ctf.created_at,
             updated_at=ctf.updated_at,
-            has_writeup=writeup is not None,
+            has_writeup=has_writeup,
         )
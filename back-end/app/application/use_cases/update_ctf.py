@@ -10,6 +10,7 @@ from ...domain.entities.ctf import CTFLevel, CTFCategory
 from ...domain.repositories.ctf_repo import CTFRepository
 from ...domain.repositories.writeup_repo import WriteupRepository
 from ...domain.services.ctf_service import CTFService
+from ...domain.services.submission_cache import submission_cache
 
 
 class UpdateCTFUseCase:
@@ -61,8 +62,20 @@ class UpdateCTFUseCase:
         if data.description is not None:
             ctf.description = data.description
         
-        if data.points is not None:
-            ctf.points = data.points
+        # Con puntuación dinámica, points es el valor inicial y el actual se recalcula
+        dynamic = data.dynamic_scoring if data.dynamic_scoring is not None else ctf.dynamic_scoring
+        if dynamic:
+            if data.dynamic_scoring or any(
+                value is not None for value in (data.points, data.minimum_points, data.decay_solves)
+            ):
+                initial = ctf.initial_points if ctf.dynamic_scoring else ctf.points
+                ctf.set_dynamic_scoring(
+                    data.points if data.points is not None else initial,
+                    data.minimum_points if data.minimum_points is not None else ctf.minimum_points,
+                    data.decay_solves if data.decay_solves is not None else ctf.decay_solves,
+                )
+        elif data.points is not None or ctf.dynamic_scoring:
+            ctf.set_static_scoring(data.points if data.points is not None else ctf.initial_points)
         
         if data.machine_os is not None:
             ctf.machine_os = data.machine_os
@@ -80,6 +93,7 @@ class UpdateCTFUseCase:
         if data.solved is not None and data.solved and not ctf.solved:
             ctf.mark_as_solved()
         
+        was_active = ctf.is_active
         if data.is_active is not None:
             ctf.is_active = data.is_active
         
@@ -90,6 +104,11 @@ class UpdateCTFUseCase:
         # Persistir cambios
         saved_ctf = self.ctf_repository.save(ctf)
         
+        # Un intento incorrecto con la flag anterior puede ser correcto ahora, y
+        # uno repetido sobre un CTF desactivado debe recibir 400, no "incorrecta"
+        if data.flag is not None or ctf.is_active != was_active:
+            submission_cache.invalidate_ctf(ctf_id)
+        
         # Verificar si tiene writeup
         writeup = self.writeup_repository.get_by_ctf_id(ctf_id)
         
@@ -101,6 +120,10 @@ class UpdateCTFUseCase:
             platform=saved_ctf.platform,
             description=saved_ctf.description,
             points=saved_ctf.points,
+            dynamic_scoring=saved_ctf.dynamic_scoring,
+            initial_points=saved_ctf.initial_points if saved_ctf.dynamic_scoring else None,
+            minimum_points=saved_ctf.minimum_points if saved_ctf.dynamic_scoring else None,
+            decay_solves=saved_ctf.decay_solves if saved_ctf.dynamic_scoring else None,
             solved=saved_ctf.solved,
             solved_at=saved_ctf.solved_at,
             machine_os=saved_ctf.machine_os,
@@ -108,6 +131,8 @@ class UpdateCTFUseCase:
             hints=saved_ctf.hints,
             author=saved_ctf.author,
             solved_count=saved_ctf.solved_count,
+            first_blood_user_id=saved_ctf.first_blood_user_id,
+            first_blood_at=saved_ctf.first_blood_at,
             is_active=saved_ctf.is_active,
             status=saved_ctf.status.value,
             created_at=saved_ctf.created_at,
@@ -138,6 +163,8 @@ class UpdateCTFUseCase:
         
         ctf.publish()
         saved_ctf = self.ctf_repository.save(ctf)
+        # Cambia la disponibilidad: no responder con intentos cacheados de antes
+        submission_cache.invalidate_ctf(ctf_id)
         
         writeup = self.writeup_repository.get_by_ctf_id(ctf_id)
         
@@ -149,6 +176,10 @@ class UpdateCTFUseCase:
             platform=saved_ctf.platform,
             description=saved_ctf.description,
             points=saved_ctf.points,
+            dynamic_scoring=saved_ctf.dynamic_scoring,
+            initial_points=saved_ctf.initial_points if saved_ctf.dynamic_scoring else None,
+            minimum_points=saved_ctf.minimum_points if saved_ctf.dynamic_scoring else None,
+            decay_solves=saved_ctf.decay_solves if saved_ctf.dynamic_scoring else None,
             solved=saved_ctf.solved,
             solved_at=saved_ctf.solved_at,
             machine_os=saved_ctf.machine_os,
@@ -156,6 +187,8 @@ class UpdateCTFUseCase:
             hints=saved_ctf.hints,
             author=saved_ctf.author,
             solved_count=saved_ctf.solved_count,
+            first_blood_user_id=saved_ctf.first_blood_user_id,
+            first_blood_at=saved_ctf.first_blood_at,
             is_active=saved_ctf.is_active,
             status=saved_ctf.status.value,
             created_at=saved_ctf.created_at,
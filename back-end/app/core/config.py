@@ -31,6 +31,10 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     
+    # Usuarios verificados en memoria (evita cargar el usuario en cada petición)
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 30.0  # Máximo desfase entre workers (0 desactiva)
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    
     # Cookie Security Settings
     COOKIE_SECURE: bool = False  # True in production (HTTPS)
     COOKIE_SAMESITE: str = "lax"  # "strict" for highest security, "lax" for usability
@@ -59,6 +63,62 @@ class Settings(BaseSettings):
     S3_ACCESS_KEY: Optional[str] = None
     S3_SECRET_KEY: Optional[str] = None
     
+    # Catálogo de CTFs en memoria (GET /ctfs)
+    CTF_CATALOG_INDEX_ENABLED: bool = False
+    CTF_CATALOG_INDEX_TTL_SECONDS: int = 60  # Máximo desfase entre workers
+    
+    # Evaluación de flags regex (pool de procesos)
+    FLAG_REGEX_WORKERS: int = 2
+    FLAG_REGEX_TIMEOUT_SECONDS: float = 1.0
+    FLAG_REGEX_CACHE_SIZE: int = 256  # Patrones compilados por proceso
+    
+    # Ranking de usuarios en memoria (user_scores)
+    LEADERBOARD_TTL_SECONDS: int = 60  # Máximo desfase entre workers
+    
+    # Diario de intentos incorrectos (inserción por lotes en segundo plano)
+    FLAG_SUBMISSION_JOURNAL_ENABLED: bool = False
+    FLAG_SUBMISSION_JOURNAL_MAX_QUEUE: int = 10000
+    FLAG_SUBMISSION_JOURNAL_BATCH_SIZE: int = 500
+    FLAG_SUBMISSION_JOURNAL_FLUSH_SECONDS: float = 0.5
+    FLAG_SUBMISSION_JOURNAL_PATH: Optional[str] = None  # Modo durable: fsync antes de responder
+    
+    # Caché de intentos incorrectos repetidos (responde sin tocar la base de datos)
+    FLAG_SUBMISSION_CACHE_ENABLED: bool = False
+    FLAG_SUBMISSION_CACHE_TTL_SECONDS: float = 30.0  # También el máximo desfase entre workers
+    FLAG_SUBMISSION_CACHE_SIZE: int = 10000
+    FLAG_SUBMISSION_REPEATS_FLUSH_SECONDS: float = 5.0
+    
+    # Throttle de envíos por (usuario o IP, CTF) con backoff exponencial
+    FLAG_THROTTLE_ENABLED: bool = True
+    FLAG_THROTTLE_FREE_ATTEMPTS: int = 3  # Fallos seguidos sin espera
+    FLAG_THROTTLE_BASE_SECONDS: float = 1.0
+    FLAG_THROTTLE_MAX_SECONDS: float = 300.0
+    FLAG_THROTTLE_RESET_SECONDS: float = 900.0
+    FLAG_THROTTLE_MAX_ENTRIES: int = 100000
+    
+    # Archivo de envíos antiguos (segmentos comprimidos por mes)
+    FLAG_SUBMISSION_ARCHIVE_DIR: str = "archive/flag_submissions"
+    FLAG_SUBMISSION_RETENTION_DAYS: int = 30  # Días que quedan en flag_submissions
+    
+    # CTFs resueltos por usuario (solved_by_me en GET /ctfs)
+    SOLVED_SET_CACHE_TTL_SECONDS: float = 15.0  # Máximo desfase entre workers
+    SOLVED_SET_CACHE_SIZE: int = 10000
+    
+    # Feed en vivo del ranking y de los solves (Server-Sent Events)
+    LIVE_FEED_QUEUE_SIZE: int = 100  # Eventos pendientes por cliente antes de descartarlo
+    LIVE_FEED_MAX_CLIENTS: int = 5000  # Por worker
+    LIVE_FEED_HEARTBEAT_SECONDS: float = 15.0
+    LIVE_FEED_POLL_SECONDS: float = 2.0  # Solves de otros workers (0 desactiva)
+    
+    # Recomendaciones de CTFs (vecinos por co-solves y skills compartidas)
+    RECOMMENDER_INTERVAL_SECONDS: float = 3600.0  # Recalcular los vecinos (0 desactiva el job)
+    RECOMMENDER_NEIGHBOURS: int = 20  # Vecinos guardados por CTF
+    RECOMMENDER_SKILL_WEIGHT: float = 0.3  # Peso de las skills frente a los co-solves (0-1)
+    
+    # Analíticas por CTF (rollup horario de intentos y solves)
+    ANALYTICS_INTERVAL_SECONDS: float = 300.0  # Recalcular las horas recientes (0 desactiva el job)
+    ANALYTICS_BACKFILL_DAYS: int = 30  # Primera pasada con la tabla vacía
+    
     model_config = SettingsConfigDict(
         env_file=".env",
         case_sensitive=True,
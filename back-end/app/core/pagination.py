@@ -0,0 +1,94 @@
+"""
+Paginación por cursor (keyset pagination).
+
+Un cursor es un token opaco que codifica la clave de ordenación y el ID
+del último elemento devuelto. La siguiente página se obtiene con
+``WHERE (sort_key, id) < (:sort_key, :id)`` en lugar de ``OFFSET``, por lo
+que el coste no crece con la profundidad y las filas nuevas no desplazan
+las páginas ya servidas.
+"""
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Posición de un cursor: valor de la clave de ordenación + ID."""
+
+    sort_value: Any
+    id: str
+
+
+def encode_cursor(sort_value: Any, item_id: Any) -> str:
+    """
+    Codifica una posición como token opaco (base64 url-safe).
+
+    Args:
+        sort_value: Valor de la clave de ordenación (datetime o int).
+        item_id: ID del elemento (UUID o str).
+
+    Returns:
+        Token del cursor.
+    """
+    if isinstance(sort_value, datetime):
+        payload = ["dt", sort_value.isoformat(), str(item_id)]
+    else:
+        payload = ["v", sort_value, str(item_id)]
+
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Cursor:
+    """
+    Decodifica un token de cursor.
+
+    Raises:
+        ValueError: Si el token no es válido.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        kind, value, item_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if kind == "dt":
+            value = datetime.fromisoformat(value)
+        elif kind != "v":
+            raise ValueError(kind)
+        return Cursor(sort_value=value, id=str(item_id))
+    except (ValueError, TypeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def parse_cursor(token: Optional[str]) -> Optional[Cursor]:
+    """Decodifica un cursor opcional (None si no se proporciona)."""
+    return decode_cursor(token) if token else None
+
+
+def split_page(
+    items: Sequence[T],
+    size: int,
+    sort_key: str,
+) -> Tuple[Sequence[T], Optional[str]]:
+    """
+    Recorta una página consultada con ``limit=size + 1``.
+
+    Args:
+        items: Elementos obtenidos (hasta size + 1).
+        size: Tamaño de página solicitado.
+        sort_key: Atributo de la entidad usado como clave de ordenación.
+
+    Returns:
+        Tupla (elementos de la página, next_cursor o None si es la última).
+    """
+    if len(items) <= size:
+        return items, None
+
+    page = items[:size]
+    last = page[-1]
+    return page, encode_cursor(getattr(last, sort_key), last.id)
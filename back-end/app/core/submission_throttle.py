@@ -0,0 +1,132 @@
+"""
+Throttle de envíos de flags por reto con backoff exponencial.
+
+El rate limit genérico (slowapi) cuenta peticiones por IP + User-Agent sin
+distinguir retos. Este throttle lleva, por (usuario o IP, CTF), el número
+de fallos consecutivos: tras ``free_attempts`` fallos cada nuevo fallo
+bloquea ese reto ``base_delay * 2^n`` segundos (hasta ``max_delay``). Un
+acierto o ``reset_after`` segundos sin actividad tras el último bloqueo
+olvidan el historial.
+
+El estado es un LRU acotado de tuplas (fallos, bloqueado hasta), así que
+comprobar y registrar son O(1) y la memoria no crece con los atacantes.
+Es por proceso: con varios workers cada uno aplica su propio backoff.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from .config import settings
+
+
+ThrottleKey = Tuple[str, str]
+
+
+class SubmissionThrottle:
+    """
+    Backoff exponencial de envíos por (identidad, CTF).
+
+    Args:
+        free_attempts: Fallos consecutivos permitidos sin espera.
+        base_delay: Espera tras el primer fallo penalizado (segundos).
+        max_delay: Espera máxima (segundos).
+        reset_after: Inactividad tras la que se olvidan los fallos (segundos).
+        max_entries: Claves como máximo (se descartan las menos recientes).
+    """
+
+    def __init__(
+        self,
+        free_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 300.0,
+        reset_after: float = 900.0,
+        max_entries: int = 100000,
+    ):
+        self.free_attempts = free_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.reset_after = reset_after
+        self.max_entries = max_entries
+        # clave -> (fallos consecutivos, bloqueado hasta en reloj monotónico)
+        self._entries: "OrderedDict[ThrottleKey, Tuple[int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = dict.fromkeys(("allowed", "throttled", "failures"), 0)
+
+    @staticmethod
+    def key(ctf_id: UUID, user_id: Optional[str] = None, ip_address: Optional[str] = None) -> ThrottleKey:
+        """Clave del throttle: el usuario si lo hay, si no la IP."""
+        principal = f"user:{user_id}" if user_id else f"ip:{ip_address or 'unknown'}"
+        return principal, str(ctf_id)
+
+    def check(self, key: ThrottleKey) -> Optional[int]:
+        """
+        Comprueba si la clave puede enviar ahora.
+
+        Returns:
+            None si puede; si no, los segundos (redondeados hacia arriba)
+            que faltan para poder reintentar.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                self._counters["throttled"] += 1
+                return max(1, math.ceil(entry[1] - now))
+            self._counters["allowed"] += 1
+            return None
+
+    def record(self, key: ThrottleKey, success: bool) -> float:
+        """
+        Registra el resultado de un envío.
+
+        Returns:
+            Segundos de bloqueo que impone este resultado (0 si ninguno).
+        """
+        now = time.monotonic()
+        with self._lock:
+            if success:
+                self._entries.pop(key, None)
+                return 0.0
+            failures, blocked_until = self._entries.get(key, (0, now))
+            if now - blocked_until > self.reset_after:
+                failures = 0
+            failures += 1
+            delay = 0.0
+            if failures > self.free_attempts:
+                exponent = min(failures - self.free_attempts - 1, 32)
+                delay = min(self.base_delay * (2 ** exponent), self.max_delay)
+            self._entries[key] = (failures, max(now + delay, blocked_until) if delay else now)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._counters["failures"] += 1
+            return delay
+
+    def reset(self) -> None:
+        """Olvida todo el historial."""
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> Dict[str, int]:
+        """Peticiones permitidas/bloqueadas, fallos registrados y claves activas."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                **self._counters,
+                "entries": len(self._entries),
+                "blocked": sum(1 for _, until in self._entries.values() if until > now),
+            }
+
+
+# Instancia global
+submission_throttle = SubmissionThrottle(
+    free_attempts=settings.FLAG_THROTTLE_FREE_ATTEMPTS,
+    base_delay=settings.FLAG_THROTTLE_BASE_SECONDS,
+    max_delay=settings.FLAG_THROTTLE_MAX_SECONDS,
+    reset_after=settings.FLAG_THROTTLE_RESET_SECONDS,
+    max_entries=settings.FLAG_THROTTLE_MAX_ENTRIES,
+)
@@ -10,7 +10,7 @@ from .writeup import Writeup
 from .technology import Technology
 from .attachment import Attachment, AttachmentType
 from .contact import Contact, ContactStatus, ProjectType
-from .flag_submission import FlagSubmission
+from .flag_submission import FlagSubmission, RepeatedSubmission
 from .portfolio import PortfolioProfile, Highlight
 
 __all__ = [
@@ -25,6 +25,7 @@ __all__ = [
     "ContactStatus",
     "ProjectType",
     "FlagSubmission",
+    "RepeatedSubmission",
     "PortfolioProfile",
     "Highlight",
 ]
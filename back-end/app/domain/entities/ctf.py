@@ -2,19 +2,16 @@
 Entidad CTF - Capture The Flag challenges.
 """
 
-import concurrent.futures
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional
 from uuid import UUID, uuid4
 from enum import Enum
 import hashlib
+import math
 import re
 
 
-# Timeout para evaluación de regex (en segundos)
-REGEX_TIMEOUT_SECONDS = 1.0
-
 # Longitud máxima de input de flag
 MAX_FLAG_LENGTH = 256
 
@@ -39,6 +36,18 @@ class CTFCategory(str, Enum):
     STEGO = "stego"
 
 
+def dynamic_points(initial: int, minimum: int, decay: int, solves: int) -> int:
+    """
+    Valor de un reto con puntuación dinámica tras ``solves`` solves.
+    
+    Curva cuadrática (la de CTFd): el primer solver recibe ``initial`` y el
+    valor cae hasta ``minimum`` al llegar a ``decay`` solves.
+    """
+    previous = max(solves - 1, 0)
+    value = math.ceil((minimum - initial) / (decay ** 2) * previous ** 2 + initial)
+    return max(value, minimum)
+
+
 class CTFStatus(str, Enum):
     """Estados de un CTF."""
     DRAFT = "draft"
@@ -47,11 +56,15 @@ class CTFStatus(str, Enum):
 
 
 from .attachment import Attachment
+from .tracking import ChangeTracking
 
 @dataclass
-class CTF:
+class CTF(ChangeTracking):
     """Entidad de dominio para retos CTF."""
     
+    # first_blood_* solo los escribe el registro de solves, nunca save()
+    _UNTRACKED_FIELDS = frozenset({"id", "attachments", "first_blood_user_id", "first_blood_at"})
+    
     title: str
     level: CTFLevel
     category: CTFCategory
@@ -71,6 +84,12 @@ class CTF:
     created_by_id: Optional[UUID] = None              # ID del usuario creador (sistema)
     updated_by_id: Optional[UUID] = None              # ID del usuario actualizador (sistema)
     solved_count: int = 0                             # Número de soluciones
+    dynamic_scoring: bool = False                     # Si True, points decae con los solves
+    initial_points: int = 0                           # Valor inicial (puntuación dinámica)
+    minimum_points: int = 0                           # Valor mínimo (puntuación dinámica)
+    decay_solves: int = 0                             # Solves hasta llegar al mínimo
+    first_blood_user_id: Optional[UUID] = None        # Primer usuario que lo resolvió
+    first_blood_at: Optional[datetime] = None         # Momento del first blood
     is_active: bool = True                            # Si el reto está activo
     status: CTFStatus = CTFStatus.DRAFT
     created_at: datetime = field(default_factory=datetime.utcnow)
@@ -88,6 +107,30 @@ class CTF:
         self.solved_count += 1
         self.updated_at = datetime.utcnow()
     
+    def set_dynamic_scoring(self, initial: int, minimum: int, decay: Optional[int]) -> None:
+        """
+        Activa la puntuación dinámica y fija ``points`` al valor actual.
+        
+        Raises:
+            ValueError: Si el mínimo supera al inicial o ``decay`` no es positivo.
+        """
+        if not decay or decay < 1:
+            raise ValueError("decay_solves must be at least 1 for dynamic scoring")
+        if minimum > initial:
+            raise ValueError("minimum_points cannot be greater than the initial points")
+        self.dynamic_scoring = True
+        self.initial_points = initial
+        self.minimum_points = minimum
+        self.decay_solves = decay
+        self.points = dynamic_points(initial, minimum, decay, self.solved_count)
+        self.updated_at = datetime.utcnow()
+    
+    def set_static_scoring(self, points: int) -> None:
+        """Desactiva la puntuación dinámica con un valor fijo."""
+        self.dynamic_scoring = False
+        self.points = points
+        self.updated_at = datetime.utcnow()
+    
     def set_flag(self, flag: str, is_regex: bool = False) -> None:
         """
         Establece la flag (se almacena como hash o regex).
@@ -97,7 +140,8 @@ class CTF:
             is_regex: Si es True, se trata como patrón regex.
             
         Raises:
-            ValueError: Si el regex es inválido.
+            ValueError: Si el regex es inválido o usa construcciones no
+                soportadas por el matcher lineal (backreferences, lookarounds...).
         """
         self.is_flag_regex = is_regex
         if is_regex:
@@ -106,6 +150,12 @@ class CTF:
                 re.compile(flag)
             except re.error as e:
                 raise ValueError(f"Invalid regex pattern: {e}")
+            # Solo se admiten patrones que el matcher lineal evalúa sin backtracking
+            from ..services.safe_regex import UnsupportedPatternError, compile_safe
+            try:
+                compile_safe(flag)
+            except UnsupportedPatternError as e:
+                raise ValueError(f"Unsupported regex pattern: {e}")
             # Guardamos el patrón tal cual
             self.flag_hash = flag
         else:
@@ -113,30 +163,6 @@ class CTF:
             self.flag_hash = hashlib.sha256(flag.encode()).hexdigest()
         self.updated_at = datetime.utcnow()
     
-    def _match_regex_with_timeout(self, pattern: str, text: str) -> bool:
-        """
-        Ejecuta match de regex con timeout para prevenir ReDoS.
-        
-        Args:
-            pattern: Patrón regex a evaluar.
-            text: Texto contra el que evaluar.
-            
-        Returns:
-            True si hay match, False si no o si hay timeout/error.
-        """
-        def do_match():
-            return bool(re.match(pattern, text))
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(do_match)
-            try:
-                return future.result(timeout=REGEX_TIMEOUT_SECONDS)
-            except concurrent.futures.TimeoutError:
-                # Regex tomó demasiado tiempo - posible ReDoS
-                return False
-            except Exception:
-                return False
-    
     def verify_flag(self, flag: str) -> bool:
         """
         Verifica si una flag es correcta.
@@ -155,11 +181,14 @@ class CTF:
             return False
             
         if self.is_flag_regex:
-            # Verificación mediante Regex con timeout
-            try:
-                return self._match_regex_with_timeout(self.flag_hash, flag)
-            except re.error:
-                return False
+            # Matcher lineal en línea; los patrones antiguos que no admite
+            # van al pool de procesos (timeout real contra ReDoS)
+            from ..services.safe_regex import cached_safe_pattern
+            safe_pattern = cached_safe_pattern(self.flag_hash)
+            if safe_pattern is not None:
+                return safe_pattern.match(flag)
+            from ..services.regex_engine import regex_engine
+            return regex_engine.match(self.flag_hash, flag, cache_key=str(self.id))
         else:
             # Verificación mediante Hash
             return hashlib.sha256(flag.encode()).hexdigest() == self.flag_hash
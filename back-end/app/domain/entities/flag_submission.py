@@ -19,6 +19,8 @@ class FlagSubmission:
     is_correct: bool = False
     ip_address: Optional[str] = None
     submitted_at: datetime = field(default_factory=datetime.utcnow)
+    # Puntos acreditados al acertar (con puntuación dinámica, el valor tras el solve)
+    points: Optional[int] = None
     
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, FlagSubmission):
@@ -27,3 +29,22 @@ class FlagSubmission:
     
     def __hash__(self) -> int:
         return hash(self.id)
+
+
+@dataclass
+class RepeatedSubmission:
+    """
+    Repeticiones agregadas de un mismo intento incorrecto.
+    
+    Un intento idéntico (mismo usuario o IP, CTF y hash de flag) repetido
+    dentro del TTL de la caché de envíos no genera una fila nueva en
+    flag_submissions: se acumula aquí y se suma a ``flag_submission_repeats``.
+    """
+    
+    principal: str                      # "user:<id>" o "ip:<dirección>"
+    ctf_id: UUID
+    flag: str                           # Hash de la flag
+    count: int = 0
+    user_id: Optional[UUID] = None
+    ip_address: Optional[str] = None
+    last_at: datetime = field(default_factory=datetime.utcnow)
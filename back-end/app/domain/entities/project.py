@@ -8,6 +8,8 @@ from typing import List, Optional
 from uuid import UUID, uuid4
 from enum import Enum
 
+from .tracking import ChangeTracking
+
 
 class ProjectStatus(str, Enum):
     """Estados posibles de un proyecto."""
@@ -17,7 +19,7 @@ class ProjectStatus(str, Enum):
 
 
 @dataclass
-class Project:
+class Project(ChangeTracking):
     """Entidad de dominio para proyectos del portafolio."""
     
     title: str
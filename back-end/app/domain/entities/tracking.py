@@ -0,0 +1,60 @@
+"""
+Seguimiento de cambios (dirty tracking) para entidades de dominio.
+"""
+
+import copy
+from dataclasses import fields
+from typing import Any, ClassVar, Dict, FrozenSet, Optional, Set
+
+
+class ChangeTracking:
+    """
+    Mixin para dataclasses que recuerda el último estado persistido.
+
+    El repositorio llama a ``mark_persisted()`` al cargar o guardar la
+    entidad; ``changed_fields()`` compara el estado actual con esa copia,
+    de modo que también se detectan mutaciones en sitio de listas
+    (``skills.append(...)``). Una entidad sin estado persistido es nueva.
+    """
+
+    # Campos que no se comparan (identidad y colecciones gestionadas aparte)
+    _UNTRACKED_FIELDS: ClassVar[FrozenSet[str]] = frozenset({"id"})
+
+    def mark_persisted(self) -> None:
+        """Toma el estado actual como el persistido."""
+        object.__setattr__(self, "_persisted_state", self._tracked_state())
+
+    @property
+    def is_new(self) -> bool:
+        """True si la entidad aún no se ha cargado ni guardado."""
+        return self.__dict__.get("_persisted_state") is None
+
+    def changed_fields(self) -> Optional[Set[str]]:
+        """
+        Campos modificados desde el último estado persistido.
+
+        Returns:
+            Conjunto de nombres de campo, o None si la entidad es nueva.
+        """
+        persisted = self.__dict__.get("_persisted_state")
+        if persisted is None:
+            return None
+        return {
+            name
+            for name, value in self._tracked_state().items()
+            if persisted.get(name) != value
+        }
+
+    def persisted_value(self, name: str) -> Any:
+        """Valor persistido de un campo (o el actual si la entidad es nueva)."""
+        persisted = self.__dict__.get("_persisted_state")
+        if persisted is None:
+            return getattr(self, name)
+        return persisted[name]
+
+    def _tracked_state(self) -> Dict[str, Any]:
+        return {
+            f.name: copy.copy(getattr(self, f.name))
+            for f in fields(self)
+            if f.name not in self._UNTRACKED_FIELDS
+        }
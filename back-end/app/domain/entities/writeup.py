@@ -8,6 +8,8 @@ from typing import List, Optional
 from uuid import UUID, uuid4
 from enum import Enum
 
+from .tracking import ChangeTracking
+
 
 class WriteupStatus(str, Enum):
     """Estados de un writeup."""
@@ -17,7 +19,7 @@ class WriteupStatus(str, Enum):
 
 
 @dataclass
-class Writeup:
+class Writeup(ChangeTracking):
     """Entidad de dominio para writeups de CTF."""
     
     title: str
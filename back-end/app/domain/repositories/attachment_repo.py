@@ -4,7 +4,7 @@ Define la interfaz que debe implementar cualquier repositorio de adjuntos.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from uuid import UUID
 
 from ..entities.attachment import Attachment
@@ -18,6 +18,19 @@ class AttachmentRepository(ABC):
         """Guarda un adjunto."""
         pass
     
+    @abstractmethod
+    def save_many(self, attachments: List[Attachment]) -> int:
+        """
+        Guarda un lote de adjuntos (upsert por ID) en una sola transacción.
+        Retorna cantidad de adjuntos nuevos.
+        """
+        pass
+    
+    @abstractmethod
+    def stream_all(self, batch_size: int = 500) -> Iterator[Attachment]:
+        """Recorre todos los adjuntos leyendo por lotes, ordenados por ID."""
+        pass
+    
     @abstractmethod
     def get_by_id(self, attachment_id: UUID) -> Optional[Attachment]:
         """Obtiene un adjunto por su ID."""
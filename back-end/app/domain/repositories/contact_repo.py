@@ -8,6 +8,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from ..entities.contact import Contact, ContactStatus
+from ...core.pagination import Cursor
 
 
 class ContactRepository(ABC):
@@ -29,8 +30,14 @@ class ContactRepository(ABC):
         status: Optional[ContactStatus] = None,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[Cursor] = None,
     ) -> List[Contact]:
-        """Obtiene todos los mensajes con filtros opcionales."""
+        """
+        Obtiene todos los mensajes con filtros opcionales.
+        
+        Si se proporciona ``cursor`` se ignora ``skip`` (paginación keyset
+        sobre (created_at, id)).
+        """
         pass
     
     @abstractmethod
@@ -4,10 +4,11 @@ Define el contrato que debe cumplir cualquier implementación.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
 
 from ..entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus
+from ...core.pagination import Cursor
 
 
 class CTFRepository(ABC):
@@ -18,19 +19,62 @@ class CTFRepository(ABC):
         """Guarda un CTF (crear o actualizar)."""
         ...
     
+    @abstractmethod
+    def save_many(self, ctfs: List[CTF]) -> int:
+        """
+        Guarda un lote de CTFs (upsert por ID) en una sola transacción.
+        
+        Si falla, deshace el lote completo y relanza la excepción.
+        Devuelve cuántos CTFs no existían.
+        """
+        ...
+    
+    @abstractmethod
+    def stream_all(self, batch_size: int = 500) -> Iterator[CTF]:
+        """Recorre todos los CTFs (sin adjuntos) leyendo por lotes, ordenados por ID."""
+        ...
+    
     @abstractmethod
     def get_by_id(self, ctf_id: UUID) -> Optional[CTF]:
         """Obtiene un CTF por su ID."""
         ...
     
+    @abstractmethod
+    def get_for_submission(self, ctf_id: UUID) -> Optional[CTF]:
+        """
+        Obtiene la proyección ligera de un CTF para validar flags.
+        
+        Solo carga las columnas necesarias (estado, flag, puntos y las que
+        alimentan las estadísticas); sin descripción ni adjuntos.
+        """
+        ...
+    
+    @abstractmethod
+    def get_catalog_rows(self) -> List[Dict[str, Any]]:
+        """
+        Obtiene las columnas del listado de todos los CTFs publicados.
+        
+        Una sola consulta por columnas para el catálogo en memoria: sin
+        flag, adjuntos ni auditoría. ``skills`` y ``hints`` van
+        decodificados y nivel, categoría y estado como su valor.
+        """
+        ...
+    
     @abstractmethod
     def get_all(
         self,
         skip: int = 0,
-        limit: int = 100,
+        limit: Optional[int] = 100,
         status: Optional[CTFStatus] = None,
+        cursor: Optional[Cursor] = None,
+        skill: Optional[str] = None,
     ) -> List[CTF]:
-        """Obtiene todos los CTFs con paginación y filtros."""
+        """
+        Obtiene todos los CTFs con paginación y filtros.
+        
+        Si se proporciona ``cursor`` se ignora ``skip`` (paginación keyset
+        sobre (created_at, id)). ``skill`` filtra sin distinguir mayúsculas.
+        """
         ...
     
     @abstractmethod
@@ -49,7 +93,13 @@ class CTFRepository(ABC):
         ...
     
     @abstractmethod
-    def get_published(self, skip: int = 0, limit: int = 100) -> List[CTF]:
+    def get_published(
+        self,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        cursor: Optional[Cursor] = None,
+        skill: Optional[str] = None,
+    ) -> List[CTF]:
         """Obtiene solo los CTFs publicados."""
         ...
     
@@ -60,7 +110,39 @@ class CTFRepository(ABC):
     
     @abstractmethod
     def search(self, query: str) -> List[CTF]:
-        """Busca CTFs por título o tags."""
+        """Busca CTFs publicados por título, skills o descripción."""
+        ...
+    
+    @abstractmethod
+    def search_ranked(
+        self,
+        query: str,
+        skip: int = 0,
+        limit: Optional[int] = 10,
+        status: Optional[CTFStatus] = None,
+        level: Optional[CTFLevel] = None,
+        category: Optional[CTFCategory] = None,
+        platform: Optional[str] = None,
+        active_only: bool = False,
+        skill: Optional[str] = None,
+    ) -> Tuple[List[Tuple[CTF, float]], int]:
+        """
+        Búsqueda difusa (tolerante a errores) ordenada por relevancia.
+        
+        Args:
+            query: Texto buscado.
+            skip: Resultados a saltar.
+            limit: Máximo de resultados (None = sin límite).
+            status: Filtrar por estado (None = todos).
+            level: Filtrar por nivel.
+            category: Filtrar por categoría.
+            platform: Filtrar por plataforma (sin distinguir mayúsculas).
+            active_only: Excluir CTFs inactivos.
+            skill: Filtrar por skill.
+            
+        Returns:
+            Tupla (lista de (CTF, puntuación) de mayor a menor, total de resultados).
+        """
         ...
     
     @abstractmethod
@@ -73,11 +155,49 @@ class CTFRepository(ABC):
         self,
         status: Optional[CTFStatus] = None,
         category: Optional[CTFCategory] = None,
+        skill: Optional[str] = None,
     ) -> int:
         """Cuenta el número de CTFs con filtros opcionales."""
         ...
     
+    @abstractmethod
+    def get_facets(
+        self,
+        level: Optional[CTFLevel] = None,
+        category: Optional[CTFCategory] = None,
+        platform: Optional[str] = None,
+        skill: Optional[str] = None,
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Cuenta los CTFs publicados que cumplen los filtros, por faceta.
+        
+        Returns:
+            Diccionario {"skill"|"level"|"category"|"platform": {valor: total}}.
+        """
+        ...
+    
     @abstractmethod
     def get_statistics(self) -> dict:
-        """Obtiene estadísticas de CTFs (por nivel, categoría, etc.)."""
+        """
+        Obtiene estadísticas de los CTFs publicados.
+        
+        Returns:
+            Diccionario con total, solved, total_points, earned_points,
+            by_level, by_category y by_platform.
+        """
+        ...
+    
+    @abstractmethod
+    def reconcile_statistics(self, repair: bool = False) -> dict:
+        """
+        Recalcula las estadísticas desde cero y las compara con las almacenadas.
+        
+        Returns:
+            Diccionario con consistent, differences y repaired.
+        """
+        ...
+    
+    @abstractmethod
+    def rebuild_search_index(self) -> int:
+        """Reconstruye el índice de búsqueda. Devuelve el número de CTFs indexados."""
         ...
@@ -4,10 +4,13 @@ Define la interfaz para registrar y consultar intentos de flags.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import Iterator, List, Optional, Dict, Any, Set, Tuple
 from uuid import UUID
 
-from ..entities.flag_submission import FlagSubmission
+from ..entities.ctf import CTF
+from ..entities.flag_submission import FlagSubmission, RepeatedSubmission
+from ...core.pagination import Cursor
 
 
 class FlagSubmissionRepository(ABC):
@@ -19,13 +22,73 @@ class FlagSubmissionRepository(ABC):
         pass
     
     @abstractmethod
-    def get_by_ctf_id(self, ctf_id: UUID) -> List[FlagSubmission]:
-        """Obtiene todos los intentos de un CTF."""
+    def record_attempt(self, submission: FlagSubmission, ctf: CTF) -> FlagSubmission:
+        """
+        Registra un intento como una única unidad de trabajo.
+        
+        Inserta el intento y, si es correcto, lo marca como resuelto. Si
+        además hay usuario, registra su solve (insert-or-ignore sobre la
+        clave única (ctf_id, user_id)); solo cuando el solve es nuevo se
+        incrementa ``solved_count`` (``solved_count = solved_count + 1``) y
+        se fija el first blood si aún no lo había. Todo va en la misma
+        transacción y con un solo commit. ``ctf`` es la proyección leída
+        para validar la flag. Si es correcto, deja en ``submission.points``
+        los puntos acreditados (con puntuación dinámica, el valor tras el
+        solve, que puede ser menor que ``ctf.points``).
+        """
+        pass
+    
+    @abstractmethod
+    def record_repeats(self, repeats: List[RepeatedSubmission]) -> None:
+        """
+        Suma repeticiones agregadas de intentos incorrectos (una fila por
+        usuario o IP, CTF y hash de flag) en una sola transacción.
+        """
+        pass
+    
+    @abstractmethod
+    def get_by_ctf_id(
+        self,
+        ctf_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+    ) -> List[FlagSubmission]:
+        """
+        Obtiene los intentos de un CTF (más recientes primero).
+        
+        Si se proporciona ``cursor`` se ignora ``skip`` (paginación keyset
+        sobre (submitted_at, id)).
+        """
         pass
     
     @abstractmethod
-    def get_by_user_id(self, user_id: UUID) -> List[FlagSubmission]:
-        """Obtiene todos los intentos de un usuario."""
+    def get_by_user_id(
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+    ) -> List[FlagSubmission]:
+        """Obtiene los intentos de un usuario (más recientes primero)."""
+        pass
+    
+    @abstractmethod
+    def stream_rows(
+        self,
+        ctf_id: Optional[UUID] = None,
+        user_id: Optional[UUID] = None,
+        ip_address: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Tuple]:
+        """
+        Recorre los intentos filtrados, más antiguos primero, sin construir entidades.
+        
+        Returns:
+            Tuplas (id, ctf_id, user_id, ip_address, is_correct, submitted_at)
+        """
         pass
     
     @abstractmethod
@@ -38,9 +101,14 @@ class FlagSubmissionRepository(ABC):
         """Verifica si un usuario ya resolvió un CTF."""
         pass
     
+    @abstractmethod
+    def get_solved_ctf_ids(self, user_id: UUID) -> Set[str]:
+        """Obtiene los IDs de todos los CTFs que ha resuelto un usuario."""
+        pass
+    
     @abstractmethod
     def count_solvers(self, ctf_id: UUID) -> int:
-        """Cuenta usuarios únicos que resolvieron un CTF."""
+        """Cuenta usuarios únicos que resolvieron un CTF (``solved_count``)."""
         pass
     
     @abstractmethod
@@ -53,6 +121,46 @@ class FlagSubmissionRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_score_history(
+        self,
+        limit: int = 10,
+        bucket: str = "1h",
+        since: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Obtiene la evolución de la puntuación de los primeros del ranking.
+        
+        Returns:
+            Lista de diccionarios del ranking con ``points``: [(fecha, puntos, solves)]
+        """
+        pass
+    
+    @abstractmethod
+    def get_recommendations(self, user_id: UUID, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Obtiene los CTFs no resueltos que más se parecen a los que ha resuelto el usuario.
+        
+        Returns:
+            Lista de diccionarios con id, title, points, category, level, score, source
+        """
+        pass
+    
+    @abstractmethod
+    def get_ctf_analytics(
+        self,
+        ctf_id: UUID,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Obtiene las analíticas horarias de intentos y solves de un CTF.
+        
+        Returns:
+            Diccionario con ``hours`` (una fila por hora con actividad) y los totales del rango
+        """
+        pass
+    
     @abstractmethod
     def get_user_stats(self, user_id: UUID) -> Optional[Dict[str, Any]]:
         """
@@ -62,3 +170,16 @@ class FlagSubmissionRepository(ABC):
             Diccionario con total_points, solved_count, rank, solved_ctfs
         """
         pass
+    
+    @abstractmethod
+    def reconcile_scores(self, repair: bool = False) -> Dict[str, Any]:
+        """
+        Recalcula las puntuaciones por usuario desde los solves y las compara.
+        
+        Args:
+            repair: Si es True, corrige las puntuaciones que no coinciden.
+            
+        Returns:
+            Diccionario con consistent, checked, mismatched, differences y repaired.
+        """
+        pass
@@ -8,6 +8,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from ..entities.project import Project, ProjectStatus
+from ...core.pagination import Cursor
 
 
 class ProjectRepository(ABC):
@@ -29,8 +30,14 @@ class ProjectRepository(ABC):
         skip: int = 0,
         limit: int = 100,
         status: Optional[ProjectStatus] = None,
+        cursor: Optional[Cursor] = None,
     ) -> List[Project]:
-        """Obtiene todos los proyectos con paginación y filtros."""
+        """
+        Obtiene todos los proyectos con paginación y filtros.
+        
+        Si se proporciona ``cursor`` se ignora ``skip`` (paginación keyset
+        sobre (order, id)).
+        """
         ...
     
     @abstractmethod
@@ -39,7 +46,12 @@ class ProjectRepository(ABC):
         ...
     
     @abstractmethod
-    def get_published(self, skip: int = 0, limit: int = 100) -> List[Project]:
+    def get_published(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+    ) -> List[Project]:
         """Obtiene solo los proyectos publicados."""
         ...
     
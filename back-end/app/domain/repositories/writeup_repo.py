@@ -4,10 +4,11 @@ Define el contrato que debe cumplir cualquier implementación.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional, Set
 from uuid import UUID
 
 from ..entities.writeup import Writeup, WriteupStatus
+from ...core.pagination import Cursor
 
 
 class WriteupRepository(ABC):
@@ -18,6 +19,20 @@ class WriteupRepository(ABC):
         """Guarda un writeup (crear o actualizar)."""
         ...
     
+    @abstractmethod
+    def save_many(self, writeups: List[Writeup]) -> int:
+        """
+        Guarda un lote de writeups (upsert por ID) en una sola transacción.
+        
+        Devuelve cuántos writeups no existían.
+        """
+        ...
+    
+    @abstractmethod
+    def stream_all(self, batch_size: int = 500) -> Iterator[Writeup]:
+        """Recorre todos los writeups leyendo por lotes, ordenados por ID."""
+        ...
+    
     @abstractmethod
     def get_by_id(self, writeup_id: UUID) -> Optional[Writeup]:
         """Obtiene un writeup por su ID."""
@@ -28,18 +43,34 @@ class WriteupRepository(ABC):
         """Obtiene el writeup asociado a un CTF."""
         ...
     
+    @abstractmethod
+    def get_ctf_ids_with_writeup(self) -> Set[UUID]:
+        """Obtiene los IDs de los CTFs que tienen algún writeup."""
+        ...
+    
     @abstractmethod
     def get_all(
         self,
         skip: int = 0,
         limit: int = 100,
         status: Optional[WriteupStatus] = None,
+        cursor: Optional[Cursor] = None,
     ) -> List[Writeup]:
-        """Obtiene todos los writeups con paginación y filtros."""
+        """
+        Obtiene todos los writeups con paginación y filtros.
+        
+        Si se proporciona ``cursor`` se ignora ``skip`` (paginación keyset
+        sobre (created_at, id)).
+        """
         ...
     
     @abstractmethod
-    def get_published(self, skip: int = 0, limit: int = 100) -> List[Writeup]:
+    def get_published(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+    ) -> List[Writeup]:
         """Obtiene solo los writeups publicados."""
         ...
     
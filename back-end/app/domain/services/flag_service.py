@@ -3,6 +3,7 @@ Servicio de dominio para validación de flags.
 Contiene la lógica de negocio para submit de flags en CTFs.
 """
 
+from enum import Enum
 from typing import Optional, Tuple
 from uuid import UUID
 from datetime import datetime
@@ -12,18 +13,43 @@ from ..entities.ctf import CTF
 from ..entities.flag_submission import FlagSubmission
 from ..repositories.ctf_repo import CTFRepository
 from ..repositories.flag_submission_repo import FlagSubmissionRepository
+from .submission_cache import SubmissionCache
+
+
+WRONG_FLAG_MESSAGE = "Flag incorrecta. Sigue intentando."
+
+
+class FlagVerdict(str, Enum):
+    """Resultado de un envío de flag."""
+    CORRECT = "correct"
+    WRONG = "wrong"  # La flag se evaluó (o se repitió un fallo reciente) y no coincide
+    ALREADY_SOLVED = "already_solved"
+    INVALID_FORMAT = "invalid_format"
+    UNAVAILABLE = "unavailable"
+    
+    @property
+    def evaluated(self) -> bool:
+        """Si la flag llegó a compararse (solo entonces cuenta para el throttle)."""
+        return self in (FlagVerdict.CORRECT, FlagVerdict.WRONG)
 
 
 class FlagService:
-    """Servicio de dominio para lógica de validación de flags."""
+    """
+    Servicio de dominio para lógica de validación de flags.
+    
+    Con ``submission_cache`` una repetición reciente de un intento
+    incorrecto se responde desde memoria y solo suma a un contador agregado.
+    """
     
     def __init__(
         self,
         ctf_repository: CTFRepository,
         submission_repository: FlagSubmissionRepository,
+        submission_cache: Optional[SubmissionCache] = None,
     ):
         self.ctf_repository = ctf_repository
         self.submission_repository = submission_repository
+        self.submission_cache = submission_cache
     
     def submit_flag(
         self,
@@ -33,7 +59,28 @@ class FlagService:
         ip_address: Optional[str] = None,
     ) -> Tuple[bool, str, Optional[int]]:
         """
-        Valida un intento de flag.
+        Valida un intento de flag (ver ``evaluate_flag``).
+        
+        Returns:
+            Tuple de (éxito, mensaje, puntos_ganados)
+        """
+        verdict, message, points = self.evaluate_flag(ctf_id, flag, user_id, ip_address)
+        return verdict is FlagVerdict.CORRECT, message, points
+    
+    def evaluate_flag(
+        self,
+        ctf_id: UUID,
+        flag: str,
+        user_id: Optional[UUID] = None,
+        ip_address: Optional[str] = None,
+    ) -> Tuple[FlagVerdict, str, Optional[int]]:
+        """
+        Valida un intento de flag en una sola unidad de trabajo.
+        
+        Lee una proyección ligera del CTF, comprueba si el usuario ya lo
+        resolvió y registra el intento (más el contador si es correcto)
+        con un único commit. Si el mismo usuario (o IP) acaba de enviar
+        esa misma flag incorrecta, responde sin leer el CTF ni insertar.
         
         Args:
             ctf_id: ID del CTF
@@ -42,32 +89,44 @@ class FlagService:
             ip_address: IP del solicitante
             
         Returns:
-            Tuple de (éxito, mensaje, puntos_ganados)
+            Tuple de (veredicto, mensaje, puntos_ganados)
+            
+        Raises:
+            LookupError: Si el CTF no existe.
+            ValueError: Si el CTF no está activo.
         """
-        # Obtener CTF
-        ctf = self.ctf_repository.get_by_id(ctf_id)
+        # Hash de la flag para almacenamiento seguro (y clave de la caché)
+        flag_hash = hashlib.sha256(flag.strip().encode()).hexdigest()
+        
+        cache = self.submission_cache
+        if cache is not None and cache.hit(ctf_id, flag_hash, user_id, ip_address):
+            self._flush_repeats()
+            return FlagVerdict.WRONG, WRONG_FLAG_MESSAGE, None
+        
+        # Obtener CTF (sin adjuntos ni descripción)
+        ctf = self.ctf_repository.get_for_submission(ctf_id)
         if not ctf:
-            return False, "CTF no encontrado", None
+            raise LookupError("CTF not found")
+        
+        if not ctf.is_active:
+            raise ValueError("This challenge is not active")
         
         # Verificar que el CTF está disponible
         if not ctf.is_available:
-            return False, "Este reto no está disponible", None
+            return FlagVerdict.UNAVAILABLE, "Este reto no está disponible", None
+        
+        # Validar formato de flag (antes de tocar la base de datos)
+        if not self._validate_flag_format(flag):
+            return FlagVerdict.INVALID_FORMAT, "Formato de flag inválido", None
         
         # Verificar si el usuario ya resolvió este CTF
         if user_id and self.submission_repository.has_user_solved(ctf_id, user_id):
-            return False, "Ya has resuelto este reto", None
-        
-        # Validar formato de flag
-        if not self._validate_flag_format(flag):
-            return False, "Formato de flag inválido", None
+            return FlagVerdict.ALREADY_SOLVED, "Ya has resuelto este reto", None
         
         # Verificar flag
         is_correct = ctf.verify_flag(flag.strip())
         
-        # Hash de la flag para almacenamiento seguro
-        flag_hash = hashlib.sha256(flag.strip().encode()).hexdigest()
-        
-        # Registrar intento
+        # Registrar intento (y solved_count si es correcto) en una transacción
         submission = FlagSubmission(
             ctf_id=ctf_id,
             flag=flag_hash,  # Guardamos el hash, no el texto plano
@@ -75,17 +134,36 @@ class FlagService:
             is_correct=is_correct,
             ip_address=ip_address,
         )
-        self.submission_repository.save(submission)
+        self.submission_repository.record_attempt(submission, ctf)
         
         if is_correct:
-            # Marcar CTF como resuelto y actualizar contador
-            ctf.mark_as_solved()
-            ctf.increment_solved_count()
-            self.ctf_repository.save(ctf)
-            
-            return True, f"¡Correcto! +{ctf.points} puntos", ctf.points
+            # Puntos acreditados (con puntuación dinámica, ya con el decaimiento)
+            points = submission.points if submission.points is not None else ctf.points
+            return FlagVerdict.CORRECT, f"¡Correcto! +{points} puntos", points
         
-        return False, "Flag incorrecta. Sigue intentando.", None
+        if cache is not None:
+            cache.store(ctf_id, flag_hash, user_id, ip_address)
+            self._flush_repeats()
+        return FlagVerdict.WRONG, WRONG_FLAG_MESSAGE, None
+    
+    def flush_repeats(self) -> int:
+        """Vuelca ya todas las repeticiones acumuladas (p. ej. al apagar)."""
+        return self._flush_repeats(force=True)
+    
+    def _flush_repeats(self, force: bool = False) -> int:
+        """Vuelca las repeticiones si toca; si falla, vuelven al acumulador."""
+        if self.submission_cache is None:
+            return 0
+        repeats = self.submission_cache.drain_repeats(force=force)
+        if not repeats:
+            return 0
+        try:
+            self.submission_repository.record_repeats(repeats)
+        except Exception:
+            # La respuesta ya está decidida: el contador se reintenta más tarde
+            self.submission_cache.restore(repeats)
+            return 0
+        return sum(repeat.count for repeat in repeats)
     
     def _validate_flag_format(self, flag: str) -> bool:
         """Valida el formato básico de una flag."""
@@ -0,0 +1,138 @@
+"""
+Caché de usuarios autenticados (principals verificados).
+
+``get_current_user`` verifica la firma y la caducidad del JWT en cada
+petición, pero cargar el usuario de la base de datos para comprobar que
+existe y sigue activo era una consulta más por petición autenticada
+(incluidos todos los envíos de flags). Tras una carga correcta se guardan
+aquí los datos que necesita la autorización durante ``ttl`` segundos.
+
+La clave es (usuario, hash del token): otro token del mismo usuario vuelve
+a cargar de la base de datos, y los tokens no se guardan en claro. Guardar
+o borrar un usuario invalida todas sus entradas en este proceso; en otros
+workers un cambio (p. ej. desactivarlo) tarda como mucho ``ttl`` segundos.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from ..entities.user import User
+from ...core.config import settings
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Datos de un usuario verificado que usan los endpoints (sin el hash de la contraseña)."""
+    id: UUID
+    email: str
+    username: str
+    is_active: bool
+    is_admin: bool
+    created_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(user.id, user.email, user.username, user.is_active, user.is_admin, user.created_at)
+
+    def to_user(self) -> User:
+        """Usuario para el endpoint; ``hashed_password`` va vacío (al guardarlo se conserva el almacenado)."""
+        return User(
+            id=self.id,
+            email=self.email,
+            username=self.username,
+            hashed_password="",
+            is_active=self.is_active,
+            is_admin=self.is_admin,
+            created_at=self.created_at,
+        )
+
+
+class PrincipalCache:
+    """
+    LRU con TTL de principals por usuario y token.
+
+    Args:
+        ttl: Segundos que se confía en un principal sin volver a cargarlo (0 desactiva).
+        max_entries: Usuarios como máximo (se descartan los menos recientes).
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # usuario -> {hash del token: (caduca en, principal)}
+        self._entries: "OrderedDict[str, Dict[bytes, Tuple[float, Principal]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = dict.fromkeys(("hits", "misses", "invalidations"), 0)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    @staticmethod
+    def _token_key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, user_id: str, token: str) -> Optional[Principal]:
+        """Principal verificado para ese usuario y token, o None si hay que cargarlo."""
+        if not self.enabled:
+            return None
+        token_key = self._token_key(token)
+        with self._lock:
+            tokens = self._entries.get(user_id)
+            entry = tokens.get(token_key) if tokens else None
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del tokens[token_key]
+                self._counters["misses"] += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self._counters["hits"] += 1
+            return entry[1]
+
+    def put(self, token: str, user: User) -> Principal:
+        """Guarda el principal de un usuario recién cargado y verificado."""
+        principal = Principal.from_user(user)
+        if not self.enabled:
+            return principal
+        user_id = str(user.id)
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            tokens = self._entries.setdefault(user_id, {})
+            # Quita los tokens caducados del usuario (p. ej. tras renovar el token)
+            now = time.monotonic()
+            for key in [key for key, (until, _) in tokens.items() if until <= now]:
+                del tokens[key]
+            tokens[self._token_key(token)] = (expires, principal)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return principal
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Olvida todos los tokens del usuario (tras guardarlo o borrarlo)."""
+        with self._lock:
+            if self._entries.pop(str(user_id), None) is not None:
+                self._counters["invalidations"] += 1
+
+    def clear(self) -> None:
+        """Olvida todos los principals."""
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> Dict[str, int]:
+        """Aciertos, fallos, invalidaciones y usuarios en caché."""
+        with self._lock:
+            return {**self._counters, "entries": len(self._entries)}
+
+
+# Instancia global
+principal_cache = PrincipalCache(
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    max_entries=settings.PRINCIPAL_CACHE_SIZE,
+)
@@ -0,0 +1,213 @@
+"""
+Motor compartido de evaluación de flags regex.
+
+Las flags regex se evalúan con ``re`` (backtracking), así que un patrón o
+una entrada maliciosa pueden tardar indefinidamente (ReDoS). Un hilo no se
+puede matar, de modo que la evaluación se hace en un pequeño pool de
+procesos de larga vida:
+
+- Cada evaluación toma un proceso libre, le envía (clave, patrón, texto)
+  por un pipe y espera la respuesta como mucho ``timeout`` segundos.
+- Si no responde a tiempo el proceso se mata y se sustituye por uno nuevo;
+  la CPU que estaba quemando se libera en ese momento.
+- Cada proceso mantiene un LRU de patrones compilados con clave
+  (id del CTF, patrón), así que un patrón se compila una vez por proceso
+  y cambiarlo en un CTF no reutiliza la versión anterior.
+
+El pool se arranca perezosamente en la primera evaluación (y de nuevo si
+el proceso se bifurca, p. ej. en workers de gunicorn).
+"""
+
+import multiprocessing
+import os
+import queue
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from ...core.config import settings
+
+
+def _worker_main(conn, cache_size: int) -> None:
+    """Bucle de un proceso evaluador: recibe peticiones y responde por ``conn``."""
+    cache: "OrderedDict[Tuple[str, str], re.Pattern]" = OrderedDict()
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+
+        key, pattern, text = message
+        compiled = cache.get(key)
+        hit = compiled is not None
+        try:
+            if compiled is None:
+                compiled = re.compile(pattern)
+                cache[key] = compiled
+                if len(cache) > cache_size:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(key)
+            conn.send((compiled.match(text) is not None, hit, None))
+        except re.error as e:
+            conn.send((False, hit, str(e)))
+
+
+class _Worker:
+    """Proceso evaluador y el extremo del pipe del proceso padre."""
+
+    def __init__(self, context, cache_size: int):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, cache_size),
+            name="flag-regex-worker",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+
+    def stop(self, force: bool = False) -> None:
+        if not force:
+            try:
+                self.conn.send(None)
+                self.process.join(timeout=0.5)
+            except (OSError, ValueError):
+                pass
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout=1)
+        self.conn.close()
+
+
+class RegexEngine:
+    """
+    Pool de procesos para evaluar flags regex con timeout real.
+
+    Args:
+        workers: Procesos evaluadores.
+        timeout: Segundos máximos por evaluación.
+        cache_size: Patrones compilados que guarda cada proceso.
+        start_method: Método de multiprocessing (por defecto ``fork`` si
+            existe, para no reimportar la aplicación en cada proceso).
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        timeout: float = 1.0,
+        cache_size: int = 256,
+        start_method: Optional[str] = None,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be positive")
+        self.workers = workers
+        self.timeout = timeout
+        self.cache_size = cache_size
+        if start_method is None:
+            start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        self._context = multiprocessing.get_context(start_method)
+        self._lock = threading.Lock()
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._pid: Optional[int] = None
+        self._counters: Dict[str, int] = dict.fromkeys(
+            ("evaluations", "matches", "timeouts", "restarts", "errors",
+             "saturated", "cache_hits", "cache_misses"),
+            0,
+        )
+
+    def match(self, pattern: str, text: str, cache_key: str = "") -> bool:
+        """
+        Evalúa ``re.match(pattern, text)`` en un proceso del pool.
+
+        Args:
+            pattern: Patrón regex.
+            text: Texto a evaluar.
+            cache_key: Identificador del dueño del patrón (id del CTF).
+
+        Returns:
+            True si hay match; False si no, si el patrón es inválido, si se
+            supera el timeout o si no hay un proceso libre a tiempo.
+        """
+        self._ensure_started()
+        self._count("evaluations")
+
+        try:
+            worker = self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            self._count("saturated")
+            return False
+
+        try:
+            worker.conn.send(((cache_key, pattern), pattern, text))
+            if not worker.conn.poll(self.timeout):
+                # Posible ReDoS: matar el proceso libera la CPU
+                self._count("timeouts")
+                worker = self._replace(worker)
+                return False
+            matched, hit, error = worker.conn.recv()
+        except (EOFError, OSError):
+            self._count("errors")
+            worker = self._replace(worker)
+            return False
+        finally:
+            self._idle.put(worker)
+
+        self._count("cache_hits" if hit else "cache_misses")
+        if error is not None:
+            self._count("errors")
+        if matched:
+            self._count("matches")
+        return matched
+
+    def metrics(self) -> Dict[str, int]:
+        """Contadores acumulados del motor."""
+        with self._lock:
+            snapshot = dict(self._counters)
+        snapshot["workers"] = self.workers if self._pid == os.getpid() else 0
+        return snapshot
+
+    def shutdown(self) -> None:
+        """Detiene todos los procesos del pool (se rearranca al volver a usarlo)."""
+        with self._lock:
+            if self._pid != os.getpid():
+                return
+            self._pid = None
+            for _ in range(self.workers):
+                try:
+                    worker = self._idle.get(timeout=self.timeout)
+                except queue.Empty:
+                    continue
+                worker.stop()
+
+    def _ensure_started(self) -> None:
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # Tras un fork los procesos y pipes heredados no son nuestros
+            self._idle = queue.Queue()
+            for _ in range(self.workers):
+                self._idle.put(_Worker(self._context, self.cache_size))
+            self._pid = os.getpid()
+
+    def _replace(self, worker: _Worker) -> _Worker:
+        worker.stop(force=True)
+        self._count("restarts")
+        return _Worker(self._context, self.cache_size)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+
+# Instancia global
+regex_engine = RegexEngine(
+    workers=settings.FLAG_REGEX_WORKERS,
+    timeout=settings.FLAG_REGEX_TIMEOUT_SECONDS,
+    cache_size=settings.FLAG_REGEX_CACHE_SIZE,
+)
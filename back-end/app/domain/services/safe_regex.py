@@ -0,0 +1,454 @@
+"""
+Matcher de regex en tiempo lineal para flags.
+
+Las flags regex se escriben con la sintaxis de ``re``, pero en lugar de
+evaluarse con backtracking se compilan a un autómata de Thompson:
+
+- Un parser acepta un subconjunto de la sintaxis (literales, escapes, ``.``,
+  clases, grupos, alternancia, cuantificadores y anclas) y rechaza lo que
+  no es regular o no se puede emular con exactitud (referencias hacia
+  atrás, lookarounds, ``\\b``, flags inline...).
+- El AST se traduce a un programa NFA (char, split, jmp, assert, match).
+- La simulación avanza todos los estados a la vez, así que el coste es
+  O(len(texto) * len(programa)) sin importar el patrón. Los conjuntos de
+  estados de las posiciones intermedias se cachean como un DFA perezoso.
+
+La semántica es la de ``re.match``: el patrón debe coincidir desde el
+inicio del texto, pero no tiene por qué consumirlo entero.
+"""
+
+import unicodedata
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+
+# Tamaño máximo del programa NFA (limita la expansión de {n,m})
+MAX_PROGRAM_SIZE = 5000
+
+# Máximo de transiciones cacheadas por patrón
+MAX_DFA_TRANSITIONS = 10000
+
+
+class UnsupportedPatternError(ValueError):
+    """El patrón usa una construcción que el matcher seguro no admite."""
+
+
+# Clases de caracteres con la misma definición que ``re`` para patrones str
+_CATEGORIES: Dict[str, Callable[[str], bool]] = {
+    "d": str.isdecimal,
+    "w": lambda ch: ch.isalnum() or ch == "_",
+    "s": str.isspace,
+}
+
+_CONTROL_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "f": "\f", "v": "\v", "a": "\a"}
+
+_DIGITS = "0123456789"
+_OCTAL = "01234567"
+
+
+class CharSet:
+    """Conjunto de caracteres: literales, rangos y categorías (\\d, \\w, \\s)."""
+
+    __slots__ = ("chars", "ranges", "categories", "negated")
+
+    def __init__(self, negated: bool = False):
+        self.chars = set()
+        self.ranges: List[Tuple[str, str]] = []
+        self.categories: List[Tuple[Callable[[str], bool], bool]] = []
+        self.negated = negated
+
+    @classmethod
+    def category(cls, code: str) -> "CharSet":
+        charset = cls()
+        charset.categories.append((_CATEGORIES[code.lower()], code.isupper()))
+        return charset
+
+    def __contains__(self, ch: str) -> bool:
+        found = (
+            ch in self.chars
+            or any(low <= ch <= high for low, high in self.ranges)
+            or any(test(ch) != inverted for test, inverted in self.categories)
+        )
+        return found != self.negated
+
+
+# Nodos del AST (tuplas): ("lit", ch) ("set", CharSet) ("any",) ("assert", kind)
+# ("cat", [nodos]) ("alt", [nodos]) ("repeat", nodo, min, max|None)
+
+class _Parser:
+    """Parser descendente recursivo del subconjunto soportado."""
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.pos = 0
+
+    def parse(self):
+        node = self._alternation()
+        if self.pos < len(self.pattern):
+            raise UnsupportedPatternError(f"unbalanced parenthesis at position {self.pos}")
+        return node
+
+    # Utilidades
+
+    def _peek(self, offset: int = 0) -> Optional[str]:
+        index = self.pos + offset
+        return self.pattern[index] if index < len(self.pattern) else None
+
+    def _next(self) -> str:
+        if self.pos >= len(self.pattern):
+            raise UnsupportedPatternError("unexpected end of pattern")
+        ch = self.pattern[self.pos]
+        self.pos += 1
+        return ch
+
+    def _unsupported(self, what: str):
+        raise UnsupportedPatternError(f"{what} is not supported in regex flags (position {self.pos})")
+
+    # Gramática
+
+    def _alternation(self):
+        branches = [self._sequence()]
+        while self._peek() == "|":
+            self.pos += 1
+            branches.append(self._sequence())
+        return branches[0] if len(branches) == 1 else ("alt", branches)
+
+    def _sequence(self):
+        items = []
+        while self._peek() is not None and self._peek() not in "|)":
+            items.append(self._quantified(self._atom()))
+        return items[0] if len(items) == 1 else ("cat", items)
+
+    def _quantified(self, atom):
+        ch = self._peek()
+        if ch in ("*", "+", "?"):
+            self.pos += 1
+            low, high = {"*": (0, None), "+": (1, None), "?": (0, 1)}[ch]
+        elif ch == "{":
+            bounds = self._repeat_bounds()
+            if bounds is None:
+                return atom
+            low, high = bounds
+        else:
+            return atom
+
+        if self._peek() == "?":
+            # Perezoso: para saber si hay match es igual que el voraz
+            self.pos += 1
+        elif self._peek() == "+":
+            self._unsupported("possessive quantifier")
+        return ("repeat", atom, low, high)
+
+    def _repeat_bounds(self) -> Optional[Tuple[int, Optional[int]]]:
+        """Lee {n}, {n,}, {,m} o {n,m}. Si no es un cuantificador, ``{`` es literal."""
+        start = self.pos
+        self.pos += 1
+        low = ""
+        while self._peek() is not None and self._peek() in _DIGITS:
+            low += self._next()
+        if self._peek() == ",":
+            self.pos += 1
+            high = ""
+            while self._peek() is not None and self._peek() in _DIGITS:
+                high += self._next()
+        else:
+            high = low
+        if self._peek() != "}" or (start + 1 == self.pos):
+            self.pos = start
+            return None
+        self.pos += 1
+        minimum = int(low) if low else 0
+        maximum = int(high) if high else None
+        if maximum is not None and maximum < minimum:
+            raise UnsupportedPatternError("min repeat greater than max repeat")
+        return minimum, maximum
+
+    def _atom(self):
+        ch = self._next()
+        if ch == "(":
+            return self._group()
+        if ch == "[":
+            return self._charset()
+        if ch == ".":
+            return ("any",)
+        if ch == "^":
+            return ("assert", "bol")
+        if ch == "$":
+            return ("assert", "eol")
+        if ch == "\\":
+            return self._escape(in_class=False)
+        if ch in "*+?":
+            raise UnsupportedPatternError("nothing to repeat")
+        if ch == "{":
+            self.pos -= 1
+            if self._repeat_bounds() is not None:
+                raise UnsupportedPatternError("nothing to repeat")
+            self.pos += 1
+        return ("lit", ch)
+
+    def _group(self):
+        if self._peek() == "?":
+            self.pos += 1
+            kind = self._next()
+            if kind == ":":
+                pass
+            elif kind == "P" and self._peek() == "<":
+                end = self.pattern.find(">", self.pos)
+                if end == -1:
+                    raise UnsupportedPatternError("missing >, unterminated name")
+                self.pos = end + 1
+            elif kind in "=!<":
+                self._unsupported("lookaround")
+            elif kind == "P":
+                self._unsupported("named backreference")
+            else:
+                self._unsupported("inline flag or extension group")
+        node = self._alternation()
+        if self._peek() != ")":
+            raise UnsupportedPatternError("missing ), unterminated subpattern")
+        self.pos += 1
+        return node
+
+    def _charset(self):
+        charset = CharSet(negated=self._peek() == "^")
+        if charset.negated:
+            self.pos += 1
+        first = True
+        while True:
+            ch = self._next()
+            if ch == "]" and not first:
+                return ("set", charset)
+            first = False
+
+            if ch == "\\":
+                item = self._escape(in_class=True)
+                if item[0] == "set":
+                    charset.categories.extend(item[1].categories)
+                    continue
+                low = item[1]
+            else:
+                low = ch
+
+            if self._peek() == "-" and self._peek(1) not in (None, "]"):
+                self.pos += 1
+                end = self._next()
+                if end == "\\":
+                    item = self._escape(in_class=True)
+                    if item[0] == "set":
+                        raise UnsupportedPatternError("bad character range")
+                    end = item[1]
+                if end < low:
+                    raise UnsupportedPatternError("bad character range")
+                charset.ranges.append((low, end))
+            else:
+                charset.chars.add(low)
+
+    def _escape(self, in_class: bool):
+        ch = self._next()
+        if ch in "dDwWsS":
+            return ("set", CharSet.category(ch))
+        if ch in _CONTROL_ESCAPES:
+            return ("lit", _CONTROL_ESCAPES[ch])
+        if ch == "b" and in_class:
+            return ("lit", "\b")
+        if ch == "A" and not in_class:
+            return ("assert", "bos")
+        if ch == "Z" and not in_class:
+            return ("assert", "eos")
+        if ch == "x":
+            return ("lit", self._hex(2))
+        if ch == "u":
+            return ("lit", self._hex(4))
+        if ch == "U":
+            return ("lit", self._hex(8))
+        if ch == "N":
+            if self._peek() != "{":
+                raise UnsupportedPatternError("missing {")
+            end = self.pattern.find("}", self.pos)
+            if end == -1:
+                raise UnsupportedPatternError("missing }")
+            name = self.pattern[self.pos + 1:end]
+            self.pos = end + 1
+            try:
+                return ("lit", unicodedata.lookup(name))
+            except KeyError:
+                raise UnsupportedPatternError(f"undefined character name {name!r}")
+        if ch == "0":
+            digits = ""
+            while len(digits) < 2 and self._peek() is not None and self._peek() in _OCTAL:
+                digits += self._next()
+            return ("lit", chr(int(digits or "0", 8)))
+        if ch in _DIGITS:
+            self._unsupported("backreference")
+        if ch in "bB":
+            self._unsupported("word boundary")
+        if ch.isascii() and ch.isalpha():
+            self._unsupported(f"escape \\{ch}")
+        return ("lit", ch)
+
+    def _hex(self, size: int) -> str:
+        digits = self.pattern[self.pos:self.pos + size]
+        if len(digits) != size or any(c not in "0123456789abcdefABCDEF" for c in digits):
+            raise UnsupportedPatternError("incomplete escape")
+        self.pos += size
+        value = int(digits, 16)
+        if value > 0x10FFFF:
+            raise UnsupportedPatternError("bad escape")
+        return chr(value)
+
+
+# Instrucciones del programa NFA
+_CHAR, _SPLIT, _JMP, _ASSERT, _MATCH = range(5)
+
+
+class _Compiler:
+    """Traduce el AST a un programa NFA de Thompson."""
+
+    def __init__(self):
+        self.program: List[list] = []
+
+    def compile(self, node) -> List[tuple]:
+        self._emit(node)
+        self._add([_MATCH])
+        return [tuple(instruction) for instruction in self.program]
+
+    def _add(self, instruction: list) -> int:
+        if len(self.program) >= MAX_PROGRAM_SIZE:
+            raise UnsupportedPatternError("pattern is too complex")
+        self.program.append(instruction)
+        return len(self.program) - 1
+
+    def _emit(self, node) -> None:
+        kind = node[0]
+        if kind == "lit":
+            literal = node[1]
+            self._add([_CHAR, lambda ch, literal=literal: ch == literal])
+        elif kind == "set":
+            self._add([_CHAR, node[1].__contains__])
+        elif kind == "any":
+            self._add([_CHAR, lambda ch: ch != "\n"])
+        elif kind == "assert":
+            self._add([_ASSERT, node[1]])
+        elif kind == "cat":
+            for child in node[1]:
+                self._emit(child)
+        elif kind == "alt":
+            exits = []
+            branches = node[1]
+            for branch in branches[:-1]:
+                split = self._add([_SPLIT, len(self.program) + 1, None])
+                self._emit(branch)
+                exits.append(self._add([_JMP, None]))
+                self.program[split][2] = len(self.program)
+            self._emit(branches[-1])
+            for jump in exits:
+                self.program[jump][1] = len(self.program)
+        elif kind == "repeat":
+            _, child, low, high = node
+            for _ in range(low):
+                self._emit(child)
+            if high is None:
+                loop = self._add([_SPLIT, len(self.program) + 1, None])
+                self._emit(child)
+                self._add([_JMP, loop])
+                self.program[loop][2] = len(self.program)
+            else:
+                splits = []
+                for _ in range(high - low):
+                    splits.append(self._add([_SPLIT, len(self.program) + 1, None]))
+                    self._emit(child)
+                for split in splits:
+                    self.program[split][2] = len(self.program)
+
+
+class SafePattern:
+    """Patrón compilado a NFA con la semántica de ``re.match`` (sin backtracking)."""
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.program = _Compiler().compile(_Parser(pattern).parse())
+        self._match_pc = len(self.program) - 1
+        self._transitions: Dict[Tuple[FrozenSet[int], str], FrozenSet[int]] = {}
+
+    def match(self, text: str) -> bool:
+        """True si el patrón coincide con un prefijo de ``text``."""
+        states = self._closure((0,), 0, text)
+        for pos, ch in enumerate(text):
+            if self._match_pc in states:
+                return True
+            states = self._step(states, ch, pos + 1, text)
+            if not states:
+                return False
+        return self._match_pc in states
+
+    def _step(self, states: FrozenSet[int], ch: str, pos: int, text: str) -> FrozenSet[int]:
+        # Solo al final del texto (o antes de un \n final) dependen de la posición
+        cacheable = pos < len(text) - 1 or (pos == len(text) - 1 and text[pos] != "\n")
+        if cacheable:
+            cached = self._transitions.get((states, ch))
+            if cached is not None:
+                return cached
+
+        program = self.program
+        kernel = [pc + 1 for pc in states if program[pc][0] == _CHAR and program[pc][1](ch)]
+        result = self._closure(kernel, pos, text)
+
+        if cacheable:
+            if len(self._transitions) >= MAX_DFA_TRANSITIONS:
+                self._transitions.clear()
+            self._transitions[(states, ch)] = result
+        return result
+
+    def _closure(self, pcs, pos: int, text: str) -> FrozenSet[int]:
+        """Estados alcanzables sin consumir caracteres desde ``pcs`` en ``pos``."""
+        program = self.program
+        size = len(text)
+        seen = set()
+        result = set()
+        stack = list(pcs)
+        while stack:
+            pc = stack.pop()
+            if pc in seen:
+                continue
+            seen.add(pc)
+            instruction = program[pc]
+            op = instruction[0]
+            if op == _SPLIT:
+                stack.append(instruction[2])
+                stack.append(instruction[1])
+            elif op == _JMP:
+                stack.append(instruction[1])
+            elif op == _ASSERT:
+                if _assertion_holds(instruction[1], pos, text, size):
+                    stack.append(pc + 1)
+            else:
+                result.add(pc)
+        return frozenset(result)
+
+
+def _assertion_holds(kind: str, pos: int, text: str, size: int) -> bool:
+    if kind in ("bol", "bos"):
+        return pos == 0
+    if kind == "eos":
+        return pos == size
+    # $ sin MULTILINE: al final o justo antes de un \n final
+    return pos == size or (pos == size - 1 and text[pos] == "\n")
+
+
+def compile_safe(pattern: str) -> SafePattern:
+    """
+    Compila un patrón al matcher lineal.
+
+    Raises:
+        UnsupportedPatternError: Si usa construcciones no soportadas.
+    """
+    return SafePattern(pattern)
+
+
+@lru_cache(maxsize=256)
+def cached_safe_pattern(pattern: str) -> Optional[SafePattern]:
+    """Patrón compilado y cacheado, o None si no está soportado."""
+    try:
+        return SafePattern(pattern)
+    except UnsupportedPatternError:
+        return None
@@ -0,0 +1,85 @@
+"""
+Caché de los CTFs resueltos por cada usuario.
+
+El listado de CTFs marca ``solved_by_me`` para el usuario autenticado. En
+lugar de una consulta por CTF (o por página), se carga una vez el conjunto
+completo de IDs que ha resuelto el usuario y se guarda durante ``ttl``
+segundos; las páginas siguientes se resuelven en memoria.
+
+Un acierto confirmado en este proceso invalida el conjunto de su usuario.
+En otros workers el conjunto puede quedarse sin ese CTF como mucho ``ttl``
+segundos.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+from uuid import UUID
+
+from ...core.config import settings
+
+
+class SolvedSetCache:
+    """
+    LRU con TTL de conjuntos de CTFs resueltos por usuario.
+
+    Args:
+        ttl: Segundos que se conserva el conjunto de un usuario.
+        max_entries: Usuarios como máximo (se descartan los menos recientes).
+    """
+
+    def __init__(self, ttl: float = 15.0, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # usuario -> (caduca en, IDs resueltos)
+        self._entries: "OrderedDict[str, Tuple[float, FrozenSet[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = dict.fromkeys(("hits", "misses", "invalidations"), 0)
+
+    def get(self, user_id: UUID) -> Optional[FrozenSet[str]]:
+        """IDs (como texto) de los CTFs resueltos por el usuario, o None si no está en caché."""
+        key = str(user_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            return entry[1]
+
+    def put(self, user_id: UUID, ctf_ids: Iterable[str]) -> FrozenSet[str]:
+        """Guarda el conjunto de CTFs resueltos por el usuario y lo devuelve."""
+        solved = frozenset(str(ctf_id) for ctf_id in ctf_ids)
+        with self._lock:
+            self._entries[str(user_id)] = (time.monotonic() + self.ttl, solved)
+            self._entries.move_to_end(str(user_id))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return solved
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Olvida el conjunto del usuario (p. ej. tras un acierto)."""
+        with self._lock:
+            if self._entries.pop(str(user_id), None) is not None:
+                self._counters["invalidations"] += 1
+
+    def clear(self) -> None:
+        """Olvida todos los conjuntos."""
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> Dict[str, int]:
+        """Aciertos, fallos, invalidaciones y usuarios en caché."""
+        with self._lock:
+            return {**self._counters, "entries": len(self._entries)}
+
+
+# Instancia global
+solved_set_cache = SolvedSetCache(
+    ttl=settings.SOLVED_SET_CACHE_TTL_SECONDS,
+    max_entries=settings.SOLVED_SET_CACHE_SIZE,
+)
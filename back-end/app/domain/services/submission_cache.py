@@ -0,0 +1,176 @@
+"""
+Caché de intentos incorrectos recientes.
+
+Jugadores y scripts reenvían muchas veces la misma flag incorrecta. Cada
+intento incorrecto se recuerda durante ``ttl`` segundos con clave
+(usuario o IP, CTF, hash de la flag); una repetición dentro de ese tiempo
+se responde desde memoria, sin cargar el CTF, evaluar la flag ni insertar
+una fila. Las repeticiones se acumulan por clave y se vuelcan como
+contadores agregados cada ``flush_interval`` segundos.
+
+Al cambiar la flag de un CTF, su disponibilidad (activarlo, desactivarlo o
+publicarlo) o al borrarlo se invalida con ``invalidate_ctf``: cada CTF
+tiene una generación y las entradas de generaciones anteriores dejan de
+valer. Solo afecta a este proceso; en otros workers una entrada puede
+sobrevivir como mucho ``ttl`` segundos.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from ..entities.flag_submission import RepeatedSubmission
+from ...core.config import settings
+
+
+CacheKey = Tuple[str, str, str]
+
+
+def principal_for(user_id: Optional[UUID], ip_address: Optional[str]) -> Optional[str]:
+    """Identidad con la que se agrupan los intentos (None si no hay ninguna)."""
+    if user_id:
+        return f"user:{user_id}"
+    if ip_address:
+        return f"ip:{ip_address}"
+    return None
+
+
+class SubmissionCache:
+    """
+    LRU con TTL de intentos incorrectos y contadores de repeticiones.
+
+    Args:
+        ttl: Segundos que se recuerda un intento incorrecto.
+        max_entries: Entradas como máximo (se descartan las más antiguas).
+        flush_interval: Segundos entre volcados de repeticiones.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 10000, flush_interval: float = 5.0):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.flush_interval = flush_interval
+        # clave -> (caduca en, generación del CTF)
+        self._entries: "OrderedDict[CacheKey, Tuple[float, int]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._repeats: Dict[CacheKey, RepeatedSubmission] = {}
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = dict.fromkeys(
+            ("hits", "misses", "stored", "invalidations", "flush_failures"), 0
+        )
+
+    def hit(
+        self,
+        ctf_id: UUID,
+        flag_hash: str,
+        user_id: Optional[UUID] = None,
+        ip_address: Optional[str] = None,
+    ) -> bool:
+        """
+        Comprueba si el intento es una repetición reciente de uno incorrecto.
+
+        Si lo es, lo cuenta como repetición (sin fila nueva) y devuelve True.
+        """
+        principal = principal_for(user_id, ip_address)
+        if principal is None:
+            return False
+        key = (principal, str(ctf_id), flag_hash)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now or entry[1] != self._generations.get(key[1], 0):
+                if entry is not None:
+                    del self._entries[key]
+                self._counters["misses"] += 1
+                return False
+            self._entries.move_to_end(key)
+            repeat = self._repeats.get(key)
+            if repeat is None:
+                repeat = self._repeats[key] = RepeatedSubmission(
+                    principal=principal, ctf_id=ctf_id, flag=flag_hash,
+                    user_id=user_id, ip_address=ip_address,
+                )
+            repeat.count += 1
+            repeat.last_at = datetime.utcnow()
+            self._counters["hits"] += 1
+            return True
+
+    def store(
+        self,
+        ctf_id: UUID,
+        flag_hash: str,
+        user_id: Optional[UUID] = None,
+        ip_address: Optional[str] = None,
+    ) -> None:
+        """Recuerda un intento incorrecto recién registrado."""
+        principal = principal_for(user_id, ip_address)
+        if principal is None:
+            return
+        key = (principal, str(ctf_id), flag_hash)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, self._generations.get(key[1], 0))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._counters["stored"] += 1
+
+    def invalidate_ctf(self, ctf_id: UUID) -> None:
+        """Olvida los intentos de un CTF (p. ej. al cambiar su flag, desactivarlo o borrarlo)."""
+        with self._lock:
+            ctf = str(ctf_id)
+            self._generations[ctf] = self._generations.get(ctf, 0) + 1
+            self._counters["invalidations"] += 1
+
+    def clear(self) -> None:
+        """Olvida todos los intentos (las repeticiones pendientes se conservan)."""
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+
+    def drain_repeats(self, force: bool = False) -> List[RepeatedSubmission]:
+        """
+        Repeticiones acumuladas desde el último volcado.
+
+        Sin ``force`` solo devuelve algo si ha pasado ``flush_interval``
+        desde el anterior, para agrupar muchas repeticiones en una escritura.
+        """
+        with self._lock:
+            if not self._repeats or (not force and time.monotonic() - self._last_flush < self.flush_interval):
+                return []
+            repeats = list(self._repeats.values())
+            self._repeats = {}
+            self._last_flush = time.monotonic()
+            return repeats
+
+    def restore(self, repeats: List[RepeatedSubmission]) -> None:
+        """Devuelve al acumulador repeticiones que no se pudieron volcar."""
+        with self._lock:
+            self._counters["flush_failures"] += 1
+            for repeat in repeats:
+                key = (repeat.principal, str(repeat.ctf_id), repeat.flag)
+                current = self._repeats.get(key)
+                if current is None:
+                    self._repeats[key] = repeat
+                else:
+                    current.count += repeat.count
+                    current.last_at = max(current.last_at, repeat.last_at)
+
+    def metrics(self) -> Dict[str, int]:
+        """Contadores de aciertos/fallos, entradas y repeticiones pendientes."""
+        with self._lock:
+            return {
+                **self._counters,
+                "entries": len(self._entries),
+                "pending_repeats": sum(repeat.count for repeat in self._repeats.values()),
+            }
+
+
+# Instancia global (la usa FlagService si FLAG_SUBMISSION_CACHE_ENABLED)
+submission_cache = SubmissionCache(
+    ttl=settings.FLAG_SUBMISSION_CACHE_TTL_SECONDS,
+    max_entries=settings.FLAG_SUBMISSION_CACHE_SIZE,
+    flush_interval=settings.FLAG_SUBMISSION_REPEATS_FLUSH_SECONDS,
+)
@@ -0,0 +1,8 @@
+"""
+Archive module - Segmentos comprimidos de envíos de flags antiguos.
+"""
+
+from .segments import Segment, write_segment
+from .submission_archive import SubmissionArchive, submission_archive
+
+__all__ = ["Segment", "SubmissionArchive", "submission_archive", "write_segment"]
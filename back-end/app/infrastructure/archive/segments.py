@@ -0,0 +1,259 @@
+"""
+Segmentos columnares comprimidos de envíos de flags.
+
+Formato de un fichero ``.seg``::
+
+    MAGIC | longitud de la cabecera (uint32 BE) | cabecera JSON | bloques
+
+La cabecera guarda el número de filas, el rango de ``submitted_at`` y la
+posición de cada bloque. Cada columna va en su propio bloque comprimido
+con zlib, así que una consulta solo descomprime las columnas que usa:
+
+- ``id``: UUIDs en binario (16 bytes por fila).
+- ``submitted_at``: microsegundos desde epoch en deltas (filas ordenadas
+  por fecha, los deltas son pequeños y comprimen muy bien).
+- ``is_correct``: un byte por fila.
+- ``ctf_id``, ``user_id``, ``ip_address``, ``flag``: diccionario de valores
+  distintos (bloque ``<columna>.dict``) y un código uint32 por fila.
+
+Con el diccionario de ``ctf_id``/``user_id`` se descarta un segmento sin
+leer el resto de sus columnas cuando no contiene el CTF o usuario buscado.
+"""
+
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+
+MAGIC = b"CTFSEG1\n"
+COMPRESSION_LEVEL = 6
+
+# Columnas codificadas con diccionario (valores muy repetidos)
+DICT_COLUMNS = ("ctf_id", "user_id", "ip_address", "flag")
+
+_EPOCH = datetime(1970, 1, 1)
+_HEADER_LENGTH = struct.Struct(">I")
+
+
+def _to_micros(value: datetime) -> int:
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _from_micros(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _pack(typecode: str, values: Sequence[int]) -> bytes:
+    packed = array(typecode, values)
+    if sys.byteorder == "big":
+        packed.byteswap()  # En disco siempre little-endian
+    return packed.tobytes()
+
+
+def _unpack(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def fsync_directory(path: str) -> None:
+    """Persiste en disco las entradas (creaciones, renombrados) de un directorio."""
+    if not hasattr(os, "O_DIRECTORY"):  # pragma: no cover - Windows
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_segment(path: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Escribe ``rows`` (filas de flag_submissions) como un segmento.
+
+    Se escribe en un fichero temporal, se hace fsync y se renombra, de modo
+    que un segmento visible siempre está completo.
+
+    Returns:
+        Cabecera del segmento escrito.
+    """
+    if not rows:
+        raise ValueError("Cannot write an empty segment")
+    rows = sorted(rows, key=lambda row: (row["submitted_at"], row["id"]))
+
+    micros = [_to_micros(row["submitted_at"]) for row in rows]
+    blocks: Dict[str, bytes] = {
+        "id": b"".join(UUID(row["id"]).bytes for row in rows),
+        "submitted_at": _pack("q", [micros[0]] + [b - a for a, b in zip(micros, micros[1:])]),
+        "is_correct": bytes(1 if row["is_correct"] else 0 for row in rows),
+    }
+    for column in DICT_COLUMNS:
+        codes: Dict[Optional[str], int] = {}
+        values = [codes.setdefault(row[column], len(codes)) for row in rows]
+        blocks[f"{column}.dict"] = json.dumps(list(codes)).encode()
+        blocks[column] = _pack("I", values)
+
+    offsets: Dict[str, List[int]] = {}
+    payload = []
+    position = 0
+    for name, data in blocks.items():
+        compressed = zlib.compress(data, COMPRESSION_LEVEL)
+        offsets[name] = [position, len(compressed)]
+        payload.append(compressed)
+        position += len(compressed)
+
+    header = {
+        "version": 1,
+        "rows": len(rows),
+        "min_at": rows[0]["submitted_at"].isoformat(),
+        "max_at": rows[-1]["submitted_at"].isoformat(),
+        "blocks": offsets,
+    }
+    encoded = json.dumps(header, separators=(",", ":")).encode()
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as output:
+        output.write(MAGIC)
+        output.write(_HEADER_LENGTH.pack(len(encoded)))
+        output.write(encoded)
+        for data in payload:
+            output.write(data)
+        output.flush()
+        os.fsync(output.fileno())
+    os.replace(tmp_path, path)
+    fsync_directory(os.path.dirname(path) or ".")
+    return header
+
+
+class Segment:
+    """
+    Lector de un segmento (usar como context manager). Descomprime cada
+    columna la primera vez que se usa.
+
+    Raises:
+        ValueError: Si el fichero no es un segmento válido.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        # El fichero queda abierto: una compactación puede borrarlo mientras se lee
+        self._file = open(path, "rb")
+        try:
+            if self._file.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a submission segment: {path}")
+            (length,) = _HEADER_LENGTH.unpack(self._file.read(_HEADER_LENGTH.size))
+            self.header = json.loads(self._file.read(length))
+        except Exception:
+            self._file.close()
+            raise
+        self._data_offset = len(MAGIC) + _HEADER_LENGTH.size + length
+        self.rows: int = self.header["rows"]
+        self.min_at = datetime.fromisoformat(self.header["min_at"])
+        self.max_at = datetime.fromisoformat(self.header["max_at"])
+        self._cache: Dict[str, Any] = {}
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "Segment":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _block(self, name: str) -> bytes:
+        offset, length = self.header["blocks"][name]
+        self._file.seek(self._data_offset + offset)
+        return zlib.decompress(self._file.read(length))
+
+    def _cached(self, name: str, decode) -> Any:
+        if name not in self._cache:
+            self._cache[name] = decode(self._block(name))
+        return self._cache[name]
+
+    def dictionary(self, column: str) -> List[Optional[str]]:
+        """Valores distintos de una columna codificada con diccionario."""
+        return self._cached(f"{column}.dict", json.loads)
+
+    def codes(self, column: str) -> array:
+        return self._cached(column, lambda data: _unpack("I", data))
+
+    def timestamps(self) -> List[int]:
+        """``submitted_at`` de cada fila en microsegundos desde epoch."""
+        return self._cached("submitted_at", lambda data: list(accumulate(_unpack("q", data))))
+
+    def ids(self) -> bytes:
+        return self._cached("id", bytes)
+
+    def is_correct(self) -> bytes:
+        return self._cached("is_correct", bytes)
+
+    def select(
+        self,
+        ctf_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[int]:
+        """
+        Posiciones de las filas que cumplen los filtros (``since`` <= fecha < ``until``).
+
+        Descarta el segmento con la cabecera (rango de fechas) o con el
+        diccionario antes de descomprimir columnas completas.
+        """
+        if (since and self.max_at < since) or (until and self.min_at >= until):
+            return []
+
+        positions: Optional[List[int]] = None
+        for column, value in (("ctf_id", ctf_id), ("user_id", user_id)):
+            if value is None:
+                continue
+            try:
+                code = self.dictionary(column).index(value)
+            except ValueError:
+                return []
+            codes = self.codes(column)
+            if positions is None:
+                positions = [i for i, current in enumerate(codes) if current == code]
+            else:
+                positions = [i for i in positions if codes[i] == code]
+        if positions is None:
+            positions = list(range(self.rows))
+
+        if (since and since > self.min_at) or (until and until <= self.max_at):
+            times = self.timestamps()
+            low = _to_micros(since) if since else None
+            high = _to_micros(until) if until else None
+            positions = [
+                i for i in positions
+                if (low is None or times[i] >= low) and (high is None or times[i] < high)
+            ]
+        return positions
+
+    def read(self, positions: Sequence[int]) -> List[Dict[str, Any]]:
+        """Materializa las filas de las posiciones indicadas."""
+        if not positions:
+            return []
+        ids, times, correct = self.ids(), self.timestamps(), self.is_correct()
+        columns = {
+            column: (self.dictionary(column), self.codes(column)) for column in DICT_COLUMNS
+        }
+        return [
+            {
+                "id": str(UUID(bytes=ids[i * 16:(i + 1) * 16])),
+                "submitted_at": _from_micros(times[i]),
+                "is_correct": bool(correct[i]),
+                **{column: values[codes[i]] for column, (values, codes) in columns.items()},
+            }
+            for i in positions
+        ]
@@ -0,0 +1,222 @@
+"""
+Archivo de envíos de flags en disco, particionado por mes.
+
+Estructura::
+
+    <directorio>/<AAAA-MM>/<primera fecha>-<sufijo>.seg
+
+Cada ejecución del job de retención añade un segmento por mes afectado y
+``compact`` los fusiona en uno solo. Si el job se interrumpe entre escribir
+un segmento y borrar sus filas de la base de datos, la siguiente ejecución
+vuelve a archivarlas: las consultas descartan IDs repetidos y la
+compactación los elimina.
+"""
+
+import os
+import re
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from ...core.config import settings
+from ...core.pagination import Cursor
+from ...domain.entities.flag_submission import FlagSubmission
+from .segments import Segment, fsync_directory, write_segment
+
+
+_MONTH = re.compile(r"^\d{4}-\d{2}$")
+
+
+def _month_of(value: datetime) -> str:
+    return f"{value.year:04d}-{value.month:02d}"
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Las fechas se archivan en UTC sin zona, como en flag_submissions."""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _to_entity(row: Dict[str, Any]) -> FlagSubmission:
+    return FlagSubmission(
+        id=UUID(row["id"]),
+        ctf_id=UUID(row["ctf_id"]),
+        user_id=UUID(row["user_id"]) if row["user_id"] else None,
+        flag=row["flag"],
+        is_correct=row["is_correct"],
+        ip_address=row["ip_address"],
+        submitted_at=row["submitted_at"],
+    )
+
+
+class SubmissionArchive:
+    """
+    Segmentos de envíos archivados y consultas sobre ellos.
+
+    Args:
+        directory: Directorio raíz del archivo.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        # Serializa escrituras y compactaciones dentro del proceso
+        self._lock = threading.Lock()
+
+    def months(self) -> List[str]:
+        """Meses (AAAA-MM) con segmentos, del más antiguo al más reciente."""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(
+            name for name in os.listdir(self.directory)
+            if _MONTH.match(name) and os.path.isdir(os.path.join(self.directory, name))
+        )
+
+    def segments(self, month: str) -> List[str]:
+        """Rutas de los segmentos de un mes."""
+        path = os.path.join(self.directory, month)
+        if not os.path.isdir(path):
+            return []
+        return sorted(
+            os.path.join(path, name) for name in os.listdir(path) if name.endswith(".seg")
+        )
+
+    def write(self, rows: List[Dict[str, Any]]) -> List[str]:
+        """
+        Escribe filas de flag_submissions en un segmento nuevo por mes.
+
+        Returns:
+            Rutas de los segmentos creados (ya persistidos en disco).
+        """
+        by_month: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            by_month[_month_of(row["submitted_at"])].append(row)
+
+        written = []
+        with self._lock:
+            for month, month_rows in sorted(by_month.items()):
+                written.append(self._write_month(month, month_rows))
+        return written
+
+    def scan(
+        self,
+        ctf_id: Optional[UUID] = None,
+        user_id: Optional[UUID] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        cursor: Optional[Cursor] = None,
+        limit: int = 100,
+    ) -> List[FlagSubmission]:
+        """
+        Busca envíos archivados, más recientes primero.
+
+        Los meses fuera de ``since``/``until`` (o posteriores al cursor) no se
+        abren; de cada segmento se descartan por cabecera y diccionario los
+        que no contienen el CTF o usuario, y solo se materializan las filas
+        que cumplen los filtros.
+
+        Args:
+            ctf_id: Filtrar por CTF.
+            user_id: Filtrar por usuario.
+            since: Fecha mínima (incluida).
+            until: Fecha máxima (excluida).
+            cursor: Continuar tras esta posición (submitted_at, id).
+            limit: Máximo de resultados.
+        """
+        since, until = _naive_utc(since), _naive_utc(until)
+        ctf = str(ctf_id) if ctf_id else None
+        user = str(user_id) if user_id else None
+        if cursor is not None and (until is None or cursor.sort_value < until):
+            # Las filas (fecha, id) < cursor quedan en fechas <= la del cursor
+            until_month = _month_of(cursor.sort_value)
+        else:
+            until_month = _month_of(until) if until else None
+
+        results: List[FlagSubmission] = []
+        for month in reversed(self.months()):
+            if since and month < _month_of(since):
+                break
+            if until_month and month > until_month:
+                continue
+
+            rows: Dict[str, Dict[str, Any]] = {}
+            for path in self.segments(month):
+                try:
+                    segment = Segment(path)
+                except FileNotFoundError:
+                    continue  # Reemplazado por una compactación en curso
+                with segment:
+                    for row in segment.read(segment.select(ctf, user, since, until)):
+                        rows[row["id"]] = row  # Sin duplicados entre segmentos
+
+            ordered = sorted(rows.values(), key=lambda row: (row["submitted_at"], row["id"]), reverse=True)
+            for row in ordered:
+                if cursor is not None and (row["submitted_at"], row["id"]) >= (cursor.sort_value, cursor.id):
+                    continue
+                results.append(_to_entity(row))
+                if len(results) >= limit:
+                    return results
+        return results
+
+    def compact(self, month: Optional[str] = None) -> Dict[str, int]:
+        """
+        Fusiona los segmentos de cada mes (o solo de ``month``) en uno.
+
+        El segmento fusionado se escribe y persiste antes de borrar los
+        originales, así que una interrupción solo deja filas repetidas.
+
+        Returns:
+            Meses compactados, segmentos fusionados y duplicados eliminados.
+        """
+        result = {"months": 0, "segments": 0, "duplicates": 0}
+        with self._lock:
+            for current in ([month] if month else self.months()):
+                paths = self.segments(current)
+                if len(paths) < 2:
+                    continue
+                rows: Dict[str, Dict[str, Any]] = {}
+                total = 0
+                for path in paths:
+                    with Segment(path) as segment:
+                        total += segment.rows
+                        for row in segment.read(range(segment.rows)):
+                            rows[row["id"]] = row
+                self._write_month(current, list(rows.values()))
+                for path in paths:
+                    os.unlink(path)
+                fsync_directory(os.path.join(self.directory, current))
+                result["months"] += 1
+                result["segments"] += len(paths)
+                result["duplicates"] += total - len(rows)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Meses, segmentos, filas y bytes en disco del archivo."""
+        months = self.months()
+        segments = rows = size = 0
+        for month in months:
+            for path in self.segments(month):
+                segments += 1
+                with Segment(path) as segment:
+                    rows += segment.rows
+                size += os.path.getsize(path)
+        return {
+            "months": months,
+            "segments": segments,
+            "rows": rows,
+            "bytes": size,
+        }
+
+    def _write_month(self, month: str, rows: List[Dict[str, Any]]) -> str:
+        path = os.path.join(self.directory, month)
+        os.makedirs(path, exist_ok=True)
+        first = min(row["submitted_at"] for row in rows)
+        name = f"{first:%Y%m%dT%H%M%S}-{uuid4().hex[:8]}.seg"
+        write_segment(os.path.join(path, name), rows)
+        return os.path.join(path, name)
+
+
+# Instancia global (directorio FLAG_SUBMISSION_ARCHIVE_DIR)
+submission_archive = SubmissionArchive(settings.FLAG_SUBMISSION_ARCHIVE_DIR)
@@ -0,0 +1,7 @@
+"""
+Catalog module - Índices en memoria del catálogo público.
+"""
+
+from .ctf_catalog import CATALOG_COLUMNS, CTFCatalog, CTFCatalogSnapshot, CatalogPage, ctf_catalog
+
+__all__ = ["CATALOG_COLUMNS", "CTFCatalog", "CTFCatalogSnapshot", "CatalogPage", "ctf_catalog"]
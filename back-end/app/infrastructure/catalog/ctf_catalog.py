@@ -0,0 +1,331 @@
+"""
+Catálogo en memoria de CTFs publicados.
+
+El catálogo público es pequeño y casi de solo lectura, así que se mantiene
+una instantánea por columnas en el proceso:
+
+- Arrays paralelos ordenados por (created_at, id) descendente, de modo que
+  la posición ``i`` identifica al mismo CTF en todas las columnas. Solo se
+  guardan las columnas del listado (``CATALOG_COLUMNS``), leídas con una
+  proyección: ni la flag ni los adjuntos entran en el catálogo.
+- Índices bitmap por nivel, categoría, plataforma y skill. Cada bitmap es un
+  ``int`` de Python donde el bit ``i`` indica si el CTF en la posición ``i``
+  tiene ese valor. Filtrar es un AND de bitmaps, contar facetas es un
+  popcount y paginar es recorrer los bits activos en orden.
+
+La instantánea es inmutable; cuando cambia un CTF se invalida el catálogo y
+la siguiente lectura construye una nueva y la publica con una sola
+asignación (swap atómico), etiquetada con un número de versión. Un solve
+solo cambia columnas que no están indexadas (contador, puntos, first
+blood), así que se aplica como parche de esa fila sin reconstruir.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from ...core.config import settings
+from ...core.pagination import Cursor, encode_cursor
+
+
+# Columnas del listado público (las del DTO de respuesta salvo adjuntos)
+CATALOG_COLUMNS = (
+    "id", "title", "level", "category", "platform", "description", "points",
+    "dynamic_scoring", "initial_points", "minimum_points", "decay_solves",
+    "solved", "solved_at", "machine_os", "skills", "hints", "author",
+    "solved_count", "first_blood_user_id", "first_blood_at", "is_active",
+    "status", "created_at", "updated_at",
+)
+
+# Columnas que alimentan el orden o los bitmaps: no se pueden parchear
+_INDEXED_COLUMNS = frozenset({"id", "level", "category", "platform", "skills", "created_at"})
+
+CatalogRow = Mapping[str, Any]
+CatalogLoader = Callable[[], Tuple[Sequence[CatalogRow], Set[UUID]]]
+
+
+@dataclass(frozen=True)
+class CatalogPage:
+    """Resultado de una consulta al catálogo."""
+
+    items: List[Dict[str, Any]]
+    has_writeup: List[bool]
+    total: int
+    next_cursor: Optional[str]
+
+
+@dataclass(frozen=True)
+class CTFCatalogSnapshot:
+    """Instantánea inmutable y por columnas de los CTFs publicados."""
+
+    version: int
+    built_at: float
+    ids: Tuple[str, ...]
+    columns: Dict[str, Tuple[Any, ...]]
+    writeup_mask: int
+    by_level: Dict[str, int] = field(default_factory=dict)
+    by_category: Dict[str, int] = field(default_factory=dict)
+    by_platform: Dict[str, int] = field(default_factory=dict)
+    by_skill: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls,
+        version: int,
+        ctfs: Iterable[CatalogRow],
+        writeup_ctf_ids: Set[UUID],
+    ) -> "CTFCatalogSnapshot":
+        """Construye la instantánea a partir de las filas publicadas (``CATALOG_COLUMNS``)."""
+        rows = sorted(ctfs, key=lambda c: (c["created_at"], str(c["id"])), reverse=True)
+
+        by_level: Dict[str, int] = {}
+        by_category: Dict[str, int] = {}
+        by_platform: Dict[str, int] = {}
+        by_skill: Dict[str, int] = {}
+        writeup_mask = 0
+
+        for position, ctf in enumerate(rows):
+            bit = 1 << position
+            _set_bit(by_level, ctf["level"], bit)
+            _set_bit(by_category, ctf["category"], bit)
+            _set_bit(by_platform, ctf["platform"].lower(), bit)
+            for skill in ctf["skills"] or ():
+                _set_bit(by_skill, skill.lower(), bit)
+            if ctf["id"] in writeup_ctf_ids:
+                writeup_mask |= bit
+
+        return cls(
+            version=version,
+            built_at=time.monotonic(),
+            ids=tuple(str(c["id"]) for c in rows),
+            columns={column: tuple(c.get(column) for c in rows) for column in CATALOG_COLUMNS},
+            writeup_mask=writeup_mask,
+            by_level=by_level,
+            by_category=by_category,
+            by_platform=by_platform,
+            by_skill=by_skill,
+        )
+
+    @property
+    def size(self) -> int:
+        """Número de CTFs en la instantánea."""
+        return len(self.ids)
+
+    @property
+    def created_at(self) -> Tuple[datetime, ...]:
+        return self.columns["created_at"]
+
+    def row(self, position: int) -> Dict[str, Any]:
+        """Columnas del CTF en esa posición."""
+        return {column: values[position] for column, values in self.columns.items()}
+
+    def patched(self, version: int, ctf_id: str, values: Mapping[str, Any]) -> Optional["CTFCatalogSnapshot"]:
+        """
+        Copia con columnas no indexadas de un CTF cambiadas (solo se copian esas columnas).
+
+        Devuelve None si el CTF no está en la instantánea.
+
+        Raises:
+            ValueError: Si se intenta cambiar una columna indexada.
+        """
+        if _INDEXED_COLUMNS.intersection(values):
+            raise ValueError("Indexed catalog columns cannot be patched")
+        try:
+            position = self.ids.index(ctf_id)
+        except ValueError:
+            return None
+        columns = dict(self.columns)
+        for column, value in values.items():
+            column_values = list(columns[column])
+            column_values[position] = value
+            columns[column] = tuple(column_values)
+        return replace(self, version=version, columns=columns)
+
+    def match(
+        self,
+        level: Optional[str] = None,
+        category: Optional[str] = None,
+        platform: Optional[str] = None,
+        skill: Optional[str] = None,
+    ) -> int:
+        """Devuelve el bitmap de los CTFs que cumplen todos los filtros."""
+        mask = (1 << self.size) - 1
+        if level:
+            mask &= self.by_level.get(level, 0)
+        if category:
+            mask &= self.by_category.get(category, 0)
+        if platform:
+            mask &= self.by_platform.get(platform.lower(), 0)
+        if skill:
+            mask &= self.by_skill.get(skill.lower(), 0)
+        return mask
+
+    def query(
+        self,
+        offset: int = 0,
+        limit: int = 10,
+        cursor: Optional[Cursor] = None,
+        level: Optional[str] = None,
+        category: Optional[str] = None,
+        platform: Optional[str] = None,
+        skill: Optional[str] = None,
+    ) -> CatalogPage:
+        """
+        Filtra, ordena (más recientes primero) y pagina.
+
+        Args:
+            offset: Elementos a saltar (se ignora si hay cursor).
+            limit: Tamaño de página.
+            cursor: Posición keyset (created_at, id) de la página anterior.
+
+        Returns:
+            Página con las filas, si tienen writeup, el total filtrado y
+            el cursor de la siguiente página.
+        """
+        mask = self.match(level, category, platform, skill)
+        total = mask.bit_count()
+
+        if cursor is not None:
+            # Descartar las posiciones anteriores al cursor
+            mask &= ~((1 << self._position_after(cursor)) - 1)
+            offset = 0
+
+        positions: List[int] = []
+        remaining = mask
+        while remaining and len(positions) < offset + limit + 1:
+            lowest = remaining & -remaining
+            positions.append(lowest.bit_length() - 1)
+            remaining ^= lowest
+
+        page = positions[offset:offset + limit]
+        next_cursor = None
+        if len(positions) > offset + limit and page:
+            last = page[-1]
+            next_cursor = encode_cursor(self.created_at[last], self.ids[last])
+
+        return CatalogPage(
+            items=[self.row(p) for p in page],
+            has_writeup=[bool(self.writeup_mask >> p & 1) for p in page],
+            total=total,
+            next_cursor=next_cursor,
+        )
+
+    def facets(
+        self,
+        level: Optional[str] = None,
+        category: Optional[str] = None,
+        platform: Optional[str] = None,
+        skill: Optional[str] = None,
+    ) -> Dict[str, Dict[str, int]]:
+        """Cuenta, para cada faceta, cuántos CTFs filtrados tienen cada valor."""
+        mask = self.match(level, category, platform, skill)
+
+        def count(index: Dict[str, int]) -> Dict[str, int]:
+            counts = {key: (bits & mask).bit_count() for key, bits in index.items()}
+            return {key: value for key, value in counts.items() if value}
+
+        return {
+            "level": count(self.by_level),
+            "category": count(self.by_category),
+            "platform": count(self.by_platform),
+            "skill": count(self.by_skill),
+        }
+
+    def _position_after(self, cursor: Cursor) -> int:
+        """Primera posición con (created_at, id) estrictamente menor que el cursor."""
+        key = (cursor.sort_value, cursor.id)
+        low, high = 0, self.size
+        while low < high:
+            mid = (low + high) // 2
+            if (self.created_at[mid], self.ids[mid]) < key:
+                high = mid
+            else:
+                low = mid + 1
+        return low
+
+
+class CTFCatalog:
+    """
+    Mantiene la instantánea vigente del catálogo.
+
+    Cada escritura llama a ``invalidate()``; la siguiente lectura reconstruye
+    la instantánea desde la base de datos. Los solves llaman a ``patch()``,
+    que publica una copia con la fila cambiada. Como ambos son locales al
+    proceso, ``ttl_seconds`` acota cuánto puede tardar en verse un cambio
+    hecho por otro worker.
+    """
+
+    def __init__(self, ttl_seconds: float = 60):
+        self.ttl_seconds = ttl_seconds
+        self._snapshot: Optional[CTFCatalogSnapshot] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        """Versión que debe tener una instantánea para considerarse vigente."""
+        return self._generation
+
+    def invalidate(self) -> None:
+        """Marca la instantánea actual como obsoleta."""
+        with self._lock:
+            self._generation += 1
+
+    def patch(self, ctf_id: str, values: Mapping[str, Any]) -> None:
+        """
+        Aplica a la instantánea vigente los valores nuevos de un CTF.
+
+        Sube la generación y etiqueta la copia con ella, de modo que una
+        reconstrucción que empezó antes (con los valores anteriores) queda
+        obsoleta al publicarse. Si no hay instantánea vigente o el CTF no
+        está en ella (p. ej. no publicado) no hace nada.
+        """
+        with self._lock:
+            current = self._snapshot
+            if current is None or not self._is_fresh(current):
+                return
+            patched = current.patched(self._generation + 1, ctf_id, values)
+            if patched is not None:
+                self._generation += 1
+                self._snapshot = patched
+
+    def snapshot(self, loader: CatalogLoader) -> CTFCatalogSnapshot:
+        """
+        Devuelve la instantánea vigente, reconstruyéndola si es necesario.
+
+        Args:
+            loader: Función que devuelve (filas publicadas, IDs de CTF con writeup).
+        """
+        current = self._snapshot
+        if current is not None and self._is_fresh(current):
+            return current
+
+        with self._lock:
+            current = self._snapshot
+            if current is not None and self._is_fresh(current):
+                return current
+
+            # La versión se toma antes de cargar: si hay una invalidación
+            # durante la carga, la siguiente lectura vuelve a reconstruir.
+            version = self._generation
+            ctfs, writeup_ctf_ids = loader()
+            snapshot = CTFCatalogSnapshot.build(version, ctfs, writeup_ctf_ids)
+            self._snapshot = snapshot
+            return snapshot
+
+    def _is_fresh(self, snapshot: CTFCatalogSnapshot) -> bool:
+        return (
+            snapshot.version == self._generation
+            and time.monotonic() - snapshot.built_at < self.ttl_seconds
+        )
+
+
+def _set_bit(index: Dict[str, int], key: str, bit: int) -> None:
+    index[key] = index.get(key, 0) | bit
+
+
+# Instancia global
+ctf_catalog = CTFCatalog(ttl_seconds=settings.CTF_CATALOG_INDEX_TTL_SECONDS)
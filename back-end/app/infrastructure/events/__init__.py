@@ -0,0 +1,8 @@
+"""
+Events module - Bus de eventos en proceso y feed en vivo (SSE).
+"""
+
+from .bus import EventBus, Subscription, sse_frame
+from .live_feed import LiveFeed, event_bus, live_feed
+
+__all__ = ["EventBus", "LiveFeed", "Subscription", "event_bus", "live_feed", "sse_frame"]
@@ -0,0 +1,139 @@
+"""
+Bus de eventos en proceso para Server-Sent Events.
+
+Cada evento se serializa una sola vez como trama SSE y se entrega a todas
+las suscripciones; así el coste por evento no depende de cuántos clientes
+estén conectados más allá de encolar la misma cadena en cada uno.
+
+- Cada suscripción tiene una cola asyncio acotada. Si un cliente lento la
+  llena, se le descarta (``dropped``) en lugar de frenar al resto o de
+  acumular memoria; su stream termina y el navegador se reconecta.
+- ``publish`` es seguro desde cualquier hilo: la entrega se programa en el
+  bucle de eventos de cada suscripción.
+- Se guardan los últimos eventos de cada tipo para enviarlos al conectar.
+"""
+
+import asyncio
+import itertools
+import json
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Set
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def sse_frame(event: str, data: Any, event_id: Optional[int] = None) -> str:
+    """Trama SSE (``id``/``event``/``data``) terminada en línea en blanco."""
+    payload = json.dumps(data, default=_default, separators=(",", ":"))
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{head}event: {event}\ndata: {payload}\n\n"
+
+
+class Subscription:
+    """Cola de tramas de un cliente conectado."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_queue: int):
+        self.loop = loop
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=max_queue)
+        self.dropped = False
+
+
+class EventBus:
+    """
+    Difusión de eventos a suscriptores SSE.
+
+    Args:
+        max_queue: Tramas pendientes por cliente antes de descartarlo.
+        max_subscribers: Clientes conectados como máximo.
+        history: Últimos eventos que se guardan por tipo.
+    """
+
+    def __init__(self, max_queue: int = 100, max_subscribers: int = 5000, history: int = 20):
+        self.max_queue = max_queue
+        self.max_subscribers = max_subscribers
+        self._subscribers: Set[Subscription] = set()
+        self._history: Dict[str, Deque[Any]] = {}
+        self._history_size = history
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = dict.fromkeys(("published", "delivered", "dropped"), 0)
+
+    def subscribe(self) -> Optional[Subscription]:
+        """Crea una suscripción en el bucle actual (None si se alcanzó el máximo)."""
+        subscription = Subscription(asyncio.get_running_loop(), self.max_queue)
+        with self._lock:
+            if len(self._subscribers) >= self.max_subscribers:
+                return None
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def publish(self, event: str, data: Any) -> int:
+        """
+        Publica un evento a todos los suscriptores.
+
+        Returns:
+            Número de suscriptores a los que se ha programado la entrega.
+        """
+        frame = sse_frame(event, data, next(self._ids))
+        with self._lock:
+            history = self._history.setdefault(event, deque(maxlen=self._history_size))
+            history.append(data)
+            subscribers = list(self._subscribers)
+            self._counters["published"] += 1
+
+        # Una sola llamada por bucle (normalmente solo hay uno)
+        by_loop: Dict[asyncio.AbstractEventLoop, List[Subscription]] = {}
+        for subscription in subscribers:
+            by_loop.setdefault(subscription.loop, []).append(subscription)
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        for loop, group in by_loop.items():
+            if loop is current:
+                self._deliver(group, frame)
+                continue
+            try:
+                loop.call_soon_threadsafe(self._deliver, group, frame)
+            except RuntimeError:
+                for subscription in group:  # Bucle cerrado
+                    self.unsubscribe(subscription)
+        return len(subscribers)
+
+    def recent(self, event: str) -> List[Any]:
+        """Últimos datos publicados de un tipo de evento (el más reciente al final)."""
+        with self._lock:
+            return list(self._history.get(event, ()))
+
+    def metrics(self) -> Dict[str, int]:
+        """Eventos publicados, tramas entregadas, clientes descartados y conectados."""
+        with self._lock:
+            return {**self._counters, "subscribers": len(self._subscribers)}
+
+    def _deliver(self, subscriptions: List[Subscription], frame: str) -> None:
+        delivered = dropped = 0
+        for subscription in subscriptions:
+            if subscription.dropped:
+                continue
+            try:
+                subscription.queue.put_nowait(frame)
+                delivered += 1
+            except asyncio.QueueFull:
+                # Cliente lento: se descarta en lugar de bloquear o crecer sin límite
+                subscription.dropped = True
+                dropped += 1
+        with self._lock:
+            if dropped:
+                self._subscribers.difference_update(s for s in subscriptions if s.dropped)
+            self._counters["delivered"] += delivered
+            self._counters["dropped"] += dropped
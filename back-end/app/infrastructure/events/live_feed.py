@@ -0,0 +1,211 @@
+"""
+Feed en vivo del ranking y de los solves recientes.
+
+Convierte cada primer acierto en dos eventos del bus:
+
+- ``solve``: CTF, puntos, usuario, fecha y si fue first blood.
+- ``leaderboard``: puntuación nueva del usuario con ``rank`` y
+  ``previous_rank`` (None si no puntuaba). Los usuarios que estaban en
+  [rank, previous_rank) bajan un puesto; el cliente aplica el delta sobre
+  la instantánea inicial sin volver a pedir el top.
+
+Los solves de este proceso se publican en cuanto se confirman. Los de
+otros workers los recoge ``poll`` leyendo ``ctf_solves`` por fecha; solo
+consulta mientras haya clientes conectados. Un conjunto acotado de
+(ctf_id, user_id) ya publicados evita duplicados entre ambos caminos.
+"""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ...core.config import settings
+from ...core.logging import logger
+from ..leaderboard import Leaderboard, ScoreEntry, leaderboard
+from .bus import EventBus, sse_frame
+
+
+SolveKey = Tuple[str, str]
+
+
+class LiveFeed:
+    """
+    Publica solves y deltas del ranking en un ``EventBus``.
+
+    Args:
+        bus: Bus al que se publican los eventos.
+        board: Ranking en memoria del que se leen las posiciones.
+        poll_interval: Segundos entre lecturas de solves de otros workers.
+        max_seen: Solves recordados para no publicarlos dos veces.
+    """
+
+    def __init__(
+        self,
+        bus: EventBus,
+        board: Leaderboard,
+        poll_interval: float = 2.0,
+        max_seen: int = 10000,
+    ):
+        self.bus = bus
+        self.board = board
+        self.poll_interval = poll_interval
+        # Margen para commits que confirman un solved_at anterior al último visto
+        self.poll_slack = timedelta(seconds=max(5.0, poll_interval * 2))
+        self.max_seen = max_seen
+        self._seen: "OrderedDict[SolveKey, None]" = OrderedDict()
+        self._watermark: Optional[datetime] = None
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def publish_solve(
+        self,
+        ctf_id: str,
+        title: str,
+        points: int,
+        user_id: str,
+        username: Optional[str],
+        solved_at: datetime,
+        first_blood: bool,
+        score: Optional[ScoreEntry] = None,
+        previous_rank: Optional[int] = None,
+    ) -> bool:
+        """
+        Publica un solve y, con ``score``, el delta del ranking de su usuario.
+
+        ``score`` debe estar ya fijado en el ranking; ``previous_rank`` es la
+        posición anterior a fijarlo. Devuelve False si ya se había publicado.
+        """
+        if not self._remember((ctf_id, user_id)):
+            return False
+        self.bus.publish("solve", {
+            "ctf_id": ctf_id,
+            "title": title,
+            "points": points,
+            "user_id": user_id,
+            "username": username,
+            "solved_at": solved_at,
+            "first_blood": first_blood,
+        })
+        if score is not None:
+            self.bus.publish("leaderboard", {
+                "user_id": user_id,
+                "username": username,
+                "total_points": score.total_points,
+                "solved_count": score.solved_count,
+                "rank": self.board.rank(user_id),
+                "previous_rank": previous_rank,
+            })
+        return True
+
+    def snapshot(self, top: List[Dict[str, Any]]) -> str:
+        """Trama inicial para un cliente: top actual y solves recientes (más reciente primero)."""
+        return sse_frame("snapshot", {
+            "leaderboard": top,
+            "solves": self.bus.recent("solve")[::-1],
+        })
+
+    def poll(self, db: Session) -> int:
+        """
+        Publica los solves confirmados por otros workers desde la última lectura.
+
+        Fija también en el ranking local la puntuación de esos usuarios.
+        Devuelve el número de solves publicados.
+        """
+        from ..persistence.models.ctf_model import CTFModel
+        from ..persistence.models.ctf_solve_model import CTFSolveModel
+        from ..persistence.models.user_model import UserModel
+        from ..persistence.user_scores import UserScoreLedger
+
+        if self._watermark is None:
+            self._watermark = datetime.utcnow()
+        solves = CTFSolveModel.__table__
+        rows = db.execute(
+            select(
+                solves.c.ctf_id,
+                solves.c.user_id,
+                solves.c.solved_at,
+                CTFModel.title,
+                CTFModel.points,
+                CTFModel.first_blood_user_id,
+                UserModel.username,
+            )
+            .join(CTFModel, CTFModel.id == solves.c.ctf_id)
+            .join(UserModel, UserModel.id == solves.c.user_id)
+            .where(solves.c.solved_at > self._watermark - self.poll_slack)
+            .order_by(solves.c.solved_at)
+            .limit(1000)
+        ).all()
+
+        published = 0
+        ledger = UserScoreLedger(db)
+        for row in rows:
+            self._watermark = max(self._watermark, row.solved_at)
+            with self._lock:
+                if (row.ctf_id, row.user_id) in self._seen:
+                    continue
+            previous_rank = self.board.rank(row.user_id)
+            score = replace(ledger.get(row.user_id), username=row.username)
+            self.board.set_score(score)
+            published += self.publish_solve(
+                row.ctf_id, row.title, row.points, row.user_id, row.username,
+                row.solved_at, row.first_blood_user_id == row.user_id,
+                score=score, previous_rank=previous_rank,
+            )
+        return published
+
+    def start(self, session_factory: Callable[[], Session]) -> None:
+        """Arranca la lectura periódica de solves de otros workers en el bucle actual."""
+        if self._task is None and self.poll_interval > 0:
+            self._task = asyncio.get_running_loop().create_task(self._run(session_factory))
+
+    async def stop(self) -> None:
+        """Detiene la lectura periódica."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self, session_factory: Callable[[], Session]) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            if not self.bus.metrics()["subscribers"]:
+                # Sin clientes no hace falta leer; se retoma desde ahora
+                self._watermark = None
+                continue
+            try:
+                await asyncio.to_thread(self._poll_once, session_factory)
+            except Exception as exc:
+                logger.warning(f"Live feed poll failed: {exc}")
+
+    def _poll_once(self, session_factory: Callable[[], Session]) -> int:
+        db = session_factory()
+        try:
+            return self.poll(db)
+        finally:
+            db.close()
+
+    def _remember(self, key: SolveKey) -> bool:
+        with self._lock:
+            if key in self._seen:
+                return False
+            self._seen[key] = None
+            while len(self._seen) > self.max_seen:
+                self._seen.popitem(last=False)
+            return True
+
+
+# Instancias globales
+event_bus = EventBus(
+    max_queue=settings.LIVE_FEED_QUEUE_SIZE,
+    max_subscribers=settings.LIVE_FEED_MAX_CLIENTS,
+)
+live_feed = LiveFeed(event_bus, leaderboard, poll_interval=settings.LIVE_FEED_POLL_SECONDS)
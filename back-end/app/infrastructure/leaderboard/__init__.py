@@ -0,0 +1,8 @@
+"""
+Leaderboard module - Ranking de usuarios en memoria.
+"""
+
+from .leaderboard import Leaderboard, ScoreEntry, leaderboard
+from .ranking import RankedSkipList
+
+__all__ = ["Leaderboard", "RankedSkipList", "ScoreEntry", "leaderboard"]
@@ -0,0 +1,195 @@
+"""
+Ranking de usuarios en memoria.
+
+La fuente de verdad es la tabla ``user_scores`` (una fila por usuario,
+actualizada en la misma transacción que cada primer acierto). Este módulo
+mantiene una copia ordenada en un skip list indexable para que el top-N y
+la posición de un usuario no necesiten consultar la base de datos:
+
+- Se construye desde ``user_scores`` en el arranque (o en la primera lectura).
+- Cada solve confirmado en este proceso fija la puntuación absoluta del
+  usuario (leída tras el upsert), así que aplicar dos veces es inocuo.
+- Si cambia el valor de un CTF resuelto (puntuación dinámica), la
+  diferencia se suma a sus solvers con ``adjust_points``.
+- Como otros workers también escriben, ``ttl_seconds`` acota cuánto
+  tarda en verse aquí un cambio hecho en otro proceso.
+
+Orden: más puntos primero; a igualdad, quien llegó antes a esa puntuación
+(``last_solve_at`` más antiguo) y después el ID de usuario.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ...core.config import settings
+from .ranking import RankedSkipList
+
+
+@dataclass(frozen=True)
+class ScoreEntry:
+    """Puntuación de un usuario."""
+    user_id: str
+    total_points: int
+    solved_count: int
+    last_solve_at: Optional[datetime] = None
+    username: Optional[str] = None
+
+    @property
+    def sort_key(self) -> Tuple:
+        last = self.last_solve_at.timestamp() if self.last_solve_at else float("inf")
+        return (-self.total_points, last, self.user_id)
+
+
+ScoreLoader = Callable[[], Iterable[ScoreEntry]]
+
+
+class _Board:
+    """Instantánea: entradas por usuario + skip list ordenado."""
+
+    def __init__(self, entries: Iterable[ScoreEntry]):
+        self.entries: Dict[str, ScoreEntry] = {}
+        self.ranking = RankedSkipList()
+        self.built_at = time.monotonic()
+        for entry in entries:
+            self.set(entry)
+
+    def set(self, entry: ScoreEntry) -> None:
+        current = self.entries.get(entry.user_id)
+        if current is not None:
+            if entry.username is None:
+                entry = replace(entry, username=current.username)
+            self.ranking.remove(current.sort_key)
+        if entry.solved_count <= 0:
+            self.entries.pop(entry.user_id, None)
+            return
+        self.entries[entry.user_id] = entry
+        self.ranking.insert(entry.sort_key)
+
+
+class Leaderboard:
+    """
+    Ranking en memoria con top-N y posición en O(log n).
+
+    Args:
+        ttl_seconds: Antigüedad máxima de la instantánea antes de recargarla.
+    """
+
+    def __init__(self, ttl_seconds: float = 60):
+        self.ttl_seconds = ttl_seconds
+        self._board: Optional[_Board] = None
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        # Puntuaciones fijadas durante una recarga (se reaplican al terminar)
+        self._pending: Optional[List[ScoreEntry]] = None
+        # Ajustes masivos durante una recarga: la nueva instantánea nace caducada
+        self._stale_reload = False
+
+    def ensure(self, loader: ScoreLoader) -> None:
+        """Carga el ranking si no existe o si ha superado el TTL."""
+        board = self._board
+        if board is not None and time.monotonic() - board.built_at < self.ttl_seconds:
+            return
+        self.reload(loader)
+
+    def reload(self, loader: ScoreLoader) -> int:
+        """Reconstruye el ranking desde ``loader``; devuelve el número de usuarios."""
+        with self._load_lock:
+            with self._lock:
+                self._pending = []
+                self._stale_reload = False
+            try:
+                board = _Board(loader())
+            except BaseException:
+                with self._lock:
+                    self._pending = None
+                raise
+            with self._lock:
+                for entry in self._pending:
+                    board.set(entry)
+                if self._stale_reload:
+                    board.built_at = float("-inf")
+                self._pending = None
+                self._board = board
+            return len(board.entries)
+
+    def invalidate(self) -> None:
+        """Fuerza la recarga en la siguiente lectura."""
+        with self._lock:
+            if self._board is not None:
+                self._board.built_at = float("-inf")
+
+    def set_score(self, entry: ScoreEntry) -> None:
+        """Fija la puntuación (absoluta) de un usuario tras confirmar su solve."""
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append(entry)
+            if self._board is not None:
+                self._board.set(entry)
+
+    def adjust_points(self, user_ids: Iterable[str], delta: int) -> None:
+        """
+        Suma ``delta`` puntos a varios usuarios (cambio de valor de un CTF resuelto).
+
+        Si hay una recarga en curso se fuerza otra al terminar: la instantánea
+        que se está leyendo puede incluir ya el ajuste o no.
+        """
+        with self._lock:
+            if self._pending is not None:
+                self._stale_reload = True
+            board = self._board
+            if board is None:
+                return
+            for user_id in user_ids:
+                entry = board.entries.get(user_id)
+                if entry is not None:
+                    board.set(replace(entry, total_points=entry.total_points + delta))
+
+    def set_usernames(self, usernames: Dict[str, str]) -> None:
+        """Completa nombres de usuario que no se conocían al fijar su puntuación."""
+        with self._lock:
+            if self._board is None:
+                return
+            for user_id, username in usernames.items():
+                entry = self._board.entries.get(user_id)
+                if entry is not None:
+                    self._board.entries[user_id] = replace(entry, username=username)
+
+    def top(self, limit: int, offset: int = 0) -> List[Tuple[int, ScoreEntry]]:
+        """Devuelve [(posición 1-based, entrada)] de los ``limit`` primeros desde ``offset``."""
+        with self._lock:
+            board = self._board
+            if board is None:
+                return []
+            result = []
+            for position, key in enumerate(board.ranking.iter_from(offset), start=offset + 1):
+                if len(result) >= limit:
+                    break
+                result.append((position, board.entries[key[2]]))
+            return result
+
+    def rank(self, user_id: str) -> Optional[int]:
+        """Posición 1-based del usuario, o None si no puntúa."""
+        with self._lock:
+            board = self._board
+            entry = board.entries.get(user_id) if board else None
+            if entry is None:
+                return None
+            return board.ranking.rank(entry.sort_key) + 1
+
+    def get(self, user_id: str) -> Optional[ScoreEntry]:
+        """Puntuación actual del usuario."""
+        with self._lock:
+            return self._board.entries.get(user_id) if self._board else None
+
+    @property
+    def size(self) -> int:
+        """Usuarios en el ranking."""
+        board = self._board
+        return len(board.entries) if board else 0
+
+
+# Instancia global
+leaderboard = Leaderboard(ttl_seconds=settings.LEADERBOARD_TTL_SECONDS)
@@ -0,0 +1,146 @@
+"""
+Skip list indexable (estructura de estadísticos de orden).
+
+Cada enlace guarda cuántos elementos salta (``width``), de modo que
+insertar, borrar, obtener la posición de una clave y acceder al
+elemento i-ésimo cuestan O(log n) esperado.
+"""
+
+import random
+from typing import Any, Iterator, List, Optional
+
+
+MAX_LEVEL = 32
+
+
+class _Node:
+    __slots__ = ("key", "next", "width")
+
+    def __init__(self, key: Any, level: int):
+        self.key = key
+        self.next: List[Optional["_Node"]] = [None] * level
+        self.width: List[int] = [1] * level
+
+
+class RankedSkipList:
+    """
+    Conjunto ordenado de claves únicas con acceso por posición.
+
+    Args:
+        seed: Semilla del generador de niveles (para resultados reproducibles).
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self._random = random.Random(seed)
+        self._head = _Node(None, MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, key: Any) -> None:
+        """Inserta ``key`` (debe no estar presente)."""
+        level = self._random_level()
+        update: List[_Node] = [self._head] * MAX_LEVEL
+        # Posición (1-based) del nodo de cada nivel tras el que se inserta
+        positions = [0] * MAX_LEVEL
+        node = self._head
+        position = 0
+        for i in range(self._level - 1, -1, -1):
+            while node.next[i] is not None and node.next[i].key < key:
+                position += node.width[i]
+                node = node.next[i]
+            update[i] = node
+            positions[i] = position
+
+        if level > self._level:
+            for i in range(self._level, level):
+                update[i] = self._head
+                positions[i] = 0
+                self._head.width[i] = self._size + 1
+            self._level = level
+
+        new = _Node(key, level)
+        for i in range(level):
+            prev = update[i]
+            new.next[i] = prev.next[i]
+            prev.next[i] = new
+            # El nuevo nodo queda en la posición positions[0] + 1
+            skipped = positions[0] - positions[i]
+            new.width[i] = prev.width[i] - skipped
+            prev.width[i] = skipped + 1
+        for i in range(level, self._level):
+            update[i].width[i] += 1
+        self._size += 1
+
+    def remove(self, key: Any) -> bool:
+        """Elimina ``key``; devuelve False si no estaba."""
+        update: List[_Node] = [self._head] * MAX_LEVEL
+        node = self._head
+        for i in range(self._level - 1, -1, -1):
+            while node.next[i] is not None and node.next[i].key < key:
+                node = node.next[i]
+            update[i] = node
+
+        target = node.next[0]
+        if target is None or target.key != key:
+            return False
+
+        for i in range(self._level):
+            prev = update[i]
+            if prev.next[i] is target:
+                prev.next[i] = target.next[i]
+                prev.width[i] += target.width[i] - 1
+            else:
+                prev.width[i] -= 1
+        while self._level > 1 and self._head.next[self._level - 1] is None:
+            self._level -= 1
+        self._size -= 1
+        return True
+
+    def rank(self, key: Any) -> Optional[int]:
+        """Posición 0-based de ``key``, o None si no está."""
+        node = self._head
+        position = 0
+        for i in range(self._level - 1, -1, -1):
+            while node.next[i] is not None and node.next[i].key < key:
+                position += node.width[i]
+                node = node.next[i]
+        node = node.next[0]
+        if node is None or node.key != key:
+            return None
+        return position
+
+    def at(self, index: int) -> Any:
+        """Clave en la posición ``index`` (0-based)."""
+        if not 0 <= index < self._size:
+            raise IndexError("skip list index out of range")
+        return self._node_at(index).key
+
+    def iter_from(self, index: int) -> Iterator[Any]:
+        """Recorre las claves en orden a partir de la posición ``index``."""
+        if index >= self._size:
+            return
+        node = self._node_at(max(index, 0))
+        while node is not None:
+            yield node.key
+            node = node.next[0]
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.iter_from(0)
+
+    def _node_at(self, index: int) -> _Node:
+        node = self._head
+        remaining = index + 1
+        for i in range(self._level - 1, -1, -1):
+            while node.next[i] is not None and node.width[i] <= remaining:
+                remaining -= node.width[i]
+                node = node.next[i]
+        return node
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < MAX_LEVEL and self._random.random() < 0.5:
+            level += 1
+        return level
@@ -0,0 +1,287 @@
+"""
+Analíticas por CTF: rollup horario de intentos y solves (``ctf_analytics_hourly``).
+
+Un agregador en segundo plano recalcula las horas recientes y sobrescribe
+sus filas, así que repetir una pasada (o que la hagan dos workers) es
+inocuo:
+
+- Intentos y usuarios distintos por hora salen de recorrer
+  ``flag_submissions`` por el índice de ``submitted_at``.
+- Un usuario es nuevo en la hora de su primer intento en el CTF (una
+  consulta agrupada por (ctf, usuario) para los pares vistos).
+- Los solves salen de ``ctf_solves`` (primer acierto de cada usuario), con
+  sus intentos hasta acertar y el tiempo desde el primer intento.
+
+Cada pasada empieza en la última hora guardada (y como tarde una hora
+antes de ahora), para recoger intentos que llegan con retraso desde el
+diario de intentos incorrectos. Los envíos repetidos respondidos desde la
+caché solo cuentan una vez, como en ``flag_submissions``; los envíos ya
+archivados no se vuelven a contar.
+"""
+
+import asyncio
+import statistics
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, func, select, tuple_
+from sqlalchemy.orm import Session
+
+from ...core.config import settings
+from ...core.logging import logger
+from .models.ctf_analytics_model import CTFAnalyticsHourlyModel
+from .models.ctf_solve_model import CTFSolveModel
+from .models.flag_submission_model import FlagSubmissionModel
+from .score_history import bucket_start
+from .writes import upsert_increment
+
+
+_hourly = CTFAnalyticsHourlyModel.__table__
+_submissions = FlagSubmissionModel.__table__
+_solves = CTFSolveModel.__table__
+
+# Margen hacia atrás de cada pasada (intentos que llegan tarde)
+REFRESH_SLACK = timedelta(hours=1)
+
+# Pares (ctf, usuario) por consulta de primer intento
+_PAIR_CHUNK = 500
+
+HourKey = Tuple[str, datetime]
+
+
+class _Hour:
+    """Acumulador de una (ctf, hora) durante una pasada."""
+
+    __slots__ = ("attempts", "attempters", "new_attempters", "to_solve")
+
+    def __init__(self):
+        self.attempts = 0
+        self.attempters: Set[str] = set()
+        self.new_attempters = 0
+        # (intentos hasta acertar, segundos desde el primer intento) por solve
+        self.to_solve: List[Tuple[int, float]] = []
+
+    def row(self, ctf_id: str, start: datetime) -> Dict[str, Any]:
+        return {
+            "ctf_id": ctf_id,
+            "bucket_start": start,
+            "attempts": self.attempts,
+            "attempters": len(self.attempters),
+            "new_attempters": self.new_attempters,
+            "solves": len(self.to_solve),
+            "median_attempts_to_solve": _median([a for a, _ in self.to_solve]),
+            "median_seconds_to_solve": _median([s for _, s in self.to_solve]),
+        }
+
+
+def _median(values: List[float]) -> Optional[float]:
+    return float(statistics.median(values)) if values else None
+
+
+class CTFAnalytics:
+    """Mantiene y lee el rollup horario de analíticas por CTF."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def refresh(
+        self,
+        now: Optional[datetime] = None,
+        backfill_days: int = settings.ANALYTICS_BACKFILL_DAYS,
+    ) -> int:
+        """
+        Recalcula las horas desde la última guardada hasta ``now``; devuelve las filas escritas.
+
+        Con la tabla vacía empieza ``backfill_days`` días atrás.
+        """
+        now = now or datetime.utcnow()
+        last = self.db.execute(select(func.max(_hourly.c.bucket_start))).scalar()
+        start = now - timedelta(days=backfill_days) if last is None else min(last, now - REFRESH_SLACK)
+        return self.aggregate(bucket_start(start), now)
+
+    def aggregate(self, start: datetime, end: datetime) -> int:
+        """Recalcula y sobrescribe las horas de [start, end) con actividad (hace commit)."""
+        hours: Dict[HourKey, _Hour] = defaultdict(_Hour)
+        pairs: Set[Tuple[str, str]] = set()
+
+        rows = self.db.execute(
+            select(_submissions.c.ctf_id, _submissions.c.user_id, _submissions.c.submitted_at)
+            .where(_submissions.c.submitted_at >= start, _submissions.c.submitted_at < end)
+            .execution_options(yield_per=5000)
+        )
+        for ctf_id, user_id, submitted_at in rows:
+            hour = hours[(ctf_id, bucket_start(submitted_at))]
+            hour.attempts += 1
+            if user_id is not None:
+                hour.attempters.add(user_id)
+                pairs.add((ctf_id, user_id))
+
+        for ctf_id, first_at in self._first_attempts(pairs):
+            if start <= first_at < end:
+                hours[(ctf_id, bucket_start(first_at))].new_attempters += 1
+
+        for ctf_id, solved_at, attempts, first_at in self._solves(start, end):
+            seconds = max((solved_at - first_at).total_seconds(), 0.0) if first_at else 0.0
+            hours[(ctf_id, bucket_start(solved_at))].to_solve.append((max(attempts, 1), seconds))
+
+        try:
+            for (ctf_id, hour_start), hour in hours.items():
+                upsert_increment(
+                    self.db, _hourly, hour.row(ctf_id, hour_start),
+                    increments=(), key=("ctf_id", "bucket_start"),
+                )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return len(hours)
+
+    def _first_attempts(self, pairs: Set[Tuple[str, str]]) -> List[Tuple[str, datetime]]:
+        """Primer intento de cada (ctf, usuario), agrupado por el índice de usuario."""
+        result = []
+        pairs = sorted(pairs)
+        for offset in range(0, len(pairs), _PAIR_CHUNK):
+            chunk = pairs[offset:offset + _PAIR_CHUNK]
+            result.extend(self.db.execute(
+                select(_submissions.c.ctf_id, func.min(_submissions.c.submitted_at))
+                .where(tuple_(_submissions.c.ctf_id, _submissions.c.user_id).in_(chunk))
+                .group_by(_submissions.c.ctf_id, _submissions.c.user_id)
+            ).all())
+        return result
+
+    def _solves(self, start: datetime, end: datetime) -> List[Tuple[str, datetime, int, Optional[datetime]]]:
+        """Solves de [start, end) con sus intentos hasta acertar y el primer intento."""
+        attempts = _submissions.alias("attempts")
+        return self.db.execute(
+            select(
+                _solves.c.ctf_id,
+                _solves.c.solved_at,
+                func.count(attempts.c.id),
+                func.min(attempts.c.submitted_at),
+            )
+            .select_from(_solves.outerjoin(attempts, and_(
+                attempts.c.ctf_id == _solves.c.ctf_id,
+                attempts.c.user_id == _solves.c.user_id,
+                attempts.c.submitted_at <= _solves.c.solved_at,
+            )))
+            .where(_solves.c.solved_at >= start, _solves.c.solved_at < end)
+            .group_by(_solves.c.ctf_id, _solves.c.user_id, _solves.c.solved_at)
+        ).all()
+
+    def series(
+        self,
+        ctf_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Horas con actividad de un CTF y totales del rango.
+
+        Los totales suman intentos, solves y usuarios nuevos; la tasa de
+        solve es solves / usuarios nuevos y las medianas del rango se
+        aproximan con la mediana de las medianas horarias ponderada por
+        solves.
+        """
+        query = select(_hourly).where(_hourly.c.ctf_id == ctf_id)
+        if since is not None:
+            query = query.where(_hourly.c.bucket_start >= bucket_start(since))
+        if until is not None:
+            query = query.where(_hourly.c.bucket_start < until)
+        hours = [dict(row._mapping) for row in self.db.execute(query.order_by(_hourly.c.bucket_start))]
+
+        attempters = sum(hour["new_attempters"] for hour in hours)
+        solves = sum(hour["solves"] for hour in hours)
+        return {
+            "hours": hours,
+            "attempts": sum(hour["attempts"] for hour in hours),
+            "attempters": attempters,
+            "solves": solves,
+            "solve_rate": round(solves / attempters, 4) if attempters else None,
+            "median_attempts_to_solve": _weighted_median(hours, "median_attempts_to_solve"),
+            "median_seconds_to_solve": _weighted_median(hours, "median_seconds_to_solve"),
+        }
+
+
+def _weighted_median(hours: List[Dict[str, Any]], column: str) -> Optional[float]:
+    values = sorted((hour[column], hour["solves"]) for hour in hours if hour["solves"])
+    total = sum(weight for _, weight in values)
+    seen = 0
+    for value, weight in values:
+        seen += weight
+        if seen * 2 >= total:
+            return value
+    return None
+
+
+class AnalyticsAggregator:
+    """
+    Recalcula el rollup de analíticas cada ``interval`` segundos en segundo plano.
+
+    Args:
+        interval: Segundos entre pasadas (0 desactiva el job).
+    """
+
+    def __init__(self, interval: float = 300.0):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._metrics: Dict[str, Any] = {
+            "runs": 0, "failures": 0, "rows": 0,
+            "last_run_at": None, "last_duration_ms": None,
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self, session_factory: Callable[[], Session]) -> None:
+        """Arranca las pasadas periódicas en el bucle actual."""
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.get_running_loop().create_task(self._run(session_factory))
+
+    async def stop(self) -> None:
+        """Detiene las pasadas periódicas."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def run_once(self, db: Session) -> int:
+        """Hace una pasada; devuelve las filas (ctf, hora) escritas."""
+        started = time.perf_counter()
+        written = CTFAnalytics(db).refresh()
+        self._metrics.update(
+            runs=self._metrics["runs"] + 1,
+            rows=written,
+            last_run_at=datetime.utcnow().isoformat(),
+            last_duration_ms=round((time.perf_counter() - started) * 1000, 1),
+        )
+        return written
+
+    def metrics(self) -> Dict[str, Any]:
+        """Pasadas hechas, fallos, filas y duración de la última."""
+        return dict(self._metrics)
+
+    async def _run(self, session_factory: Callable[[], Session]) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self._run_once, session_factory)
+            except Exception as exc:
+                self._metrics["failures"] += 1
+                logger.warning(f"Analytics aggregator failed: {exc}")
+            await asyncio.sleep(self.interval)
+
+    def _run_once(self, session_factory: Callable[[], Session]) -> int:
+        db = session_factory()
+        try:
+            return self.run_once(db)
+        finally:
+            db.close()
+
+
+# Instancia global
+analytics_aggregator = AnalyticsAggregator(interval=settings.ANALYTICS_INTERVAL_SECONDS)
@@ -0,0 +1,165 @@
+"""
+Búsqueda difusa de CTFs por trigramas.
+
+Cada CTF se indexa en ``ctf_search_trigrams`` con los trigramas de su
+título, skills, plataforma y descripción. Una búsqueda descompone la
+consulta en trigramas, cuenta con una sola consulta agrupada cuántos
+coinciden por (CTF, campo) y calcula la similitud como la fracción de
+trigramas de la consulta presentes en el campo, ponderada por campo.
+Así se toleran errores tipográficos ("buffer overlfow") y abreviaturas
+("sqli") y los resultados salen ordenados por relevancia.
+"""
+
+import json
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from .models.ctf_model import CTFModel
+from .models.ctf_search_model import CTFSearchTrigramModel
+
+
+# Peso de cada campo en la puntuación final
+FIELD_WEIGHTS: Dict[str, float] = {
+    "title": 1.0,
+    "skills": 0.9,
+    "platform": 0.8,
+    "description": 0.6,
+}
+
+# Puntuación mínima para considerar un CTF como resultado
+MIN_SCORE = 0.3
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(text: Optional[str]) -> List[str]:
+    """Pasa a minúsculas, elimina acentos y separa en palabras alfanuméricas."""
+    if not text:
+        return []
+    ascii_text = (
+        unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode().lower()
+    )
+    return _NON_ALNUM.sub(" ", ascii_text).split()
+
+
+def trigrams(text: Optional[str]) -> Set[str]:
+    """
+    Trigramas de un texto, al estilo de pg_trgm.
+
+    Cada palabra se rellena con dos ``_`` delante y uno detrás, de modo que
+    los prefijos pesan más y las palabras cortas también generan trigramas.
+    """
+    result: Set[str] = set()
+    for word in normalize(text):
+        padded = f"__{word}_"
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return result
+
+
+def document_trigrams(
+    title: Optional[str],
+    skills: Iterable[str],
+    platform: Optional[str],
+    description: Optional[str],
+) -> Dict[str, Set[str]]:
+    """Trigramas de cada campo indexado de un CTF."""
+    return {
+        "title": trigrams(title),
+        "skills": trigrams(" ".join(skills)),
+        "platform": trigrams(platform),
+        "description": trigrams(description),
+    }
+
+
+class CTFSearchIndex:
+    """Mantiene y consulta el índice de trigramas de CTFs."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def index(
+        self,
+        ctf_id: str,
+        title: Optional[str],
+        skills: Iterable[str],
+        platform: Optional[str],
+        description: Optional[str],
+    ) -> None:
+        """
+        Reemplaza las entradas de un CTF en el índice.
+
+        No hace commit: el llamador confirma junto con la escritura del CTF.
+        """
+        self.remove(ctf_id)
+        rows = [
+            {"ctf_id": ctf_id, "field": field, "trigram": trigram}
+            for field, grams in document_trigrams(title, skills, platform, description).items()
+            for trigram in grams
+        ]
+        if rows:
+            self.db.execute(CTFSearchTrigramModel.__table__.insert(), rows)
+
+    def remove(self, ctf_id: str) -> None:
+        """Elimina (sin commit) las entradas de un CTF."""
+        self.db.query(CTFSearchTrigramModel).filter(
+            CTFSearchTrigramModel.ctf_id == ctf_id
+        ).delete(synchronize_session=False)
+
+    def rebuild(self) -> int:
+        """Reconstruye el índice completo desde ``ctfs``. Devuelve los CTFs indexados."""
+        self.db.query(CTFSearchTrigramModel).delete(synchronize_session=False)
+        rows = self.db.query(
+            CTFModel.id, CTFModel.title, CTFModel.skills, CTFModel.platform, CTFModel.description
+        ).all()
+        for ctf_id, title, skills, platform, description in rows:
+            self.index(ctf_id, title, json.loads(skills) if skills else [], platform, description)
+        self.db.commit()
+        return len(rows)
+
+    def score(self, query: str, *filters) -> List[Tuple[str, float]]:
+        """
+        Puntúa los CTFs que coinciden con la consulta.
+
+        Args:
+            query: Texto buscado.
+            filters: Condiciones adicionales sobre ``CTFModel``.
+
+        Returns:
+            Lista de (ctf_id, puntuación) ordenada de mayor a menor, solo con
+            puntuación >= MIN_SCORE.
+        """
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+
+        matches = (
+            self.db.query(
+                CTFSearchTrigramModel.ctf_id,
+                CTFSearchTrigramModel.field,
+                func.count(),
+            )
+            .join(CTFModel, CTFModel.id == CTFSearchTrigramModel.ctf_id)
+            .filter(CTFSearchTrigramModel.trigram.in_(query_grams))
+            .filter(*filters)
+            .group_by(CTFSearchTrigramModel.ctf_id, CTFSearchTrigramModel.field)
+            .all()
+        )
+
+        scores: Dict[str, float] = {}
+        total = len(query_grams)
+        for ctf_id, field, count in matches:
+            value = FIELD_WEIGHTS.get(field, 0.0) * count / total
+            if value > scores.get(ctf_id, 0.0):
+                scores[ctf_id] = value
+
+        ranked = [
+            (ctf_id, round(value, 4))
+            for ctf_id, value in scores.items()
+            if value >= MIN_SCORE
+        ]
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return ranked
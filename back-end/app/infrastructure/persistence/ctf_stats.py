@@ -0,0 +1,220 @@
+"""
+Rollup incremental de estadísticas de CTFs.
+
+Cada escritura sobre un CTF calcula su "contribución" a las estadísticas
+antes y después del cambio y aplica solo la diferencia sobre la fila de
+``ctf_stats``, dentro de la misma transacción. La lectura es una consulta
+por clave primaria en lugar de cargar todos los CTFs publicados.
+"""
+
+import json
+from typing import Any, Dict, NamedTuple, Optional
+
+from sqlalchemy import func, case
+from sqlalchemy.orm import Session
+
+from .models.ctf_model import CTFModel
+from .models.ctf_stats_model import CTFStatsModel
+
+
+STATS_ROW_ID = 1
+
+PUBLISHED = "published"
+
+
+class CTFContribution(NamedTuple):
+    """Aporte de un CTF publicado a las estadísticas."""
+    level: str
+    category: str
+    platform: str
+    points: int
+    solved: bool
+
+
+def contribution_from_values(
+    status: Optional[str],
+    level: str,
+    category: str,
+    platform: str,
+    points: Optional[int],
+    solved: Optional[bool],
+) -> Optional[CTFContribution]:
+    """Calcula el aporte de un CTF; None si no está publicado."""
+    if status != PUBLISHED:
+        return None
+    return CTFContribution(level, category, platform, points or 0, bool(solved))
+
+
+def contribution_from_model(model: CTFModel) -> Optional[CTFContribution]:
+    """Aporte de un CTF según su fila persistida."""
+    return contribution_from_values(
+        model.status, model.level, model.category, model.platform, model.points, model.solved
+    )
+
+
+class CTFStatsRollup:
+    """Mantiene y lee la fila de estadísticas agregadas de CTFs."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def apply(
+        self,
+        old: Optional[CTFContribution],
+        new: Optional[CTFContribution],
+    ) -> None:
+        """
+        Aplica el cambio de aporte de un CTF sobre el rollup.
+
+        No hace commit: el llamador confirma junto con la escritura del CTF.
+        """
+        if old == new:
+            return
+
+        row = self._lock_row()
+        by_level = _loads(row.by_level)
+        by_category = _loads(row.by_category)
+        by_platform = _loads(row.by_platform)
+
+        for contribution, sign in ((old, -1), (new, 1)):
+            if contribution is None:
+                continue
+            row.total += sign
+            row.total_points += sign * contribution.points
+            if contribution.solved:
+                row.solved += sign
+                row.earned_points += sign * contribution.points
+            _bump(by_level, contribution.level, sign)
+            _bump(by_category, contribution.category, sign)
+            _bump(by_platform, contribution.platform, sign)
+
+        row.by_level = json.dumps(by_level)
+        row.by_category = json.dumps(by_category)
+        row.by_platform = json.dumps(by_platform)
+
+    def read(self) -> Dict[str, Any]:
+        """Lee las estadísticas (una fila por PK); reconstruye si no existe."""
+        row = self.db.get(CTFStatsModel, STATS_ROW_ID)
+        if row is None:
+            row = self._store(self.compute())
+            self.db.commit()
+        return _row_to_dict(row)
+
+    def compute(self) -> Dict[str, Any]:
+        """Calcula las estadísticas desde cero con consultas agregadas."""
+        published = CTFModel.status == PUBLISHED
+
+        total, solved, total_points, earned_points = (
+            self.db.query(
+                func.count(CTFModel.id),
+                func.coalesce(func.sum(case((CTFModel.solved == True, 1), else_=0)), 0),
+                func.coalesce(func.sum(CTFModel.points), 0),
+                func.coalesce(
+                    func.sum(case((CTFModel.solved == True, CTFModel.points), else_=0)), 0
+                ),
+            )
+            .filter(published)
+            .one()
+        )
+
+        def group(column) -> Dict[str, int]:
+            rows = (
+                self.db.query(column, func.count(CTFModel.id))
+                .filter(published)
+                .group_by(column)
+                .all()
+            )
+            return {key: int(count) for key, count in rows}
+
+        return {
+            "total": int(total),
+            "solved": int(solved),
+            "total_points": int(total_points),
+            "earned_points": int(earned_points),
+            "by_level": group(CTFModel.level),
+            "by_category": group(CTFModel.category),
+            "by_platform": group(CTFModel.platform),
+        }
+
+    def reconcile(self, repair: bool = False) -> Dict[str, Any]:
+        """
+        Recalcula el rollup desde cero y lo compara con el almacenado.
+
+        Args:
+            repair: Si es True, sobrescribe el rollup con los valores recalculados.
+
+        Returns:
+            Diccionario con ``consistent``, ``differences`` y ``repaired``.
+        """
+        row = self.db.get(CTFStatsModel, STATS_ROW_ID)
+        stored = _row_to_dict(row) if row else None
+        actual = self.compute()
+
+        differences = {}
+        for key, value in actual.items():
+            stored_value = stored.get(key) if stored else None
+            if stored_value != value:
+                differences[key] = {"stored": stored_value, "actual": value}
+
+        repaired = False
+        if differences and repair:
+            self._store(actual)
+            self.db.commit()
+            repaired = True
+
+        return {
+            "consistent": not differences,
+            "differences": differences,
+            "repaired": repaired,
+        }
+
+    def _lock_row(self) -> CTFStatsModel:
+        """Obtiene la fila de estadísticas con bloqueo de escritura."""
+        row = (
+            self.db.query(CTFStatsModel)
+            .filter(CTFStatsModel.id == STATS_ROW_ID)
+            .with_for_update()
+            .first()
+        )
+        if row is None:
+            row = self._store(self.compute())
+        return row
+
+    def _store(self, stats: Dict[str, Any]) -> CTFStatsModel:
+        """Guarda (sin commit) los valores indicados en la fila de estadísticas."""
+        row = self.db.get(CTFStatsModel, STATS_ROW_ID)
+        if row is None:
+            row = CTFStatsModel(id=STATS_ROW_ID)
+            self.db.add(row)
+        row.total = stats["total"]
+        row.solved = stats["solved"]
+        row.total_points = stats["total_points"]
+        row.earned_points = stats["earned_points"]
+        row.by_level = json.dumps(stats["by_level"])
+        row.by_category = json.dumps(stats["by_category"])
+        row.by_platform = json.dumps(stats["by_platform"])
+        return row
+
+
+def _loads(value: Optional[str]) -> Dict[str, int]:
+    return json.loads(value) if value else {}
+
+
+def _bump(counts: Dict[str, int], key: str, delta: int) -> None:
+    value = counts.get(key, 0) + delta
+    if value > 0:
+        counts[key] = value
+    else:
+        counts.pop(key, None)
+
+
+def _row_to_dict(row: CTFStatsModel) -> Dict[str, Any]:
+    return {
+        "total": row.total or 0,
+        "solved": row.solved or 0,
+        "total_points": row.total_points or 0,
+        "earned_points": row.earned_points or 0,
+        "by_level": _loads(row.by_level),
+        "by_category": _loads(row.by_category),
+        "by_platform": _loads(row.by_platform),
+    }
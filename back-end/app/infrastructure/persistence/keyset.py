@@ -0,0 +1,44 @@
+"""
+Helpers de paginación keyset para consultas SQLAlchemy.
+"""
+
+from typing import Optional
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+from ...core.pagination import Cursor
+
+
+def apply_keyset(
+    query: Query,
+    sort_column,
+    id_column,
+    cursor: Optional[Cursor] = None,
+    descending: bool = True,
+) -> Query:
+    """
+    Aplica orden (sort_key, id) y, si hay cursor, el filtro de la siguiente página.
+
+    El orden incluye el ID como desempate para que sea total y estable;
+    así se aprovecha un índice compuesto (sort_key, id).
+    """
+    if cursor is not None:
+        if descending:
+            query = query.filter(
+                or_(
+                    sort_column < cursor.sort_value,
+                    and_(sort_column == cursor.sort_value, id_column < cursor.id),
+                )
+            )
+        else:
+            query = query.filter(
+                or_(
+                    sort_column > cursor.sort_value,
+                    and_(sort_column == cursor.sort_value, id_column > cursor.id),
+                )
+            )
+
+    if descending:
+        return query.order_by(sort_column.desc(), id_column.desc())
+    return query.order_by(sort_column.asc(), id_column.asc())
@@ -9,6 +9,15 @@ from .writeup_model import WriteupModel
 from .attachment_model import AttachmentModel
 from .contact_model import ContactModel
 from .flag_submission_model import FlagSubmissionModel
+from .flag_submission_repeat_model import FlagSubmissionRepeatModel
+from .ctf_stats_model import CTFStatsModel
+from .ctf_search_model import CTFSearchTrigramModel
+from .ctf_skill_model import CTFSkillModel
+from .ctf_solve_model import CTFSolveModel
+from .user_score_model import UserScoreModel
+from .user_score_history_model import UserScoreHistoryModel
+from .ctf_neighbour_model import CTFNeighbourModel
+from .ctf_analytics_model import CTFAnalyticsHourlyModel
 
 __all__ = [
     "UserModel",
@@ -18,4 +27,13 @@ __all__ = [
     "AttachmentModel",
     "ContactModel",
     "FlagSubmissionModel",
+    "FlagSubmissionRepeatModel",
+    "CTFStatsModel",
+    "CTFSearchTrigramModel",
+    "CTFSkillModel",
+    "CTFSolveModel",
+    "UserScoreModel",
+    "UserScoreHistoryModel",
+    "CTFNeighbourModel",
+    "CTFAnalyticsHourlyModel",
 ]
@@ -2,7 +2,7 @@
 Modelo SQLAlchemy para Contact.
 """
 
-from sqlalchemy import Column, String, DateTime, Text, CHAR
+from sqlalchemy import Column, String, DateTime, Text, CHAR, Index
 from datetime import datetime
 import uuid
 
@@ -13,6 +13,11 @@ class ContactModel(Base):
     """Modelo de base de datos para mensajes de contacto."""
     
     __tablename__ = "contacts"
+    __table_args__ = (
+        # Paginación keyset: ORDER BY created_at DESC, id DESC
+        Index("ix_contacts_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_contacts_created_at_id", "created_at", "id"),
+    )
     
     id = Column(CHAR(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String(100), nullable=False)
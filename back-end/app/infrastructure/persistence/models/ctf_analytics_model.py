@@ -0,0 +1,35 @@
+"""
+Modelo SQLAlchemy para las estadísticas horarias de intentos por CTF.
+"""
+
+from sqlalchemy import Column, Integer, Float, DateTime, CHAR, ForeignKey
+
+from ..base import Base
+
+
+class CTFAnalyticsHourlyModel(Base):
+    """
+    Intentos y solves de un CTF en una hora.
+
+    Lo mantiene el agregador de analíticas recalculando las horas recientes
+    desde ``flag_submissions`` y ``ctf_solves``. ``attempters`` son usuarios
+    distintos que intentaron en esa hora (no se puede sumar entre horas);
+    ``new_attempters`` los que intentaron ese CTF por primera vez (sí se
+    puede). Las medianas son de los solves de esa hora: intentos hasta
+    acertar y segundos desde el primer intento. La clave primaria
+    (ctf_id, bucket_start) sirve la lectura por CTF y rango de fechas.
+    """
+
+    __tablename__ = "ctf_analytics_hourly"
+
+    ctf_id = Column(CHAR(36), ForeignKey("ctfs.id", ondelete="CASCADE"), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    attempters = Column(Integer, nullable=False, default=0)
+    new_attempters = Column(Integer, nullable=False, default=0)
+    solves = Column(Integer, nullable=False, default=0)
+    median_attempts_to_solve = Column(Float)
+    median_seconds_to_solve = Column(Float)
+
+    def __repr__(self) -> str:
+        return f"<CTFAnalyticsHourly {self.ctf_id} {self.bucket_start} attempts={self.attempts} solves={self.solves}>"
@@ -2,7 +2,7 @@
 Modelo SQLAlchemy para CTF.
 """
 
-from sqlalchemy import Column, String, Boolean, Integer, DateTime, Text, CHAR, ForeignKey
+from sqlalchemy import Column, String, Boolean, Integer, DateTime, Text, CHAR, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -14,6 +14,11 @@ class CTFModel(Base):
     """Modelo de base de datos para CTFs."""
     
     __tablename__ = "ctfs"
+    __table_args__ = (
+        # Paginación keyset: ORDER BY created_at DESC, id DESC
+        Index("ix_ctfs_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_ctfs_created_at_id", "created_at", "id"),
+    )
     
     id = Column(CHAR(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String(200), nullable=False)
@@ -32,6 +37,14 @@ class CTFModel(Base):
     is_flag_regex = Column(Boolean, default=False)
     author = Column(String(100))
     solved_count = Column(Integer, default=0)
+    # Puntuación dinámica: points se recalcula desde estos campos en cada solve
+    dynamic_scoring = Column(Boolean, default=False)
+    initial_points = Column(Integer, default=0)
+    minimum_points = Column(Integer, default=0)
+    decay_solves = Column(Integer, default=0)
+    # First blood: primer usuario que lo resolvió (lo fija el envío de flags)
+    first_blood_user_id = Column(CHAR(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    first_blood_at = Column(DateTime)
     is_active = Column(Boolean, default=True)
     status = Column(String(20), default="draft")
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -46,6 +59,7 @@ class CTFModel(Base):
     attachments = relationship("AttachmentModel", back_populates="ctf", cascade="all, delete-orphan")
     created_by = relationship("UserModel", foreign_keys=[created_by_id])
     updated_by = relationship("UserModel", foreign_keys=[updated_by_id])
+    first_blood_user = relationship("UserModel", foreign_keys=[first_blood_user_id])
     
     def __repr__(self) -> str:
         return f"<CTF {self.title}>"
@@ -0,0 +1,30 @@
+"""
+Modelo SQLAlchemy para los CTFs vecinos de cada CTF (recomendaciones).
+"""
+
+from sqlalchemy import Column, Integer, Float, DateTime, CHAR, ForeignKey
+from datetime import datetime
+
+from ..base import Base
+
+
+class CTFNeighbourModel(Base):
+    """
+    Uno de los N CTFs más parecidos a otro.
+
+    La tabla la reescribe entera el job de recomendaciones: la similitud
+    mezcla quién resolvió ambos CTFs (coseno sobre los solves) con las
+    skills que comparten. La clave primaria (ctf_id, rank) sirve la
+    lectura de los vecinos de los CTFs resueltos por un usuario.
+    """
+
+    __tablename__ = "ctf_neighbours"
+
+    ctf_id = Column(CHAR(36), ForeignKey("ctfs.id", ondelete="CASCADE"), primary_key=True)
+    rank = Column(Integer, primary_key=True)
+    neighbour_id = Column(CHAR(36), ForeignKey("ctfs.id", ondelete="CASCADE"), nullable=False)
+    score = Column(Float, nullable=False)
+    computed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<CTFNeighbour {self.ctf_id} #{self.rank} {self.neighbour_id} score={self.score:.3f}>"
@@ -0,0 +1,28 @@
+"""
+Modelo SQLAlchemy para el índice de trigramas de CTFs.
+"""
+
+from sqlalchemy import Column, String, CHAR, ForeignKey, Index
+
+from ..base import Base
+
+
+class CTFSearchTrigramModel(Base):
+    """
+    Trigrama presente en un campo de texto de un CTF.
+
+    Una fila por (CTF, campo, trigrama) distinto. El índice por trigrama
+    permite obtener candidatos y contar coincidencias sin recorrer ``ctfs``.
+    """
+
+    __tablename__ = "ctf_search_trigrams"
+    __table_args__ = (
+        Index("ix_ctf_search_trigrams_trigram", "trigram", "ctf_id", "field"),
+    )
+
+    ctf_id = Column(CHAR(36), ForeignKey("ctfs.id", ondelete="CASCADE"), primary_key=True)
+    field = Column(String(16), primary_key=True)   # title, skills, platform, description
+    trigram = Column(String(3), primary_key=True)  # Solo [a-z0-9_]
+
+    def __repr__(self) -> str:
+        return f"<CTFSearchTrigram {self.ctf_id} {self.field} {self.trigram!r}>"
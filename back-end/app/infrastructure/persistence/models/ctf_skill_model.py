@@ -0,0 +1,29 @@
+"""
+Modelo SQLAlchemy para las skills de un CTF (tabla de unión).
+"""
+
+from sqlalchemy import Column, String, CHAR, ForeignKey, Index
+
+from ..base import Base
+
+
+class CTFSkillModel(Base):
+    """
+    Skill asociada a un CTF.
+
+    Normaliza la columna JSON ``ctfs.skills`` para poder filtrar y contar
+    facetas por skill con índices. ``skill`` es la clave normalizada
+    (minúsculas, sin espacios extremos) y ``name`` el texto original.
+    """
+
+    __tablename__ = "ctf_skills"
+    __table_args__ = (
+        Index("ix_ctf_skills_skill_ctf_id", "skill", "ctf_id"),
+    )
+
+    ctf_id = Column(CHAR(36), ForeignKey("ctfs.id", ondelete="CASCADE"), primary_key=True)
+    skill = Column(String(100), primary_key=True)
+    name = Column(String(100), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<CTFSkill {self.ctf_id} {self.name}>"
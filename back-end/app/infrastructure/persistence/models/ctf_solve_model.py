@@ -0,0 +1,31 @@
+"""
+Modelo SQLAlchemy para los solves de un CTF (uno por usuario).
+"""
+
+from sqlalchemy import Column, DateTime, CHAR, ForeignKey, Index
+from datetime import datetime
+
+from ..base import Base
+
+
+class CTFSolveModel(Base):
+    """
+    Primer acierto de un usuario en un CTF.
+
+    La clave primaria (ctf_id, user_id) hace de restricción única: el
+    envío correcto intenta insertar su fila y solo si la inserción entra
+    se incrementa ``ctfs.solved_count`` (y se fija el first blood).
+    """
+
+    __tablename__ = "ctf_solves"
+    __table_args__ = (
+        Index("ix_ctf_solves_user_solved_at", "user_id", "solved_at"),
+        Index("ix_ctf_solves_solved_at", "solved_at"),
+    )
+
+    ctf_id = Column(CHAR(36), ForeignKey("ctfs.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(CHAR(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    solved_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<CTFSolve ctf={self.ctf_id} user={self.user_id}>"
@@ -0,0 +1,32 @@
+"""
+Modelo SQLAlchemy para el rollup de estadísticas de CTFs.
+"""
+
+from sqlalchemy import Column, Integer, DateTime, Text
+from datetime import datetime
+
+from ..base import Base
+
+
+class CTFStatsModel(Base):
+    """
+    Estadísticas agregadas de los CTFs publicados.
+
+    Tabla de una sola fila (id=1) que se mantiene de forma incremental
+    en la misma transacción que las escrituras sobre ``ctfs``.
+    """
+
+    __tablename__ = "ctf_stats"
+
+    id = Column(Integer, primary_key=True, default=1)
+    total = Column(Integer, nullable=False, default=0)          # CTFs publicados
+    solved = Column(Integer, nullable=False, default=0)         # Publicados y resueltos
+    total_points = Column(Integer, nullable=False, default=0)
+    earned_points = Column(Integer, nullable=False, default=0)
+    by_level = Column(Text)     # JSON string {level: count}
+    by_category = Column(Text)  # JSON string {category: count}
+    by_platform = Column(Text)  # JSON string {platform: count}
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<CTFStats total={self.total} solved={self.solved}>"
@@ -2,7 +2,7 @@
 Modelo SQLAlchemy para FlagSubmission.
 """
 
-from sqlalchemy import Column, String, Boolean, DateTime, Text, CHAR, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, Text, CHAR, ForeignKey, Index
 from datetime import datetime
 import uuid
 
@@ -13,6 +13,17 @@ class FlagSubmissionModel(Base):
     """Modelo de base de datos para intentos de flags."""
     
     __tablename__ = "flag_submissions"
+    __table_args__ = (
+        # Paginación keyset: ORDER BY submitted_at DESC, id DESC
+        Index("ix_flag_submissions_ctf_submitted_at_id", "ctf_id", "submitted_at", "id"),
+        Index("ix_flag_submissions_user_submitted_at_id", "user_id", "submitted_at", "id"),
+        # Aciertos por CTF (y sus solvers) sin leer el resto de intentos
+        Index("ix_flag_submissions_ctf_correct_user", "ctf_id", "is_correct", "user_id"),
+        # Envíos recientes globales y recorridos por rango de fechas
+        Index("ix_flag_submissions_submitted_at", "submitted_at"),
+        # Auditoría y exportación por IP
+        Index("ix_flag_submissions_ip_submitted_at", "ip_address", "submitted_at"),
+    )
     
     id = Column(CHAR(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     ctf_id = Column(CHAR(36), ForeignKey("ctfs.id"), nullable=False)
@@ -0,0 +1,29 @@
+"""
+Modelo SQLAlchemy para las repeticiones agregadas de intentos incorrectos.
+"""
+
+from sqlalchemy import Column, String, Integer, DateTime, CHAR, ForeignKey
+
+from ..base import Base
+
+
+class FlagSubmissionRepeatModel(Base):
+    """
+    Repeticiones de un mismo intento incorrecto (usuario o IP, CTF, hash de flag).
+
+    El primer intento queda en ``flag_submissions``; las repeticiones
+    respondidas desde la caché de envíos solo suman a ``repeat_count``.
+    """
+
+    __tablename__ = "flag_submission_repeats"
+
+    principal = Column(String(64), primary_key=True)  # "user:<id>" o "ip:<dirección>"
+    ctf_id = Column(CHAR(36), ForeignKey("ctfs.id", ondelete="CASCADE"), primary_key=True)
+    flag = Column(CHAR(64), primary_key=True)  # Hash de la flag
+    user_id = Column(CHAR(36), ForeignKey("users.id", ondelete="SET NULL"))
+    ip_address = Column(String(45))
+    repeat_count = Column(Integer, nullable=False, default=0)
+    last_repeat_at = Column(DateTime)
+
+    def __repr__(self) -> str:
+        return f"<FlagSubmissionRepeat {self.principal} ctf={self.ctf_id} x{self.repeat_count}>"
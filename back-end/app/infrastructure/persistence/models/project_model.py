@@ -2,7 +2,7 @@
 Modelo SQLAlchemy para Project.
 """
 
-from sqlalchemy import Column, String, Boolean, Integer, DateTime, Text, CHAR
+from sqlalchemy import Column, String, Boolean, Integer, DateTime, Text, CHAR, Index
 from datetime import datetime
 import uuid
 
@@ -13,6 +13,11 @@ class ProjectModel(Base):
     """Modelo de base de datos para proyectos."""
     
     __tablename__ = "projects"
+    __table_args__ = (
+        # Paginación keyset: ORDER BY order ASC, id ASC
+        Index("ix_projects_status_order_id", "status", "order", "id"),
+        Index("ix_projects_order_id", "order", "id"),
+    )
     
     id = Column(CHAR(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String(200), nullable=False)
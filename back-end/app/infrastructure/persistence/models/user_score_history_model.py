@@ -0,0 +1,30 @@
+"""
+Modelo SQLAlchemy para la evolución de la puntuación de cada usuario.
+"""
+
+from sqlalchemy import Column, Integer, DateTime, CHAR, ForeignKey
+
+from ..base import Base
+
+
+class UserScoreHistoryModel(Base):
+    """
+    Puntuación acumulada de un usuario al cierre de cada hora con solves.
+
+    Cada primer acierto sobrescribe la fila de su hora con la puntuación
+    resultante, en la misma transacción que actualiza ``user_scores``. Solo
+    hay filas para las horas en las que el usuario resolvió algo, así que
+    la serie de un usuario es escalonada y ocupa una fila por hora activa.
+    La clave primaria (user_id, bucket_start) sirve la lectura por usuarios
+    y rango de fechas.
+    """
+
+    __tablename__ = "user_score_history"
+
+    user_id = Column(CHAR(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    total_points = Column(Integer, nullable=False, default=0)
+    solved_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<UserScoreHistory {self.user_id} {self.bucket_start} points={self.total_points}>"
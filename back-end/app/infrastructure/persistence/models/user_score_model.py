@@ -0,0 +1,30 @@
+"""
+Modelo SQLAlchemy para la puntuación agregada de cada usuario.
+"""
+
+from sqlalchemy import Column, Integer, DateTime, CHAR, ForeignKey, Index
+
+from ..base import Base
+
+
+class UserScoreModel(Base):
+    """
+    Puntos y solves de un usuario.
+
+    Se mantiene de forma incremental en la misma transacción que cada
+    primer acierto (fila de ``ctf_solves``) y es la fuente desde la que
+    se construye el ranking en memoria.
+    """
+
+    __tablename__ = "user_scores"
+    __table_args__ = (
+        Index("ix_user_scores_points_last_solve", "total_points", "last_solve_at"),
+    )
+
+    user_id = Column(CHAR(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    total_points = Column(Integer, nullable=False, default=0)
+    solved_count = Column(Integer, nullable=False, default=0)
+    last_solve_at = Column(DateTime)  # Desempate: antes llegó, mejor posición
+
+    def __repr__(self) -> str:
+        return f"<UserScore {self.user_id} points={self.total_points}>"
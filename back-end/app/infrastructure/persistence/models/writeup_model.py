@@ -2,7 +2,7 @@
 Modelo SQLAlchemy para Writeup.
 """
 
-from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, CHAR
+from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, CHAR, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -14,6 +14,11 @@ class WriteupModel(Base):
     """Modelo de base de datos para writeups."""
     
     __tablename__ = "writeups"
+    __table_args__ = (
+        # Paginación keyset: ORDER BY created_at DESC, id DESC
+        Index("ix_writeups_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_writeups_created_at_id", "created_at", "id"),
+    )
     
     id = Column(CHAR(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String(200), nullable=False)
@@ -0,0 +1,333 @@
+"""
+Recomendaciones de CTFs a partir de quién resolvió qué.
+
+Un job periódico calcula, para cada CTF publicado, sus N vecinos más
+parecidos y los guarda en ``ctf_neighbours``:
+
+- Cada CTF es un vector disperso usuario -> peso sobre ``ctf_solves``. El
+  peso de un usuario baja con el número de CTFs que ha resuelto, para que
+  quien lo resuelve todo no haga parecidos a todos los CTFs entre sí.
+- La similitud por co-solves es el coseno entre vectores. Se acumula
+  recorriendo los solves de cada usuario (en el orden del índice
+  ``ix_ctf_solves_user_solved_at``), así que solo se tocan pares que
+  alguien ha resuelto juntos.
+- Se mezcla con el Jaccard de las skills (``ctf_skills``); así los CTFs
+  nuevos, aún sin solves, también tienen vecinos.
+
+La recomendación para un usuario son lecturas por índice: sus CTFs
+resueltos, los vecinos de esos CTFs (clave primaria) y las filas de los
+candidatos. Los vecinos se suman por candidato y se descartan los ya
+resueltos; si no hay bastantes se completa con los CTFs más resueltos.
+"""
+
+import asyncio
+import heapq
+import math
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from ...core.config import settings
+from ...core.logging import logger
+from .models.ctf_model import CTFModel
+from .models.ctf_neighbour_model import CTFNeighbourModel
+from .models.ctf_skill_model import CTFSkillModel
+from .models.ctf_solve_model import CTFSolveModel
+
+
+PUBLISHED = "published"
+
+# Solves más recientes de un usuario que cuentan para los pares (O(k²) por usuario)
+MAX_BASKET = 200
+
+_neighbours = CTFNeighbourModel.__table__
+_INSERT_BATCH = 1000
+
+# CTF -> [(vecino, similitud)] de mayor a menor
+NeighbourMap = Dict[str, List[Tuple[str, float]]]
+
+
+class CoSolveRecommender:
+    """
+    Calcula, guarda y consulta los vecinos de cada CTF.
+
+    Args:
+        db: Sesión de base de datos.
+        neighbours: Vecinos guardados por CTF.
+        skill_weight: Peso de las skills compartidas (0-1); el resto es co-solve.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        neighbours: int = settings.RECOMMENDER_NEIGHBOURS,
+        skill_weight: float = settings.RECOMMENDER_SKILL_WEIGHT,
+    ):
+        self.db = db
+        self.neighbours = neighbours
+        self.skill_weight = min(max(skill_weight, 0.0), 1.0)
+
+    # ------------------------------------------------------------------
+    # Cálculo
+    # ------------------------------------------------------------------
+
+    def compute(self) -> NeighbourMap:
+        """Calcula los vecinos de todos los CTFs publicados (sin escribir)."""
+        published = set(self.db.execute(
+            select(CTFModel.id).where(CTFModel.status == PUBLISHED)
+        ).scalars())
+        co_solve = self._co_solve_similarity(published)
+        skills = self._skill_similarity(published)
+
+        result: NeighbourMap = {}
+        for ctf_id in published:
+            scores: Dict[str, float] = defaultdict(float)
+            for other, value in co_solve.get(ctf_id, {}).items():
+                scores[other] += (1.0 - self.skill_weight) * value
+            for other, value in skills.get(ctf_id, {}).items():
+                scores[other] += self.skill_weight * value
+            best = heapq.nlargest(
+                self.neighbours,
+                ((score, other) for other, score in scores.items() if score > 0),
+                key=lambda item: (item[0], item[1]),
+            )
+            if best:
+                result[ctf_id] = [(other, score) for score, other in best]
+        return result
+
+    def _co_solve_similarity(self, published: Set[str]) -> Dict[str, Dict[str, float]]:
+        """Coseno entre los vectores de solves de cada par resuelto a la vez."""
+        dot: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        norm: Dict[str, float] = defaultdict(float)
+
+        def flush(basket: List[str]) -> None:
+            if not basket:
+                return
+            weight = 1.0 / math.log2(2 + len(basket))
+            squared = weight * weight
+            basket = basket[-MAX_BASKET:]
+            for ctf_id in basket:
+                norm[ctf_id] += squared
+            for i, first in enumerate(basket):
+                row = dot[first]
+                for second in basket[i + 1:]:
+                    row[second] += squared
+                    dot[second][first] += squared
+
+        rows = self.db.execute(
+            select(CTFSolveModel.user_id, CTFSolveModel.ctf_id)
+            .order_by(CTFSolveModel.user_id, CTFSolveModel.solved_at)
+            .execution_options(yield_per=5000)
+        )
+        current_user: Optional[str] = None
+        basket: List[str] = []
+        for user_id, ctf_id in rows:
+            if user_id != current_user:
+                flush(basket)
+                current_user, basket = user_id, []
+            if ctf_id in published:
+                basket.append(ctf_id)
+        flush(basket)
+
+        return {
+            first: {
+                second: value / math.sqrt(norm[first] * norm[second])
+                for second, value in row.items()
+            }
+            for first, row in dot.items()
+        }
+
+    def _skill_similarity(self, published: Set[str]) -> Dict[str, Dict[str, float]]:
+        """Jaccard de las skills de cada par de CTFs con alguna skill en común."""
+        skills_of: Dict[str, Set[str]] = defaultdict(set)
+        ctfs_with: Dict[str, List[str]] = defaultdict(list)
+        for ctf_id, skill in self.db.execute(select(CTFSkillModel.ctf_id, CTFSkillModel.skill)):
+            if ctf_id in published:
+                skills_of[ctf_id].add(skill)
+                ctfs_with[skill].append(ctf_id)
+
+        shared: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        for ctf_ids in ctfs_with.values():
+            for i, first in enumerate(ctf_ids):
+                for second in ctf_ids[i + 1:]:
+                    shared[first][second] += 1
+                    shared[second][first] += 1
+
+        return {
+            first: {
+                second: common / (len(skills_of[first]) + len(skills_of[second]) - common)
+                for second, common in row.items()
+            }
+            for first, row in shared.items()
+        }
+
+    def rebuild(self) -> int:
+        """Recalcula y reescribe ``ctf_neighbours`` en una transacción; devuelve las filas."""
+        computed = self.compute()
+        now = datetime.utcnow()
+        rows = [
+            {"ctf_id": ctf_id, "rank": rank, "neighbour_id": other, "score": score, "computed_at": now}
+            for ctf_id, neighbours in computed.items()
+            for rank, (other, score) in enumerate(neighbours, start=1)
+        ]
+        try:
+            self.db.execute(delete(_neighbours))
+            for start in range(0, len(rows), _INSERT_BATCH):
+                self.db.execute(insert(_neighbours), rows[start:start + _INSERT_BATCH])
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return len(rows)
+
+    def computed_at(self) -> Optional[datetime]:
+        """Fecha del último cálculo guardado (None si la tabla está vacía)."""
+        return self.db.execute(select(func.max(_neighbours.c.computed_at))).scalar()
+
+    # ------------------------------------------------------------------
+    # Consulta
+    # ------------------------------------------------------------------
+
+    def recommend(self, solved: Iterable[str], limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        CTFs publicados no resueltos, ordenados por afinidad con ``solved``.
+
+        Cada elemento lleva ``score`` (suma de similitudes con los CTFs
+        resueltos) y ``source``: ``similar`` o ``popular`` (relleno).
+        """
+        solved = set(solved)
+        scores: Dict[str, float] = defaultdict(float)
+        if solved:
+            rows = self.db.execute(
+                select(_neighbours.c.neighbour_id, _neighbours.c.score)
+                .where(_neighbours.c.ctf_id.in_(sorted(solved)))
+            )
+            for neighbour_id, score in rows:
+                if neighbour_id not in solved:
+                    scores[neighbour_id] += score
+
+        # Algún margen por si un candidato ya no está publicado
+        ranked = heapq.nlargest(limit * 2, scores.items(), key=lambda item: (item[1], item[0]))
+        found = self._published([ctf_id for ctf_id, _ in ranked])
+        result = [
+            {**found[ctf_id], "score": round(score, 4), "source": "similar"}
+            for ctf_id, score in ranked
+            if ctf_id in found
+        ][:limit]
+
+        if len(result) < limit:
+            exclude = solved | {item["id"] for item in result}
+            result.extend(
+                {**row, "score": 0.0, "source": "popular"}
+                for row in self._popular(exclude, limit - len(result))
+            )
+        return result
+
+    def _published(self, ctf_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        if not ctf_ids:
+            return {}
+        rows = self.db.execute(
+            select(CTFModel.id, CTFModel.title, CTFModel.points, CTFModel.category, CTFModel.level)
+            .where(CTFModel.id.in_(ctf_ids), CTFModel.status == PUBLISHED)
+        )
+        return {row.id: dict(row._mapping) for row in rows}
+
+    def _popular(self, exclude: Set[str], limit: int) -> List[Dict[str, Any]]:
+        query = (
+            select(CTFModel.id, CTFModel.title, CTFModel.points, CTFModel.category, CTFModel.level)
+            .where(CTFModel.status == PUBLISHED)
+            .order_by(CTFModel.solved_count.desc(), CTFModel.created_at, CTFModel.id)
+            .limit(limit + len(exclude))
+        )
+        rows = [dict(row._mapping) for row in self.db.execute(query)]
+        return [row for row in rows if row["id"] not in exclude][:limit]
+
+
+class RecommendationJob:
+    """
+    Recalcula ``ctf_neighbours`` cada ``interval`` segundos en segundo plano.
+
+    Con varios workers cada uno tiene su job, pero antes de calcular se
+    comprueba la fecha del último cálculo guardado: si otro worker lo hizo
+    hace menos de ``interval`` se salta la vuelta.
+
+    Args:
+        interval: Segundos entre cálculos (0 desactiva el job).
+    """
+
+    def __init__(self, interval: float = 3600.0):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._metrics: Dict[str, Any] = {
+            "runs": 0, "skipped": 0, "failures": 0,
+            "neighbours": 0, "last_run_at": None, "last_duration_ms": None,
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self, session_factory: Callable[[], Session]) -> None:
+        """Arranca el cálculo periódico en el bucle actual."""
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.get_running_loop().create_task(self._run(session_factory))
+
+    async def stop(self) -> None:
+        """Detiene el cálculo periódico."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def run_once(self, db: Session, force: bool = False) -> Optional[int]:
+        """
+        Recalcula los vecinos; devuelve las filas escritas o None si estaban al día.
+
+        Con ``force`` se recalcula aunque el último cálculo sea reciente.
+        """
+        recommender = CoSolveRecommender(db)
+        if not force:
+            last = recommender.computed_at()
+            if last is not None and datetime.utcnow() - last < timedelta(seconds=self.interval):
+                self._metrics["skipped"] += 1
+                return None
+        started = time.perf_counter()
+        written = recommender.rebuild()
+        self._metrics.update(
+            runs=self._metrics["runs"] + 1,
+            neighbours=written,
+            last_run_at=datetime.utcnow().isoformat(),
+            last_duration_ms=round((time.perf_counter() - started) * 1000, 1),
+        )
+        return written
+
+    def metrics(self) -> Dict[str, Any]:
+        """Cálculos hechos y saltados, fallos, filas y duración del último."""
+        return dict(self._metrics)
+
+    async def _run(self, session_factory: Callable[[], Session]) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self._run_once, session_factory)
+            except Exception as exc:
+                self._metrics["failures"] += 1
+                logger.warning(f"Recommendation job failed: {exc}")
+            await asyncio.sleep(self.interval)
+
+    def _run_once(self, session_factory: Callable[[], Session]) -> Optional[int]:
+        db = session_factory()
+        try:
+            return self.run_once(db)
+        finally:
+            db.close()
+
+
+# Instancia global
+recommendation_job = RecommendationJob(interval=settings.RECOMMENDER_INTERVAL_SECONDS)
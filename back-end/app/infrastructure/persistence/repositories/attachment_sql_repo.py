@@ -2,13 +2,21 @@
 Implementación SQL del repositorio de Attachments.
 """
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 
 from ....domain.entities.attachment import Attachment, AttachmentType
 from ....domain.repositories.attachment_repo import AttachmentRepository
 from ..models.attachment_model import AttachmentModel
+from ..writes import entity_row, upsert_row
+
+
+# Columnas de attachments que se corresponden 1:1 con campos de la entidad
+_ATTACHMENT_COLUMNS = (
+    "name", "type", "ctf_id", "url", "file_path", "size", "mime_type",
+    "checksum", "uploaded_by", "created_at",
+)
 
 
 class AttachmentSqlRepository(AttachmentRepository):
@@ -49,6 +57,35 @@ class AttachmentSqlRepository(AttachmentRepository):
         self.db.commit()
         return attachment
     
+    def save_many(self, attachments: List[Attachment]) -> int:
+        """Guarda un lote de adjuntos con un upsert por fila y un único commit."""
+        if not attachments:
+            return 0
+        
+        ids = {str(a.id) for a in attachments}
+        existing = {
+            attachment_id
+            for (attachment_id,) in self.db.query(AttachmentModel.id).filter(AttachmentModel.id.in_(ids))
+        }
+        try:
+            for attachment in attachments:
+                upsert_row(
+                    self.db,
+                    AttachmentModel.__table__,
+                    entity_row(attachment, ("id", *_ATTACHMENT_COLUMNS)),
+                )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return len(ids - existing)
+    
+    def stream_all(self, batch_size: int = 500) -> Iterator[Attachment]:
+        """Recorre todos los adjuntos con un cursor de servidor."""
+        query = self.db.query(AttachmentModel).order_by(AttachmentModel.id).yield_per(batch_size)
+        for model in query:
+            yield self._to_entity(model)
+    
     def get_by_id(self, attachment_id: UUID) -> Optional[Attachment]:
         """Obtiene un adjunto por su ID."""
         db_attachment = self.db.query(AttachmentModel).filter(
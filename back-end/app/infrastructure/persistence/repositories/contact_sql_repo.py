@@ -8,7 +8,9 @@ from sqlalchemy.orm import Session
 
 from ....domain.entities.contact import Contact, ContactStatus, ProjectType
 from ....domain.repositories.contact_repo import ContactRepository
+from ....core.pagination import Cursor
 from ..models.contact_model import ContactModel
+from ..keyset import apply_keyset
 
 
 class ContactSqlRepository(ContactRepository):
@@ -55,6 +57,7 @@ class ContactSqlRepository(ContactRepository):
         status: Optional[ContactStatus] = None,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[Cursor] = None,
     ) -> List[Contact]:
         """Obtiene todos los mensajes con filtros opcionales."""
         query = self.db.query(ContactModel)
@@ -62,8 +65,11 @@ class ContactSqlRepository(ContactRepository):
         if status:
             query = query.filter(ContactModel.status == status.value)
         
-        query = query.order_by(ContactModel.created_at.desc())
-        db_contacts = query.offset(skip).limit(limit).all()
+        query = apply_keyset(query, ContactModel.created_at, ContactModel.id, cursor)
+        if cursor is None:
+            query = query.offset(skip)
+        
+        db_contacts = query.limit(limit).all()
         return [self._to_entity(c) for c in db_contacts]
     
     def get_pending(self, skip: int = 0, limit: int = 100) -> List[Contact]:
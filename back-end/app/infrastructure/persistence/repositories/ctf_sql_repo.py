@@ -3,14 +3,49 @@ Implementación SQL del repositorio de CTFs.
 """
 
 import json
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import String, func, literal, select, union_all
 
-from ....domain.entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus
+from ....domain.entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus, dynamic_points
 from ....domain.repositories.ctf_repo import CTFRepository
+from ....domain.services.submission_cache import submission_cache
+from ....core.pagination import Cursor
 from ..models.ctf_model import CTFModel
+from ..models.ctf_skill_model import CTFSkillModel
+from ..models.ctf_solve_model import CTFSolveModel
+from ..models.flag_submission_repeat_model import FlagSubmissionRepeatModel
+from ..keyset import apply_keyset
+from ..models.attachment_model import AttachmentModel
+from ..ctf_stats import CTFStatsRollup, contribution_from_values
+from ..writes import entity_row, update_row, upsert_row
+from ..ctf_search import CTFSearchIndex
+from ..user_scores import UserScoreLedger
+from ...catalog import CATALOG_COLUMNS, ctf_catalog
+from ...leaderboard import leaderboard
+
+
+# Columnas de ctfs que se corresponden 1:1 con campos de la entidad
+_CTF_COLUMNS = (
+    "title", "level", "category", "platform", "description", "points",
+    "solved", "solved_at", "machine_os", "skills", "hints", "flag_hash",
+    "is_flag_regex", "author", "created_by_id", "updated_by_id",
+    "solved_count", "is_active", "status", "created_at", "updated_at",
+    "dynamic_scoring", "initial_points", "minimum_points", "decay_solves",
+)
+
+# Columnas que solo escribe record_attempt (vía ctf_solves); una importación
+# sobre un CTF existente no las toca
+_SOLVE_COLUMNS = frozenset({"solved", "solved_at", "solved_count"})
+
+# Campos indexados para la búsqueda difusa
+_SEARCH_FIELDS = frozenset({"title", "skills", "platform", "description"})
+
+
+def skill_key(name: str) -> str:
+    """Clave normalizada de una skill (para filtrar sin distinguir mayúsculas)."""
+    return name.strip().lower()[:100]
 
 
 class CTFSqlRepository(CTFRepository):
@@ -18,104 +53,204 @@ class CTFSqlRepository(CTFRepository):
     
     def __init__(self, db: Session):
         self.db = db
+        self.stats = CTFStatsRollup(db)
+        self.search_index = CTFSearchIndex(db)
+        self.scores = UserScoreLedger(db)
     
     def save(self, ctf: CTF) -> CTF:
-        """Guarda un CTF (crear o actualizar)."""
+        """
+        Guarda un CTF (crear o actualizar) y actualiza el rollup de estadísticas.
+        
+        Un CTF nuevo se inserta con un upsert; uno cargado desde el repositorio
+        emite un único UPDATE con las columnas modificadas (o nada si no cambió).
+        """
         ctf_id = str(ctf.id)
-        existing = self.db.query(CTFModel).filter(CTFModel.id == ctf_id).first()
+        changed = ctf.changed_fields()
+        if changed is not None and not changed:
+            return ctf
+        
+        # Rollup en la misma transacción que la escritura del CTF
+        self.stats.apply(
+            None if changed is None else self._contribution(ctf, persisted=True),
+            self._contribution(ctf),
+        )
         
-        if existing:
-            existing.title = ctf.title
-            existing.level = ctf.level.value
-            existing.category = ctf.category.value
-            existing.platform = ctf.platform
-            existing.description = ctf.description
-            existing.points = ctf.points
-            existing.solved = ctf.solved
-            existing.solved_at = ctf.solved_at
-            existing.machine_os = ctf.machine_os
-            existing.skills = json.dumps(ctf.skills)
-            existing.hints = json.dumps(ctf.hints)
-            existing.flag_hash = ctf.flag_hash
-            existing.author = ctf.author
-            existing.solved_count = ctf.solved_count
-            existing.is_active = ctf.is_active
-            existing.status = ctf.status.value
-            existing.updated_at = ctf.updated_at
-            existing.updated_by_id = str(ctf.updated_by_id) if ctf.updated_by_id else None
-            
-            # Actualizar adjuntos si es necesario (simplificado: recrear)
-            # Nota: Esto es destructivo, idealmente se debería comparar
-            if ctf.attachments:
-                # Eliminar existentes para evitar duplicados si la lógica de negocio lo requiere,
-                # pero aquí asumimos que ctf.attachments es la verdad absoluta.
-                # Sin embargo, SQLAlchemy gestiona la colección.
-                # Una estrategia simple es limpiar y agregar.
-                # existing.attachments.clear() # Cuidado con orphans
-                pass 
-                # TODO: Implementar lógica de actualización de adjuntos más robusta si se requiere edición
+        if changed is None:
+            upsert_row(self.db, CTFModel.__table__, entity_row(ctf, ("id", *_CTF_COLUMNS)))
+            self._insert_attachments(ctf)
         else:
-            # Crear modelos de adjuntos
-            from ..models.attachment_model import AttachmentModel
-            attachment_models = []
-            for att in ctf.attachments:
-                att_model = AttachmentModel(
-                    id=str(att.id),
-                    name=att.name,
-                    type=att.type.value,
-                    url=att.url,
-                    size=att.size,
-                    mime_type=att.mime_type,
-                    ctf_id=ctf_id
-                )
-                attachment_models.append(att_model)
-
-            db_ctf = CTFModel(
-                id=ctf_id,
-                title=ctf.title,
-                level=ctf.level.value,
-                category=ctf.category.value,
-                platform=ctf.platform,
-                description=ctf.description,
-                points=ctf.points,
-                solved=ctf.solved,
-                solved_at=ctf.solved_at,
-                machine_os=ctf.machine_os,
-                skills=json.dumps(ctf.skills),
-                hints=json.dumps(ctf.hints),
-                flag_hash=ctf.flag_hash,
-                author=ctf.author,
-                solved_count=ctf.solved_count,
-                is_active=ctf.is_active,
-                status=ctf.status.value,
-                created_at=ctf.created_at,
-                created_by_id=str(ctf.created_by_id) if ctf.created_by_id else None,
-                updated_by_id=str(ctf.updated_by_id) if ctf.updated_by_id else None,
-                attachments=attachment_models
+            update_row(self.db, CTFModel.__table__, ctf_id, entity_row(ctf, changed))
+        
+        # Los solvers ya puntuados reciben la diferencia de puntos
+        rescored = 0
+        if changed and "points" in changed:
+            rescored = self.scores.adjust_ctf_points(
+                ctf_id, (ctf.points or 0) - (ctf.persisted_value("points") or 0)
             )
-            self.db.add(db_ctf)
+        
+        # Solo se reindexa si cambia algún campo de texto buscable
+        if changed is None or changed & _SEARCH_FIELDS:
+            self.search_index.index(ctf_id, ctf.title, ctf.skills, ctf.platform, ctf.description)
+        if changed is None or "skills" in changed:
+            self._sync_skills(ctf_id, ctf.skills)
         
         self.db.commit()
+        ctf.mark_persisted()
+        ctf_catalog.invalidate()
+        if rescored:
+            leaderboard.invalidate()
         return ctf
     
+    def save_many(self, ctfs: List[CTF]) -> int:
+        """
+        Guarda un lote de CTFs con un upsert por fila y un único commit.
+        
+        Una consulta ligera previa indica qué IDs existen, para descontar su
+        aporte anterior del rollup e insertar adjuntos solo en los nuevos.
+        En los existentes se conservan los contadores de solves (solo los
+        cambia ``record_attempt``) y la flag guardada si el CTF no trae una.
+        """
+        if not ctfs:
+            return 0
+        
+        rows = self.db.query(
+            CTFModel.id,
+            CTFModel.status,
+            CTFModel.level,
+            CTFModel.category,
+            CTFModel.platform,
+            CTFModel.points,
+            CTFModel.solved,
+            CTFModel.solved_at,
+            CTFModel.solved_count,
+            CTFModel.flag_hash,
+            CTFModel.is_flag_regex,
+        ).filter(CTFModel.id.in_([str(c.id) for c in ctfs])).all()
+        existing = {row.id: contribution_from_values(*row[1:7]) for row in rows}
+        points = {row.id: row.points or 0 for row in rows}
+        stored = {row.id: row for row in rows}
+        
+        created = 0
+        rescored = 0
+        try:
+            for ctf in ctfs:
+                ctf_id = str(ctf.id)
+                columns = _CTF_COLUMNS
+                if ctf_id in stored:
+                    row = stored[ctf_id]
+                    ctf.solved = bool(row.solved)
+                    ctf.solved_at = row.solved_at
+                    ctf.solved_count = row.solved_count or 0
+                    if ctf.dynamic_scoring:
+                        ctf.points = dynamic_points(
+                            ctf.initial_points, ctf.minimum_points, ctf.decay_solves, ctf.solved_count
+                        )
+                    columns = tuple(c for c in columns if c not in _SOLVE_COLUMNS)
+                    if ctf.flag_hash is None:
+                        ctf.flag_hash = row.flag_hash
+                        ctf.is_flag_regex = bool(row.is_flag_regex)
+                contribution = self._contribution(ctf)
+                self.stats.apply(existing.get(ctf_id), contribution)
+                upsert_row(self.db, CTFModel.__table__, entity_row(ctf, ("id", *columns)))
+                if ctf_id in points:
+                    rescored += self.scores.adjust_ctf_points(ctf_id, (ctf.points or 0) - points[ctf_id])
+                points[ctf_id] = ctf.points or 0
+                if ctf_id not in existing:
+                    created += 1
+                    self._insert_attachments(ctf)
+                existing[ctf_id] = contribution
+                self.search_index.index(ctf_id, ctf.title, ctf.skills, ctf.platform, ctf.description)
+                self._sync_skills(ctf_id, ctf.skills)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        
+        for ctf in ctfs:
+            ctf.mark_persisted()
+        ctf_catalog.invalidate()
+        if rescored:
+            leaderboard.invalidate()
+        return created
+    
+    def stream_all(self, batch_size: int = 500) -> Iterator[CTF]:
+        """Recorre todos los CTFs con un cursor de servidor (sin cargar adjuntos)."""
+        query = self.db.query(CTFModel).order_by(CTFModel.id).yield_per(batch_size)
+        for model in query:
+            yield self._to_entity(model, include_attachments=False)
+    
     def get_by_id(self, ctf_id: UUID) -> Optional[CTF]:
         """Obtiene un CTF por su ID."""
         db_ctf = self.db.query(CTFModel).filter(CTFModel.id == str(ctf_id)).first()
         return self._to_entity(db_ctf) if db_ctf else None
     
+    def get_for_submission(self, ctf_id: UUID) -> Optional[CTF]:
+        """Proyección ligera de un CTF para validar flags (una lectura por PK)."""
+        row = (
+            self.db.query(
+                CTFModel.title,
+                CTFModel.level,
+                CTFModel.category,
+                CTFModel.platform,
+                CTFModel.points,
+                CTFModel.solved,
+                CTFModel.flag_hash,
+                CTFModel.is_flag_regex,
+                CTFModel.solved_count,
+                CTFModel.dynamic_scoring,
+                CTFModel.is_active,
+                CTFModel.status,
+            )
+            .filter(CTFModel.id == str(ctf_id))
+            .first()
+        )
+        if row is None:
+            return None
+        
+        ctf = CTF(
+            id=ctf_id,
+            title=row.title,
+            level=CTFLevel(row.level),
+            category=CTFCategory(row.category),
+            platform=row.platform,
+            points=row.points,
+            solved=row.solved,
+            flag_hash=row.flag_hash,
+            is_flag_regex=bool(row.is_flag_regex),
+            solved_count=row.solved_count or 0,
+            dynamic_scoring=bool(row.dynamic_scoring),
+            is_active=row.is_active if row.is_active is not None else True,
+            status=CTFStatus(row.status),
+        )
+        # Como entidad cargada: un save() solo escribiría lo que se modifique
+        ctf.mark_persisted()
+        return ctf
+    
+    def get_catalog_rows(self) -> List[Dict[str, Any]]:
+        """Columnas del listado de los CTFs publicados (una consulta, sin adjuntos)."""
+        table = CTFModel.__table__
+        rows = self.db.execute(
+            select(*(table.c[column] for column in CATALOG_COLUMNS))
+            .where(*self._filters(status=CTFStatus.PUBLISHED))
+        )
+        return [self._catalog_row(row._mapping) for row in rows]
+    
     def get_all(
         self,
         skip: int = 0,
-        limit: int = 100,
+        limit: Optional[int] = 100,
         status: Optional[CTFStatus] = None,
+        cursor: Optional[Cursor] = None,
+        skill: Optional[str] = None,
     ) -> List[CTF]:
         """Obtiene todos los CTFs con paginación y filtros."""
-        query = self.db.query(CTFModel)
+        query = self.db.query(CTFModel).filter(*self._filters(status=status, skill=skill))
         
-        if status:
-            query = query.filter(CTFModel.status == status.value)
+        query = apply_keyset(query, CTFModel.created_at, CTFModel.id, cursor)
+        if cursor is None:
+            query = query.offset(skip)
         
-        db_ctfs = query.order_by(CTFModel.created_at.desc()).offset(skip).limit(limit).all()
+        db_ctfs = query.limit(limit).all()
         return [self._to_entity(c) for c in db_ctfs]
     
     def get_by_level(self, level: CTFLevel) -> List[CTF]:
@@ -148,9 +283,17 @@ class CTFSqlRepository(CTFRepository):
         )
         return [self._to_entity(c) for c in db_ctfs]
     
-    def get_published(self, skip: int = 0, limit: int = 100) -> List[CTF]:
+    def get_published(
+        self,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        cursor: Optional[Cursor] = None,
+        skill: Optional[str] = None,
+    ) -> List[CTF]:
         """Obtiene solo los CTFs publicados."""
-        return self.get_all(skip=skip, limit=limit, status=CTFStatus.PUBLISHED)
+        return self.get_all(
+            skip=skip, limit=limit, status=CTFStatus.PUBLISHED, cursor=cursor, skill=skill
+        )
     
     def get_solved(self) -> List[CTF]:
         """Obtiene los CTFs resueltos."""
@@ -162,77 +305,243 @@ class CTFSqlRepository(CTFRepository):
         return [self._to_entity(c) for c in db_ctfs]
     
     def search(self, query: str) -> List[CTF]:
-        """Busca CTFs por título o skills."""
-        db_ctfs = (
-            self.db.query(CTFModel)
-            .filter(
-                or_(
-                    CTFModel.title.ilike(f"%{query}%"),
-                    CTFModel.skills.ilike(f"%{query}%"),
-                    CTFModel.description.ilike(f"%{query}%"),
-                )
-            )
-            .filter(CTFModel.status == "published")
-            .filter(CTFModel.is_active == True)
-            .all()
+        """Busca CTFs publicados y activos, ordenados por relevancia."""
+        results, _ = self.search_ranked(
+            query, limit=None, status=CTFStatus.PUBLISHED, active_only=True
         )
-        return [self._to_entity(c) for c in db_ctfs]
+        return [ctf for ctf, _ in results]
+    
+    def search_ranked(
+        self,
+        query: str,
+        skip: int = 0,
+        limit: Optional[int] = 10,
+        status: Optional[CTFStatus] = None,
+        level: Optional[CTFLevel] = None,
+        category: Optional[CTFCategory] = None,
+        platform: Optional[str] = None,
+        active_only: bool = False,
+        skill: Optional[str] = None,
+    ) -> Tuple[List[Tuple[CTF, float]], int]:
+        """Búsqueda difusa por trigramas con filtros, ranking y paginación."""
+        filters = self._filters(status, level, category, platform, skill)
+        if active_only:
+            filters.append(CTFModel.is_active == True)
+        
+        ranked = self.search_index.score(query, *filters)
+        page = ranked[skip:skip + limit] if limit is not None else ranked[skip:]
+        if not page:
+            return [], len(ranked)
+        
+        models = {
+            m.id: m
+            for m in self.db.query(CTFModel).filter(CTFModel.id.in_([cid for cid, _ in page])).all()
+        }
+        results = [
+            (self._to_entity(models[cid]), score) for cid, score in page if cid in models
+        ]
+        return results, len(ranked)
     
     def delete(self, ctf_id: UUID) -> bool:
-        """Elimina un CTF por su ID."""
+        """Elimina un CTF por su ID y descuenta su aporte a las estadísticas."""
+        row = (
+            self.db.query(
+                CTFModel.status,
+                CTFModel.level,
+                CTFModel.category,
+                CTFModel.platform,
+                CTFModel.points,
+                CTFModel.solved,
+            )
+            .filter(CTFModel.id == str(ctf_id))
+            .first()
+        )
+        if row is None:
+            return False
+        
+        self.stats.apply(contribution_from_values(*row), None)
+        self.search_index.remove(str(ctf_id))
+        self.db.query(CTFSkillModel).filter(CTFSkillModel.ctf_id == str(ctf_id)).delete(
+            synchronize_session=False
+        )
+        rescored = self.scores.remove_ctf(str(ctf_id), row.points)
+        self.db.query(CTFSolveModel).filter(CTFSolveModel.ctf_id == str(ctf_id)).delete(
+            synchronize_session=False
+        )
+        self.db.query(FlagSubmissionRepeatModel).filter(
+            FlagSubmissionRepeatModel.ctf_id == str(ctf_id)
+        ).delete(synchronize_session=False)
         result = self.db.query(CTFModel).filter(CTFModel.id == str(ctf_id)).delete()
         self.db.commit()
+        ctf_catalog.invalidate()
+        # Las repeticiones cacheadas no deben seguir respondiendo "incorrecta" (sino 404)
+        submission_cache.invalidate_ctf(ctf_id)
+        if rescored:
+            leaderboard.invalidate()
         return result > 0
     
     def count(
         self,
         status: Optional[CTFStatus] = None,
         category: Optional[CTFCategory] = None,
+        skill: Optional[str] = None,
     ) -> int:
         """Cuenta el número de CTFs con filtros opcionales."""
-        query = self.db.query(CTFModel)
-        
-        if status:
-            query = query.filter(CTFModel.status == status.value)
-        
-        if category:
-            query = query.filter(CTFModel.category == category.value)
-        
-        return query.count()
+        query = self.db.query(func.count(CTFModel.id)).filter(
+            *self._filters(status=status, category=category, skill=skill)
+        )
+        return query.scalar()
     
-    def get_statistics(self) -> dict:
-        """Obtiene estadísticas de CTFs (por nivel, categoría, etc.)."""
-        all_ctfs = self.db.query(CTFModel).filter(CTFModel.status == "published").all()
+    def get_facets(
+        self,
+        level: Optional[CTFLevel] = None,
+        category: Optional[CTFCategory] = None,
+        platform: Optional[str] = None,
+        skill: Optional[str] = None,
+    ) -> Dict[str, Dict[str, int]]:
+        """Cuenta CTFs publicados por skill, nivel, categoría y plataforma (una consulta)."""
+        filtered = (
+            select(CTFModel.id, CTFModel.level, CTFModel.category, CTFModel.platform)
+            .where(*self._filters(CTFStatus.PUBLISHED, level, category, platform, skill))
+            .cte("filtered")
+        )
         
-        by_level = {}
-        by_category = {}
-        by_platform = {}
+        def grouped(facet: str, column):
+            return (
+                select(literal(facet, String).label("facet"), column.label("value"), func.count().label("total"))
+                .select_from(filtered)
+                .group_by(column)
+            )
         
-        total_points = 0
-        earned_points = 0
+        skills = (
+            select(
+                literal("skill", String).label("facet"),
+                func.min(CTFSkillModel.name).label("value"),
+                func.count().label("total"),
+            )
+            .select_from(filtered.join(CTFSkillModel, CTFSkillModel.ctf_id == filtered.c.id))
+            .group_by(CTFSkillModel.skill)
+        )
         
-        for ctf in all_ctfs:
-            total_points += ctf.points
-            if ctf.solved:
-                earned_points += ctf.points
-                
-            # Por nivel
-            by_level[ctf.level] = by_level.get(ctf.level, 0) + 1
-            # Por categoría
-            by_category[ctf.category] = by_category.get(ctf.category, 0) + 1
-            # Por plataforma
-            by_platform[ctf.platform] = by_platform.get(ctf.platform, 0) + 1
+        statement = union_all(
+            grouped("level", filtered.c.level),
+            grouped("category", filtered.c.category),
+            grouped("platform", filtered.c.platform),
+            skills,
+        )
         
-        return {
-            "by_level": by_level,
-            "by_category": by_category,
-            "by_platform": by_platform,
-            "total_points": total_points,
-            "earned_points": earned_points,
-        }
+        facets: Dict[str, Dict[str, int]] = {"skill": {}, "level": {}, "category": {}, "platform": {}}
+        for facet, value, total in self.db.execute(statement):
+            facets[facet][value] = total
+        return facets
     
-    def _to_entity(self, model: CTFModel) -> CTF:
-        """Convierte un modelo a entidad de dominio."""
+    def get_statistics(self) -> dict:
+        """Obtiene estadísticas de CTFs desde el rollup (lectura de una fila)."""
+        return self.stats.read()
+    
+    def reconcile_statistics(self, repair: bool = False) -> dict:
+        """Recalcula las estadísticas desde cero y las compara con el rollup."""
+        return self.stats.reconcile(repair=repair)
+    
+    def rebuild_search_index(self) -> int:
+        """Reconstruye el índice de trigramas de todos los CTFs."""
+        return self.search_index.rebuild()
+    
+    def _filters(
+        self,
+        status: Optional[CTFStatus] = None,
+        level: Optional[CTFLevel] = None,
+        category: Optional[CTFCategory] = None,
+        platform: Optional[str] = None,
+        skill: Optional[str] = None,
+    ) -> list:
+        """Construye las condiciones de filtrado sobre CTFModel."""
+        filters = []
+        if status:
+            filters.append(CTFModel.status == status.value)
+        if level:
+            filters.append(CTFModel.level == level.value)
+        if category:
+            filters.append(CTFModel.category == category.value)
+        if platform:
+            filters.append(func.lower(CTFModel.platform) == platform.lower())
+        if skill:
+            filters.append(
+                CTFModel.id.in_(
+                    select(CTFSkillModel.ctf_id).where(CTFSkillModel.skill == skill_key(skill))
+                )
+            )
+        return filters
+    
+    def _contribution(self, ctf: CTF, persisted: bool = False):
+        """Aporte del CTF a las estadísticas (estado actual o persistido)."""
+        value = ctf.persisted_value if persisted else (lambda name: getattr(ctf, name))
+        return contribution_from_values(
+            value("status").value,
+            value("level").value,
+            value("category").value,
+            value("platform"),
+            value("points"),
+            value("solved"),
+        )
+    
+    def _insert_attachments(self, ctf: CTF) -> None:
+        """Inserta (sin commit) los adjuntos de un CTF nuevo."""
+        rows = [
+            {
+                "id": str(att.id),
+                "name": att.name,
+                "type": att.type.value,
+                "url": att.url,
+                "size": att.size,
+                "mime_type": att.mime_type,
+                "ctf_id": str(ctf.id),
+            }
+            for att in ctf.attachments
+        ]
+        if rows:
+            self.db.execute(AttachmentModel.__table__.insert(), rows)
+    
+    def _sync_skills(self, ctf_id: str, skills: Iterable[str]) -> None:
+        """Reemplaza (sin commit) las filas de ctf_skills de un CTF."""
+        self.db.query(CTFSkillModel).filter(CTFSkillModel.ctf_id == ctf_id).delete(
+            synchronize_session=False
+        )
+        rows = {}
+        for name in skills:
+            key = skill_key(name)
+            if key and key not in rows:
+                rows[key] = {"ctf_id": ctf_id, "skill": key, "name": name.strip()[:100]}
+        if rows:
+            self.db.execute(CTFSkillModel.__table__.insert(), list(rows.values()))
+    
+    @staticmethod
+    def _catalog_row(row) -> Dict[str, Any]:
+        """Decodifica una fila de ``get_catalog_rows`` como lo hace ``_to_entity``."""
+        values = dict(row)
+        values.update(
+            id=UUID(row["id"]),
+            skills=json.loads(row["skills"]) if row["skills"] else [],
+            hints=json.loads(row["hints"]) if row["hints"] else [],
+            points=row["points"] or 0,
+            solved=bool(row["solved"]),
+            solved_count=row["solved_count"] or 0,
+            dynamic_scoring=bool(row["dynamic_scoring"]),
+            initial_points=row["initial_points"] or 0,
+            minimum_points=row["minimum_points"] or 0,
+            decay_solves=row["decay_solves"] or 0,
+            first_blood_user_id=UUID(row["first_blood_user_id"]) if row["first_blood_user_id"] else None,
+            is_active=row["is_active"] if row["is_active"] is not None else True,
+        )
+        return values
+    
+    def _to_entity(self, model: CTFModel, include_attachments: bool = True) -> CTF:
+        """
+        Convierte un modelo a entidad de dominio.
+        
+        Con ``include_attachments=False`` no se toca la relación (evita una
+        consulta perezosa por fila mientras hay un cursor abierto).
+        """
         from uuid import UUID as UUIDType
         # Mapear adjuntos
         from ....domain.entities.attachment import Attachment, AttachmentType
@@ -246,10 +555,10 @@ class CTFSqlRepository(CTFRepository):
                 mime_type=att.mime_type,
                 ctf_id=UUIDType(att.ctf_id)
             )
-            for att in model.attachments
+            for att in (model.attachments if include_attachments else [])
         ]
 
-        return CTF(
+        ctf = CTF(
             id=UUIDType(model.id),
             title=model.title,
             level=CTFLevel(model.level),
@@ -263,8 +572,15 @@ class CTFSqlRepository(CTFRepository):
             skills=json.loads(model.skills) if model.skills else [],
             hints=json.loads(model.hints) if model.hints else [],
             flag_hash=model.flag_hash,
+            is_flag_regex=bool(model.is_flag_regex),
             author=model.author,
             solved_count=model.solved_count or 0,
+            dynamic_scoring=bool(model.dynamic_scoring),
+            initial_points=model.initial_points or 0,
+            minimum_points=model.minimum_points or 0,
+            decay_solves=model.decay_solves or 0,
+            first_blood_user_id=UUIDType(model.first_blood_user_id) if model.first_blood_user_id else None,
+            first_blood_at=model.first_blood_at,
             is_active=model.is_active if model.is_active is not None else True,
             status=CTFStatus(model.status),
             created_at=model.created_at,
@@ -273,3 +589,5 @@ class CTFSqlRepository(CTFRepository):
             updated_by_id=UUIDType(model.updated_by_id) if model.updated_by_id else None,
             attachments=attachments
         )
+        ctf.mark_persisted()
+        return ctf
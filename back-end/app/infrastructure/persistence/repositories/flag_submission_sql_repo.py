@@ -2,20 +2,57 @@
 Implementación SQL del repositorio de FlagSubmission.
 """
 
-from typing import List, Optional, Dict, Any
+from dataclasses import replace
+from datetime import datetime
+from typing import Iterator, List, Optional, Dict, Any, Set, Tuple
 from uuid import UUID
+from sqlalchemy import exists, func, select, update
 from sqlalchemy.orm import Session
 
-from ....domain.entities.flag_submission import FlagSubmission
+from ....domain.entities.ctf import CTF, dynamic_points
+from ....domain.entities.flag_submission import FlagSubmission, RepeatedSubmission
 from ....domain.repositories.flag_submission_repo import FlagSubmissionRepository
+from ....domain.services.solved_cache import solved_set_cache
+from ....core.pagination import Cursor
+from ..models.ctf_model import CTFModel
+from ..models.ctf_solve_model import CTFSolveModel
 from ..models.flag_submission_model import FlagSubmissionModel
+from ..models.flag_submission_repeat_model import FlagSubmissionRepeatModel
+from ..models.user_model import UserModel
+from ..keyset import apply_keyset
+from ..ctf_analytics import CTFAnalytics
+from ..ctf_stats import CTFStatsRollup, contribution_from_values
+from ..submission_journal import SubmissionJournal
+from ..recommendations import CoSolveRecommender
+from ..score_history import ScoreHistory
+from ..user_scores import UserScoreLedger
+from ..writes import entity_row, insert_ignore, upsert_increment
+from ...catalog import ctf_catalog
+from ...events import live_feed
+from ...leaderboard import leaderboard
+
+
+# Columnas de flag_submissions que se corresponden 1:1 con campos de la entidad
+_SUBMISSION_COLUMNS = ("id", "ctf_id", "user_id", "flag", "is_correct", "ip_address", "submitted_at")
+
+# Columnas del catálogo en memoria que cambia un solve (se parchean tras el commit)
+_CATALOG_SOLVE_COLUMNS = (
+    "points", "solved", "solved_at", "solved_count",
+    "first_blood_user_id", "first_blood_at", "updated_at",
+)
 
 
 class FlagSubmissionSqlRepository(FlagSubmissionRepository):
-    """Repositorio SQL para envíos de flags."""
+    """
+    Repositorio SQL para envíos de flags.
     
-    def __init__(self, db: Session):
+    Con ``journal`` los intentos incorrectos se encolan y se insertan por
+    lotes en segundo plano en lugar de con un INSERT + COMMIT cada uno.
+    """
+    
+    def __init__(self, db: Session, journal: Optional[SubmissionJournal] = None):
         self.db = db
+        self.journal = journal
     
     def save(self, submission: FlagSubmission) -> FlagSubmission:
         """Guarda un envío de flag."""
@@ -32,13 +69,215 @@ class FlagSubmissionSqlRepository(FlagSubmissionRepository):
         self.db.commit()
         return submission
     
-    def get_by_ctf_id(self, ctf_id: UUID, skip: int = 0, limit: int = 100) -> List[FlagSubmission]:
+    def record_attempt(self, submission: FlagSubmission, ctf: CTF) -> FlagSubmission:
+        """
+        Inserta el intento y, si es correcto, actualiza el CTF con un solo commit.
+        
+        El solve se registra con insert-or-ignore sobre (ctf_id, user_id):
+        solo la inserción que entra incrementa el contador (en SQL, así que
+        dos envíos concurrentes no pierden incrementos) y el first blood se
+        fija con COALESCE en ese mismo UPDATE, de modo que lo gana el primer
+        solve confirmado; el mismo solve suma los puntos en ``user_scores``.
+        El paso a "resuelto" es un UPDATE condicional:
+        solo la transacción que lo cambia ajusta el rollup de estadísticas.
+        Los aciertos anónimos no cuentan como solver. Los intentos incorrectos
+        van al diario si lo hay (y si su cola no está llena). Tras el commit
+        el solve y el delta del ranking se publican en el feed en vivo, y
+        la fila del CTF se parchea en el catálogo en memoria (contador,
+        puntos y first blood) en lugar de invalidarlo entero.
+        
+        Con puntuación dinámica el nuevo solve recalcula el valor del CTF y
+        la diferencia se suma a los solvers anteriores con un único UPDATE
+        masivo (``adjust_ctf_points``); el nuevo solver suma ya el valor nuevo.
+        Los puntos acreditados quedan en ``submission.points``.
+        """
+        if not submission.is_correct and self.journal is not None and self.journal.append(submission):
+            return submission
+        
+        ctfs = CTFModel.__table__
+        ctf_id = str(submission.ctf_id)
+        score = None
+        solve = None
+        first_solve = 0
+        points = ctf.points
+        rescored: List[str] = []
+        delta = 0
+        try:
+            self.db.execute(
+                FlagSubmissionModel.__table__.insert().values(
+                    **entity_row(submission, _SUBMISSION_COLUMNS)
+                )
+            )
+            if submission.is_correct:
+                if submission.user_id and insert_ignore(
+                    self.db,
+                    CTFSolveModel.__table__,
+                    {
+                        "ctf_id": ctf_id,
+                        "user_id": str(submission.user_id),
+                        "solved_at": submission.submitted_at,
+                    },
+                ):
+                    self.db.execute(
+                        update(ctfs)
+                        .where(ctfs.c.id == ctf_id)
+                        .values(
+                            solved_count=ctfs.c.solved_count + 1,
+                            first_blood_user_id=func.coalesce(
+                                ctfs.c.first_blood_user_id, str(submission.user_id)
+                            ),
+                            first_blood_at=func.coalesce(
+                                ctfs.c.first_blood_at, submission.submitted_at
+                            ),
+                            updated_at=submission.submitted_at,
+                        )
+                    )
+                    if ctf.dynamic_scoring:
+                        points, delta, rescored = self._decay_points(
+                            ctf, str(submission.user_id), submission.submitted_at
+                        )
+                    score = UserScoreLedger(self.db).add_solve(
+                        str(submission.user_id), points, submission.submitted_at
+                    )
+                if not ctf.solved:
+                    first_solve = self.db.execute(
+                        update(ctfs)
+                        .where(ctfs.c.id == ctf_id, ctfs.c.solved.isnot(True))
+                        .values(solved=True, solved_at=submission.submitted_at)
+                    ).rowcount
+                    if first_solve:
+                        row = (ctf.status.value, ctf.level.value, ctf.category.value, ctf.platform, points)
+                        CTFStatsRollup(self.db).apply(
+                            contribution_from_values(*row, False),
+                            contribution_from_values(*row, True),
+                        )
+                if score is not None:
+                    # First blood, nombre y columnas del catálogo tal y como quedan confirmados
+                    username = (
+                        select(UserModel.username)
+                        .where(UserModel.id == str(submission.user_id))
+                        .scalar_subquery()
+                    )
+                    solve = self.db.execute(
+                        select(*(ctfs.c[column] for column in _CATALOG_SOLVE_COLUMNS), username.label("username"))
+                        .where(ctfs.c.id == ctf_id)
+                    ).first()
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        
+        if submission.is_correct:
+            submission.points = points
+            # El solve solo cambia columnas no indexadas: se parchea la fila del catálogo
+            if solve is not None:
+                values = {column: solve._mapping[column] for column in _CATALOG_SOLVE_COLUMNS}
+                if values["first_blood_user_id"]:
+                    values["first_blood_user_id"] = UUID(values["first_blood_user_id"])
+                ctf_catalog.patch(ctf_id, values)
+            elif first_solve:
+                ctf_catalog.patch(ctf_id, {"solved": True, "solved_at": submission.submitted_at})
+        if rescored:
+            leaderboard.adjust_points(rescored, delta)
+        if score is not None:
+            user_id = str(submission.user_id)
+            solved_set_cache.invalidate(user_id)
+            previous_rank = leaderboard.rank(user_id)
+            username = solve.username if solve else None
+            score = replace(score, username=username)
+            leaderboard.set_score(score)
+            live_feed.publish_solve(
+                ctf_id, ctf.title, points, user_id, username, submission.submitted_at,
+                first_blood=solve is not None and solve.first_blood_user_id == user_id,
+                score=score, previous_rank=previous_rank,
+            )
+        return submission
+    
+    def _decay_points(self, ctf: CTF, user_id: str, at: datetime) -> Tuple[int, int, List[str]]:
+        """
+        Recalcula el valor de un CTF dinámico tras contar un solve en ``at`` (sin commit).
+        
+        Se lee después del UPDATE de ``solved_count``, que bloquea la fila del
+        CTF hasta el commit: dos solves concurrentes se recalculan en serie.
+        
+        Returns:
+            (valor nuevo, diferencia, solvers anteriores reajustados)
+        """
+        ctfs = CTFModel.__table__
+        ctf_id = str(ctf.id)
+        row = self.db.execute(
+            select(
+                ctfs.c.points, ctfs.c.solved, ctfs.c.solved_count,
+                ctfs.c.initial_points, ctfs.c.minimum_points, ctfs.c.decay_solves,
+            ).where(ctfs.c.id == ctf_id)
+        ).first()
+        current = row.points or 0
+        if not row.decay_solves:
+            return current, 0, []
+        value = dynamic_points(row.initial_points or 0, row.minimum_points or 0, row.decay_solves, row.solved_count)
+        delta = value - current
+        if not delta:
+            return current, 0, []
+        
+        self.db.execute(update(ctfs).where(ctfs.c.id == ctf_id).values(points=value))
+        contribution = (ctf.status.value, ctf.level.value, ctf.category.value, ctf.platform)
+        CTFStatsRollup(self.db).apply(
+            contribution_from_values(*contribution, current, bool(row.solved)),
+            contribution_from_values(*contribution, value, bool(row.solved)),
+        )
+        ledger = UserScoreLedger(self.db)
+        if not ledger.adjust_ctf_points(ctf_id, delta, exclude_user_id=user_id, at=at):
+            return value, delta, []
+        solvers = self.db.execute(
+            select(CTFSolveModel.user_id).where(
+                CTFSolveModel.ctf_id == ctf_id, CTFSolveModel.user_id != user_id
+            )
+        ).scalars().all()
+        return value, delta, solvers
+    
+    def record_repeats(self, repeats: List[RepeatedSubmission]) -> None:
+        """Suma las repeticiones con un upsert incremental por clave y un solo commit."""
+        if not repeats:
+            return
+        table = FlagSubmissionRepeatModel.__table__
+        try:
+            for repeat in repeats:
+                upsert_increment(
+                    self.db,
+                    table,
+                    {
+                        "principal": repeat.principal,
+                        "ctf_id": str(repeat.ctf_id),
+                        "flag": repeat.flag,
+                        "user_id": str(repeat.user_id) if repeat.user_id else None,
+                        "ip_address": repeat.ip_address,
+                        "repeat_count": repeat.count,
+                        "last_repeat_at": repeat.last_at,
+                    },
+                    increments=("repeat_count",),
+                    key=("principal", "ctf_id", "flag"),
+                )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+    
+    def get_by_ctf_id(
+        self,
+        ctf_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+    ) -> List[FlagSubmission]:
         """Obtiene envíos por CTF."""
-        db_submissions = self.db.query(FlagSubmissionModel).filter(
+        query = self.db.query(FlagSubmissionModel).filter(
             FlagSubmissionModel.ctf_id == str(ctf_id)
-        ).order_by(
-            FlagSubmissionModel.submitted_at.desc()
-        ).offset(skip).limit(limit).all()
+        )
+        query = apply_keyset(query, FlagSubmissionModel.submitted_at, FlagSubmissionModel.id, cursor)
+        if cursor is None:
+            query = query.offset(skip)
+        
+        db_submissions = query.limit(limit).all()
         return [self._to_entity(s) for s in db_submissions]
     
     def get_successful_by_ctf_id(self, ctf_id: UUID) -> List[FlagSubmission]:
@@ -51,31 +290,87 @@ class FlagSubmissionSqlRepository(FlagSubmissionRepository):
         ).all()
         return [self._to_entity(s) for s in db_submissions]
     
-    def get_by_user_id(self, user_id: UUID, skip: int = 0, limit: int = 100) -> List[FlagSubmission]:
+    def get_by_user_id(
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+    ) -> List[FlagSubmission]:
         """Obtiene envíos por usuario."""
-        db_submissions = self.db.query(FlagSubmissionModel).filter(
+        query = self.db.query(FlagSubmissionModel).filter(
             FlagSubmissionModel.user_id == str(user_id)
-        ).order_by(
-            FlagSubmissionModel.submitted_at.desc()
-        ).offset(skip).limit(limit).all()
+        )
+        query = apply_keyset(query, FlagSubmissionModel.submitted_at, FlagSubmissionModel.id, cursor)
+        if cursor is None:
+            query = query.offset(skip)
+        
+        db_submissions = query.limit(limit).all()
         return [self._to_entity(s) for s in db_submissions]
     
+    def stream_rows(
+        self,
+        ctf_id: Optional[UUID] = None,
+        user_id: Optional[UUID] = None,
+        ip_address: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Tuple]:
+        """
+        Recorre los intentos filtrados con un cursor de servidor.
+        
+        Lee solo las columnas de auditoría (sin la flag) en lotes de
+        ``batch_size`` filas y devuelve tuplas, así que la memoria no
+        depende del número de intentos exportados.
+        """
+        query = select(
+            FlagSubmissionModel.id,
+            FlagSubmissionModel.ctf_id,
+            FlagSubmissionModel.user_id,
+            FlagSubmissionModel.ip_address,
+            FlagSubmissionModel.is_correct,
+            FlagSubmissionModel.submitted_at,
+        )
+        if ctf_id:
+            query = query.where(FlagSubmissionModel.ctf_id == str(ctf_id))
+        if user_id:
+            query = query.where(FlagSubmissionModel.user_id == str(user_id))
+        if ip_address:
+            query = query.where(FlagSubmissionModel.ip_address == ip_address)
+        if since:
+            query = query.where(FlagSubmissionModel.submitted_at >= since)
+        if until:
+            query = query.where(FlagSubmissionModel.submitted_at < until)
+        
+        result = self.db.execute(
+            query.order_by(FlagSubmissionModel.submitted_at, FlagSubmissionModel.id)
+            .execution_options(stream_results=True, yield_per=batch_size)
+        )
+        for row in result:
+            yield tuple(row)
+    
     def has_user_solved(self, ctf_id: UUID, user_id: UUID) -> bool:
-        """Verifica si un usuario ya resolvió un CTF."""
-        return self.db.query(FlagSubmissionModel).filter(
-            FlagSubmissionModel.ctf_id == str(ctf_id),
-            FlagSubmissionModel.user_id == str(user_id),
-            FlagSubmissionModel.is_correct == True
-        ).first() is not None
+        """Verifica si un usuario ya resolvió un CTF (búsqueda por PK en ctf_solves)."""
+        return self.db.query(
+            exists().where(
+                CTFSolveModel.ctf_id == str(ctf_id),
+                CTFSolveModel.user_id == str(user_id),
+            )
+        ).scalar()
+    
+    def get_solved_ctf_ids(self, user_id: UUID) -> Set[str]:
+        """IDs de los CTFs resueltos por un usuario (una consulta por índice de usuario en ctf_solves)."""
+        return set(
+            self.db.execute(
+                select(CTFSolveModel.ctf_id).where(CTFSolveModel.user_id == str(user_id))
+            ).scalars()
+        )
     
     def count_solvers(self, ctf_id: UUID) -> int:
-        """Cuenta usuarios únicos que resolvieron un CTF."""
-        from sqlalchemy import func
-        result = self.db.query(
-            func.count(func.distinct(FlagSubmissionModel.user_id))
-        ).filter(
-            FlagSubmissionModel.ctf_id == str(ctf_id),
-            FlagSubmissionModel.is_correct == True
+        """Cuenta usuarios únicos que resolvieron un CTF (contador desnormalizado)."""
+        result = self.db.query(CTFModel.solved_count).filter(
+            CTFModel.id == str(ctf_id)
         ).scalar()
         return result or 0
     
@@ -99,71 +394,93 @@ class FlagSubmissionSqlRepository(FlagSubmissionRepository):
         """
         Obtiene el ranking de usuarios por puntos de CTF.
         
+        Se sirve desde el ranking en memoria (construido desde user_scores);
+        solo consulta la base de datos para cargarlo o para completar nombres
+        de usuarios que puntuaron por primera vez en este proceso.
+        
         Returns:
             Lista de diccionarios con user_id, username, total_points, solved_count, rank
         """
-        from sqlalchemy import func, distinct
-        from ..models.user_model import UserModel
-        from ..models.ctf_model import CTFModel
+        leaderboard.ensure(UserScoreLedger(self.db).load_all)
+        top = leaderboard.top(limit)
         
-        # Subconsulta para obtener puntos por usuario
-        # Solo contamos flags correctos y únicos por CTF
-        subquery = (
-            self.db.query(
-                FlagSubmissionModel.user_id,
-                func.sum(CTFModel.points).label('total_points'),
-                func.count(distinct(FlagSubmissionModel.ctf_id)).label('solved_count')
+        missing = [entry.user_id for _, entry in top if entry.username is None]
+        usernames = {}
+        if missing:
+            usernames = dict(
+                self.db.query(UserModel.id, UserModel.username)
+                .filter(UserModel.id.in_(missing))
+                .all()
             )
-            .join(CTFModel, FlagSubmissionModel.ctf_id == CTFModel.id)
-            .filter(
-                FlagSubmissionModel.is_correct == True,
-                FlagSubmissionModel.user_id.isnot(None)
-            )
-            .group_by(FlagSubmissionModel.user_id)
-            .subquery()
-        )
+            leaderboard.set_usernames(usernames)
         
-        # Query principal con join a usuarios
-        results = (
-            self.db.query(
-                UserModel.id,
-                UserModel.username,
-                func.coalesce(subquery.c.total_points, 0).label('total_points'),
-                func.coalesce(subquery.c.solved_count, 0).label('solved_count')
-            )
-            .outerjoin(subquery, UserModel.id == subquery.c.user_id)
-            .filter(subquery.c.total_points > 0)  # Solo usuarios con puntos
-            .order_by(func.coalesce(subquery.c.total_points, 0).desc())
-            .limit(limit)
-            .all()
-        )
-        
-        leaderboard = []
-        for rank, row in enumerate(results, start=1):
-            leaderboard.append({
+        return [
+            {
                 'rank': rank,
-                'user_id': row.id,
-                'username': row.username,
-                'total_points': int(row.total_points or 0),
-                'solved_count': int(row.solved_count or 0)
-            })
+                'user_id': entry.user_id,
+                'username': entry.username or usernames.get(entry.user_id, 'Unknown'),
+                'total_points': entry.total_points,
+                'solved_count': entry.solved_count,
+            }
+            for rank, entry in top
+        ]
+    
+    def get_score_history(
+        self,
+        limit: int = 10,
+        bucket: str = "1h",
+        since: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Obtiene la evolución de la puntuación de los primeros del ranking.
+        
+        El top sale del ranking en memoria y las series de una lectura por
+        clave primaria de user_score_history (más otra, con ``since``, para
+        el último valor de cada usuario antes de la ventana).
         
-        return leaderboard
+        Raises:
+            ValueError: Si ``bucket`` no es 1h, 6h o 1d.
+        """
+        top = self.get_leaderboard(limit=limit)
+        series = ScoreHistory(self.db).series([entry['user_id'] for entry in top], bucket, since)
+        return [{**entry, 'points': series[entry['user_id']]} for entry in top]
+    
+    def get_recommendations(self, user_id: UUID, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Obtiene los CTFs recomendados para un usuario.
+        
+        Los CTFs resueltos salen de la caché por usuario (o de una consulta
+        por índice) y los candidatos de los vecinos precalculados en
+        ctf_neighbours, leídos por clave primaria.
+        """
+        solved = solved_set_cache.get(user_id)
+        if solved is None:
+            solved = solved_set_cache.put(user_id, self.get_solved_ctf_ids(user_id))
+        return CoSolveRecommender(self.db).recommend(solved, limit=limit)
+    
+    def get_ctf_analytics(
+        self,
+        ctf_id: UUID,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Analíticas de un CTF leídas del rollup horario (clave primaria por CTF y hora)."""
+        return CTFAnalytics(self.db).series(str(ctf_id), since=since, until=until)
     
     def get_user_stats(self, user_id: UUID) -> Optional[Dict[str, Any]]:
         """
         Obtiene estadísticas de CTF de un usuario específico.
         
+        Puntos y posición salen del ranking en memoria; la lista de CTFs
+        resueltos, de ctf_solves (índice por usuario y fecha).
+        
         Returns:
             Diccionario con total_points, solved_count, rank, solved_ctfs
         """
-        from sqlalchemy import func, distinct
-        from ..models.ctf_model import CTFModel
-        from ..models.user_model import UserModel
-        
         user_id_str = str(user_id)
+        leaderboard.ensure(UserScoreLedger(self.db).load_all)
+        entry = leaderboard.get(user_id_str)
         
-        # Obtener CTFs resueltos por el usuario
         solved_ctfs_query = (
             self.db.query(
                 CTFModel.id,
@@ -171,45 +488,20 @@ class FlagSubmissionSqlRepository(FlagSubmissionRepository):
                 CTFModel.points,
                 CTFModel.category,
                 CTFModel.level,
-                FlagSubmissionModel.submitted_at.label('solved_at')
-            )
-            .join(FlagSubmissionModel, CTFModel.id == FlagSubmissionModel.ctf_id)
-            .filter(
-                FlagSubmissionModel.user_id == user_id_str,
-                FlagSubmissionModel.is_correct == True
+                CTFSolveModel.solved_at,
             )
-            .order_by(FlagSubmissionModel.submitted_at.desc())
+            .join(CTFSolveModel, CTFModel.id == CTFSolveModel.ctf_id)
+            .filter(CTFSolveModel.user_id == user_id_str)
+            .order_by(CTFSolveModel.solved_at.desc())
             .all()
         )
         
-        # Calcular totales
-        total_points = sum(ctf.points for ctf in solved_ctfs_query)
-        solved_count = len(solved_ctfs_query)
-        
-        # Calcular ranking del usuario
-        all_users_points = (
-            self.db.query(
-                FlagSubmissionModel.user_id,
-                func.sum(CTFModel.points).label('points')
-            )
-            .join(CTFModel, FlagSubmissionModel.ctf_id == CTFModel.id)
-            .filter(
-                FlagSubmissionModel.is_correct == True,
-                FlagSubmissionModel.user_id.isnot(None)
-            )
-            .group_by(FlagSubmissionModel.user_id)
-            .order_by(func.sum(CTFModel.points).desc())
-            .all()
-        )
-        
-        user_rank = None
-        for rank, row in enumerate(all_users_points, start=1):
-            if row.user_id == user_id_str:
-                user_rank = rank
-                break
-        
         # Obtener nombre de usuario
-        user = self.db.query(UserModel).filter(UserModel.id == user_id_str).first()
+        username = entry.username if entry else None
+        if username is None:
+            username = self.db.query(UserModel.username).filter(
+                UserModel.id == user_id_str
+            ).scalar()
         
         solved_ctfs = [
             {
@@ -225,13 +517,20 @@ class FlagSubmissionSqlRepository(FlagSubmissionRepository):
         
         return {
             'user_id': user_id_str,
-            'username': user.username if user else 'Unknown',
-            'total_points': total_points,
-            'solved_count': solved_count,
-            'rank': user_rank,
+            'username': username or 'Unknown',
+            'total_points': entry.total_points if entry else 0,
+            'solved_count': entry.solved_count if entry else 0,
+            'rank': leaderboard.rank(user_id_str),
             'solved_ctfs': solved_ctfs
         }
     
+    def reconcile_scores(self, repair: bool = False) -> Dict[str, Any]:
+        """Reconciliación de user_scores; tras ella se recarga el ranking en memoria."""
+        ledger = UserScoreLedger(self.db)
+        result = ledger.reconcile(repair=repair)
+        leaderboard.reload(ledger.load_all)
+        return result
+    
     def _to_entity(self, model: FlagSubmissionModel) -> FlagSubmission:
         """Convierte modelo a entidad de dominio."""
         from uuid import UUID as UUIDType
@@ -9,7 +9,18 @@ from sqlalchemy.orm import Session
 
 from ....domain.entities.project import Project, ProjectStatus
 from ....domain.repositories.project_repo import ProjectRepository
+from ....core.pagination import Cursor
 from ..models.project_model import ProjectModel
+from ..keyset import apply_keyset
+from ..writes import entity_row, update_row, upsert_row
+
+
+# Columnas de projects que se corresponden 1:1 con campos de la entidad
+_PROJECT_COLUMNS = (
+    "title", "description", "short_description", "image_url", "github_url",
+    "demo_url", "technologies", "highlights", "status", "featured", "order",
+    "created_at", "updated_at",
+)
 
 
 class ProjectSqlRepository(ProjectRepository):
@@ -19,42 +30,23 @@ class ProjectSqlRepository(ProjectRepository):
         self.db = db
     
     def save(self, project: Project) -> Project:
-        """Guarda un proyecto (crear o actualizar)."""
-        project_id = str(project.id)
-        existing = self.db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
+        """
+        Guarda un proyecto (crear o actualizar).
+        
+        Uno nuevo se inserta con un upsert; uno cargado solo actualiza
+        las columnas modificadas.
+        """
+        changed = project.changed_fields()
+        if changed is not None and not changed:
+            return project
         
-        if existing:
-            existing.title = project.title
-            existing.description = project.description
-            existing.short_description = project.short_description
-            existing.image_url = project.image_url
-            existing.github_url = project.github_url
-            existing.demo_url = project.demo_url
-            existing.technologies = json.dumps(project.technologies)
-            existing.highlights = json.dumps(project.highlights)
-            existing.status = project.status.value
-            existing.featured = project.featured
-            existing.order = project.order
-            existing.updated_at = project.updated_at
+        if changed is None:
+            upsert_row(self.db, ProjectModel.__table__, entity_row(project, ("id", *_PROJECT_COLUMNS)))
         else:
-            db_project = ProjectModel(
-                id=project_id,
-                title=project.title,
-                description=project.description,
-                short_description=project.short_description,
-                image_url=project.image_url,
-                github_url=project.github_url,
-                demo_url=project.demo_url,
-                technologies=json.dumps(project.technologies),
-                highlights=json.dumps(project.highlights),
-                status=project.status.value,
-                featured=project.featured,
-                order=project.order,
-                created_at=project.created_at,
-            )
-            self.db.add(db_project)
+            update_row(self.db, ProjectModel.__table__, str(project.id), entity_row(project, changed))
         
         self.db.commit()
+        project.mark_persisted()
         return project
     
     def get_by_id(self, project_id: UUID) -> Optional[Project]:
@@ -67,6 +59,7 @@ class ProjectSqlRepository(ProjectRepository):
         skip: int = 0,
         limit: int = 100,
         status: Optional[ProjectStatus] = None,
+        cursor: Optional[Cursor] = None,
     ) -> List[Project]:
         """Obtiene todos los proyectos con paginación y filtros."""
         query = self.db.query(ProjectModel)
@@ -74,7 +67,11 @@ class ProjectSqlRepository(ProjectRepository):
         if status:
             query = query.filter(ProjectModel.status == status.value)
         
-        db_projects = query.order_by(ProjectModel.order).offset(skip).limit(limit).all()
+        query = apply_keyset(query, ProjectModel.order, ProjectModel.id, cursor, descending=False)
+        if cursor is None:
+            query = query.offset(skip)
+        
+        db_projects = query.limit(limit).all()
         return [self._to_entity(p) for p in db_projects]
     
     def get_featured(self, limit: int = 5) -> List[Project]:
@@ -89,9 +86,14 @@ class ProjectSqlRepository(ProjectRepository):
         )
         return [self._to_entity(p) for p in db_projects]
     
-    def get_published(self, skip: int = 0, limit: int = 100) -> List[Project]:
+    def get_published(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+    ) -> List[Project]:
         """Obtiene solo los proyectos publicados."""
-        return self.get_all(skip=skip, limit=limit, status=ProjectStatus.PUBLISHED)
+        return self.get_all(skip=skip, limit=limit, status=ProjectStatus.PUBLISHED, cursor=cursor)
     
     def get_by_technology(self, technology: str) -> List[Project]:
         """Obtiene proyectos que usen una tecnología específica."""
@@ -115,7 +117,7 @@ class ProjectSqlRepository(ProjectRepository):
     def _to_entity(self, model: ProjectModel) -> Project:
         """Convierte un modelo a entidad de dominio."""
         from uuid import UUID as UUIDType
-        return Project(
+        project = Project(
             id=UUIDType(model.id),
             title=model.title,
             description=model.description,
@@ -131,3 +133,5 @@ class ProjectSqlRepository(ProjectRepository):
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
+        project.mark_persisted()
+        return project
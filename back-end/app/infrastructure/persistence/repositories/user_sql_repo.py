@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from ....domain.entities.user import User
 from ....domain.repositories.user_repo import UserRepository
+from ....domain.services.principal_cache import principal_cache
 from ..models.user_model import UserModel
 
 
@@ -18,7 +19,16 @@ class UserSqlRepository(UserRepository):
         self.db = db
     
     def save(self, user: User) -> User:
-        """Guarda un usuario (crear o actualizar)."""
+        """
+        Guarda un usuario (crear o actualizar).
+        
+        Un ``hashed_password`` vacío (el usuario que devuelve
+        ``get_current_user`` desde ``principal_cache``) no sobrescribe el
+        hash almacenado.
+        
+        Raises:
+            ValueError: Si se crea un usuario sin ``hashed_password``.
+        """
         user_id = str(user.id)
         existing = self.db.query(UserModel).filter(UserModel.id == user_id).first()
         
@@ -26,12 +36,15 @@ class UserSqlRepository(UserRepository):
             # Actualizar
             existing.email = user.email
             existing.username = user.username
-            existing.hashed_password = user.hashed_password
+            if user.hashed_password:
+                existing.hashed_password = user.hashed_password
             existing.is_active = user.is_active
             existing.is_admin = user.is_admin
             existing.updated_at = user.updated_at
         else:
             # Crear
+            if not user.hashed_password:
+                raise ValueError("Cannot create a user without a password hash")
             db_user = UserModel(
                 id=user_id,
                 email=user.email,
@@ -44,6 +57,9 @@ class UserSqlRepository(UserRepository):
             self.db.add(db_user)
         
         self.db.commit()
+        if existing:
+            # Desactivar o cambiar permisos se ve en la siguiente petición
+            principal_cache.invalidate(user.id)
         return user
     
     def get_by_id(self, user_id: UUID) -> Optional[User]:
@@ -70,6 +86,7 @@ class UserSqlRepository(UserRepository):
         """Elimina un usuario por su ID."""
         result = self.db.query(UserModel).filter(UserModel.id == str(user_id)).delete()
         self.db.commit()
+        principal_cache.invalidate(user_id)
         return result > 0
     
     def exists_by_email(self, email: str) -> bool:
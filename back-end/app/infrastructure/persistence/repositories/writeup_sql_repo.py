@@ -3,14 +3,26 @@ Implementación SQL del repositorio de writeups.
 """
 
 import json
-from typing import List, Optional
+from typing import Iterator, List, Optional, Set
 from uuid import UUID
 from sqlalchemy.orm import Session
 from sqlalchemy import or_
 
 from ....domain.entities.writeup import Writeup, WriteupStatus
 from ....domain.repositories.writeup_repo import WriteupRepository
+from ....core.pagination import Cursor
 from ..models.writeup_model import WriteupModel
+from ..keyset import apply_keyset
+from ..writes import entity_row, update_row, upsert_row
+from ...catalog import ctf_catalog
+
+
+# Columnas de writeups que se corresponden 1:1 con campos de la entidad
+_WRITEUP_COLUMNS = (
+    "title", "ctf_id", "content", "summary", "tools_used", "techniques",
+    "attachments", "status", "views", "author_id", "created_at",
+    "updated_at", "published_at",
+)
 
 
 class WriteupSqlRepository(WriteupRepository):
@@ -20,41 +32,57 @@ class WriteupSqlRepository(WriteupRepository):
         self.db = db
     
     def save(self, writeup: Writeup) -> Writeup:
-        """Guarda un writeup (crear o actualizar)."""
-        writeup_id = str(writeup.id)
-        existing = self.db.query(WriteupModel).filter(WriteupModel.id == writeup_id).first()
+        """
+        Guarda un writeup (crear o actualizar).
+        
+        Uno nuevo se inserta con un upsert; uno cargado solo actualiza
+        las columnas modificadas.
+        """
+        changed = writeup.changed_fields()
+        if changed is not None and not changed:
+            return writeup
         
-        if existing:
-            existing.title = writeup.title
-            existing.content = writeup.content
-            existing.summary = writeup.summary
-            existing.tools_used = json.dumps(writeup.tools_used)
-            existing.techniques = json.dumps(writeup.techniques)
-            existing.attachments = json.dumps(writeup.attachments)
-            existing.status = writeup.status.value
-            existing.views = writeup.views
-            existing.updated_at = writeup.updated_at
-            existing.published_at = writeup.published_at
+        if changed is None:
+            upsert_row(self.db, WriteupModel.__table__, entity_row(writeup, ("id", *_WRITEUP_COLUMNS)))
         else:
-            db_writeup = WriteupModel(
-                id=writeup_id,
-                title=writeup.title,
-                ctf_id=str(writeup.ctf_id),
-                content=writeup.content,
-                summary=writeup.summary,
-                tools_used=json.dumps(writeup.tools_used),
-                techniques=json.dumps(writeup.techniques),
-                attachments=json.dumps(writeup.attachments),
-                status=writeup.status.value,
-                views=writeup.views,
-                author_id=str(writeup.author_id) if writeup.author_id else None,
-                created_at=writeup.created_at,
-            )
-            self.db.add(db_writeup)
+            update_row(self.db, WriteupModel.__table__, str(writeup.id), entity_row(writeup, changed))
         
         self.db.commit()
+        writeup.mark_persisted()
+        if changed is None or "ctf_id" in changed:
+            # has_writeup del catálogo de CTFs
+            ctf_catalog.invalidate()
         return writeup
     
+    def save_many(self, writeups: List[Writeup]) -> int:
+        """Guarda un lote de writeups con un upsert por fila y un único commit."""
+        if not writeups:
+            return 0
+        
+        ids = {str(w.id) for w in writeups}
+        existing = {
+            writeup_id
+            for (writeup_id,) in self.db.query(WriteupModel.id).filter(WriteupModel.id.in_(ids))
+        }
+        try:
+            for writeup in writeups:
+                upsert_row(self.db, WriteupModel.__table__, entity_row(writeup, ("id", *_WRITEUP_COLUMNS)))
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        
+        for writeup in writeups:
+            writeup.mark_persisted()
+        ctf_catalog.invalidate()
+        return len(ids - existing)
+    
+    def stream_all(self, batch_size: int = 500) -> Iterator[Writeup]:
+        """Recorre todos los writeups con un cursor de servidor."""
+        query = self.db.query(WriteupModel).order_by(WriteupModel.id).yield_per(batch_size)
+        for model in query:
+            yield self._to_entity(model)
+    
     def get_by_id(self, writeup_id: UUID) -> Optional[Writeup]:
         """Obtiene un writeup por su ID."""
         db_writeup = self.db.query(WriteupModel).filter(WriteupModel.id == str(writeup_id)).first()
@@ -70,6 +98,7 @@ class WriteupSqlRepository(WriteupRepository):
         skip: int = 0,
         limit: int = 100,
         status: Optional[WriteupStatus] = None,
+        cursor: Optional[Cursor] = None,
     ) -> List[Writeup]:
         """Obtiene todos los writeups con paginación y filtros."""
         query = self.db.query(WriteupModel)
@@ -77,12 +106,21 @@ class WriteupSqlRepository(WriteupRepository):
         if status:
             query = query.filter(WriteupModel.status == status.value)
         
-        db_writeups = query.order_by(WriteupModel.created_at.desc()).offset(skip).limit(limit).all()
+        query = apply_keyset(query, WriteupModel.created_at, WriteupModel.id, cursor)
+        if cursor is None:
+            query = query.offset(skip)
+        
+        db_writeups = query.limit(limit).all()
         return [self._to_entity(w) for w in db_writeups]
     
-    def get_published(self, skip: int = 0, limit: int = 100) -> List[Writeup]:
+    def get_published(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+    ) -> List[Writeup]:
         """Obtiene solo los writeups publicados."""
-        return self.get_all(skip=skip, limit=limit, status=WriteupStatus.PUBLISHED)
+        return self.get_all(skip=skip, limit=limit, status=WriteupStatus.PUBLISHED, cursor=cursor)
     
     def get_by_author(self, author_id: UUID) -> List[Writeup]:
         """Obtiene writeups de un autor específico."""
@@ -120,10 +158,21 @@ class WriteupSqlRepository(WriteupRepository):
         )
         return [self._to_entity(w) for w in db_writeups]
     
+    def get_ctf_ids_with_writeup(self) -> Set[UUID]:
+        """Obtiene los IDs de los CTFs que tienen algún writeup."""
+        rows = (
+            self.db.query(WriteupModel.ctf_id)
+            .filter(WriteupModel.ctf_id.isnot(None))
+            .distinct()
+            .all()
+        )
+        return {UUID(ctf_id) for (ctf_id,) in rows}
+    
     def delete(self, writeup_id: UUID) -> bool:
         """Elimina un writeup por su ID."""
         result = self.db.query(WriteupModel).filter(WriteupModel.id == str(writeup_id)).delete()
         self.db.commit()
+        ctf_catalog.invalidate()
         return result > 0
     
     def count(self, status: Optional[WriteupStatus] = None) -> int:
@@ -145,10 +194,10 @@ class WriteupSqlRepository(WriteupRepository):
     def _to_entity(self, model: WriteupModel) -> Writeup:
         """Convierte un modelo a entidad de dominio."""
         from uuid import UUID as UUIDType
-        return Writeup(
+        writeup = Writeup(
             id=UUIDType(model.id),
             title=model.title,
-            ctf_id=UUIDType(model.ctf_id),
+            ctf_id=UUIDType(model.ctf_id) if model.ctf_id else None,
             content=model.content,
             summary=model.summary,
             tools_used=json.loads(model.tools_used) if model.tools_used else [],
@@ -161,3 +210,5 @@ class WriteupSqlRepository(WriteupRepository):
             updated_at=model.updated_at,
             published_at=model.published_at,
         )
+        writeup.mark_persisted()
+        return writeup
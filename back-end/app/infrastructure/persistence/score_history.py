@@ -0,0 +1,142 @@
+"""
+Evolución de la puntuación por usuario (tabla ``user_score_history``).
+
+Cada primer acierto sobrescribe la fila (usuario, hora) con la puntuación
+absoluta resultante, así que la última escritura de la hora es su cierre.
+Las series se leen con una consulta por clave primaria para los usuarios
+pedidos y se agregan en intervalos más largos quedándose con el último
+valor de cada uno; con ``since`` cada serie empieza con el último valor
+anterior a la ventana.
+
+Los cambios de puntos de un CTF ya resuelto (puntuación dinámica, edición
+o borrado) escriben la puntuación nueva de sus solvers en la hora del
+cambio sin reescribir el pasado: la serie muestra la puntuación que tenía
+el usuario en cada momento y su último punto coincide con el ranking.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session
+
+from .models.user_score_history_model import UserScoreHistoryModel
+from .models.user_score_model import UserScoreModel
+from .writes import upsert_increment, upsert_many
+from ..leaderboard import ScoreEntry
+
+
+# Granularidad almacenada y agregaciones disponibles (segundos)
+HISTORY_BUCKET_SECONDS = 3600
+HISTORY_BUCKETS = {"1h": 3600, "6h": 6 * 3600, "1d": 24 * 3600}
+
+_EPOCH = datetime(1970, 1, 1)
+_history = UserScoreHistoryModel.__table__
+_scores = UserScoreModel.__table__
+
+# (inicio del intervalo, puntos, solves)
+ScorePoint = Tuple[datetime, int, int]
+
+
+def bucket_start(at: datetime, seconds: int = HISTORY_BUCKET_SECONDS) -> datetime:
+    """Inicio (UTC) del intervalo de ``seconds`` segundos que contiene ``at``."""
+    elapsed = int((at - _EPOCH).total_seconds())
+    return _EPOCH + timedelta(seconds=elapsed - elapsed % seconds)
+
+
+class ScoreHistory:
+    """Escribe y lee la tabla ``user_score_history``."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def record(self, entry: ScoreEntry, at: datetime) -> None:
+        """Fija la puntuación del usuario en la hora de ``at`` (sin commit)."""
+        upsert_increment(
+            self.db,
+            _history,
+            {
+                "user_id": entry.user_id,
+                "bucket_start": bucket_start(at),
+                "total_points": entry.total_points,
+                "solved_count": entry.solved_count,
+            },
+            increments=(),
+            key=("user_id", "bucket_start"),
+        )
+
+    def record_users(self, user_ids: Select, at: datetime) -> int:
+        """
+        Fija en la hora de ``at`` la puntuación actual de esos usuarios (sin commit).
+
+        ``user_ids`` es una consulta de IDs; los que ya no tienen fila en
+        ``user_scores`` quedan con cero. Devuelve las filas escritas.
+        """
+        users = user_ids.subquery()
+        user_id = users.c[0]
+        rows = [
+            {
+                "user_id": row[0],
+                "bucket_start": bucket_start(at),
+                "total_points": row[1],
+                "solved_count": row[2],
+            }
+            for row in self.db.execute(
+                select(
+                    user_id,
+                    func.coalesce(_scores.c.total_points, 0),
+                    func.coalesce(_scores.c.solved_count, 0),
+                ).select_from(users.outerjoin(_scores, _scores.c.user_id == user_id))
+            )
+        ]
+        upsert_many(self.db, _history, rows, key=("user_id", "bucket_start"))
+        return len(rows)
+
+    def series(
+        self,
+        user_ids: Sequence[str],
+        bucket: str = "1h",
+        since: Optional[datetime] = None,
+    ) -> Dict[str, List[ScorePoint]]:
+        """
+        Series de los usuarios indicados, agregadas por ``bucket`` (1h, 6h o 1d).
+
+        Raises:
+            ValueError: Si el intervalo no es uno de ``HISTORY_BUCKETS``.
+        """
+        seconds = HISTORY_BUCKETS.get(bucket)
+        if seconds is None:
+            raise ValueError(f"Unknown bucket '{bucket}'. Valid: {', '.join(HISTORY_BUCKETS)}")
+        result: Dict[str, List[ScorePoint]] = {user_id: [] for user_id in user_ids}
+        if not user_ids:
+            return result
+
+        columns = (_history.c.user_id, _history.c.bucket_start, _history.c.total_points, _history.c.solved_count)
+        query = select(*columns).where(_history.c.user_id.in_(list(user_ids)))
+        if since is not None:
+            window = bucket_start(since)
+            query = query.where(_history.c.bucket_start >= window)
+            # Punto de partida: el último valor de cada usuario antes de la ventana
+            previous = _history.alias("previous")
+            last_before = (
+                select(func.max(previous.c.bucket_start))
+                .where(previous.c.user_id == _history.c.user_id, previous.c.bucket_start < window)
+                .scalar_subquery()
+            )
+            start = bucket_start(window, seconds)
+            for row in self.db.execute(
+                select(*columns).where(
+                    _history.c.user_id.in_(list(user_ids)), _history.c.bucket_start == last_before
+                )
+            ):
+                result[row.user_id].append((start, row.total_points, row.solved_count))
+        rows = self.db.execute(query.order_by(_history.c.user_id, _history.c.bucket_start))
+
+        for row in rows:
+            points = result[row.user_id]
+            start = bucket_start(row.bucket_start, seconds)
+            if points and points[-1][0] == start:
+                points[-1] = (start, row.total_points, row.solved_count)
+            else:
+                points.append((start, row.total_points, row.solved_count))
+        return result
@@ -0,0 +1,331 @@
+"""
+Diario de intentos incorrectos de flags con escritura por lotes.
+
+La mayoría de envíos son incorrectos y solo sirven de auditoría, así que
+no necesitan un INSERT + COMMIT antes de responder:
+
+- ``append`` encola el intento en una cola acotada y vuelve enseguida.
+  Si la cola está llena devuelve False y el llamador lo inserta de forma
+  síncrona (contrapresión en lugar de perder intentos).
+- Un hilo de fondo vacía la cola e inserta lotes de hasta ``batch_size``
+  filas con una sentencia y un commit por lote. Si un lote falla por
+  integridad (p. ej. el CTF se borró) se reintenta fila a fila.
+- Con ``path`` (modo durable) cada intento se añade además a un fichero
+  local y se hace fsync antes de confirmar. Al arrancar se reinsertan los
+  intentos que quedaran en ficheros de ejecuciones anteriores (el insert
+  ignora IDs ya existentes) y el fichero se trunca cuando todo lo
+  escrito en él está ya en la base de datos.
+
+Cada proceso escribe su propio fichero (``<path>.<pid>``) y lo mantiene
+bloqueado, de modo que al arrancar solo se reproducen los de procesos que
+ya no existen.
+
+Los intentos encolados no aparecen en las consultas hasta el siguiente
+lote (como mucho ``flush_interval`` segundos en condiciones normales).
+"""
+
+import glob
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from ...core.config import settings
+from ...core.logging import logger
+from ...domain.entities.flag_submission import FlagSubmission
+from .models.flag_submission_model import FlagSubmissionModel
+from .writes import insert_ignore, insert_many_ignore
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+# Espera tras un fallo de la base de datos antes de reintentar el lote
+RETRY_DELAY_SECONDS = 1.0
+
+_table = FlagSubmissionModel.__table__
+
+
+def submission_to_row(submission: FlagSubmission) -> Dict[str, Any]:
+    """Fila de flag_submissions para un intento."""
+    return {
+        "id": str(submission.id),
+        "ctf_id": str(submission.ctf_id),
+        "user_id": str(submission.user_id) if submission.user_id else None,
+        "flag": submission.flag,
+        "is_correct": submission.is_correct,
+        "ip_address": submission.ip_address,
+        "submitted_at": submission.submitted_at,
+    }
+
+
+def _encode(row: Dict[str, Any]) -> str:
+    return json.dumps({**row, "submitted_at": row["submitted_at"].isoformat()}) + "\n"
+
+
+def _decode(line: str) -> Dict[str, Any]:
+    row = json.loads(line)
+    row["submitted_at"] = datetime.fromisoformat(row["submitted_at"])
+    return row
+
+
+class SubmissionJournal:
+    """
+    Cola de intentos incorrectos con un hilo que los inserta por lotes.
+
+    Args:
+        session_factory: Crea las sesiones del hilo de escritura.
+        max_queue: Intentos pendientes como máximo.
+        batch_size: Filas por INSERT/commit.
+        flush_interval: Segundos máximos que espera un lote incompleto.
+        path: Prefijo del fichero de diario (activa el modo durable).
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        max_queue: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 0.5,
+        path: Optional[str] = None,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.path = path
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._file = None
+        self._file_lock = threading.Lock()
+        # Filas escritas en el fichero que aún no están en la base de datos
+        self._unflushed = 0
+        self._counters: Dict[str, int] = dict.fromkeys(
+            ("queued", "flushed", "batches", "rejected", "failed_batches", "dropped", "deferred", "replayed"),
+            0,
+        )
+        self._counters_lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> int:
+        """
+        Reproduce diarios pendientes (modo durable) y arranca el hilo de escritura.
+
+        Returns:
+            Número de intentos reproducidos.
+        """
+        if self.running:
+            return 0
+        replayed = 0
+        if self.path:
+            # Primero se bloquea el fichero propio para que nadie lo reproduzca
+            self._file = open(f"{self.path}.{os.getpid()}", "a+", encoding="utf-8")
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            replayed = self._replay()
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="submission-journal", daemon=True)
+        self._thread.start()
+        return replayed
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Vacía la cola y detiene el hilo de escritura."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join(timeout)
+        self._thread = None
+        if self._file is not None:
+            with self._file_lock:
+                self._compact()
+                self._file.close()
+                if self._unflushed == 0:
+                    os.unlink(self._file.name)
+                self._file = None
+                self._unflushed = 0
+
+    def append(self, submission: FlagSubmission) -> bool:
+        """
+        Encola un intento para insertarlo en el siguiente lote.
+
+        Returns:
+            False si el diario no está en marcha o la cola está llena; el
+            llamador debe entonces insertarlo de forma síncrona.
+        """
+        if not self.running:
+            return False
+        row = submission_to_row(submission)
+        try:
+            if self._file is not None:
+                with self._file_lock:
+                    # put dentro del bloqueo: nada se encola sin estar en el fichero
+                    self._queue.put_nowait(row)
+                    self._file.write(_encode(row))
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+                    self._unflushed += 1
+            else:
+                self._queue.put_nowait(row)
+        except queue.Full:
+            self._count("rejected")
+            return False
+        self._count("queued")
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Espera a que la cola quede vacía; devuelve False si vence el timeout."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def metrics(self) -> Dict[str, int]:
+        """Contadores acumulados y tamaño actual de la cola."""
+        with self._counters_lock:
+            snapshot = dict(self._counters)
+        snapshot["pending"] = self._queue.qsize()
+        return snapshot
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch:
+                self._write(batch)
+            elif self._stopping.is_set():
+                return
+
+    def _next_batch(self) -> List[Dict[str, Any]]:
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        while True:
+            try:
+                self._insert(batch)
+                break
+            except SQLAlchemyError as e:
+                # Base de datos caída: se conserva el lote y se reintenta
+                self._count("failed_batches")
+                logger.warning(f"Submission journal flush failed, retrying: {e}")
+                if self._stopping.wait(RETRY_DELAY_SECONDS):
+                    # Al apagar: en modo durable el lote sigue en el fichero y
+                    # se reproducirá al arrancar; sin fichero se pierde
+                    self._count("deferred" if self._file is not None else "dropped", len(batch))
+                    for _ in batch:
+                        self._queue.task_done()
+                    return
+
+        for _ in batch:
+            self._queue.task_done()
+        if self._file is not None:
+            with self._file_lock:
+                self._unflushed -= len(batch)
+                self._compact()
+
+    def _insert(self, batch: List[Dict[str, Any]]) -> None:
+        db = self.session_factory()
+        try:
+            try:
+                insert_many_ignore(db, _table, batch)
+                db.commit()
+            except IntegrityError:
+                db.rollback()
+                # Una fila inválida no tumba el lote: se reintenta fila a fila
+                for row in batch:
+                    try:
+                        insert_ignore(db, _table, row)
+                        db.commit()
+                    except IntegrityError:
+                        db.rollback()
+                        self._count("dropped")
+            self._count("flushed", len(batch))
+            self._count("batches")
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _compact(self) -> None:
+        """Trunca el fichero si todo lo escrito ya está en la base de datos (con _file_lock)."""
+        if self._file is not None and self._unflushed == 0 and self._file.tell() > 0:
+            self._file.truncate(0)
+            self._file.seek(0)
+            os.fsync(self._file.fileno())
+
+    def _replay(self) -> int:
+        """Reinserta los intentos de diarios de procesos anteriores y los elimina."""
+        replayed = 0
+        own = self._file.name
+        for name in sorted(glob.glob(f"{glob.escape(self.path)}.*")):
+            if not name.rsplit(".", 1)[-1].isdigit():
+                continue
+            if name == own:
+                # Fichero de un proceso anterior con el mismo PID
+                replayed += self._replay_file(self._file)
+                self._file.truncate(0)
+                continue
+            with open(name, "r+", encoding="utf-8") as journal:
+                if fcntl is not None:
+                    try:
+                        fcntl.flock(journal.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except OSError:
+                        continue  # Lo mantiene un proceso vivo
+                replayed += self._replay_file(journal)
+            os.unlink(name)
+        if replayed:
+            self._count("replayed", replayed)
+            logger.info(f"Submission journal replayed {replayed} attempts")
+        return replayed
+
+    def _replay_file(self, journal) -> int:
+        journal.seek(0)
+        rows = []
+        for line in journal:
+            try:
+                rows.append(_decode(line))
+            except (ValueError, KeyError):
+                continue  # Última línea a medio escribir
+        for start in range(0, len(rows), self.batch_size):
+            self._insert(rows[start:start + self.batch_size])
+        return len(rows)
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._counters_lock:
+            self._counters[name] += amount
+
+
+def _default_session_factory() -> Session:
+    from ...core.database import SessionLocal
+    return SessionLocal()
+
+
+# Instancia global (se arranca en el lifespan si FLAG_SUBMISSION_JOURNAL_ENABLED)
+submission_journal = SubmissionJournal(
+    _default_session_factory,
+    max_queue=settings.FLAG_SUBMISSION_JOURNAL_MAX_QUEUE,
+    batch_size=settings.FLAG_SUBMISSION_JOURNAL_BATCH_SIZE,
+    flush_interval=settings.FLAG_SUBMISSION_JOURNAL_FLUSH_SECONDS,
+    path=settings.FLAG_SUBMISSION_JOURNAL_PATH,
+)
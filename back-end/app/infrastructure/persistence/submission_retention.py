@@ -0,0 +1,85 @@
+"""
+Retención de flag_submissions: mueve los envíos antiguos al archivo en disco.
+
+Los envíos con más de N días se leen por lotes (índice por
+``submitted_at``), se escriben como segmentos comprimidos por mes y solo
+entonces se borran de la tabla, lote a lote y con un commit por lote. Los
+solves y las puntuaciones viven en ``ctf_solves`` y ``user_scores``, así
+que archivar aciertos no cambia el ranking ni los contadores.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from .models.flag_submission_model import FlagSubmissionModel
+from ..archive import SubmissionArchive
+
+
+# IDs por sentencia DELETE
+DELETE_CHUNK_SIZE = 1000
+
+_table = FlagSubmissionModel.__table__
+
+
+class SubmissionRetention:
+    """Job de archivado de envíos antiguos."""
+
+    def __init__(self, db: Session, archive: SubmissionArchive):
+        self.db = db
+        self.archive = archive
+
+    def count_older_than(self, days: int) -> int:
+        """Envíos que archivaría ``archive_older_than(days)``."""
+        return self.db.execute(
+            select(func.count()).select_from(_table).where(_table.c.submitted_at < self._cutoff(days))
+        ).scalar()
+
+    def archive_older_than(self, days: int, batch_size: int = 50000) -> Dict[str, Any]:
+        """
+        Archiva y borra los envíos anteriores a ``days`` días.
+
+        Cada lote se persiste en disco antes de borrarse de la base de datos:
+        una interrupción puede dejar filas archivadas dos veces (las
+        consultas y la compactación las descartan), nunca perderlas.
+
+        Returns:
+            Fecha de corte, filas archivadas, segmentos y lotes.
+        """
+        cutoff = self._cutoff(days)
+        result: Dict[str, Any] = {"cutoff": cutoff, "archived": 0, "segments": 0, "batches": 0}
+        while True:
+            rows = [
+                dict(row)
+                for row in self.db.execute(
+                    select(_table)
+                    .where(_table.c.submitted_at < cutoff)
+                    .order_by(_table.c.submitted_at, _table.c.id)
+                    .limit(batch_size)
+                ).mappings()
+            ]
+            if not rows:
+                break
+
+            result["segments"] += len(self.archive.write(rows))
+            self._delete([row["id"] for row in rows])
+            result["archived"] += len(rows)
+            result["batches"] += 1
+        return result
+
+    def _delete(self, ids: List[str]) -> None:
+        try:
+            for start in range(0, len(ids), DELETE_CHUNK_SIZE):
+                self.db.execute(delete(_table).where(_table.c.id.in_(ids[start:start + DELETE_CHUNK_SIZE])))
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    @staticmethod
+    def _cutoff(days: int) -> datetime:
+        if days < 1:
+            raise ValueError("Retention must be at least 1 day")
+        return datetime.utcnow() - timedelta(days=days)
@@ -0,0 +1,243 @@
+"""
+Puntuaciones agregadas por usuario (tabla ``user_scores``).
+
+Cada primer acierto suma los puntos del CTF a la fila del usuario con un
+upsert incremental, en la misma transacción que inserta el solve. Los
+cambios de puntos de un CTF ya resuelto y su borrado se propagan con un
+UPDATE masivo sobre sus solvers, que además fija su puntuación nueva en
+``user_score_history``. ``reconcile`` recalcula todo desde
+``ctf_solves`` para detectar (y opcionalmente corregir) desviaciones.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
+
+from .models.ctf_model import CTFModel
+from .models.ctf_solve_model import CTFSolveModel
+from .models.user_model import UserModel
+from .models.user_score_model import UserScoreModel
+from .score_history import ScoreHistory
+from .writes import upsert_increment
+from ..leaderboard import ScoreEntry
+
+
+# Diferencias que se devuelven como máximo en una reconciliación
+MAX_REPORTED_DIFFERENCES = 100
+
+_scores = UserScoreModel.__table__
+_solves = CTFSolveModel.__table__
+
+
+class UserScoreLedger:
+    """Mantiene y lee la tabla ``user_scores``."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def add_solve(self, user_id: str, points: int, solved_at: datetime) -> ScoreEntry:
+        """
+        Suma un solve al usuario (sin commit) y devuelve su puntuación resultante.
+
+        La lectura posterior al upsert va en la misma transacción, así que
+        devuelve el valor absoluto que quedará confirmado; ese mismo valor
+        se fija en ``user_score_history`` para la hora del solve.
+        """
+        upsert_increment(
+            self.db,
+            _scores,
+            {
+                "user_id": user_id,
+                "total_points": points or 0,
+                "solved_count": 1,
+                "last_solve_at": solved_at,
+            },
+            increments=("total_points", "solved_count"),
+            key="user_id",
+        )
+        entry = self.get(user_id)
+        ScoreHistory(self.db).record(entry, solved_at)
+        return entry
+
+    def adjust_ctf_points(
+        self,
+        ctf_id: str,
+        delta: int,
+        exclude_user_id: Optional[str] = None,
+        at: Optional[datetime] = None,
+    ) -> int:
+        """
+        Suma ``delta`` puntos a todos los solvers de un CTF (sin commit), salvo ``exclude_user_id``.
+
+        Su puntuación nueva se fija en el historial en la hora de ``at`` (ahora por defecto).
+        """
+        if not delta:
+            return 0
+        solvers = select(_solves.c.user_id).where(_solves.c.ctf_id == ctf_id)
+        if exclude_user_id is not None:
+            solvers = solvers.where(_solves.c.user_id != exclude_user_id)
+        affected = self.db.execute(
+            update(_scores)
+            .where(_scores.c.user_id.in_(solvers))
+            .values(total_points=_scores.c.total_points + delta)
+        ).rowcount
+        if affected:
+            ScoreHistory(self.db).record_users(solvers, at or datetime.utcnow())
+        return affected
+
+    def remove_ctf(self, ctf_id: str, points: int) -> int:
+        """
+        Descuenta un CTF que se va a borrar de la puntuación de sus solvers (sin commit).
+
+        Debe llamarse antes de borrar sus filas de ``ctf_solves``. La
+        puntuación resultante de cada solver (cero si era su único solve)
+        se fija en el historial en la hora actual.
+        """
+        solvers = select(_solves.c.user_id).where(_solves.c.ctf_id == ctf_id)
+        last_other_solve = (
+            select(func.max(_solves.c.solved_at))
+            .where(_solves.c.user_id == _scores.c.user_id, _solves.c.ctf_id != ctf_id)
+            .scalar_subquery()
+        )
+        affected = self.db.execute(
+            update(_scores)
+            .where(_scores.c.user_id.in_(solvers))
+            .values(
+                total_points=_scores.c.total_points - (points or 0),
+                solved_count=_scores.c.solved_count - 1,
+                last_solve_at=last_other_solve,
+            )
+        ).rowcount
+        self.db.execute(delete(_scores).where(_scores.c.solved_count <= 0))
+        if affected:
+            ScoreHistory(self.db).record_users(solvers, datetime.utcnow())
+        return affected
+
+    def get(self, user_id: str) -> ScoreEntry:
+        """Puntuación almacenada de un usuario (sin nombre; ceros si no tiene fila)."""
+        row = self.db.execute(
+            select(
+                _scores.c.total_points, _scores.c.solved_count, _scores.c.last_solve_at
+            ).where(_scores.c.user_id == user_id)
+        ).first()
+        if row is None:
+            return ScoreEntry(user_id=user_id, total_points=0, solved_count=0)
+        return ScoreEntry(
+            user_id=user_id,
+            total_points=row.total_points,
+            solved_count=row.solved_count,
+            last_solve_at=row.last_solve_at,
+        )
+
+    def load_all(self) -> List[ScoreEntry]:
+        """Todas las puntuaciones con el nombre de usuario (para construir el ranking)."""
+        rows = self.db.execute(
+            select(
+                _scores.c.user_id,
+                _scores.c.total_points,
+                _scores.c.solved_count,
+                _scores.c.last_solve_at,
+                UserModel.username,
+            ).join(UserModel, UserModel.id == _scores.c.user_id)
+        )
+        return [
+            ScoreEntry(
+                user_id=row.user_id,
+                total_points=row.total_points,
+                solved_count=row.solved_count,
+                last_solve_at=row.last_solve_at,
+                username=row.username,
+            )
+            for row in rows
+        ]
+
+    def compute(self) -> Dict[str, Tuple[int, int, Optional[datetime]]]:
+        """Recalcula {user_id: (puntos, solves, último solve)} desde ``ctf_solves``."""
+        rows = self.db.execute(
+            select(
+                _solves.c.user_id,
+                func.coalesce(func.sum(CTFModel.points), 0),
+                func.count(),
+                func.max(_solves.c.solved_at),
+            )
+            .join(CTFModel, CTFModel.id == _solves.c.ctf_id)
+            .group_by(_solves.c.user_id)
+        )
+        return {row[0]: (int(row[1]), int(row[2]), row[3]) for row in rows}
+
+    def reconcile(self, repair: bool = False) -> Dict[str, Any]:
+        """
+        Compara ``user_scores`` con los valores recalculados desde los solves.
+
+        Args:
+            repair: Si es True, corrige las filas que no coinciden.
+
+        Returns:
+            Diccionario con ``consistent``, ``checked``, ``mismatched``,
+            ``differences`` (como mucho MAX_REPORTED_DIFFERENCES) y ``repaired``.
+        """
+        actual = self.compute()
+        stored = {
+            row.user_id: (row.total_points, row.solved_count, row.last_solve_at)
+            for row in self.db.execute(
+                select(
+                    _scores.c.user_id,
+                    _scores.c.total_points,
+                    _scores.c.solved_count,
+                    _scores.c.last_solve_at,
+                )
+            )
+        }
+
+        mismatched = [
+            user_id
+            for user_id in actual.keys() | stored.keys()
+            if actual.get(user_id) != stored.get(user_id)
+        ]
+        differences = {
+            user_id: {
+                "stored": _as_dict(stored.get(user_id)),
+                "actual": _as_dict(actual.get(user_id)),
+            }
+            for user_id in sorted(mismatched)[:MAX_REPORTED_DIFFERENCES]
+        }
+
+        repaired = False
+        if mismatched and repair:
+            try:
+                for user_id in mismatched:
+                    self.db.execute(delete(_scores).where(_scores.c.user_id == user_id))
+                    if user_id in actual:
+                        points, solved, last = actual[user_id]
+                        self.db.execute(_scores.insert().values(
+                            user_id=user_id,
+                            total_points=points,
+                            solved_count=solved,
+                            last_solve_at=last,
+                        ))
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
+            repaired = True
+
+        return {
+            "consistent": not mismatched,
+            "checked": len(actual.keys() | stored.keys()),
+            "mismatched": len(mismatched),
+            "differences": differences,
+            "repaired": repaired,
+        }
+
+
+def _as_dict(value: Optional[Tuple[int, int, Optional[datetime]]]) -> Optional[Dict[str, Any]]:
+    if value is None:
+        return None
+    points, solved, last = value
+    return {
+        "total_points": points,
+        "solved_count": solved,
+        "last_solve_at": last.isoformat() if last else None,
+    }
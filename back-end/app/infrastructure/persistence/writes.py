@@ -0,0 +1,224 @@
+"""
+Escrituras de una sola sentencia para los repositorios SQL.
+
+Los repositorios ya no cargan la fila antes de guardar: una entidad nueva
+se inserta con un upsert del dialecto (``ON DUPLICATE KEY UPDATE`` en
+MySQL, ``ON CONFLICT DO UPDATE`` en SQLite/PostgreSQL) y una entidad
+cargada emite un único UPDATE con las columnas que cambiaron.
+"""
+
+import json
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Sequence, Union
+from uuid import UUID
+
+from sqlalchemy import Table, insert, update
+from sqlalchemy.orm import Session
+
+
+def column_value(value: Any) -> Any:
+    """Serializa un valor de entidad al formato de su columna."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, list):
+        return json.dumps(value)
+    return value
+
+
+def entity_row(entity: Any, names: Iterable[str]) -> Dict[str, Any]:
+    """Construye {columna: valor} para los campos indicados de una entidad."""
+    return {name: column_value(getattr(entity, name)) for name in names}
+
+
+def upsert_row(db: Session, table: Table, row: Dict[str, Any], key: str = "id") -> None:
+    """Inserta una fila o, si la clave ya existe, sobrescribe sus columnas (sin commit)."""
+    dialect = db.get_bind().dialect.name
+    updates = [name for name in row if name != key]
+
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        statement = mysql_insert(table).values(**row)
+        statement = statement.on_duplicate_key_update(
+            {name: statement.inserted[name] for name in updates}
+        )
+    elif dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+        statement = dialect_insert(table).values(**row)
+        statement = statement.on_conflict_do_update(
+            index_elements=[key],
+            set_={name: statement.excluded[name] for name in updates},
+        )
+    else:
+        statement = insert(table).values(**row)
+
+    db.execute(statement)
+
+
+def upsert_increment(
+    db: Session,
+    table: Table,
+    row: Dict[str, Any],
+    increments: Iterable[str],
+    key: Union[str, Sequence[str]] = "id",
+) -> None:
+    """
+    Inserta una fila o, si la clave ya existe, suma las columnas indicadas (sin commit).
+    
+    Las columnas de ``increments`` se suman al valor existente; el resto
+    de columnas de ``row`` (salvo la clave, simple o compuesta) se sobrescriben.
+    """
+    dialect = db.get_bind().dialect.name
+    increments = set(increments)
+    keys = (key,) if isinstance(key, str) else tuple(key)
+    updates = [name for name in row if name not in keys]
+
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        statement = mysql_insert(table).values(**row)
+        statement = statement.on_duplicate_key_update({
+            name: table.c[name] + statement.inserted[name] if name in increments
+            else statement.inserted[name]
+            for name in updates
+        })
+    elif dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+        statement = dialect_insert(table).values(**row)
+        statement = statement.on_conflict_do_update(
+            index_elements=list(keys),
+            set_={
+                name: table.c[name] + statement.excluded[name] if name in increments
+                else statement.excluded[name]
+                for name in updates
+            },
+        )
+    else:
+        values = {
+            name: table.c[name] + row[name] if name in increments else row[name]
+            for name in updates
+        }
+        result = db.execute(
+            update(table).where(*(table.c[name] == row[name] for name in keys)).values(**values)
+        )
+        if result.rowcount:
+            return
+        statement = insert(table).values(**row)
+
+    db.execute(statement)
+
+
+def upsert_many(
+    db: Session,
+    table: Table,
+    rows: List[Dict[str, Any]],
+    key: Union[str, Sequence[str]] = "id",
+) -> None:
+    """Inserta o sobrescribe varias filas con una sentencia ejecutada en lote (sin commit)."""
+    if not rows:
+        return
+    dialect = db.get_bind().dialect.name
+    keys = (key,) if isinstance(key, str) else tuple(key)
+    updates = [name for name in rows[0] if name not in keys]
+
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        statement = mysql_insert(table)
+        statement = statement.on_duplicate_key_update(
+            {name: statement.inserted[name] for name in updates}
+        )
+    elif dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+        statement = dialect_insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=list(keys),
+            set_={name: statement.excluded[name] for name in updates},
+        )
+    else:
+        for row in rows:
+            upsert_increment(db, table, row, increments=(), key=key)
+        return
+
+    db.execute(statement, rows)
+
+
+def insert_ignore(db: Session, table: Table, row: Dict[str, Any]) -> bool:
+    """
+    Inserta una fila salvo que choque con una clave única (sin commit).
+    
+    Returns:
+        True si la fila se insertó, False si ya existía.
+    """
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "mysql":
+        statement = insert(table).values(**row).prefix_with("IGNORE")
+    elif dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+        statement = dialect_insert(table).values(**row).on_conflict_do_nothing()
+    else:
+        # Sin soporte del dialecto: un savepoint aísla el posible conflicto
+        from sqlalchemy.exc import IntegrityError
+
+        try:
+            with db.begin_nested():
+                db.execute(insert(table).values(**row))
+        except IntegrityError:
+            return False
+        return True
+
+    return db.execute(statement).rowcount == 1
+
+
+def insert_many_ignore(db: Session, table: Table, rows: List[Dict[str, Any]]) -> None:
+    """Inserta varias filas en una sola sentencia ejecutada en lote, saltando las que ya existen (sin commit)."""
+    if not rows:
+        return
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "mysql":
+        statement = insert(table).prefix_with("IGNORE")
+    elif dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+        statement = dialect_insert(table).on_conflict_do_nothing()
+    else:
+        for row in rows:
+            insert_ignore(db, table, row)
+        return
+
+    db.execute(statement, rows)
+
+
+def update_row(
+    db: Session,
+    table: Table,
+    key_value: Any,
+    values: Dict[str, Any],
+    key: str = "id",
+) -> None:
+    """Actualiza (sin commit) solo las columnas indicadas de una fila."""
+    if values:
+        db.execute(update(table).where(table.c[key] == key_value).values(**values))
@@ -12,8 +12,10 @@ from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from .core.config import settings
-from .core.database import engine
+from .core.database import SessionLocal, engine
 from .core.logging import logger
+from .domain.services.regex_engine import regex_engine
+from .domain.services.submission_cache import submission_cache
 from .core.security_middleware import (
     limiter, 
     security_headers_middleware,
@@ -27,9 +29,17 @@ from .api.routers import (
     contact_router,
     attachments_router,
     portfolio_router,
+    catalog_router,
 )
+from .infrastructure.events import live_feed
 # Importar Base de persistence donde están definidos los modelos
+from .infrastructure.leaderboard import leaderboard
 from .infrastructure.persistence.base import Base
+from .infrastructure.persistence.ctf_analytics import analytics_aggregator
+from .infrastructure.persistence.recommendations import recommendation_job
+from .infrastructure.persistence.repositories import FlagSubmissionSqlRepository
+from .infrastructure.persistence.submission_journal import submission_journal
+from .infrastructure.persistence.user_scores import UserScoreLedger
 from .infrastructure.persistence.models import (
     UserModel,
     ProjectModel,
@@ -38,6 +48,15 @@ from .infrastructure.persistence.models import (
     AttachmentModel,
     ContactModel,
     FlagSubmissionModel,
+    FlagSubmissionRepeatModel,
+    CTFStatsModel,
+    CTFSearchTrigramModel,
+    CTFSkillModel,
+    CTFSolveModel,
+    UserScoreModel,
+    UserScoreHistoryModel,
+    CTFNeighbourModel,
+    CTFAnalyticsHourlyModel,
 )
 
 
@@ -51,10 +70,46 @@ async def lifespan(app: FastAPI):
     Base.metadata.create_all(bind=engine)
     logger.info("Database tables created")
     
+    # Ranking en memoria desde user_scores
+    db = SessionLocal()
+    try:
+        players = leaderboard.reload(UserScoreLedger(db).load_all)
+        logger.info(f"Leaderboard loaded ({players} players)")
+    finally:
+        db.close()
+    
+    # Diario de intentos incorrectos (reproduce lo pendiente del arranque anterior)
+    if settings.FLAG_SUBMISSION_JOURNAL_ENABLED:
+        replayed = submission_journal.start()
+        logger.info(f"Submission journal started ({replayed} attempts replayed)")
+    
+    # Solves de otros workers para el feed en vivo
+    live_feed.start(SessionLocal)
+    
+    # Vecinos de cada CTF para las recomendaciones
+    recommendation_job.start(SessionLocal)
+    
+    # Rollup horario de analíticas por CTF
+    analytics_aggregator.start(SessionLocal)
+    
     yield
     
     # Shutdown
     logger.info("Shutting down application")
+    await live_feed.stop()
+    await recommendation_job.stop()
+    await analytics_aggregator.stop()
+    regex_engine.shutdown()
+    submission_journal.stop()
+    
+    # Repeticiones de intentos incorrectos aún no volcadas
+    repeats = submission_cache.drain_repeats(force=True)
+    if repeats:
+        db = SessionLocal()
+        try:
+            FlagSubmissionSqlRepository(db).record_repeats(repeats)
+        finally:
+            db.close()
 
 
 # Crear instancia de FastAPI
@@ -112,6 +167,7 @@ app.include_router(writeups_router, prefix=settings.API_V1_PREFIX)
 app.include_router(contact_router, prefix=settings.API_V1_PREFIX)
 app.include_router(attachments_router, prefix=settings.API_V1_PREFIX)
 app.include_router(portfolio_router, prefix=settings.API_V1_PREFIX)
+app.include_router(catalog_router, prefix=settings.API_V1_PREFIX)
 
 
 @app.get("/", tags=["Root"])
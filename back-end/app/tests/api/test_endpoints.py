@@ -122,3 +122,17 @@ class TestCTFEndpoints:
         assert "solved" in data
         assert "by_level" in data
         assert "by_category" in data
+    
+    def test_get_ctf_facets(self, client: TestClient):
+        """Test: obtener facetas de CTFs."""
+        response = client.get("/api/v1/ctfs/facets", params={"skill": "xss"})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data) == {"skill", "level", "category", "platform"}
+    
+    def test_get_ctf_facets_invalid_level(self, client: TestClient):
+        """Test: un nivel inválido devuelve 400."""
+        response = client.get("/api/v1/ctfs/facets", params={"level": "imposible"})
+        
+        assert response.status_code == 400
@@ -0,0 +1,90 @@
+"""
+Tests de la caché de usuarios verificados en get_current_user.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from ...api.dependencies import get_current_user
+from ...domain.entities.user import User
+from ...domain.services.principal_cache import PrincipalCache, principal_cache
+from ...infrastructure.persistence.repositories import UserSqlRepository
+from ...infrastructure.security.jwt_provider import JWTProvider
+
+
+def _authenticate(token, repo):
+    request = SimpleNamespace(cookies={"access_token": token})
+    return asyncio.run(get_current_user(request, None, JWTProvider(), repo))
+
+
+class TestPrincipalCache:
+    """Tests del principal cacheado por usuario y token."""
+
+    def test_repeated_requests_skip_user_lookup(self, sql_db):
+        """Test: tras la primera carga el mismo token no consulta la base de datos."""
+        repo = UserSqlRepository(sql_db)
+        user = repo.save(User(email="cache@test.com", username="cache", hashed_password="x"))
+        token = JWTProvider().create_access_token(str(user.id))
+        selects = []
+        event.listen(sql_db.get_bind(), "before_cursor_execute",
+                     lambda *args: selects.append(args[2]))
+
+        first = _authenticate(token, repo)
+        second = _authenticate(token, repo)
+
+        assert len(selects) == 1
+        assert (second.id, second.username, second.is_admin) == (first.id, "cache", False)
+        assert second.hashed_password == ""
+
+    def test_save_invalidates_deactivated_user(self, sql_db):
+        """Test: desactivar al usuario (guardándolo) se aplica en la siguiente petición."""
+        repo = UserSqlRepository(sql_db)
+        user = repo.save(User(email="off@test.com", username="off", hashed_password="x"))
+        token = JWTProvider().create_access_token(str(user.id))
+        _authenticate(token, repo)
+
+        user.deactivate()
+        repo.save(user)
+
+        with pytest.raises(HTTPException) as error:
+            _authenticate(token, repo)
+        assert error.value.status_code == 403
+        assert principal_cache.get(str(user.id), token) is None
+
+    def test_saving_cached_user_keeps_password_hash(self, sql_db):
+        """Test: guardar el usuario servido desde la caché no borra el hash de la contraseña."""
+        repo = UserSqlRepository(sql_db)
+        user = repo.save(User(email="keep@test.com", username="keep", hashed_password="hash"))
+        token = JWTProvider().create_access_token(str(user.id))
+        _authenticate(token, repo)
+        cached = _authenticate(token, repo)
+
+        cached.username = "renamed"
+        repo.save(cached)
+
+        stored = repo.get_by_id(user.id)
+        assert (stored.username, stored.hashed_password) == ("renamed", "hash")
+        with pytest.raises(ValueError):
+            repo.save(User(email="new@test.com", username="new", hashed_password=""))
+
+    def test_ttl_and_token_keying(self):
+        """Test: caduca con el TTL, otro token no comparte entrada y ttl=0 desactiva."""
+        user = User(email="ttl@test.com", username="ttl", hashed_password="x")
+        cache = PrincipalCache(ttl=60)
+        cache.put("token-a", user)
+
+        assert cache.get(str(user.id), "token-a").username == "ttl"
+        assert cache.get(str(user.id), "token-b") is None
+
+        cache._entries[str(user.id)] = {
+            key: (0.0, principal) for key, (_, principal) in cache._entries[str(user.id)].items()
+        }
+        assert cache.get(str(user.id), "token-a") is None  # Caducado
+
+        disabled = PrincipalCache(ttl=0)
+        disabled.put("token-a", user)
+        assert disabled.get(str(user.id), "token-a") is None
@@ -0,0 +1,107 @@
+"""
+Tests del throttle de envíos de flags por reto.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from ...core.submission_throttle import SubmissionThrottle, submission_throttle
+
+
+class TestSubmissionThrottle:
+    """Tests del backoff en memoria."""
+
+    def test_exponential_backoff_after_free_attempts(self):
+        """Test: tras los fallos gratuitos la espera se duplica hasta el máximo."""
+        throttle = SubmissionThrottle(free_attempts=2, base_delay=1, max_delay=8)
+        key = throttle.key(uuid4(), user_id="u1")
+
+        delays = [throttle.record(key, success=False) for _ in range(7)]
+
+        assert delays == [0, 0, 1, 2, 4, 8, 8]
+        assert 1 <= throttle.check(key) <= 8
+        assert throttle.check(throttle.key(uuid4(), user_id="u1")) is None  # Otro reto
+
+    def test_success_and_inactivity_reset(self):
+        """Test: un acierto borra el historial; también la inactividad prolongada."""
+        throttle = SubmissionThrottle(free_attempts=0, base_delay=0.01, reset_after=0)
+        key = throttle.key(uuid4(), ip_address="10.0.0.1")
+
+        throttle.record(key, success=False)
+        throttle.record(key, success=True)
+        assert throttle.check(key) is None
+        assert throttle.metrics()["entries"] == 0
+
+        throttle.record(key, success=False)
+        throttle._entries[key] = (5, 0.0)  # Bloqueo vencido hace mucho
+        assert throttle.record(key, success=False) == 0.01
+
+    def test_lru_bound(self):
+        """Test: el número de claves no supera max_entries."""
+        throttle = SubmissionThrottle(max_entries=10)
+        for _ in range(50):
+            throttle.record(throttle.key(uuid4(), ip_address="10.0.0.1"), success=False)
+        assert throttle.metrics()["entries"] == 10
+
+
+class TestSubmitThrottleEndpoint:
+    """El 429 se devuelve antes de abrir una sesión de base de datos."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        submission_throttle.reset()
+        yield
+        submission_throttle.reset()
+
+    def test_returns_retry_after_without_db(self):
+        """Test: una clave en backoff recibe 429 + Retry-After sin pedir sesión."""
+        from fastapi.testclient import TestClient
+        from ...core.database import get_db
+        from ...main import app
+
+        def no_db():
+            raise AssertionError("DB session requested for a throttled submission")
+            yield  # pragma: no cover
+
+        ctf_id = uuid4()
+        key = submission_throttle.key(ctf_id, ip_address="testclient")
+        for _ in range(submission_throttle.free_attempts + 3):
+            submission_throttle.record(key, success=False)
+
+        app.dependency_overrides[get_db] = no_db
+        try:
+            with TestClient(app) as client:
+                response = client.post(f"/api/v1/ctfs/{ctf_id}/submit", json={"flag": "flag{x}"})
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
+
+    def test_only_evaluated_flags_count(self):
+        """Test: "ya resuelto", formato inválido o no disponible no suman fallos; una flag incorrecta sí."""
+        from fastapi.testclient import TestClient
+        from ...api.dependencies import get_flag_service
+        from ...domain.services.flag_service import FlagVerdict
+        from ...main import app
+
+        verdicts = [FlagVerdict.ALREADY_SOLVED, FlagVerdict.INVALID_FORMAT, FlagVerdict.UNAVAILABLE, FlagVerdict.WRONG]
+
+        class FakeFlagService:
+            def evaluate_flag(self, **kwargs):
+                return verdicts.pop(0), "x", None
+
+        ctf_id = uuid4()
+        key = submission_throttle.key(ctf_id, ip_address="testclient")
+        app.dependency_overrides[get_flag_service] = FakeFlagService
+        try:
+            with TestClient(app) as client:
+                for _ in range(3):
+                    client.post(f"/api/v1/ctfs/{ctf_id}/submit", json={"flag": "flag{x}"})
+                    assert key not in submission_throttle._entries
+                client.post(f"/api/v1/ctfs/{ctf_id}/submit", json={"flag": "flag{x}"})
+        finally:
+            app.dependency_overrides.clear()
+
+        assert submission_throttle._entries[key][0] == 1
@@ -8,7 +8,9 @@ from uuid import uuid4
 
 from ...application.dto.ctf_dto import CTFCreateDTO
 from ...application.use_cases.create_ctf import CreateCTFUseCase
+from ...application.use_cases.list_ctfs import ListCTFsUseCase
 from ...domain.entities.ctf import CTF, CTFLevel, CTFCategory
+from ...domain.services.solved_cache import SolvedSetCache
 
 
 class TestCreateCTFUseCase:
@@ -65,3 +67,39 @@ class TestCreateCTFUseCase:
         
         with pytest.raises(ValueError):
             use_case.execute(dto)
+
+
+class TestListCTFsUseCase:
+    """Tests para solved_by_me en el listado de CTFs."""
+    
+    def test_solved_by_me_from_one_cached_query(self):
+        """Test: el conjunto de resueltos se consulta una vez y se reutiliza hasta invalidarse."""
+        ctfs = [
+            CTF(title=f"CTF {n}", level=CTFLevel.EASY, category=CTFCategory.WEB, platform="HackTheBox")
+            for n in range(3)
+        ]
+        ctf_repo = Mock()
+        ctf_repo.get_published.return_value = ctfs
+        ctf_repo.count.return_value = len(ctfs)
+        writeup_repo = Mock()
+        writeup_repo.get_by_ctf_id.return_value = None
+        submission_repo = Mock()
+        submission_repo.get_solved_ctf_ids.return_value = {str(ctfs[1].id)}
+        cache = SolvedSetCache(ttl=60)
+        use_case = ListCTFsUseCase(
+            ctf_repo, writeup_repo, submission_repository=submission_repo, solved_cache=cache
+        )
+        user_id = uuid4()
+        
+        result = use_case.execute(user_id=user_id)
+        assert [item.solved_by_me for item in result.items] == [False, True, False]
+        use_case.execute(user_id=user_id)
+        assert submission_repo.get_solved_ctf_ids.call_count == 1
+        
+        cache.invalidate(user_id)
+        use_case.execute(user_id=user_id)
+        assert submission_repo.get_solved_ctf_ids.call_count == 2
+        
+        # Sin usuario no se consulta ni se marca
+        assert use_case.execute().items[0].solved_by_me is None
+        assert submission_repo.get_solved_ctf_ids.call_count == 2
@@ -60,3 +60,28 @@ def client(db: Session):
         yield c
     
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def sql_db() -> Generator[Session, None, None]:
+    """
+    Sesión sobre SQLite en memoria con todas las tablas de persistencia.
+    Útil para probar repositorios SQL sin depender de MySQL.
+    """
+    from sqlalchemy.pool import StaticPool
+    from ..infrastructure.persistence.base import Base as PersistenceBase
+    from ..infrastructure.persistence import models  # noqa: F401 - registra modelos
+    
+    memory_engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    PersistenceBase.metadata.create_all(bind=memory_engine)
+    
+    session = sessionmaker(autocommit=False, autoflush=False, bind=memory_engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        memory_engine.dispose()
@@ -0,0 +1,76 @@
+"""
+Tests para el motor de evaluación de flags regex.
+"""
+
+import pytest
+
+from ...domain.entities.ctf import CTF, CTFLevel, CTFCategory
+from ...domain.services import regex_engine as regex_engine_module
+from ...domain.services.regex_engine import RegexEngine
+
+
+@pytest.fixture
+def engine():
+    engine = RegexEngine(workers=1, timeout=0.5, cache_size=2)
+    yield engine
+    engine.shutdown()
+
+
+class TestRegexEngine:
+    """Tests para el pool de procesos evaluadores."""
+
+    def test_match_and_cache(self, engine):
+        """Test: evalúa con re.match y reutiliza el patrón compilado."""
+        assert engine.match(r"flag\{[a-z]+\}", "flag{abc}", cache_key="ctf-1") is True
+        assert engine.match(r"flag\{[a-z]+\}", "flag{123}", cache_key="ctf-1") is False
+
+        metrics = engine.metrics()
+        assert metrics["evaluations"] == 2
+        assert metrics["matches"] == 1
+        assert metrics["cache_misses"] == 1
+        assert metrics["cache_hits"] == 1
+
+    def test_invalid_pattern(self, engine):
+        """Test: un patrón inválido no coincide y cuenta como error."""
+        assert engine.match("flag{(", "flag{(") is False
+        assert engine.metrics()["errors"] == 1
+
+    def test_timeout_restarts_worker(self, engine):
+        """Test: un ReDoS se corta en el timeout y el proceso se reemplaza."""
+        assert engine.match(r"(a+)+$", "a" * 40 + "b", cache_key="evil") is False
+
+        metrics = engine.metrics()
+        assert metrics["timeouts"] == 1
+        assert metrics["restarts"] == 1
+        # El proceso nuevo sigue atendiendo
+        assert engine.match(r"ok", "ok") is True
+
+
+class TestCTFRegexFlag:
+    """Tests de verify_flag con flags regex."""
+
+    @pytest.fixture
+    def shared_engine(self, engine, monkeypatch):
+        # verify_flag importa la instancia global al usarla
+        monkeypatch.setattr(regex_engine_module, "regex_engine", engine)
+        return engine
+
+    def test_verify_regex_flag(self, shared_engine):
+        """Test: un patrón soportado se evalúa con el matcher lineal, sin el pool."""
+        ctf = CTF(title="Regex", level=CTFLevel.EASY, category=CTFCategory.WEB, platform="Web")
+        ctf.set_flag(r"flag\{user_\d+\}", is_regex=True)
+
+        assert ctf.verify_flag("flag{user_42}") is True
+        assert ctf.verify_flag("flag{user_x}") is False
+        assert shared_engine.metrics()["evaluations"] == 0
+
+    def test_legacy_pattern_uses_engine(self, shared_engine):
+        """Test: un patrón guardado que el matcher lineal no admite va al motor compartido."""
+        # Anterior a la validación de set_flag: backreference guardada tal cual
+        ctf = CTF(title="Legacy", level=CTFLevel.EASY, category=CTFCategory.WEB, platform="Web",
+                  flag_hash=r"flag\{(\w+)-\1\}", is_flag_regex=True)
+
+        assert ctf.verify_flag("flag{abc-abc}") is True
+        assert ctf.verify_flag("flag{abc-xyz}") is False
+        metrics = shared_engine.metrics()
+        assert (metrics["evaluations"], metrics["matches"]) == (2, 1)
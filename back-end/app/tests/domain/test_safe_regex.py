@@ -0,0 +1,114 @@
+"""
+Tests diferenciales del matcher lineal contra ``re``.
+"""
+
+import random
+import re
+import time
+
+import pytest
+
+from ...domain.entities.ctf import CTF, CTFLevel, CTFCategory
+from ...domain.services.safe_regex import UnsupportedPatternError, compile_safe
+
+
+PATTERNS = [
+    r"flag\{[a-z0-9_]+\}",
+    r"flag{[a-z]+}",
+    r"FLAG\{user_\d{2,4}\}$",
+    r"(?:ctf|flag)\{.*\}",
+    r"(?P<prefix>htb)\{[^}]{3,}\}\Z",
+    r"^a|b$",
+    r"a{,2}b",
+    r"a{}b",
+    r"a{2}{",
+    r"[]a-]+",
+    r"[^\s\d]+x?",
+    r"\w+\W\S",
+    r"(a|ab)(c|bcd)(d*)",
+    r"(a*)*b",
+    r"(a+)+$",
+    r"x*?y+?z??",
+    r"\x41é\N{GREEK SMALL LETTER ALPHA}\0",
+    r"[\t\n.]+$",
+    r"(|a)+c",
+    r"\.\*\\",
+]
+
+INPUTS = [
+    "", "a", "b", "ab", "abc", "aab", "abcd", "abcbcd", "aaaa", "aaab", "a\n", "b\n", "b\n\n",
+    "flag{abc_123}", "flag{abc", "FLAG{user_123}", "FLAG{user_123}\n", "FLAG{user_1}",
+    "ctf{x}", "ctf{}", "htb{abcd}", "htb{ab}", "htb{abcd}\n", "a{2}{", "aa{", "]-a",
+    "héllo!", "word_1 xy", "xyyz", "yz", "Aéα\x00", "\t.\n", "\t.\n\n", "c", "ac", "aac",
+    ".*\\", "a" * 16 + "b",
+]
+
+
+def _random_pattern(rng: random.Random, depth: int = 0) -> str:
+    choice = rng.randrange(9 if depth < 3 else 4)
+    if choice == 0:
+        return rng.choice("ab")
+    if choice == 1:
+        return rng.choice([".", "[ab]", "[^a]", r"\d", "c"])
+    if choice == 2:
+        return rng.choice(["^", "$", ""]) if depth else "a"
+    if choice == 3:
+        return rng.choice("abc")
+    inner = _random_pattern(rng, depth + 1)
+    if choice == 4:
+        return f"(?:{inner}){rng.choice(['*', '+', '?', '{1,2}', '{2}', '*?'])}"
+    if choice == 5:
+        return f"({inner}|{_random_pattern(rng, depth + 1)})"
+    return inner + _random_pattern(rng, depth + 1)
+
+
+class TestSafeRegexDifferential:
+    """El matcher lineal debe coincidir con re.match en el subconjunto soportado."""
+
+    @pytest.mark.parametrize("pattern", PATTERNS)
+    def test_fixed_patterns(self, pattern):
+        """Test: patrones escritos a mano sobre entradas variadas."""
+        compiled = compile_safe(pattern)
+        expected = re.compile(pattern)
+        for text in INPUTS:
+            assert compiled.match(text) == bool(expected.match(text)), (pattern, text)
+
+    def test_random_patterns(self):
+        """Test: patrones y entradas aleatorios."""
+        rng = random.Random(1234)
+        for _ in range(400):
+            pattern = _random_pattern(rng)
+            try:
+                expected = re.compile(pattern)
+            except re.error:
+                continue
+            compiled = compile_safe(pattern)
+            for _ in range(15):
+                text = "".join(rng.choice("abc1\n") for _ in range(rng.randrange(8)))
+                assert compiled.match(text) == bool(expected.match(text)), (pattern, text)
+
+    @pytest.mark.parametrize("pattern", [
+        r"(a)\1", r"(?=a)a", r"(?!b)a", r"(?<=a)b", r"\bflag", r"(?i)flag", r"(?P<x>a)(?P=x)",
+        r"a{3000}{3000}",
+    ])
+    def test_rejects_unsupported(self, pattern):
+        """Test: se rechazan construcciones no regulares o demasiado grandes."""
+        with pytest.raises(UnsupportedPatternError):
+            compile_safe(pattern)
+
+    def test_linear_time_on_redos_pattern(self):
+        """Test: un patrón catastrófico para re se evalúa en tiempo lineal."""
+        compiled = compile_safe(r"(a+)+$")
+        start = time.perf_counter()
+        assert compiled.match("a" * 5000 + "b") is False
+        assert time.perf_counter() - start < 1.0
+
+
+class TestSetRegexFlag:
+    """Validación al definir la flag."""
+
+    def test_set_flag_rejects_unsupported(self):
+        """Test: set_flag rechaza patrones fuera del subconjunto."""
+        ctf = CTF(title="Regex", level=CTFLevel.EASY, category=CTFCategory.WEB, platform="Web")
+        with pytest.raises(ValueError, match="Unsupported regex pattern"):
+            ctf.set_flag(r"(flag)\{\1\}", is_regex=True)
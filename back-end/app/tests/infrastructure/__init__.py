@@ -0,0 +1,3 @@
+"""
+Tests de la capa de infraestructura.
+"""
@@ -0,0 +1,167 @@
+"""
+Tests para la importación/exportación masiva del catálogo en JSONL.
+"""
+
+import json
+from uuid import UUID, uuid4
+
+from ...application.use_cases.bulk_catalog import ExportCatalogUseCase, ImportCatalogUseCase
+from ...domain.services.ctf_service import CTFService
+from ...domain.services.flag_service import FlagService
+from ...infrastructure.persistence.models import UserModel
+from ...infrastructure.persistence.repositories import (
+    AttachmentSqlRepository,
+    CTFSqlRepository,
+    FlagSubmissionSqlRepository,
+    WriteupSqlRepository,
+)
+
+
+def _repos(db):
+    ctf_repo = CTFSqlRepository(db)
+    return ctf_repo, WriteupSqlRepository(db), AttachmentSqlRepository(db)
+
+
+def _importer(db, batch_size=100):
+    ctf_repo, writeup_repo, attachment_repo = _repos(db)
+    return ImportCatalogUseCase(
+        ctf_repo, writeup_repo, attachment_repo, CTFService(ctf_repo), batch_size=batch_size
+    )
+
+
+def _ctf_line(ctf_id, title="Auth Bypass", **kwargs):
+    record = {
+        "kind": "ctf",
+        "id": str(ctf_id),
+        "title": title,
+        "level": "easy",
+        "category": "web",
+        "platform": "HackTheBox",
+        "points": 20,
+        "skills": ["SQLi"],
+        "flag": "flag{test}",
+        "is_active": True,
+    }
+    record.update(kwargs)
+    return json.dumps(record)
+
+
+class TestImportCatalog:
+    """Tests para la importación por lotes."""
+
+    def test_invalid_lines_do_not_abort(self, sql_db):
+        """Test: las líneas inválidas se reportan y el resto se guarda."""
+        ctf_id = uuid4()
+        lines = [
+            _ctf_line(ctf_id),
+            "{no es json",
+            "",
+            _ctf_line(uuid4(), title="x"),
+            json.dumps({"kind": "attachment", "ctf_id": str(ctf_id), "name": "x.zip", "type": "ftp"}),
+            json.dumps({
+                "kind": "writeup",
+                "ctf_id": str(ctf_id),
+                "title": "Auth Bypass writeup",
+                "content": "a" * 120,
+                "status": "published",
+            }),
+        ]
+
+        report = _importer(sql_db, batch_size=2).execute(lines)
+
+        assert report.processed == 5
+        assert report.created == 2
+        assert report.failed == 3
+        assert [e.line for e in report.errors] == [2, 4, 5]
+        ctf_repo, writeup_repo, _ = _repos(sql_db)
+        assert ctf_repo.get_by_id(ctf_id).verify_flag("flag{test}")
+        assert writeup_repo.get_by_ctf_id(ctf_id).title == "Auth Bypass writeup"
+        assert ctf_repo.get_statistics()["total"] == 1
+
+    def test_upsert_by_id(self, sql_db):
+        """Test: reimportar un ID actualiza la fila y corrige el rollup."""
+        ctf_id = uuid4()
+        _importer(sql_db).execute([_ctf_line(ctf_id, points=20)])
+
+        report = _importer(sql_db).execute([_ctf_line(ctf_id, title="Renombrado", points=50)])
+
+        assert (report.created, report.updated, report.failed) == (0, 1, 0)
+        ctf_repo, _, _ = _repos(sql_db)
+        assert ctf_repo.get_by_id(ctf_id).title == "Renombrado"
+        assert ctf_repo.get_statistics()["total_points"] == 50
+        assert ctf_repo.reconcile_statistics()["consistent"] is True
+
+    def test_reimport_keeps_solves_and_flag(self, sql_db):
+        """Test: reimportar un CTF resuelto sin flag conserva la flag, los solves y el rollup."""
+        ctf_id = uuid4()
+        _importer(sql_db).execute([_ctf_line(ctf_id)])
+        user_id = str(uuid4())
+        sql_db.add(UserModel(id=user_id, email=f"{user_id}@test.com", username=user_id[:20], hashed_password="x"))
+        sql_db.commit()
+        ctf_repo, _, _ = _repos(sql_db)
+        flags = FlagService(ctf_repo, FlagSubmissionSqlRepository(sql_db))
+        assert flags.submit_flag(ctf_id, "flag{test}", user_id=UUID(user_id))[0]
+
+        line = json.loads(_ctf_line(ctf_id, title="Renombrado"))
+        del line["flag"]
+        report = _importer(sql_db).execute([json.dumps(line)])
+
+        assert (report.updated, report.failed) == (1, 0)
+        stored = ctf_repo.get_by_id(ctf_id)
+        assert stored.title == "Renombrado"
+        assert stored.verify_flag("flag{test}")
+        assert (stored.solved, stored.solved_count) == (True, 1)
+        assert ctf_repo.reconcile_statistics()["consistent"] is True
+
+    def test_regex_flag_hash_is_validated(self, sql_db):
+        """Test: un flag_hash regex se valida como en set_flag; un patrón no soportado falla su línea."""
+        valid, invalid = uuid4(), uuid4()
+        lines = [
+            _ctf_line(valid, flag=None, flag_hash=r"flag\{[a-z]+\}", is_flag_regex=True),
+            _ctf_line(invalid, title="Backref", flag=None, flag_hash=r"flag\{(a)\1\}", is_flag_regex=True),
+        ]
+
+        report = _importer(sql_db).execute(lines)
+
+        assert (report.created, report.failed) == (1, 1)
+        assert report.errors[0].line == 2
+        assert "Unsupported regex pattern" in report.errors[0].error
+        ctf_repo, _, _ = _repos(sql_db)
+        assert ctf_repo.get_by_id(valid).verify_flag("flag{abc}")
+        assert ctf_repo.get_by_id(invalid) is None
+
+    def test_failed_row_is_isolated_from_its_batch(self, sql_db):
+        """Test: si un lote falla en la BD, solo se pierde la fila culpable."""
+        ctf_id = uuid4()
+        _importer(sql_db).execute([_ctf_line(ctf_id)])
+        content = "b" * 120
+        lines = [
+            json.dumps({"kind": "writeup", "ctf_id": str(ctf_id), "title": "Primero", "content": content}),
+            # ctf_id es único en writeups: viola la restricción
+            json.dumps({"kind": "writeup", "ctf_id": str(ctf_id), "title": "Duplicado", "content": content}),
+        ]
+
+        report = _importer(sql_db).execute(lines)
+
+        assert report.created == 1
+        assert report.failed == 1
+        assert report.errors[0].line == 2
+
+
+class TestExportCatalog:
+    """Tests para la exportación en streaming."""
+
+    def test_round_trip(self, sql_db):
+        """Test: lo exportado se puede reimportar sin cambios."""
+        ctf_id = uuid4()
+        attachments = [{"id": str(uuid4()), "name": "web.zip", "type": "url", "url": "https://example.com"}]
+        _importer(sql_db).execute([_ctf_line(ctf_id, attachments=attachments)])
+
+        lines = list(ExportCatalogUseCase(*_repos(sql_db)).execute(batch_size=1))
+
+        assert [json.loads(line)["kind"] for line in lines] == ["ctf", "attachment"]
+        report = _importer(sql_db).execute(lines)
+        assert (report.created, report.updated, report.failed) == (0, 2, 0)
+        ctf = CTFSqlRepository(sql_db).get_by_id(ctf_id)
+        assert ctf.verify_flag("flag{test}")
+        assert [a.name for a in ctf.attachments] == ["web.zip"]
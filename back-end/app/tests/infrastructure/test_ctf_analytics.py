@@ -0,0 +1,78 @@
+"""
+Tests del rollup horario de analíticas por CTF.
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from ...domain.entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus
+from ...infrastructure.persistence.ctf_analytics import CTFAnalytics
+from ...infrastructure.persistence.models import (
+    CTFAnalyticsHourlyModel,
+    CTFSolveModel,
+    FlagSubmissionModel,
+    UserModel,
+)
+from ...infrastructure.persistence.repositories import CTFSqlRepository
+
+
+HOUR = datetime(2026, 1, 28, 12)
+
+
+class TestCTFAnalytics:
+    """Tests de la agregación por hora y de la lectura del rango."""
+
+    def _setup(self, db):
+        ctf = CTF(title="Analytics", level=CTFLevel.EASY, category=CTFCategory.WEB,
+                  platform="HackTheBox", points=100, status=CTFStatus.PUBLISHED)
+        CTFSqlRepository(db).save(ctf)
+        users = [str(uuid4()) for _ in range(3)]
+        for user_id in users:
+            db.add(UserModel(id=user_id, email=f"{user_id}@test.com",
+                             username=user_id[:20], hashed_password="x"))
+        db.commit()
+        return str(ctf.id), users
+
+    def _attempt(self, db, ctf_id, user_id, at, correct=False):
+        db.add(FlagSubmissionModel(ctf_id=ctf_id, user_id=user_id, flag="x",
+                                   is_correct=correct, submitted_at=at))
+        if correct:
+            db.add(CTFSolveModel(ctf_id=ctf_id, user_id=user_id, solved_at=at))
+
+    def test_hourly_rows_and_range_totals(self, sql_db):
+        """Test: intentos, usuarios nuevos, solves y medianas por hora; totales del rango."""
+        ctf_id, (fast, slow, stuck) = self._setup(sql_db)
+        self._attempt(sql_db, ctf_id, fast, HOUR + timedelta(minutes=5), correct=True)
+        for minute in (0, 10, 20):
+            self._attempt(sql_db, ctf_id, slow, HOUR + timedelta(minutes=minute))
+            self._attempt(sql_db, ctf_id, stuck, HOUR + timedelta(minutes=minute + 1))
+        self._attempt(sql_db, ctf_id, slow, HOUR + timedelta(hours=1, minutes=30), correct=True)
+        self._attempt(sql_db, ctf_id, stuck, HOUR + timedelta(hours=1, minutes=40))
+        sql_db.commit()
+
+        analytics = CTFAnalytics(sql_db)
+        assert analytics.aggregate(HOUR, HOUR + timedelta(hours=2)) == 2
+
+        result = analytics.series(ctf_id)
+        first, second = result["hours"]
+        assert (first["attempts"], first["attempters"], first["new_attempters"], first["solves"]) == (7, 3, 3, 1)
+        assert first["median_attempts_to_solve"] == 1 and first["median_seconds_to_solve"] == 0
+        assert (second["attempts"], second["attempters"], second["new_attempters"], second["solves"]) == (2, 2, 0, 1)
+        assert second["median_attempts_to_solve"] == 4 and second["median_seconds_to_solve"] == 5400
+        assert (result["attempts"], result["attempters"], result["solves"]) == (9, 3, 2)
+        assert result["solve_rate"] == round(2 / 3, 4)
+
+    def test_refresh_recomputes_from_last_hour(self, sql_db):
+        """Test: refresh sobrescribe la última hora guardada con los intentos que llegan tarde."""
+        ctf_id, (user_id, _, _) = self._setup(sql_db)
+        self._attempt(sql_db, ctf_id, user_id, HOUR + timedelta(minutes=1))
+        sql_db.commit()
+        analytics = CTFAnalytics(sql_db)
+        analytics.refresh(now=HOUR + timedelta(minutes=30), backfill_days=1)
+
+        self._attempt(sql_db, ctf_id, user_id, HOUR + timedelta(minutes=20))
+        sql_db.commit()
+        analytics.refresh(now=HOUR + timedelta(minutes=40))
+
+        row = sql_db.get(CTFAnalyticsHourlyModel, (ctf_id, HOUR))
+        assert (row.attempts, row.attempters, row.new_attempters) == (2, 1, 1)
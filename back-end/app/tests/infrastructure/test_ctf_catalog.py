@@ -0,0 +1,184 @@
+"""
+Tests para el catálogo de CTFs en memoria.
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import event
+
+from ...application.use_cases.list_ctfs import ListCTFsUseCase
+from ...domain.services.flag_service import FlagService
+from ...core.pagination import decode_cursor
+from ...domain.entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus
+from ...infrastructure.catalog import CTFCatalog, CTFCatalogSnapshot, ctf_catalog
+from ...infrastructure.persistence.models import UserModel
+from ...infrastructure.persistence.repositories import (
+    CTFSqlRepository,
+    FlagSubmissionSqlRepository,
+    WriteupSqlRepository,
+)
+
+
+def _catalog_ctfs():
+    base = datetime(2026, 1, 1)
+    specs = [
+        (CTFLevel.EASY, CTFCategory.WEB, "HackTheBox", ["SQLi"]),
+        (CTFLevel.EASY, CTFCategory.PWN, "TryHackMe", ["ROP"]),
+        (CTFLevel.HARD, CTFCategory.WEB, "HackTheBox", ["SQLi", "XSS"]),
+        (CTFLevel.MEDIUM, CTFCategory.CRYPTO, "Custom", []),
+        (CTFLevel.EASY, CTFCategory.WEB, "hackthebox", ["XSS"]),
+    ]
+    return [
+        {
+            "id": uuid4(),
+            "title": f"CTF {i}",
+            "level": level.value,
+            "category": category.value,
+            "platform": platform,
+            "skills": skills,
+            "status": CTFStatus.PUBLISHED.value,
+            "created_at": base + timedelta(hours=i),
+        }
+        for i, (level, category, platform, skills) in enumerate(specs)
+    ]
+
+
+class TestCTFCatalogSnapshot:
+    """Tests para consultas sobre la instantánea."""
+
+    def test_filters_and_order(self):
+        """Test: los filtros se combinan y el orden es el más reciente primero."""
+        ctfs = _catalog_ctfs()
+        snapshot = CTFCatalogSnapshot.build(0, ctfs, {ctfs[2]["id"]})
+
+        page = snapshot.query(limit=10, category="web", platform="HACKTHEBOX")
+
+        assert [c["title"] for c in page.items] == ["CTF 4", "CTF 2", "CTF 0"]
+        assert page.has_writeup == [False, True, False]
+        assert page.total == 3
+        assert page.next_cursor is None
+
+    def test_offset_and_cursor_pages(self):
+        """Test: la paginación por offset y por cursor coinciden."""
+        snapshot = CTFCatalogSnapshot.build(0, _catalog_ctfs(), set())
+
+        first = snapshot.query(limit=2)
+        by_cursor = snapshot.query(limit=2, cursor=decode_cursor(first.next_cursor))
+        by_offset = snapshot.query(offset=2, limit=2)
+
+        assert [c["title"] for c in first.items] == ["CTF 4", "CTF 3"]
+        assert by_cursor.items == by_offset.items
+        assert [c["title"] for c in by_cursor.items] == ["CTF 2", "CTF 1"]
+        assert by_cursor.total == 5
+
+    def test_facets(self):
+        """Test: las facetas cuentan sobre el conjunto filtrado."""
+        snapshot = CTFCatalogSnapshot.build(0, _catalog_ctfs(), set())
+
+        facets = snapshot.facets(level="easy")
+
+        assert facets["category"] == {"web": 2, "pwn": 1}
+        assert facets["platform"] == {"hackthebox": 2, "tryhackme": 1}
+        assert facets["skill"] == {"sqli": 1, "rop": 1, "xss": 1}
+
+
+class TestCTFCatalog:
+    """Tests para el versionado de la instantánea."""
+
+    def test_rebuild_after_invalidate(self, sql_db):
+        """Test: guardar un CTF invalida el catálogo y la siguiente lectura lo ve."""
+        catalog = CTFCatalog(ttl_seconds=60)
+        repo = CTFSqlRepository(sql_db)
+        loads = []
+
+        def loader():
+            loads.append(1)
+            return repo.get_catalog_rows(), set()
+
+        assert catalog.snapshot(loader).size == 0
+        assert catalog.snapshot(loader).size == 0
+        assert len(loads) == 1
+
+        repo.save(CTF(
+            title="Nuevo",
+            level=CTFLevel.EASY,
+            category=CTFCategory.WEB,
+            platform="HackTheBox",
+            status=CTFStatus.PUBLISHED,
+        ))
+        catalog.invalidate()
+
+        snapshot = catalog.snapshot(loader)
+        assert snapshot.size == 1
+        assert snapshot.version == catalog.version
+        assert len(loads) == 2
+
+    def test_load_is_one_projection_query(self, sql_db):
+        """Test: cargar el catálogo es una sola consulta y no guarda la flag."""
+        repo = CTFSqlRepository(sql_db)
+        for i in range(5):
+            ctf = CTF(title=f"CTF {i}", level=CTFLevel.EASY, category=CTFCategory.WEB,
+                      platform="HackTheBox", skills=["SQLi"], status=CTFStatus.PUBLISHED)
+            ctf.set_flag("flag{secret}")
+            repo.save(ctf)
+        statements = []
+        event.listen(sql_db.get_bind(), "before_cursor_execute",
+                     lambda *args: statements.append(args[2]))
+
+        snapshot = CTFCatalog(ttl_seconds=60).snapshot(lambda: (repo.get_catalog_rows(), set()))
+
+        assert len(statements) == 1
+        assert "flag_hash" not in statements[0]
+        assert snapshot.size == 5
+        assert snapshot.query(limit=1).items[0]["skills"] == ["SQLi"]
+
+    def test_listing_matches_database(self, sql_db):
+        """Test: el listado desde el catálogo devuelve lo mismo que desde la BD."""
+        repo = CTFSqlRepository(sql_db)
+        static = CTF(title="Estático", level=CTFLevel.EASY, category=CTFCategory.WEB,
+                     platform="HackTheBox", points=20, hints=["mira"], status=CTFStatus.PUBLISHED)
+        dynamic = CTF(title="Dinámico", level=CTFLevel.HARD, category=CTFCategory.PWN,
+                      platform="Custom", status=CTFStatus.PUBLISHED,
+                      created_at=datetime(2026, 1, 1))
+        dynamic.set_dynamic_scoring(100, 10, 3)
+        repo.save(static)
+        repo.save(dynamic)
+        writeups = WriteupSqlRepository(sql_db)
+        snapshot = CTFCatalogSnapshot.build(0, repo.get_catalog_rows(), writeups.get_ctf_ids_with_writeup())
+
+        from_catalog = ListCTFsUseCase(repo, writeups, catalog=snapshot).execute(size=10)
+        from_db = ListCTFsUseCase(repo, writeups).execute(size=10)
+
+        assert from_catalog.items == from_db.items
+        assert from_catalog.total == from_db.total == 2
+
+    def test_solve_patches_snapshot_without_rebuild(self, sql_db):
+        """Test: un solve parchea su fila en la instantánea vigente en vez de invalidarla."""
+        repo = CTFSqlRepository(sql_db)
+        ctf = CTF(title="Dinámico", level=CTFLevel.HARD, category=CTFCategory.PWN,
+                  platform="Custom", status=CTFStatus.PUBLISHED)
+        ctf.set_flag("flag{ok}")
+        ctf.set_dynamic_scoring(100, 10, 2)
+        repo.save(ctf)
+        user_id = uuid4()
+        sql_db.add(UserModel(id=str(user_id), email="patch@test.com", username="patch", hashed_password="x"))
+        sql_db.commit()
+        loads = []
+
+        def loader():
+            loads.append(1)
+            return repo.get_catalog_rows(), set()
+
+        ctf_catalog.invalidate()
+        ctf_catalog.snapshot(loader)
+        flags = FlagService(repo, FlagSubmissionSqlRepository(sql_db))
+        assert flags.submit_flag(ctf.id, "flag{ok}", user_id=user_id)[0] is True
+        assert flags.submit_flag(ctf.id, "flag{ok}")[0] is True  # Anónimo: no cambia nada
+
+        snapshot = ctf_catalog.snapshot(loader)
+        row = snapshot.query(limit=1).items[0]
+        assert len(loads) == 1
+        assert snapshot.version == ctf_catalog.version
+        assert (row["solved"], row["solved_count"], row["first_blood_user_id"]) == (True, 1, user_id)
+        assert row == repo.get_catalog_rows()[0]
@@ -0,0 +1,78 @@
+"""
+Tests para la búsqueda difusa de CTFs por trigramas.
+"""
+
+from ...domain.entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus
+from ...infrastructure.persistence.ctf_search import trigrams
+from ...infrastructure.persistence.repositories import CTFSqlRepository
+
+
+def _save(repo, title, skills=None, description=None, status=CTFStatus.PUBLISHED, **kwargs):
+    data = dict(
+        title=title,
+        level=CTFLevel.EASY,
+        category=CTFCategory.WEB,
+        platform="HackTheBox",
+        skills=skills or [],
+        description=description,
+        status=status,
+    )
+    data.update(kwargs)
+    return repo.save(CTF(**data))
+
+
+class TestTrigrams:
+    """Tests para la extracción de trigramas."""
+
+    def test_normalizes_accents_and_case(self):
+        """Test: se ignoran acentos, mayúsculas y signos."""
+        assert trigrams("Inyección!") == trigrams("inyeccion")
+        assert "__s" in trigrams("SQLi")
+
+
+class TestCTFSearch:
+    """Tests para la búsqueda ordenada del repositorio SQL."""
+
+    def test_typo_tolerant_and_ranked(self, sql_db):
+        """Test: una consulta con errores encuentra el CTF y lo ordena primero."""
+        repo = CTFSqlRepository(sql_db)
+        bof = _save(repo, "Stack Smash", skills=["Buffer Overflow", "ROP"], category=CTFCategory.PWN)
+        _save(repo, "Login Portal", skills=["SQL Injection"])
+        _save(repo, "Overflowing Cups", description="Un reto de buffer de cafe")
+
+        results, total = repo.search_ranked("buffer overlfow")
+
+        assert total >= 1
+        assert results[0][0].id == bof.id
+        scores = [score for _, score in results]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_filters_pagination_and_status(self, sql_db):
+        """Test: los filtros y el estado se aplican antes de paginar."""
+        repo = CTFSqlRepository(sql_db)
+        for i in range(3):
+            _save(repo, f"SQLi Lab {i}", skills=["SQL Injection"])
+        _save(repo, "SQLi Draft", skills=["SQL Injection"], status=CTFStatus.DRAFT)
+        _save(repo, "SQLi Crypto", category=CTFCategory.CRYPTO)
+
+        page, total = repo.search_ranked(
+            "sqli", skip=2, limit=2, status=CTFStatus.PUBLISHED, category=CTFCategory.WEB
+        )
+
+        assert total == 3
+        assert len(page) == 1
+        assert all(ctf.status == CTFStatus.PUBLISHED for ctf, _ in page)
+
+    def test_index_follows_updates_and_delete(self, sql_db):
+        """Test: el índice se actualiza al editar y eliminar un CTF."""
+        repo = CTFSqlRepository(sql_db)
+        ctf = _save(repo, "Format String Basics")
+
+        ctf.title = "Heap Exploitation"
+        repo.save(ctf)
+        assert repo.search_ranked("format string")[1] == 0
+        assert repo.search_ranked("heap")[1] == 1
+
+        repo.delete(ctf.id)
+        assert repo.search_ranked("heap")[1] == 0
+        assert repo.rebuild_search_index() == 0
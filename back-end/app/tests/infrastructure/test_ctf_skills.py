@@ -0,0 +1,52 @@
+"""
+Tests para la tabla de skills normalizada y las facetas de CTFs.
+"""
+
+from ...domain.entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus
+from ...infrastructure.persistence.repositories import CTFSqlRepository
+
+
+def _save(repo, title, skills, level=CTFLevel.EASY, status=CTFStatus.PUBLISHED):
+    return repo.save(CTF(
+        title=title,
+        level=level,
+        category=CTFCategory.WEB,
+        platform="HackTheBox",
+        skills=skills,
+        status=status,
+    ))
+
+
+class TestCTFSkills:
+    """Tests para el filtrado por skill y las facetas."""
+
+    def test_filter_by_skill(self, sql_db):
+        """Test: el filtro por skill no distingue mayúsculas y sigue a las ediciones."""
+        repo = CTFSqlRepository(sql_db)
+        ctf = _save(repo, "Login", ["SQL Injection", "Cookies"])
+        _save(repo, "Reflected", ["XSS"])
+
+        assert [c.id for c in repo.get_published(skill="sql injection")] == [ctf.id]
+        assert repo.count(status=CTFStatus.PUBLISHED, skill="XSS") == 1
+
+        ctf.skills = ["XSS"]
+        repo.save(ctf)
+        assert repo.get_published(skill="sql injection") == []
+        assert repo.count(status=CTFStatus.PUBLISHED, skill="xss") == 2
+
+    def test_facets(self, sql_db):
+        """Test: las facetas cuentan solo los CTFs publicados que cumplen los filtros."""
+        repo = CTFSqlRepository(sql_db)
+        _save(repo, "Uno", ["SQL Injection", "Cookies"])
+        _save(repo, "Dos", ["SQL Injection"], level=CTFLevel.HARD)
+        _save(repo, "Tres", ["XSS"])
+        _save(repo, "Borrador", ["SQL Injection"], status=CTFStatus.DRAFT)
+
+        facets = repo.get_facets()
+        assert facets["skill"] == {"SQL Injection": 2, "Cookies": 1, "XSS": 1}
+        assert facets["level"] == {"easy": 2, "hard": 1}
+        assert facets["platform"] == {"HackTheBox": 3}
+
+        filtered = repo.get_facets(skill="sql injection", level=CTFLevel.EASY)
+        assert filtered["skill"] == {"SQL Injection": 1, "Cookies": 1}
+        assert filtered["category"] == {"web": 1}
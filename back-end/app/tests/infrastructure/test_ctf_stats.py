@@ -0,0 +1,75 @@
+"""
+Tests para el rollup incremental de estadísticas de CTFs.
+"""
+
+from ...domain.entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus
+from ...infrastructure.persistence.repositories import CTFSqlRepository
+
+
+def _ctf(**kwargs) -> CTF:
+    data = dict(
+        title="CTF",
+        level=CTFLevel.EASY,
+        category=CTFCategory.WEB,
+        platform="HackTheBox",
+        points=20,
+    )
+    data.update(kwargs)
+    return CTF(**data)
+
+
+class TestCTFStatsRollup:
+    """Tests para el mantenimiento del rollup en el repositorio SQL."""
+
+    def test_draft_does_not_count(self, sql_db):
+        """Test: un CTF en borrador no aporta a las estadísticas."""
+        repo = CTFSqlRepository(sql_db)
+        repo.save(_ctf(status=CTFStatus.DRAFT))
+
+        stats = repo.get_statistics()
+
+        assert stats["total"] == 0
+        assert stats["by_level"] == {}
+
+    def test_publish_solve_and_delete(self, sql_db):
+        """Test: publicar, resolver y eliminar actualizan el rollup."""
+        repo = CTFSqlRepository(sql_db)
+        ctf = repo.save(_ctf(status=CTFStatus.DRAFT))
+        repo.save(_ctf(title="Otro", level=CTFLevel.HARD, points=40, status=CTFStatus.PUBLISHED))
+
+        ctf.publish()
+        repo.save(ctf)
+        stats = repo.get_statistics()
+        assert stats["total"] == 2
+        assert stats["solved"] == 0
+        assert stats["total_points"] == 60
+        assert stats["by_level"] == {"easy": 1, "hard": 1}
+
+        ctf.mark_as_solved()
+        repo.save(ctf)
+        stats = repo.get_statistics()
+        assert stats["solved"] == 1
+        assert stats["earned_points"] == 20
+
+        assert repo.delete(ctf.id) is True
+        stats = repo.get_statistics()
+        assert stats["total"] == 1
+        assert stats["solved"] == 0
+        assert stats["by_level"] == {"hard": 1}
+        assert repo.reconcile_statistics()["consistent"] is True
+
+    def test_reconcile_repairs_drift(self, sql_db):
+        """Test: el verificador detecta y repara un rollup desincronizado."""
+        from ...infrastructure.persistence.models import CTFStatsModel
+
+        repo = CTFSqlRepository(sql_db)
+        repo.save(_ctf(status=CTFStatus.PUBLISHED))
+        sql_db.get(CTFStatsModel, 1).total = 5
+        sql_db.commit()
+
+        report = repo.reconcile_statistics(repair=True)
+
+        assert report["consistent"] is False
+        assert report["differences"]["total"] == {"stored": 5, "actual": 1}
+        assert report["repaired"] is True
+        assert repo.reconcile_statistics()["consistent"] is True
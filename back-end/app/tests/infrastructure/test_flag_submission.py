@@ -0,0 +1,143 @@
+"""
+Tests para el envío de flags como unidad de trabajo.
+"""
+
+import json
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import event
+
+from ...application.use_cases.export_submissions import EXPORT_COLUMNS, ExportSubmissionsUseCase
+from ...domain.entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus
+from ...domain.entities.flag_submission import FlagSubmission
+from ...domain.services.flag_service import FlagService, FlagVerdict
+from ...infrastructure.persistence.models import UserModel
+from ...infrastructure.persistence.repositories import (
+    CTFSqlRepository,
+    FlagSubmissionSqlRepository,
+)
+
+
+def _setup(db, **kwargs):
+    ctf_repo = CTFSqlRepository(db)
+    data = dict(
+        title="Auth Bypass",
+        level=CTFLevel.EASY,
+        category=CTFCategory.WEB,
+        platform="HackTheBox",
+        points=20,
+        status=CTFStatus.PUBLISHED,
+    )
+    data.update(kwargs)
+    ctf = CTF(**data)
+    ctf.set_flag("flag{ok}")
+    ctf_repo.save(ctf)
+    return ctf, ctf_repo, FlagService(ctf_repo, FlagSubmissionSqlRepository(db))
+
+
+def _user(db) -> str:
+    user_id = str(uuid4())
+    db.add(UserModel(id=user_id, email=f"{user_id}@test.com", username=user_id[:20], hashed_password="x"))
+    db.commit()
+    return user_id
+
+
+class TestSubmitFlag:
+    """Tests para FlagService.submit_flag sobre SQL."""
+
+    def test_correct_submission_single_commit(self, sql_db):
+        """Test: un acierto inserta, registra el solve y confirma en un solo commit."""
+        ctf, ctf_repo, service = _setup(sql_db)
+        user_id = UUID(_user(sql_db))
+        commits = []
+        event.listen(sql_db, "after_commit", lambda session: commits.append(1))
+
+        success, _, points = service.submit_flag(ctf.id, "flag{ok}", user_id=user_id)
+
+        assert (success, points) == (True, 20)
+        assert len(commits) == 1
+        stored = ctf_repo.get_by_id(ctf.id)
+        assert stored.solved_count == 1
+        assert stored.solved is True
+        assert stored.first_blood_user_id == user_id
+        assert stored.first_blood_at is not None
+        assert ctf_repo.get_statistics()["solved"] == 1
+
+    def test_counter_and_rollup_with_several_solvers(self, sql_db):
+        """Test: cada solver suma uno y el rollup solo cuenta el primer acierto."""
+        ctf, ctf_repo, service = _setup(sql_db)
+        users = [UUID(_user(sql_db)) for _ in range(3)]
+
+        for user_id in users:
+            assert service.submit_flag(ctf.id, "flag{ok}", user_id=user_id)[0] is True
+        success, message, _ = service.submit_flag(ctf.id, "flag{ok}", user_id=users[0])
+        assert service.submit_flag(ctf.id, "flag{nope}", user_id=users[1])[0] is False
+
+        assert success is False and "resuelto" in message
+        assert service.evaluate_flag(ctf.id, "flag{ok}", user_id=users[0])[0] is FlagVerdict.ALREADY_SOLVED
+        stored = ctf_repo.get_by_id(ctf.id)
+        assert stored.solved_count == 3
+        assert stored.first_blood_user_id == users[0]
+        assert FlagSubmissionSqlRepository(sql_db).count_solvers(ctf.id) == 3
+        assert ctf_repo.reconcile_statistics()["consistent"] is True
+
+    def test_duplicate_solve_is_ignored(self, sql_db):
+        """Test: un segundo acierto del mismo usuario no vuelve a contar."""
+        ctf, ctf_repo, _ = _setup(sql_db)
+        repo = FlagSubmissionSqlRepository(sql_db)
+        user_id = UUID(_user(sql_db))
+        projection = ctf_repo.get_for_submission(ctf.id)
+
+        # Simula dos envíos concurrentes que pasaron has_user_solved
+        for _ in range(2):
+            repo.record_attempt(
+                FlagSubmission(ctf_id=ctf.id, flag="x", user_id=user_id, is_correct=True),
+                projection,
+            )
+
+        assert ctf_repo.get_by_id(ctf.id).solved_count == 1
+        assert repo.has_user_solved(ctf.id, user_id) is True
+
+    def test_anonymous_solve_does_not_count(self, sql_db):
+        """Test: un acierto anónimo marca el reto pero no suma solver."""
+        ctf, ctf_repo, service = _setup(sql_db)
+
+        assert service.submit_flag(ctf.id, "flag{ok}")[0] is True
+
+        stored = ctf_repo.get_by_id(ctf.id)
+        assert stored.solved is True
+        assert stored.solved_count == 0
+        assert stored.first_blood_user_id is None
+
+    def test_missing_and_inactive(self, sql_db):
+        """Test: CTF inexistente -> LookupError, inactivo -> ValueError."""
+        ctf, _, service = _setup(sql_db, is_active=False)
+
+        with pytest.raises(LookupError):
+            service.submit_flag(uuid4(), "flag{ok}")
+        with pytest.raises(ValueError):
+            service.submit_flag(ctf.id, "flag{ok}")
+
+
+class TestSubmissionExport:
+    """Tests para la exportación en streaming de intentos."""
+
+    def test_export_filters_and_formats(self, sql_db):
+        """Test: filtra por IP, emite NDJSON y CSV por lotes y no incluye la flag."""
+        ctf, _, service = _setup(sql_db)
+        user_id = UUID(_user(sql_db))
+        for flag, ip in (("flag{no}", "10.0.0.1"), ("flag{ok}", "10.0.0.1"), ("flag{x}", "10.0.0.2")):
+            service.submit_flag(ctf.id, flag, user_id=user_id, ip_address=ip)
+        use_case = ExportSubmissionsUseCase(FlagSubmissionSqlRepository(sql_db))
+
+        chunks = list(use_case.execute("ndjson", ip_address="10.0.0.1", batch_size=1))
+        records = [json.loads(chunk) for chunk in chunks]
+        assert [r["is_correct"] for r in records] == [False, True]
+        assert set(records[0]) == set(EXPORT_COLUMNS)
+
+        lines = "".join(use_case.execute("csv", ctf_id=ctf.id)).splitlines()
+        assert lines[0] == ",".join(EXPORT_COLUMNS) and len(lines) == 3
+
+        with pytest.raises(ValueError):
+            use_case.execute("xml")
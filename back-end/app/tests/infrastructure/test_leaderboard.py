@@ -0,0 +1,253 @@
+"""
+Tests para el ranking incremental (user_scores + skip list en memoria).
+"""
+
+import bisect
+import random
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from ...domain.entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus
+from ...domain.entities.flag_submission import FlagSubmission
+from ...domain.services.flag_service import FlagService
+from ...infrastructure.leaderboard import RankedSkipList, leaderboard
+from ...infrastructure.persistence.models import UserModel, UserScoreHistoryModel, UserScoreModel
+from ...infrastructure.persistence.repositories import (
+    CTFSqlRepository,
+    FlagSubmissionSqlRepository,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_leaderboard():
+    # El ranking es global al proceso: cada test parte de su propia base de datos
+    leaderboard.invalidate()
+    yield
+    leaderboard.invalidate()
+
+
+def _ctf(repo, points: int) -> CTF:
+    ctf = CTF(
+        title=f"Reto {points}",
+        level=CTFLevel.EASY,
+        category=CTFCategory.WEB,
+        platform="HackTheBox",
+        points=points,
+        status=CTFStatus.PUBLISHED,
+    )
+    ctf.set_flag("flag{ok}")
+    return repo.save(ctf)
+
+
+def _user(db, username: str) -> UUID:
+    user_id = uuid4()
+    db.add(UserModel(id=str(user_id), email=f"{username}@test.com", username=username, hashed_password="x"))
+    db.commit()
+    return user_id
+
+
+class TestRankedSkipList:
+    """Tests de la estructura de estadísticos de orden."""
+
+    def test_matches_sorted_list(self):
+        """Test: insert/remove/rank/at coinciden con una lista ordenada."""
+        rng = random.Random(7)
+        ranking = RankedSkipList(seed=7)
+        expected = []
+        for _ in range(2000):
+            key = rng.randrange(300)
+            if key in expected:
+                assert ranking.remove(key) is True
+                expected.remove(key)
+            else:
+                ranking.insert(key)
+                bisect.insort(expected, key)
+            if expected:
+                index = rng.randrange(len(expected))
+                assert ranking.at(index) == expected[index]
+                assert ranking.rank(expected[index]) == index
+
+        assert list(ranking) == expected
+        assert list(ranking.iter_from(5)) == expected[5:]
+        assert ranking.remove(-1) is False
+        assert ranking.rank(-1) is None
+
+
+class TestLeaderboard:
+    """Tests del ranking servido desde user_scores."""
+
+    def _setup(self, db):
+        ctf_repo = CTFSqlRepository(db)
+        submissions = FlagSubmissionSqlRepository(db)
+        service = FlagService(ctf_repo, submissions)
+        ctfs = [_ctf(ctf_repo, points) for points in (10, 20, 30)]
+        users = {name: _user(db, name) for name in ("alice", "bob", "carol")}
+        return ctf_repo, submissions, service, ctfs, users
+
+    def test_top_and_rank(self, sql_db):
+        """Test: el top y la posición reflejan cada solve sin recalcular."""
+        ctf_repo, submissions, service, ctfs, users = self._setup(sql_db)
+        # Carga inicial (vacía) antes de los solves: luego se actualiza incrementalmente
+        assert submissions.get_leaderboard() == []
+
+        for name, solved in (("alice", ctfs[:1]), ("bob", ctfs[1:]), ("carol", ctfs[:2])):
+            for ctf in solved:
+                assert service.submit_flag(ctf.id, "flag{ok}", user_id=users[name])[0] is True
+
+        top = submissions.get_leaderboard(limit=2)
+        assert [(e["rank"], e["username"], e["total_points"]) for e in top] == [
+            (1, "bob", 50),
+            (2, "carol", 30),
+        ]
+
+        stats = submissions.get_user_stats(users["alice"])
+        assert (stats["rank"], stats["total_points"], stats["solved_count"]) == (3, 10, 1)
+        assert [c["points"] for c in stats["solved_ctfs"]] == [10]
+
+    def test_points_change_and_reconcile(self, sql_db):
+        """Test: cambiar los puntos de un CTF resuelto reajusta a sus solvers."""
+        ctf_repo, submissions, service, ctfs, users = self._setup(sql_db)
+        service.submit_flag(ctfs[0].id, "flag{ok}", user_id=users["alice"])
+        service.submit_flag(ctfs[1].id, "flag{ok}", user_id=users["bob"])
+
+        ctf = ctf_repo.get_by_id(ctfs[0].id)
+        ctf.points = 100
+        ctf_repo.save(ctf)
+
+        assert submissions.get_leaderboard()[0]["username"] == "alice"
+        assert submissions.get_user_stats(users["alice"])["total_points"] == 100
+        assert submissions.reconcile_scores()["consistent"] is True
+
+        ctf_repo.delete(ctfs[0].id)
+        assert submissions.get_user_stats(users["alice"])["rank"] is None
+        assert submissions.reconcile_scores()["consistent"] is True
+
+    def test_reconcile_repairs_drift(self, sql_db):
+        """Test: la reconciliación detecta y corrige una fila desviada."""
+        _, submissions, service, ctfs, users = self._setup(sql_db)
+        service.submit_flag(ctfs[2].id, "flag{ok}", user_id=users["carol"])
+        sql_db.query(UserScoreModel).update({"total_points": 999})
+        sql_db.commit()
+
+        report = submissions.reconcile_scores()
+        assert (report["consistent"], report["mismatched"]) == (False, 1)
+
+        report = submissions.reconcile_scores(repair=True)
+        assert report["repaired"] is True
+        assert submissions.reconcile_scores()["consistent"] is True
+        assert submissions.get_leaderboard()[0]["total_points"] == 30
+
+
+class TestScoreHistory:
+    """Tests de la evolución de la puntuación por intervalos."""
+
+    def test_series_by_bucket(self, sql_db):
+        """Test: una fila por hora con solves; las series se agregan al último valor."""
+        ctf_repo = CTFSqlRepository(sql_db)
+        submissions = FlagSubmissionSqlRepository(sql_db)
+        ctfs = [_ctf(ctf_repo, points) for points in (10, 20, 30)]
+        alice, bob = _user(sql_db, "alice"), _user(sql_db, "bob")
+        submissions.get_leaderboard()
+
+        for user_id, ctf, at in (
+            (alice, ctfs[0], datetime(2026, 3, 1, 9, 5)),
+            (alice, ctfs[1], datetime(2026, 3, 1, 9, 50)),
+            (alice, ctfs[2], datetime(2026, 3, 1, 14, 0)),
+            (bob, ctfs[2], datetime(2026, 3, 2, 1, 0)),
+        ):
+            submissions.record_attempt(
+                FlagSubmission(ctf_id=ctf.id, user_id=user_id, flag="flag{ok}",
+                               is_correct=True, submitted_at=at),
+                ctf,
+            )
+
+        assert sql_db.query(UserScoreHistoryModel).count() == 3
+        hourly = submissions.get_score_history(limit=2, bucket="1h")
+        assert [e["username"] for e in hourly] == ["alice", "bob"]
+        assert hourly[0]["points"] == [
+            (datetime(2026, 3, 1, 9), 30, 2),
+            (datetime(2026, 3, 1, 14), 60, 3),
+        ]
+
+        daily = submissions.get_score_history(limit=2, bucket="1d", since=datetime(2026, 3, 1, 12))
+        assert daily[0]["points"] == [(datetime(2026, 3, 1), 60, 3)]
+        assert daily[1]["points"] == [(datetime(2026, 3, 2), 30, 1)]
+
+        with pytest.raises(ValueError):
+            submissions.get_score_history(bucket="5m")
+
+
+    def test_series_seeded_and_follows_rescoring(self, sql_db):
+        """Test: con since se parte del último valor previo y los cambios de puntos escriben historial."""
+        ctf_repo = CTFSqlRepository(sql_db)
+        submissions = FlagSubmissionSqlRepository(sql_db)
+        edited, deleted = _ctf(ctf_repo, 10), _ctf(ctf_repo, 20)
+        alice = _user(sql_db, "alice")
+        submissions.get_leaderboard()
+        for ctf in (edited, deleted):
+            submissions.record_attempt(
+                FlagSubmission(ctf_id=ctf.id, user_id=alice, flag="flag{ok}",
+                               is_correct=True, submitted_at=datetime(2026, 3, 1, 9, 5)),
+                ctf,
+            )
+
+        window = submissions.get_score_history(bucket="1d", since=datetime(2026, 3, 5))
+        assert window[0]["points"] == [(datetime(2026, 3, 5), 30, 2)]
+
+        edited.points = 15
+        ctf_repo.save(edited)
+        last = submissions.get_score_history()[0]
+        assert last["points"][-1][1:] == (35, 2) == (last["total_points"], last["solved_count"])
+
+        ctf_repo.delete(deleted.id)
+        last = submissions.get_score_history()[0]
+        assert last["points"][-1][1:] == (15, 1) == (last["total_points"], last["solved_count"])
+
+
+class TestDynamicScoring:
+    """Tests de la puntuación dinámica con reajuste incremental."""
+
+    def test_solves_decay_value_and_rescore_solvers(self, sql_db):
+        """Test: cada solve baja el valor y todos los solvers quedan con el valor nuevo."""
+        ctf_repo = CTFSqlRepository(sql_db)
+        submissions = FlagSubmissionSqlRepository(sql_db)
+        service = FlagService(ctf_repo, submissions)
+        ctf = CTF(title="Dinámico", level=CTFLevel.HARD, category=CTFCategory.PWN,
+                  platform="Custom", status=CTFStatus.PUBLISHED)
+        ctf.set_flag("flag{ok}")
+        ctf.set_dynamic_scoring(100, 10, 3)
+        ctf_repo.save(ctf)
+        static = _ctf(ctf_repo, 70)
+        users = [_user(sql_db, name) for name in ("alice", "bob", "carol", "dave")]
+        submissions.get_leaderboard()
+
+        service.submit_flag(static.id, "flag{ok}", user_id=users[3])
+        values, credited = [], []
+        for user_id in users:
+            result = service.submit_flag(ctf.id, "flag{ok}", user_id=user_id)
+            assert result[0] is True
+            assert result[1] == f"¡Correcto! +{result[2]} puntos"
+            credited.append(result[2])
+            values.append(ctf_repo.get_by_id(ctf.id).points)
+
+        # CTFd: ceil((min - initial) / decay² · (solves - 1)² + initial), con suelo en min
+        assert values == [100, 90, 60, 10]
+        assert credited == values  # Cada solver recibe el valor ya decaído
+        top = submissions.get_leaderboard()
+        assert [(e["username"], e["total_points"]) for e in top] == [
+            ("dave", 80), ("alice", 10), ("bob", 10), ("carol", 10),
+        ]
+        history = submissions.get_score_history(limit=4)
+        assert all(e["points"][-1][1] == e["total_points"] for e in history)
+        assert submissions.reconcile_scores()["consistent"] is True
+        assert ctf_repo.reconcile_statistics()["consistent"] is True
+
+    def test_invalid_configuration(self):
+        """Test: el mínimo no puede superar al inicial y decay debe ser positivo."""
+        ctf = CTF(title="X", level=CTFLevel.EASY, category=CTFCategory.WEB, platform="Custom")
+        with pytest.raises(ValueError):
+            ctf.set_dynamic_scoring(50, 100, 10)
+        with pytest.raises(ValueError):
+            ctf.set_dynamic_scoring(100, 10, None)
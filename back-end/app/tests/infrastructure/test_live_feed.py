@@ -0,0 +1,122 @@
+"""
+Tests del bus de eventos y del feed en vivo del ranking.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from ...domain.entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus
+from ...domain.entities.flag_submission import FlagSubmission
+from ...infrastructure.events import EventBus, LiveFeed, live_feed
+from ...infrastructure.leaderboard import Leaderboard, leaderboard
+from ...infrastructure.persistence.models import CTFSolveModel, UserModel
+from ...infrastructure.persistence.repositories import (
+    CTFSqlRepository,
+    FlagSubmissionSqlRepository,
+)
+from ...infrastructure.persistence.user_scores import UserScoreLedger
+
+
+def _frames(subscription):
+    frames = []
+    while not subscription.queue.empty():
+        frames.append(subscription.queue.get_nowait())
+    return frames
+
+
+def _event(frame):
+    lines = dict(line.split(": ", 1) for line in frame.strip().split("\n"))
+    return lines["event"], json.loads(lines["data"])
+
+
+class TestEventBus:
+    """Tests de la difusión a suscriptores."""
+
+    def test_fan_out_and_drop_slow_consumer(self):
+        """Test: la misma trama llega a todos; quien llena su cola se descarta."""
+        async def scenario():
+            bus = EventBus(max_queue=2)
+            fast, slow = bus.subscribe(), bus.subscribe()
+            for n in range(3):
+                bus.publish("solve", {"n": n})
+                _frames(fast)
+            return bus, fast, slow
+
+        bus, fast, slow = asyncio.run(scenario())
+
+        assert slow.dropped and not fast.dropped
+        assert bus.metrics() == {"published": 3, "delivered": 5, "dropped": 1, "subscribers": 1}
+        assert [data["n"] for data in bus.recent("solve")] == [0, 1, 2]
+
+    def test_subscriber_limit(self):
+        """Test: por encima de max_subscribers no se admiten clientes."""
+        async def scenario():
+            bus = EventBus(max_subscribers=1)
+            first = bus.subscribe()
+            rejected = bus.subscribe()
+            bus.unsubscribe(first)
+            return rejected, bus.subscribe()
+
+        rejected, accepted = asyncio.run(scenario())
+        assert rejected is None and accepted is not None
+
+
+class TestLiveFeed:
+    """Tests de la publicación de solves y deltas del ranking."""
+
+    def _setup(self, db, count=2):
+        ctf = CTF(title="Live", level=CTFLevel.EASY, category=CTFCategory.WEB,
+                  platform="HackTheBox", points=50, status=CTFStatus.PUBLISHED)
+        ctf.set_flag("flag{live}")
+        CTFSqlRepository(db).save(ctf)
+        users = [str(uuid4()) for _ in range(count)]
+        for user_id in users:
+            db.add(UserModel(id=user_id, email=f"{user_id}@test.com",
+                             username=user_id[:20], hashed_password="x"))
+        db.commit()
+        return ctf, users
+
+    def test_correct_submission_publishes_solve_and_delta(self, sql_db):
+        """Test: un primer acierto publica el solve (first blood) y la subida de posición."""
+        ctf, (first, second) = self._setup(sql_db)
+        leaderboard.reload(UserScoreLedger(sql_db).load_all)
+        repo = FlagSubmissionSqlRepository(sql_db)
+
+        async def scenario():
+            subscription = live_feed.bus.subscribe()
+            try:
+                for user_id in (first, second, first):
+                    repo.record_attempt(
+                        FlagSubmission(ctf_id=ctf.id, user_id=UUID(user_id), flag="x", is_correct=True), ctf
+                    )
+                return [_event(frame) for frame in _frames(subscription)]
+            finally:
+                live_feed.bus.unsubscribe(subscription)
+
+        events = asyncio.run(scenario())
+
+        assert [name for name, _ in events] == ["solve", "leaderboard", "solve", "leaderboard"]
+        assert events[0][1]["first_blood"] is True and events[2][1]["first_blood"] is False
+        assert events[1][1]["rank"] == 1 and events[1][1]["previous_rank"] is None
+        assert events[3][1] == {
+            "user_id": second, "username": second[:20], "total_points": 50,
+            "solved_count": 1, "rank": 2, "previous_rank": None,
+        }
+
+    def test_poll_publishes_solves_from_other_workers(self, sql_db):
+        """Test: poll publica solves que no pasaron por este proceso, una sola vez."""
+        ctf, (user_id,) = self._setup(sql_db, count=1)
+        feed = LiveFeed(EventBus(), Leaderboard())
+        feed.board.reload(lambda: [])
+        assert feed.poll(sql_db) == 0  # Fija la marca de agua
+
+        sql_db.add(CTFSolveModel(ctf_id=str(ctf.id), user_id=user_id))
+        UserScoreLedger(sql_db).add_solve(user_id, ctf.points, datetime.utcnow())
+        sql_db.commit()
+
+        assert feed.poll(sql_db) == 1
+        assert feed.poll(sql_db) == 0
+        assert feed.board.rank(user_id) == 1
+        assert feed.bus.recent("solve")[0]["title"] == "Live"
@@ -0,0 +1,67 @@
+"""
+Tests para la paginación por cursor (keyset).
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from ...core.pagination import decode_cursor, encode_cursor, split_page
+from ...domain.entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus
+from ...infrastructure.persistence.repositories import CTFSqlRepository
+
+
+class TestCursorEncoding:
+    """Tests para codificación de cursores."""
+    
+    def test_roundtrip_datetime(self):
+        """Test: un cursor con datetime se decodifica igual."""
+        now = datetime(2026, 1, 28, 12, 30, 15, 123456)
+        cursor = decode_cursor(encode_cursor(now, "abc"))
+        
+        assert cursor.sort_value == now
+        assert cursor.id == "abc"
+    
+    def test_roundtrip_int(self):
+        """Test: un cursor con entero se decodifica igual."""
+        cursor = decode_cursor(encode_cursor(7, "xyz"))
+        
+        assert cursor.sort_value == 7
+        assert cursor.id == "xyz"
+    
+    def test_invalid_cursor(self):
+        """Test: un cursor corrupto lanza ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor("no-es-un-cursor")
+
+
+class TestCTFKeysetPagination:
+    """Tests para la paginación keyset del repositorio de CTFs."""
+    
+    def test_walk_all_pages(self, sql_db):
+        """Test: recorrer todas las páginas devuelve cada CTF una sola vez y en orden."""
+        repo = CTFSqlRepository(sql_db)
+        base = datetime(2026, 1, 1)
+        for i in range(7):
+            repo.save(CTF(
+                title=f"CTF {i}",
+                level=CTFLevel.EASY,
+                category=CTFCategory.WEB,
+                platform="HackTheBox",
+                status=CTFStatus.PUBLISHED,
+                # Dos CTFs comparten created_at para probar el desempate por id
+                created_at=base + timedelta(minutes=min(i, 5)),
+            ))
+        
+        seen = []
+        cursor = None
+        while True:
+            page = repo.get_published(limit=3, cursor=decode_cursor(cursor) if cursor else None)
+            page, cursor = split_page(page, 2, "created_at")
+            seen.extend(page)
+            if cursor is None:
+                break
+        
+        assert len(seen) == 7
+        assert len({c.id for c in seen}) == 7
+        keys = [(c.created_at, str(c.id)) for c in seen]
+        assert keys == sorted(keys, reverse=True)
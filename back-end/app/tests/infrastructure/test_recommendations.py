@@ -0,0 +1,70 @@
+"""
+Tests de las recomendaciones por co-solves y skills compartidas.
+"""
+
+from uuid import uuid4
+
+from ...domain.entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus
+from ...infrastructure.persistence.models import CTFSolveModel, UserModel
+from ...infrastructure.persistence.recommendations import CoSolveRecommender, RecommendationJob
+from ...infrastructure.persistence.repositories import CTFSqlRepository
+
+
+def _ctf(db, title, skills=(), solved_count=0):
+    ctf = CTF(title=title, level=CTFLevel.EASY, category=CTFCategory.WEB,
+              platform="HackTheBox", points=100, status=CTFStatus.PUBLISHED,
+              skills=list(skills), solved_count=solved_count)
+    CTFSqlRepository(db).save(ctf)
+    return str(ctf.id)
+
+
+def _solves(db, baskets):
+    for basket in baskets:
+        user_id = str(uuid4())
+        db.add(UserModel(id=user_id, email=f"{user_id}@test.com",
+                         username=user_id[:20], hashed_password="x"))
+        for ctf_id in basket:
+            db.add(CTFSolveModel(ctf_id=ctf_id, user_id=user_id))
+    db.commit()
+
+
+class TestCoSolveRecommender:
+    """Tests del cálculo de vecinos y de la recomendación."""
+
+    def test_neighbours_blend_co_solves_and_skills(self, sql_db):
+        """Test: los CTFs resueltos juntos son vecinos; sin solves cuentan las skills."""
+        sqli = _ctf(sql_db, "SQLi", skills=["sql"])
+        xss = _ctf(sql_db, "XSS", skills=["js"])
+        blind = _ctf(sql_db, "Blind SQLi", skills=["sql"])
+        _solves(sql_db, [[sqli, xss], [sqli, xss]])
+
+        neighbours = CoSolveRecommender(sql_db, skill_weight=0.3).compute()
+
+        assert neighbours[sqli][0] == (xss, 0.7)
+        assert neighbours[sqli][1] == (blind, 0.3)
+        assert [other for other, _ in neighbours[blind]] == [sqli]
+
+    def test_recommend_ranks_unsolved_and_fills_with_popular(self, sql_db):
+        """Test: se suman vecinos de lo resuelto, se excluye lo resuelto y se rellena con populares."""
+        first, second, third = (_ctf(sql_db, name) for name in ("A", "B", "C"))
+        popular = _ctf(sql_db, "Popular", solved_count=50)
+        _solves(sql_db, [[first, second], [first, second, third], [second, third]])
+        recommender = CoSolveRecommender(sql_db)
+        assert recommender.rebuild() > 0
+
+        result = recommender.recommend({first}, limit=3)
+
+        assert [item["id"] for item in result] == [second, third, popular]
+        assert [item["source"] for item in result] == ["similar", "similar", "popular"]
+        assert [item["id"] for item in recommender.recommend(set(), limit=1)] == [popular]
+
+    def test_job_skips_when_recently_computed(self, sql_db):
+        """Test: el job no recalcula si el último cálculo guardado es reciente."""
+        first, second = _ctf(sql_db, "A"), _ctf(sql_db, "B")
+        _solves(sql_db, [[first, second]])
+        job = RecommendationJob(interval=3600)
+
+        assert job.run_once(sql_db) == 2
+        assert job.run_once(sql_db) is None
+        assert job.run_once(sql_db, force=True) == 2
+        assert job.metrics()["runs"] == 2 and job.metrics()["skipped"] == 1
@@ -0,0 +1,101 @@
+"""
+Tests para el seguimiento de cambios y las escrituras de una sentencia.
+"""
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from ...domain.entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus
+from ...domain.entities.project import Project
+from ...infrastructure.persistence.repositories import CTFSqlRepository, ProjectSqlRepository
+
+
+@contextmanager
+def capture_statements(session):
+    """Captura las sentencias SQL emitidas sobre la conexión de la sesión."""
+    statements = []
+    engine = session.get_bind()
+
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_execute)
+
+
+def _writes(statements, table):
+    return [
+        (sql, params) for sql, params in statements
+        if sql.lstrip().upper().startswith(("INSERT", "UPDATE")) and f" {table}" in sql
+    ]
+
+
+class TestChangeTracking:
+    """Tests para el dirty tracking de entidades."""
+
+    def test_loaded_entity_tracks_in_place_changes(self, sql_db):
+        """Test: una entidad cargada detecta cambios, incluso en listas."""
+        repo = ProjectSqlRepository(sql_db)
+        repo.save(Project(title="Portfolio", description="Web personal"))
+        project = repo.get_all()[0]
+
+        assert project.changed_fields() == set()
+        project.technologies.append("FastAPI")
+        assert project.changed_fields() == {"technologies"}
+
+
+class TestSingleStatementSave:
+    """Tests para las escrituras emitidas por save."""
+
+    def test_increment_updates_only_changed_columns(self, sql_db):
+        """Test: incrementar solved_count emite un UPDATE con solo esas columnas."""
+        repo = CTFSqlRepository(sql_db)
+        repo.save(CTF(
+            title="Reto",
+            level=CTFLevel.EASY,
+            category=CTFCategory.WEB,
+            platform="HackTheBox",
+            status=CTFStatus.DRAFT,
+        ))
+        ctf = repo.get_all()[0]
+        ctf.increment_solved_count()
+
+        with capture_statements(sql_db) as statements:
+            repo.save(ctf)
+
+        writes = _writes(statements, "ctfs")
+        assert len(writes) == 1
+        sql, params = writes[0]
+        assert sql.lstrip().upper().startswith("UPDATE")
+        assert "title" not in sql and "skills" not in sql
+        assert "solved_count" in sql
+        assert not any(s.lstrip().upper().startswith("SELECT") and "FROM ctfs" in s for s, _ in statements)
+        assert repo.get_by_id(ctf.id).solved_count == 1
+
+    def test_unchanged_entity_writes_nothing(self, sql_db):
+        """Test: guardar una entidad sin cambios no emite sentencias."""
+        repo = ProjectSqlRepository(sql_db)
+        repo.save(Project(title="Portfolio", description="Web personal"))
+        project = repo.get_all()[0]
+
+        with capture_statements(sql_db) as statements:
+            repo.save(project)
+
+        assert statements == []
+
+    def test_new_entity_is_upserted(self, sql_db):
+        """Test: una entidad nueva se inserta con una sola sentencia upsert."""
+        repo = ProjectSqlRepository(sql_db)
+        project = Project(title="Portfolio", description="Web personal")
+
+        with capture_statements(sql_db) as statements:
+            repo.save(project)
+
+        writes = _writes(statements, "projects")
+        assert len(writes) == 1
+        assert "ON CONFLICT" in writes[0][0].upper()
+        assert project.changed_fields() == set()
@@ -0,0 +1,114 @@
+"""
+Tests del archivo de envíos antiguos (segmentos comprimidos por mes).
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from ...core.pagination import Cursor
+from ...domain.entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus
+from ...domain.entities.flag_submission import FlagSubmission
+from ...infrastructure.archive import Segment, SubmissionArchive
+from ...infrastructure.persistence.models import FlagSubmissionModel
+from ...infrastructure.persistence.repositories import (
+    CTFSqlRepository,
+    FlagSubmissionSqlRepository,
+)
+from ...infrastructure.persistence.submission_journal import submission_to_row
+from ...infrastructure.persistence.submission_retention import SubmissionRetention
+
+
+def _row(ctf_id, user_id, at, correct=False):
+    return submission_to_row(
+        FlagSubmission(ctf_id=ctf_id, user_id=user_id, flag="f" * 64, is_correct=correct,
+                       ip_address="10.0.0.1", submitted_at=at)
+    )
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return SubmissionArchive(str(tmp_path / "archive"))
+
+
+class TestSegments:
+    """Tests del formato de segmento."""
+
+    def test_round_trip_and_pruning(self, archive):
+        """Test: las filas se leen tal cual y un CTF ausente descarta el segmento."""
+        ctf_a, ctf_b, user = uuid4(), uuid4(), uuid4()
+        start = datetime(2025, 3, 1, 12, 0, 0, 123456)
+        rows = [_row(ctf_a if i % 2 else ctf_b, user if i % 3 else None, start + timedelta(minutes=i))
+                for i in range(50)]
+
+        [path] = archive.write(rows)
+
+        with Segment(path) as segment:
+            assert segment.rows == 50
+            assert segment.select(ctf_id=str(uuid4())) == []
+            assert "ctf_id" not in segment._cache  # Descartado solo con el diccionario
+            assert segment.read(range(50)) == sorted(rows, key=lambda r: r["submitted_at"])
+            positions = segment.select(ctf_id=str(ctf_a), user_id=str(user))
+        expected = [r for r in rows if r["ctf_id"] == str(ctf_a) and r["user_id"] == str(user)]
+        assert len(positions) == len(expected)
+
+
+class TestSubmissionArchive:
+    """Tests de consulta y compactación del archivo."""
+
+    def test_scan_partitions_by_month_and_paginates(self, archive):
+        """Test: una fila por mes, consulta por usuario del más reciente al más antiguo, con cursor."""
+        ctf, user = uuid4(), uuid4()
+        rows = [_row(ctf, user, datetime(2025, month, 10)) for month in range(1, 7)]
+        rows.append(_row(ctf, uuid4(), datetime(2025, 6, 11)))
+        archive.write(rows)
+
+        assert archive.months() == [f"2025-0{m}" for m in range(1, 7)]
+        page = archive.scan(user_id=user, limit=4)
+        assert [s.submitted_at.month for s in page] == [6, 5, 4, 3]
+        rest = archive.scan(user_id=user, cursor=Cursor(page[-1].submitted_at, str(page[-1].id)))
+        assert [s.submitted_at.month for s in rest] == [2, 1]
+        assert len(archive.scan(ctf_id=ctf, since=datetime(2025, 6, 1))) == 2
+
+    def test_compact_merges_segments_and_drops_duplicates(self, archive):
+        """Test: compactar deja un segmento por mes y sin IDs repetidos."""
+        ctf = uuid4()
+        rows = [_row(ctf, None, datetime(2025, 2, day)) for day in range(1, 11)]
+        archive.write(rows[:6])
+        archive.write(rows[4:])  # Archivado parcial repetido (job interrumpido)
+
+        assert len(archive.scan(ctf_id=ctf)) == 10
+        assert archive.compact() == {"months": 1, "segments": 2, "duplicates": 2}
+        assert len(archive.segments("2025-02")) == 1
+        assert archive.stats()["rows"] == 10
+
+
+class TestSubmissionRetention:
+    """Tests del job de retención."""
+
+    def test_moves_old_submissions_to_archive(self, sql_db, archive):
+        """Test: los envíos antiguos salen de la tabla y se consultan en el archivo."""
+        ctf = CTF(title="Old", level=CTFLevel.EASY, category=CTFCategory.WEB,
+                  platform="HTB", status=CTFStatus.PUBLISHED)
+        ctf.set_flag("flag{old}")
+        CTFSqlRepository(sql_db).save(ctf)
+        repo = FlagSubmissionSqlRepository(sql_db)
+        now = datetime.utcnow()
+        old = [FlagSubmission(ctf_id=ctf.id, flag="x", submitted_at=now - timedelta(days=40 + i))
+               for i in range(5)]
+        recent = FlagSubmission(ctf_id=ctf.id, flag="x", submitted_at=now - timedelta(days=1))
+        for submission in old + [recent]:
+            repo.save(submission)
+
+        retention = SubmissionRetention(sql_db, archive)
+        assert retention.count_older_than(30) == 5
+        result = retention.archive_older_than(30, batch_size=2)
+
+        assert (result["archived"], result["batches"]) == (5, 3)
+        assert [s.id for s in repo.get_by_ctf_id(ctf.id)] == [recent.id]
+        assert sql_db.query(FlagSubmissionModel).count() == 1
+        archived = archive.scan(ctf_id=ctf.id)
+        assert [s.id for s in archived] == [s.id for s in old]
+        with pytest.raises(ValueError):
+            retention.archive_older_than(0)
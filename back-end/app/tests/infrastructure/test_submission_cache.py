@@ -0,0 +1,119 @@
+"""
+Tests de la caché de intentos incorrectos repetidos.
+"""
+
+from uuid import UUID, uuid4
+
+import pytest
+
+from ...application.dto.ctf_dto import CTFUpdateDTO
+from ...application.use_cases import UpdateCTFUseCase
+from ...domain.entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus
+from ...domain.services.ctf_service import CTFService
+from ...domain.services.flag_service import FlagService
+from ...domain.services.submission_cache import SubmissionCache, submission_cache
+from ...infrastructure.persistence.models import (
+    FlagSubmissionModel,
+    FlagSubmissionRepeatModel,
+    UserModel,
+)
+from ...infrastructure.persistence.repositories import (
+    CTFSqlRepository,
+    FlagSubmissionSqlRepository,
+    WriteupSqlRepository,
+)
+
+
+def _setup(db, cache):
+    ctf_repo = CTFSqlRepository(db)
+    ctf = CTF(title="Repeat", level=CTFLevel.EASY, category=CTFCategory.WEB,
+              platform="HackTheBox", points=20, status=CTFStatus.PUBLISHED)
+    ctf.set_flag("flag{ok}")
+    ctf_repo.save(ctf)
+    user_id = str(uuid4())
+    db.add(UserModel(id=user_id, email=f"{user_id}@test.com", username=user_id[:20], hashed_password="x"))
+    db.commit()
+    service = FlagService(ctf_repo, FlagSubmissionSqlRepository(db), submission_cache=cache)
+    return ctf, UUID(user_id), service
+
+
+class TestSubmissionCache:
+    """Tests de la caché en memoria."""
+
+    def test_ttl_and_invalidation(self):
+        """Test: una entrada caduca con el TTL y al invalidar su CTF."""
+        ctf_id = uuid4()
+        cache = SubmissionCache(ttl=60)
+        cache.store(ctf_id, "h", ip_address="10.0.0.1")
+
+        assert cache.hit(ctf_id, "h", ip_address="10.0.0.1")
+        assert not cache.hit(ctf_id, "h", ip_address="10.0.0.2")
+        cache.invalidate_ctf(ctf_id)
+        assert not cache.hit(ctf_id, "h", ip_address="10.0.0.1")
+
+        expired = SubmissionCache(ttl=0)
+        expired.store(ctf_id, "h", ip_address="10.0.0.1")
+        assert not expired.hit(ctf_id, "h", ip_address="10.0.0.1")
+
+    def test_anonymous_without_ip_is_not_cached(self):
+        """Test: sin usuario ni IP no hay clave con la que agrupar."""
+        cache = SubmissionCache()
+        cache.store(uuid4(), "h")
+        assert cache.metrics()["entries"] == 0
+
+
+class TestRepeatedSubmissions:
+    """Tests de FlagService con la caché sobre SQL."""
+
+    def test_repeats_are_counted_not_inserted(self, sql_db):
+        """Test: repetir una flag incorrecta no añade filas; se agrega en un contador."""
+        cache = SubmissionCache(ttl=60, flush_interval=3600)
+        ctf, user_id, service = _setup(sql_db, cache)
+
+        for _ in range(5):
+            success, message, _ = service.submit_flag(ctf.id, "flag{nope}", user_id=user_id)
+            assert (success, message) == (False, "Flag incorrecta. Sigue intentando.")
+
+        assert sql_db.query(FlagSubmissionModel).count() == 1
+        assert cache.metrics()["pending_repeats"] == 4
+        assert service.flush_repeats() == 4
+        service.submit_flag(ctf.id, "flag{nope}", user_id=user_id)
+        assert service.flush_repeats() == 1
+
+        repeat = sql_db.query(FlagSubmissionRepeatModel).one()
+        assert (repeat.principal, repeat.repeat_count) == (f"user:{user_id}", 5)
+
+        # La flag correcta nunca se responde desde la caché
+        assert service.submit_flag(ctf.id, "flag{ok}", user_id=user_id)[0] is True
+
+    def test_update_ctf_flag_invalidates(self, sql_db):
+        """Test: si la flag cambia, el intento cacheado se vuelve a evaluar."""
+        ctf, user_id, service = _setup(sql_db, submission_cache)
+        service.submit_flag(ctf.id, "flag{new}", user_id=user_id)
+
+        ctf_repo = CTFSqlRepository(sql_db)
+        UpdateCTFUseCase(ctf_repo, WriteupSqlRepository(sql_db), CTFService(ctf_repo)).execute(
+            ctf.id, CTFUpdateDTO(flag="flag{new}")
+        )
+
+        assert service.submit_flag(ctf.id, "flag{new}", user_id=user_id)[0] is True
+
+    def test_deactivate_and_delete_invalidate(self, sql_db):
+        """Test: una repetición sobre un CTF desactivado o borrado recibe el error, no "incorrecta"."""
+        ctf, user_id, service = _setup(sql_db, submission_cache)
+        service.submit_flag(ctf.id, "flag{nope}", user_id=user_id)
+        ctf_repo = CTFSqlRepository(sql_db)
+
+        UpdateCTFUseCase(ctf_repo, WriteupSqlRepository(sql_db), CTFService(ctf_repo)).execute(
+            ctf.id, CTFUpdateDTO(is_active=False)
+        )
+        with pytest.raises(ValueError):
+            service.submit_flag(ctf.id, "flag{nope}", user_id=user_id)
+
+        UpdateCTFUseCase(ctf_repo, WriteupSqlRepository(sql_db), CTFService(ctf_repo)).execute(
+            ctf.id, CTFUpdateDTO(is_active=True)
+        )
+        service.submit_flag(ctf.id, "flag{nope}", user_id=user_id)
+        ctf_repo.delete(ctf.id)
+        with pytest.raises(LookupError):
+            service.submit_flag(ctf.id, "flag{nope}", user_id=user_id)
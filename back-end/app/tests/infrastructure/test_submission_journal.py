@@ -0,0 +1,114 @@
+"""
+Tests para el diario de intentos incorrectos (inserción por lotes).
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from ...domain.entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus
+from ...domain.entities.flag_submission import FlagSubmission
+from ...infrastructure.persistence.base import Base
+from ...infrastructure.persistence.models import FlagSubmissionModel
+from ...infrastructure.persistence.repositories import (
+    CTFSqlRepository,
+    FlagSubmissionSqlRepository,
+)
+from ...infrastructure.persistence.submission_journal import (
+    SubmissionJournal,
+    _encode,
+    submission_to_row,
+)
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    # Base en fichero: el hilo del diario usa sus propias conexiones
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'journal.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def ctf(session_factory):
+    db = session_factory()
+    ctf = CTF(
+        title="Journal",
+        level=CTFLevel.EASY,
+        category=CTFCategory.WEB,
+        platform="HackTheBox",
+        status=CTFStatus.PUBLISHED,
+    )
+    ctf.set_flag("flag{ok}")
+    CTFSqlRepository(db).save(ctf)
+    db.close()
+    return CTFSqlRepository(session_factory()).get_for_submission(ctf.id)
+
+
+def _attempt(ctf, correct=False):
+    return FlagSubmission(ctf_id=ctf.id, flag="x" * 64, is_correct=correct)
+
+
+def _count(session_factory) -> int:
+    db = session_factory()
+    try:
+        return db.query(FlagSubmissionModel).count()
+    finally:
+        db.close()
+
+
+class TestSubmissionJournal:
+    """Tests del diario de intentos."""
+
+    def test_incorrect_attempts_are_batched(self, session_factory, ctf):
+        """Test: los incorrectos se encolan y se insertan en pocos lotes."""
+        journal = SubmissionJournal(session_factory, batch_size=50, flush_interval=0.05)
+        journal.start()
+        repo = FlagSubmissionSqlRepository(session_factory(), journal=journal)
+        try:
+            for _ in range(120):
+                repo.record_attempt(_attempt(ctf), ctf)
+            assert journal.flush()
+        finally:
+            journal.stop()
+
+        metrics = journal.metrics()
+        assert (metrics["queued"], metrics["flushed"], metrics["pending"]) == (120, 120, 0)
+        assert metrics["batches"] < 120
+        assert _count(session_factory) == 120
+
+    def test_correct_and_fallback_are_synchronous(self, session_factory, ctf):
+        """Test: un acierto, o un diario parado, escriben antes de responder."""
+        journal = SubmissionJournal(session_factory)
+        repo = FlagSubmissionSqlRepository(session_factory(), journal=journal)
+
+        repo.record_attempt(_attempt(ctf), ctf)  # Diario sin arrancar
+        repo.record_attempt(_attempt(ctf, correct=True), ctf)
+
+        assert _count(session_factory) == 2
+        assert journal.metrics()["queued"] == 0
+
+    def test_durable_journal_replays_on_start(self, session_factory, ctf, tmp_path):
+        """Test: un diario de un proceso caído se reinserta al arrancar (sin duplicar)."""
+        path = str(tmp_path / "attempts")
+        pending = [_attempt(ctf) for _ in range(3)]
+        FlagSubmissionSqlRepository(session_factory()).save(pending[0])  # Ya insertado
+        with open(f"{path}.999999", "w", encoding="utf-8") as stale:
+            for submission in pending:
+                stale.write(_encode(submission_to_row(submission)))
+            stale.write('{"id": "a medio escrib')
+
+        journal = SubmissionJournal(session_factory, flush_interval=0.05, path=path)
+        assert journal.start() == 3
+        try:
+            assert journal.append(_attempt(ctf)) is True
+            assert journal.flush()
+        finally:
+            journal.stop()
+
+        assert _count(session_factory) == 4
+        assert not list(tmp_path.glob("attempts.*"))
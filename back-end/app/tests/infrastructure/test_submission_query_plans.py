@@ -0,0 +1,31 @@
+"""
+Tests de planes de consulta: el repositorio de envíos no recorre tablas enteras.
+
+Usa el harness de ``app/tests/query_plans.py`` (el mismo que el benchmark
+``benchmarks/bench_submission_queries.py``) con una base pequeña.
+"""
+
+from sqlalchemy import text
+
+from ..query_plans import check_plans, explain, full_scans, seed
+
+
+class TestSubmissionQueryPlans:
+    """EXPLAIN QUERY PLAN de las consultas de flag_submissions."""
+
+    def test_repository_queries_use_indexes(self, sql_db):
+        """Test: ninguna consulta del repositorio hace SCAN completo."""
+        sample = seed(sql_db, rows=3000, ctfs=20, users=100)
+
+        scans = check_plans(sql_db, sample)
+
+        assert scans and not any(scans.values()), scans
+
+    def test_detects_full_scan(self, sql_db):
+        """Test: el harness detecta una consulta sin índice."""
+        plans = explain(
+            sql_db,
+            lambda: sql_db.execute(text("SELECT id FROM flag_submissions WHERE flag = 'x'")).all(),
+        )
+
+        assert full_scans(plans[0][1]) == ["SCAN flag_submissions"]
@@ -0,0 +1,157 @@
+"""
+Harness de planes de consulta sobre flag_submissions.
+
+Siembra una base SQLite con envíos, ejecuta cada consulta del repositorio
+de envíos y comprueba con EXPLAIN QUERY PLAN que ninguna recorre una tabla
+entera sin índice. Lo usan los tests de planes (con una base pequeña) y
+``benchmarks/bench_submission_queries.py`` (un millón de filas y tiempos).
+"""
+
+import random
+import re
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, NamedTuple, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ..core.pagination import Cursor
+from ..infrastructure.leaderboard import leaderboard
+from ..infrastructure.persistence.models import (
+    CTFModel,
+    CTFSolveModel,
+    FlagSubmissionModel,
+    UserModel,
+    UserScoreModel,
+)
+from ..infrastructure.persistence.repositories import FlagSubmissionSqlRepository
+from ..infrastructure.persistence.user_scores import UserScoreLedger
+
+
+BATCH_SIZE = 20000
+
+# "SCAN tabla" sin "USING ... INDEX": recorrido completo de la tabla
+_FULL_SCAN = re.compile(r"^SCAN (\w+)(?: AS \w+)?$")
+
+
+class Sample(NamedTuple):
+    """IDs reales de la base sembrada con los que lanzar las consultas."""
+    ctf_id: UUID
+    user_id: UUID
+    cursor: Cursor
+
+
+def seed(session: Session, rows: int, ctfs: int = 200, users: int = 5000, seed_value: int = 42) -> Sample:
+    """Siembra CTFs, usuarios y ``rows`` envíos (~10% correctos) con sus solves y puntuaciones."""
+    rng = random.Random(seed_value)
+    start = datetime(2025, 1, 1)
+    span_minutes = 365 * 24 * 60
+
+    ctf_ids = [str(uuid4()) for _ in range(ctfs)]
+    points = {ctf_id: rng.choice((10, 20, 30, 40)) for ctf_id in ctf_ids}
+    session.execute(CTFModel.__table__.insert(), [
+        {"id": ctf_id, "title": f"CTF {i}", "level": "easy", "category": "web",
+         "platform": "HTB", "points": points[ctf_id], "status": "published"}
+        for i, ctf_id in enumerate(ctf_ids)
+    ])
+    user_ids = [str(uuid4()) for _ in range(users)]
+    session.execute(UserModel.__table__.insert(), [
+        {"id": user_id, "email": f"u{i}@bench", "username": f"user{i}", "hashed_password": "x"}
+        for i, user_id in enumerate(user_ids)
+    ])
+
+    solves: Dict[Tuple[str, str], datetime] = {}
+    inserted = 0
+    while inserted < rows:
+        batch = []
+        for _ in range(min(BATCH_SIZE, rows - inserted)):
+            ctf_id = rng.choice(ctf_ids)
+            user_id = rng.choice(user_ids)
+            correct = rng.random() < 0.1
+            at = start + timedelta(minutes=rng.randrange(span_minutes), seconds=rng.randrange(60))
+            batch.append({"id": str(uuid4()), "ctf_id": ctf_id, "user_id": user_id,
+                          "flag": "0" * 64, "is_correct": correct, "ip_address": "10.0.0.1",
+                          "submitted_at": at})
+            if correct and ((ctf_id, user_id) not in solves or at < solves[(ctf_id, user_id)]):
+                solves[(ctf_id, user_id)] = at
+        session.execute(FlagSubmissionModel.__table__.insert(), batch)
+        inserted += len(batch)
+
+    session.execute(CTFSolveModel.__table__.insert(), [
+        {"ctf_id": ctf_id, "user_id": user_id, "solved_at": at}
+        for (ctf_id, user_id), at in solves.items()
+    ])
+    session.commit()
+    scores = UserScoreLedger(session).compute()
+    if scores:
+        session.execute(UserScoreModel.__table__.insert(), [
+            {"user_id": user_id, "total_points": total, "solved_count": solved, "last_solve_at": last}
+            for user_id, (total, solved, last) in scores.items()
+        ])
+    session.commit()
+
+    middle = session.query(FlagSubmissionModel.submitted_at, FlagSubmissionModel.id).filter(
+        FlagSubmissionModel.ctf_id == ctf_ids[0]
+    ).order_by(FlagSubmissionModel.submitted_at.desc()).offset(20).first()
+    cursor = Cursor(sort_value=middle.submitted_at, id=middle.id) if middle else Cursor(start, "")
+    return Sample(UUID(ctf_ids[0]), UUID(user_ids[0]), cursor)
+
+
+def repository_queries(repo: FlagSubmissionSqlRepository, sample: Sample) -> List[Tuple[str, Callable[[], object]]]:
+    """Consultas de lectura del repositorio de envíos, con parámetros realistas."""
+    return [
+        ("get_by_ctf_id", lambda: repo.get_by_ctf_id(sample.ctf_id, limit=20)),
+        ("get_by_ctf_id (offset)", lambda: repo.get_by_ctf_id(sample.ctf_id, skip=200, limit=20)),
+        ("get_by_ctf_id (cursor)", lambda: repo.get_by_ctf_id(sample.ctf_id, limit=20, cursor=sample.cursor)),
+        ("get_successful_by_ctf_id", lambda: repo.get_successful_by_ctf_id(sample.ctf_id)),
+        ("get_by_user_id", lambda: repo.get_by_user_id(sample.user_id, limit=20)),
+        ("get_recent_submissions", lambda: repo.get_recent_submissions(limit=10)),
+        ("get_recent_submissions (ctf)", lambda: repo.get_recent_submissions(ctf_id=sample.ctf_id, limit=10)),
+        ("has_user_solved", lambda: repo.has_user_solved(sample.ctf_id, sample.user_id)),
+        ("count_solvers", lambda: repo.count_solvers(sample.ctf_id)),
+        ("get_leaderboard", lambda: repo.get_leaderboard(limit=10)),
+        ("get_user_stats", lambda: repo.get_user_stats(sample.user_id)),
+        ("stream_rows (ctf)", lambda: sum(1 for _ in repo.stream_rows(ctf_id=sample.ctf_id))),
+        ("stream_rows (ip, día)", lambda: sum(1 for _ in repo.stream_rows(
+            ip_address="10.0.0.1", since=datetime(2025, 6, 1), until=datetime(2025, 6, 2)))),
+    ]
+
+
+def explain(session: Session, call: Callable[[], object]) -> List[Tuple[str, List[str]]]:
+    """Ejecuta ``call`` y devuelve [(sentencia, pasos del plan)] de cada SELECT emitido."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    connection = session.connection().connection.driver_connection
+    plans = []
+    for statement, parameters in statements:
+        rows = connection.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+        plans.append((statement, [row[-1] for row in rows]))
+    return plans
+
+
+def full_scans(plan: List[str]) -> List[str]:
+    """Pasos del plan que recorren una tabla entera sin índice."""
+    return [step for step in plan if _FULL_SCAN.match(step)]
+
+
+def check_plans(session: Session, sample: Sample) -> Dict[str, List[str]]:
+    """{consulta: pasos con SCAN completo} para cada consulta del repositorio."""
+    repo = FlagSubmissionSqlRepository(session)
+    # El ranking se sirve de memoria; se carga antes para no medir la carga
+    leaderboard.reload(UserScoreLedger(session).load_all)
+    return {
+        name: [scan for _, plan in explain(session, call) for scan in full_scans(plan)]
+        for name, call in repository_queries(repo, sample)
+    }
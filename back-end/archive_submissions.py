@@ -0,0 +1,64 @@
+"""
+Job de retención de flag_submissions: archiva los envíos antiguos en disco.
+
+Uso:
+    # Mover al archivo los envíos con más de FLAG_SUBMISSION_RETENTION_DAYS días:
+    python archive_submissions.py
+
+    # Con otra antigüedad, y fusionando después los segmentos de cada mes:
+    python archive_submissions.py --days 90 --compact
+
+    # Solo contar lo que se archivaría:
+    python archive_submissions.py --dry-run
+
+Pensado para ejecutarse periódicamente (cron). Los segmentos se guardan en
+FLAG_SUBMISSION_ARCHIVE_DIR, un directorio por mes, y se consultan con
+GET /api/v1/ctfs/admin/submissions/archive.
+"""
+import argparse
+import sys
+from dotenv import load_dotenv
+
+# Cargar variables de entorno antes de importar la configuración
+load_dotenv()
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.infrastructure.archive import submission_archive
+from app.infrastructure.persistence.submission_retention import SubmissionRetention
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Archiva los envíos de flags antiguos.")
+    parser.add_argument("--days", type=int, default=settings.FLAG_SUBMISSION_RETENTION_DAYS,
+                        help="Antigüedad mínima (días) de los envíos a archivar")
+    parser.add_argument("--batch-size", type=int, default=50000, help="Filas por lote/segmento")
+    parser.add_argument("--compact", action="store_true", help="Fusiona después los segmentos de cada mes")
+    parser.add_argument("--dry-run", action="store_true", help="Solo cuenta los envíos a archivar")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        retention = SubmissionRetention(db, submission_archive)
+        if args.dry_run:
+            print(f"Envíos a archivar: {retention.count_older_than(args.days)}")
+            return 0
+        result = retention.archive_older_than(args.days, batch_size=args.batch_size)
+    finally:
+        db.close()
+
+    print(f"Corte: {result['cutoff']:%Y-%m-%d %H:%M:%S} UTC")
+    print(f"✅ Archivados {result['archived']} envíos en {result['segments']} segmentos")
+    if args.compact:
+        compacted = submission_archive.compact()
+        print(f"✅ Compactados {compacted['segments']} segmentos de {compacted['months']} meses "
+              f"({compacted['duplicates']} duplicados eliminados)")
+
+    stats = submission_archive.stats()
+    print(f"Archivo: {stats['rows']} envíos, {stats['segments']} segmentos, "
+          f"{stats['bytes'] / 1024 / 1024:.1f} MiB en {settings.FLAG_SUBMISSION_ARCHIVE_DIR}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3 @@
+"""
+Benchmarks del backend (se ejecutan manualmente, no forman parte de los tests).
+"""
@@ -0,0 +1,82 @@
+"""
+Benchmark: latencia de una petición autenticada (GET /auth/me).
+
+Lanza peticiones con un token válido a través de la aplicación completa
+(TestClient, SQLite en memoria) con la caché de usuarios verificados
+desactivada y activada, y mide la latencia media, p95 y las sentencias
+SQL por petición. Con la caché, solo la primera petición de cada token
+carga el usuario.
+
+Uso (desde back-end/):
+    SECRET_KEY=... python -m benchmarks.bench_auth [peticiones]
+"""
+
+import statistics
+import sys
+import time
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.domain.entities.user import User
+from app.domain.services.principal_cache import principal_cache
+from app.infrastructure.persistence import models  # noqa: F401 - registra modelos
+from app.infrastructure.persistence.base import Base
+from app.infrastructure.persistence.repositories import UserSqlRepository
+from app.infrastructure.security.jwt_provider import JWTProvider
+from app.main import app
+
+
+def run(requests: int):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    user = UserSqlRepository(session).save(User(email="bench@test.com", username="bench", hashed_password="x"))
+    token = JWTProvider().create_access_token(str(user.id))
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(1))
+
+    def override_get_db():
+        yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    path = f"{settings.API_V1_PREFIX}/auth/me"
+    headers = {"Authorization": f"Bearer {token}"}
+    results = {}
+    ttl = principal_cache.ttl
+    try:
+        with TestClient(app) as client:
+            for label, cache_ttl in (("sin caché", 0), ("con caché", ttl or 30.0)):
+                principal_cache.ttl = cache_ttl
+                principal_cache.clear()
+                client.get(path, headers=headers)  # Calentamiento
+                statements.clear()
+                latencies = []
+                for _ in range(requests):
+                    started = time.perf_counter()
+                    response = client.get(path, headers=headers)
+                    latencies.append((time.perf_counter() - started) * 1000)
+                    assert response.status_code == 200, response.text
+                results[label] = (latencies, len(statements) / requests)
+    finally:
+        principal_cache.ttl = ttl
+        app.dependency_overrides.clear()
+        session.close()
+        engine.dispose()
+    return results
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for label, (latencies, per_request) in run(requests).items():
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        print(f"{label:<10} {requests} peticiones: media {statistics.mean(latencies):.3f} ms, "
+              f"p95 {p95:.3f} ms, {per_request:.2f} sentencias SQL por petición")
+
+
+if __name__ == "__main__":
+    main()
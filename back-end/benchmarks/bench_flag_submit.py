@@ -0,0 +1,145 @@
+"""
+Benchmark: coste de un envío de flag (sentencias, commits y envíos/s).
+
+Compara el flujo anterior del endpoint (cargar el CTF completo con sus
+adjuntos dos veces, comprobar el solve, guardar el intento con un commit
+y luego marcar/incrementar el CTF con otro commit) frente a
+FlagService.submit_flag (proyección, EXISTS e inserción + incremento
+atómico en un único commit).
+
+Uso (desde back-end/):
+    SECRET_KEY=... python -m benchmarks.bench_flag_submit [envíos]
+"""
+
+import hashlib
+import sys
+import time
+from typing import Callable, Dict, List
+from uuid import UUID, uuid4
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.domain.entities.attachment import Attachment, AttachmentType
+from app.domain.entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus
+from app.domain.entities.flag_submission import FlagSubmission
+from app.domain.services.flag_service import FlagService
+from app.infrastructure.persistence import models  # noqa: F401 - registra modelos
+from app.infrastructure.persistence.base import Base
+from app.infrastructure.persistence.repositories import (
+    CTFSqlRepository,
+    FlagSubmissionSqlRepository,
+)
+
+
+def _make_session():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+
+def _new_ctf() -> CTF:
+    ctf = CTF(
+        title="Stack Smash",
+        level=CTFLevel.HARD,
+        category=CTFCategory.PWN,
+        platform="HackTheBox",
+        description="Desbordamiento de buffer clásico " * 20,
+        points=40,
+        skills=["Buffer Overflow", "ROP", "GDB", "pwntools"],
+        status=CTFStatus.PUBLISHED,
+    )
+    ctf.set_flag("flag{ok}")
+    ctf.attachments = [
+        Attachment(name=f"binary-{i}", type=AttachmentType.FILE, url=f"/uploads/binary-{i}")
+        for i in range(3)
+    ]
+    return ctf
+
+
+def run(submissions: int = 500) -> List[Dict[str, object]]:
+    engine, session = _make_session()
+    ctf_repo = CTFSqlRepository(session)
+    submission_repo = FlagSubmissionSqlRepository(session)
+    service = FlagService(ctf_repo, submission_repo)
+    ctf = ctf_repo.save(_new_ctf())
+
+    counters = {"statements": 0, "commits": 0}
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        counters["statements"] += 1
+
+    def on_commit(conn):
+        counters["commits"] += 1
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    event.listen(engine, "commit", on_commit)
+
+    def legacy(flag: str, user_id: UUID) -> None:
+        # Lo que hacía el endpoint antes: get_by_id en el router y en el servicio
+        current = ctf_repo.get_by_id(ctf.id)
+        current = ctf_repo.get_by_id(ctf.id)
+        if submission_repo.has_user_solved(ctf.id, user_id):
+            return
+        is_correct = current.verify_flag(flag)
+        submission_repo.save(FlagSubmission(
+            ctf_id=ctf.id,
+            user_id=user_id,
+            flag=hashlib.sha256(flag.encode()).hexdigest(),
+            is_correct=is_correct,
+        ))
+        if is_correct:
+            if not current.solved:
+                current.mark_as_solved()
+            current.increment_solved_count()
+            ctf_repo.save(current)
+
+    def fast_path(flag: str, user_id: UUID) -> None:
+        service.submit_flag(ctf.id, flag, user_id=user_id)
+
+    def scenario(name: str, mode: str, step: Callable[[str, UUID], None]) -> Dict[str, object]:
+        counters.update(statements=0, commits=0)
+        started = time.perf_counter()
+        for i in range(submissions):
+            # Uno de cada cuatro envíos es correcto, cada uno de un usuario distinto
+            step("flag{ok}" if i % 4 == 0 else f"flag{{nope-{uuid4().hex[:8]}}}", uuid4())
+        elapsed = time.perf_counter() - started
+        return {
+            "scenario": name,
+            "mode": mode,
+            "statements/submit": counters["statements"] / submissions,
+            "commits/submit": counters["commits"] / submissions,
+            "submits/s": submissions / elapsed,
+        }
+
+    results = [
+        scenario("25% correctos", "legacy", legacy),
+        scenario("25% correctos", "fast path", fast_path),
+    ]
+
+    event.remove(engine, "before_cursor_execute", on_execute)
+    event.remove(engine, "commit", on_commit)
+    session.close()
+    engine.dispose()
+    return results
+
+
+def main() -> None:
+    submissions = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    header = f"{'escenario':<16} {'modo':<10} {'sent/envío':>11} {'commits/envío':>14} {'envíos/s':>10}"
+    print(header)
+    print("-" * len(header))
+    for row in run(submissions):
+        print(
+            f"{row['scenario']:<16} {row['mode']:<10} {row['statements/submit']:>11.2f} "
+            f"{row['commits/submit']:>14.2f} {row['submits/s']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
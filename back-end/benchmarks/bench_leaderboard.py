@@ -0,0 +1,157 @@
+"""
+Benchmark: top-N y posición de un usuario en el leaderboard.
+
+Compara las consultas anteriores (GROUP BY sobre todos los aciertos de
+flag_submissions en cada petición; la posición recorriendo en Python la
+lista de totales de todos los usuarios) frente al ranking en memoria
+construido desde user_scores.
+
+Uso (desde back-end/):
+    SECRET_KEY=... python -m benchmarks.bench_leaderboard [usuarios]
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+from uuid import uuid4
+
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.infrastructure.leaderboard import leaderboard
+from app.infrastructure.persistence import models  # noqa: F401 - registra modelos
+from app.infrastructure.persistence.base import Base
+from app.infrastructure.persistence.models import (
+    CTFModel,
+    CTFSolveModel,
+    FlagSubmissionModel,
+    UserModel,
+    UserScoreModel,
+)
+from app.infrastructure.persistence.repositories import FlagSubmissionSqlRepository
+from app.infrastructure.persistence.user_scores import UserScoreLedger
+
+
+SOLVES_PER_USER = 5
+CTFS = 50
+
+
+def _seed(session, users: int) -> List[str]:
+    rng = random.Random(42)
+    start = datetime(2026, 1, 1)
+    ctfs = [
+        {"id": str(uuid4()), "title": f"CTF {i}", "level": "easy", "category": "web",
+         "platform": "HTB", "points": rng.choice((10, 20, 30, 40)), "status": "published"}
+        for i in range(CTFS)
+    ]
+    session.execute(CTFModel.__table__.insert(), ctfs)
+
+    user_rows, submissions, solves = [], [], []
+    for i in range(users):
+        user_id = str(uuid4())
+        user_rows.append({"id": user_id, "email": f"u{i}@bench", "username": f"user{i}",
+                          "hashed_password": "x"})
+        for ctf in rng.sample(ctfs, SOLVES_PER_USER):
+            at = start + timedelta(minutes=rng.randrange(500000))
+            submissions.append({"id": str(uuid4()), "ctf_id": ctf["id"], "user_id": user_id,
+                                "flag": "x", "is_correct": True, "submitted_at": at})
+            solves.append({"ctf_id": ctf["id"], "user_id": user_id, "solved_at": at})
+    session.execute(UserModel.__table__.insert(), user_rows)
+    session.execute(FlagSubmissionModel.__table__.insert(), submissions)
+    session.execute(CTFSolveModel.__table__.insert(), solves)
+    session.commit()
+
+    ledger = UserScoreLedger(session)
+    session.execute(UserScoreModel.__table__.insert(), [
+        {"user_id": user_id, "total_points": points, "solved_count": solved, "last_solve_at": last}
+        for user_id, (points, solved, last) in ledger.compute().items()
+    ])
+    session.commit()
+    return [row["id"] for row in user_rows]
+
+
+def _legacy_top(session, limit: int):
+    subquery = (
+        session.query(
+            FlagSubmissionModel.user_id,
+            func.sum(CTFModel.points).label("total_points"),
+            func.count(func.distinct(FlagSubmissionModel.ctf_id)).label("solved_count"),
+        )
+        .join(CTFModel, FlagSubmissionModel.ctf_id == CTFModel.id)
+        .filter(FlagSubmissionModel.is_correct == True, FlagSubmissionModel.user_id.isnot(None))
+        .group_by(FlagSubmissionModel.user_id)
+        .subquery()
+    )
+    return (
+        session.query(UserModel.id, UserModel.username, subquery.c.total_points)
+        .join(subquery, UserModel.id == subquery.c.user_id)
+        .order_by(subquery.c.total_points.desc())
+        .limit(limit)
+        .all()
+    )
+
+
+def _legacy_rank(session, user_id: str):
+    rows = (
+        session.query(FlagSubmissionModel.user_id, func.sum(CTFModel.points))
+        .join(CTFModel, FlagSubmissionModel.ctf_id == CTFModel.id)
+        .filter(FlagSubmissionModel.is_correct == True, FlagSubmissionModel.user_id.isnot(None))
+        .group_by(FlagSubmissionModel.user_id)
+        .order_by(func.sum(CTFModel.points).desc())
+        .all()
+    )
+    for rank, row in enumerate(rows, start=1):
+        if row.user_id == user_id:
+            return rank
+    return None
+
+
+def run(users: int = 5000, repeat: int = 20) -> List[Dict[str, object]]:
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    user_ids = _seed(session, users)
+
+    started = time.perf_counter()
+    leaderboard.reload(UserScoreLedger(session).load_all)
+    load_ms = (time.perf_counter() - started) * 1000
+
+    rng = random.Random(1)
+    probes = [rng.choice(user_ids) for _ in range(repeat)]
+
+    def timed(name: str, mode: str, step: Callable[[int], object]) -> Dict[str, object]:
+        started = time.perf_counter()
+        for i in range(repeat):
+            step(i)
+        return {"op": name, "mode": mode, "ms/op": (time.perf_counter() - started) / repeat * 1000}
+
+    results = [
+        timed("top 10", "legacy", lambda i: _legacy_top(session, 10)),
+        timed("top 10", "memoria", lambda i: leaderboard.top(10)),
+        timed("rank usuario", "legacy", lambda i: _legacy_rank(session, probes[i])),
+        timed("rank usuario", "memoria", lambda i: leaderboard.rank(probes[i])),
+        {"op": "carga inicial", "mode": "memoria", "ms/op": load_ms},
+    ]
+    # Sanidad: el repositorio sirve desde el ranking cargado
+    assert FlagSubmissionSqlRepository(session).get_leaderboard(1)
+
+    session.close()
+    engine.dispose()
+    return results
+
+
+def main() -> None:
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    header = f"{'operación':<16} {'modo':<8} {'ms/op':>10}"
+    print(f"{users} usuarios, {SOLVES_PER_USER} solves por usuario")
+    print(header)
+    print("-" * len(header))
+    for row in run(users):
+        print(f"{row['op']:<16} {row['mode']:<8} {row['ms/op']:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark: difusión del feed en vivo a muchos clientes.
+
+Conecta N suscriptores al bus (cada uno con su tarea que consume la cola,
+como el generador del endpoint SSE) y publica una ráfaga de solves. Mide
+el coste de ``publish`` y el tiempo hasta que todos los clientes han
+recibido todos los eventos; los eventos se serializan una vez, no una por
+cliente.
+
+Uso (desde back-end/):
+    SECRET_KEY=... python -m benchmarks.bench_live_feed [clientes] [eventos]
+"""
+
+import asyncio
+import sys
+import time
+from datetime import datetime
+
+from app.infrastructure.events import EventBus
+
+
+async def _consume(subscription, expected: int) -> None:
+    for _ in range(expected):
+        await subscription.queue.get()
+
+
+async def run(clients: int, events: int):
+    bus = EventBus(max_queue=events, max_subscribers=clients)
+    subscriptions = [bus.subscribe() for _ in range(clients)]
+    consumers = [asyncio.create_task(_consume(s, events)) for s in subscriptions]
+
+    started = time.perf_counter()
+    for n in range(events):
+        bus.publish("solve", {
+            "ctf_id": f"ctf-{n % 50}",
+            "title": "Benchmark",
+            "points": 100,
+            "user_id": f"user-{n}",
+            "username": f"player{n}",
+            "solved_at": datetime.utcnow(),
+            "first_blood": False,
+        })
+    publish_s = time.perf_counter() - started
+    await asyncio.gather(*consumers)
+    delivered_s = time.perf_counter() - started
+    return {"publish_s": publish_s, "delivered_s": delivered_s, **bus.metrics()}
+
+
+def main() -> None:
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    events = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    result = asyncio.run(run(clients, events))
+    frames = clients * events
+    print(f"{clients} clientes x {events} eventos = {frames} tramas")
+    print(f"publish: {result['publish_s'] * 1000:.1f} ms "
+          f"({result['publish_s'] / events * 1000:.2f} ms por evento)")
+    print(f"entregadas: {result['delivered']} en {result['delivered_s'] * 1000:.1f} ms "
+          f"({frames / result['delivered_s']:,.0f} tramas/s), descartados: {result['dropped']}")
+
+
+if __name__ == "__main__":
+    main()
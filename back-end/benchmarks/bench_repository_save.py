@@ -0,0 +1,149 @@
+"""
+Benchmark: sentencias y bytes escritos por save() en los repositorios SQL.
+
+Compara, para cada escenario, la escritura con seguimiento de cambios
+(UPDATE de las columnas modificadas) frente a reescribir la fila completa
+(upsert con todas las columnas, equivalente al save anterior sin el SELECT).
+
+Uso (desde back-end/):
+    SECRET_KEY=... python -m benchmarks.bench_repository_save [iteraciones]
+"""
+
+import sys
+import time
+from typing import Callable, Dict, List
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.domain.entities.ctf import CTF, CTFLevel, CTFCategory, CTFStatus
+from app.domain.entities.project import Project
+from app.infrastructure.persistence import models  # noqa: F401 - registra modelos
+from app.infrastructure.persistence.base import Base
+from app.infrastructure.persistence.models import CTFModel, ProjectModel
+from app.infrastructure.persistence.repositories import CTFSqlRepository, ProjectSqlRepository
+from app.infrastructure.persistence.repositories.ctf_sql_repo import _CTF_COLUMNS
+from app.infrastructure.persistence.repositories.project_sql_repo import _PROJECT_COLUMNS
+from app.infrastructure.persistence.writes import entity_row, upsert_row
+
+
+def _make_session():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+
+def _new_ctf() -> CTF:
+    return CTF(
+        title="Stack Smash",
+        level=CTFLevel.HARD,
+        category=CTFCategory.PWN,
+        platform="HackTheBox",
+        description="Desbordamiento de buffer clásico " * 20,
+        points=40,
+        skills=["Buffer Overflow", "ROP", "GDB", "pwntools"],
+        hints=["Revisa el tamaño del buffer", "NX está activo"],
+        status=CTFStatus.PUBLISHED,
+    )
+
+
+def run(iterations: int = 200) -> List[Dict[str, object]]:
+    engine, session = _make_session()
+    ctf_repo = CTFSqlRepository(session)
+    project_repo = ProjectSqlRepository(session)
+
+    ctf = ctf_repo.save(_new_ctf())
+    project = project_repo.save(Project(title="Portfolio", description="Web personal " * 30))
+
+    counters = {"statements": 0, "bytes": 0}
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        counters["statements"] += 1
+        if statement.lstrip().upper().startswith(("INSERT", "UPDATE")):
+            rows = parameters if executemany else [parameters]
+            counters["bytes"] += sum(
+                len(str(value).encode()) for row in rows for value in row if value is not None
+            )
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+
+    def scenario(name: str, mode: str, step: Callable[[], None]) -> Dict[str, object]:
+        counters.update(statements=0, bytes=0)
+        started = time.perf_counter()
+        for _ in range(iterations):
+            step()
+        elapsed = time.perf_counter() - started
+        return {
+            "scenario": name,
+            "mode": mode,
+            "statements/save": counters["statements"] / iterations,
+            "bytes/save": counters["bytes"] / iterations,
+            "us/save": elapsed / iterations * 1e6,
+        }
+
+    def write_full_row(entity, table, columns) -> None:
+        # Lo que escribía el save anterior: todas las columnas de la fila
+        upsert_row(session, table, entity_row(entity, ("id", *columns)))
+        session.commit()
+        entity.mark_persisted()
+
+    def increment(full: bool):
+        def step():
+            ctf.increment_solved_count()
+            if full:
+                write_full_row(ctf, CTFModel.__table__, _CTF_COLUMNS)
+            else:
+                ctf_repo.save(ctf)
+        return step
+
+    def feature(full: bool):
+        def step():
+            project.set_featured(not project.featured)
+            if full:
+                write_full_row(project, ProjectModel.__table__, _PROJECT_COLUMNS)
+            else:
+                project_repo.save(project)
+        return step
+
+    def noop(full: bool):
+        def step():
+            if full:
+                write_full_row(project, ProjectModel.__table__, _PROJECT_COLUMNS)
+            else:
+                project_repo.save(project)
+        return step
+
+    results = []
+    for label, factory in (
+        ("ctf.increment_solved_count", increment),
+        ("project.set_featured", feature),
+        ("project sin cambios", noop),
+    ):
+        results.append(scenario(label, "tracked", factory(False)))
+        results.append(scenario(label, "full row", factory(True)))
+
+    event.remove(engine, "before_cursor_execute", on_execute)
+    session.close()
+    engine.dispose()
+    return results
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    header = f"{'escenario':<30} {'modo':<9} {'sent/save':>10} {'bytes/save':>11} {'us/save':>9}"
+    print(header)
+    print("-" * len(header))
+    for row in run(iterations):
+        print(
+            f"{row['scenario']:<30} {row['mode']:<9} "
+            f"{row['statements/save']:>10.2f} {row['bytes/save']:>11.1f} {row['us/save']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
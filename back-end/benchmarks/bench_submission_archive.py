@@ -0,0 +1,100 @@
+"""
+Benchmark: archivado de flag_submissions en segmentos comprimidos.
+
+Siembra una base SQLite con envíos repartidos en un año (el generador de
+``app/tests/query_plans.py``, el mismo que ``bench_submission_queries``),
+los archiva todos y mide el tiempo del job, el tamaño en disco frente al
+de las filas en JSON y el tiempo de las consultas por usuario y por CTF
+sobre el archivo.
+
+Uso (desde back-end/):
+    SECRET_KEY=... python -m benchmarks.bench_submission_archive [filas]
+"""
+
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.infrastructure.archive import SubmissionArchive
+from app.infrastructure.persistence.base import Base
+from app.infrastructure.persistence.models import FlagSubmissionModel
+from app.infrastructure.persistence.submission_retention import SubmissionRetention
+from app.tests.query_plans import seed
+
+
+def _json_size(session) -> int:
+    """Bytes de las filas serializadas en JSON (referencia sin comprimir)."""
+    table = FlagSubmissionModel.__table__
+    return sum(
+        len(json.dumps({**row, "submitted_at": row["submitted_at"].isoformat()}))
+        for row in session.execute(select(table)).mappings()
+    )
+
+
+def run(rows: int, repeat: int = 20):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    sample = seed(session, rows)
+    raw_bytes = _json_size(session)
+
+    with tempfile.TemporaryDirectory() as directory:
+        archive = SubmissionArchive(directory)
+        started = time.perf_counter()
+        # Todo el año sembrado queda por detrás del corte
+        days = (datetime.utcnow() - datetime(2026, 1, 2)).days
+        result = SubmissionRetention(session, archive).archive_older_than(days)
+        archive_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        compacted = archive.compact()
+        compact_s = time.perf_counter() - started
+        stats = archive.stats()
+
+        timings = {}
+        for name, call in (
+            ("usuario (50)", lambda: archive.scan(user_id=sample.user_id, limit=50)),
+            ("CTF (50)", lambda: archive.scan(ctf_id=sample.ctf_id, limit=50)),
+            ("CTF, un mes", lambda: archive.scan(ctf_id=sample.ctf_id, since=datetime(2025, 6, 1),
+                                                 until=datetime(2025, 7, 1), limit=1000)),
+        ):
+            started = time.perf_counter()
+            for _ in range(repeat):
+                call()
+            timings[name] = (time.perf_counter() - started) / repeat * 1000
+
+    session.close()
+    engine.dispose()
+    return {
+        "archived": result["archived"],
+        "archive_s": archive_s,
+        "compact_s": compact_s,
+        "segments": stats["segments"],
+        "compacted_segments": compacted["segments"],
+        "bytes": stats["bytes"],
+        "raw_bytes": raw_bytes,
+        "scan_ms": timings,
+    }
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    result = run(rows)
+    print(f"Archivados {result['archived']} envíos en {result['archive_s']:.1f}s "
+          f"(compactación de {result['compacted_segments']} segmentos: {result['compact_s']:.1f}s)")
+    print(f"Tamaño: {result['bytes'] / 1024 / 1024:.1f} MiB en {result['segments']} segmentos "
+          f"frente a {result['raw_bytes'] / 1024 / 1024:.1f} MiB en JSON "
+          f"(x{result['raw_bytes'] / max(result['bytes'], 1):.1f})")
+    print(f"{'consulta':<16} {'ms':>9}")
+    for name, ms in result["scan_ms"].items():
+        print(f"{name:<16} {ms:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark: exportación en streaming de flag_submissions.
+
+Siembra una base SQLite (reutiliza ``seed`` del harness de consultas),
+recorre la exportación completa en NDJSON y CSV y mide filas por segundo
+y, en otra pasada, el pico de memoria Python (tracemalloc), que no debe
+crecer con el número de filas.
+
+Uso (desde back-end/):
+    SECRET_KEY=... python -m benchmarks.bench_submission_export [filas]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.application.use_cases.export_submissions import ExportSubmissionsUseCase
+from app.infrastructure.persistence.base import Base
+from app.infrastructure.persistence.repositories import FlagSubmissionSqlRepository
+from app.tests.query_plans import seed
+
+
+def run(rows: int):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    seed(session, rows)
+    use_case = ExportSubmissionsUseCase(FlagSubmissionSqlRepository(session))
+
+    results = {}
+    for format in ("ndjson", "csv"):
+        started = time.perf_counter()
+        size = sum(len(chunk) for chunk in use_case.execute(format))
+        elapsed = time.perf_counter() - started
+        # Segunda pasada solo para la memoria (tracemalloc ralentiza)
+        tracemalloc.start()
+        for _ in use_case.execute(format):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[format] = (elapsed, size, peak)
+
+    session.close()
+    engine.dispose()
+    return results
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    for format, (elapsed, size, peak) in run(rows).items():
+        print(f"{format:<7} {rows} filas en {elapsed:.2f}s ({rows / elapsed:,.0f} filas/s), "
+              f"{size / 1e6:.1f} MB emitidos, pico de memoria {peak / 1e6:.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
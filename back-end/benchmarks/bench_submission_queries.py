@@ -0,0 +1,86 @@
+"""
+Benchmark de las consultas sobre flag_submissions.
+
+Siembra una base SQLite con muchos envíos (un millón por defecto), ejecuta
+cada consulta del repositorio de envíos, comprueba con EXPLAIN QUERY PLAN
+que ninguna recorre una tabla entera sin índice y mide cuánto tarda.
+
+Uso (desde back-end/):
+    SECRET_KEY=... python -m benchmarks.bench_submission_queries [filas] [--json tiempos.json]
+
+Sale con código 1 si alguna consulta hace un SCAN completo. La siembra y
+la comprobación de planes están en ``app/tests/query_plans.py``, que
+comparten los tests de planes con una base pequeña.
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Dict, List
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.infrastructure.persistence import models  # noqa: F401 - registra modelos
+from app.infrastructure.persistence.base import Base
+from app.infrastructure.persistence.repositories import FlagSubmissionSqlRepository
+from app.tests.query_plans import check_plans, explain, repository_queries, seed
+
+
+def run(rows: int, repeat: int = 20) -> List[Dict[str, object]]:
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    started = time.perf_counter()
+    sample = seed(session, rows)
+    session.execute(text("ANALYZE"))
+    print(f"Sembradas {rows} filas en {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+    scans = check_plans(session, sample)
+    repo = FlagSubmissionSqlRepository(session)
+    results = []
+    for name, call in repository_queries(repo, sample):
+        plan = [step for _, steps in explain(session, call) for step in steps]
+        started = time.perf_counter()
+        for _ in range(repeat):
+            call()
+        results.append({
+            "query": name,
+            "ms": (time.perf_counter() - started) / repeat * 1000,
+            "full_scans": scans[name],
+            "plan": plan,
+        })
+
+    session.close()
+    engine.dispose()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Planes y tiempos de las consultas de envíos.")
+    parser.add_argument("rows", nargs="?", type=int, default=1_000_000)
+    parser.add_argument("--json", dest="json_path", help="Guarda los resultados en este fichero")
+    args = parser.parse_args()
+
+    results = run(args.rows)
+    header = f"{'consulta':<30} {'ms':>9}  plan"
+    print(header)
+    print("-" * 80)
+    for row in results:
+        flag = "SCAN COMPLETO" if row["full_scans"] else "ok"
+        print(f"{row['query']:<30} {row['ms']:>9.3f}  {flag}")
+        for step in row["plan"]:
+            print(f"{'':<42}{step}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as output:
+            json.dump({"rows": args.rows, "results": results}, output, indent=2)
+
+    return 1 if any(row["full_scans"] for row in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""
+Script para exportar/importar el catálogo (CTFs, adjuntos y writeups) en JSONL.
+
+Uso:
+    # Exportar todo (o solo algunos tipos) a un fichero:
+    python bulk_catalog.py export catalogo.jsonl
+    python bulk_catalog.py export ctfs.jsonl --types ctf,attachment
+
+    # Importar (upsert por ID) en lotes de 200 filas por transacción:
+    python bulk_catalog.py import catalogo.jsonl --batch-size 200
+
+    # "-" usa stdout/stdin:
+    python bulk_catalog.py export - | gzip > catalogo.jsonl.gz
+
+Usa la configuración de la aplicación (DATABASE_URL, SECRET_KEY... desde .env).
+"""
+import argparse
+import sys
+from dotenv import load_dotenv
+
+# Cargar variables de entorno antes de importar la configuración
+load_dotenv()
+
+from app.core.database import SessionLocal
+from app.application.use_cases.bulk_catalog import (
+    RECORD_KINDS,
+    ExportCatalogUseCase,
+    ImportCatalogUseCase,
+)
+from app.domain.services.ctf_service import CTFService
+from app.infrastructure.persistence.repositories import (
+    AttachmentSqlRepository,
+    CTFSqlRepository,
+    WriteupSqlRepository,
+)
+
+
+def export_catalog(path: str, types: list) -> None:
+    """Escribe el catálogo en ``path`` línea a línea."""
+    db = SessionLocal()
+    output = sys.stdout if path == "-" else open(path, "w", encoding="utf-8")
+    try:
+        use_case = ExportCatalogUseCase(
+            CTFSqlRepository(db), WriteupSqlRepository(db), AttachmentSqlRepository(db)
+        )
+        count = 0
+        for line in use_case.execute(types):
+            output.write(line)
+            count += 1
+        print(f"✅ Exportados {count} registros", file=sys.stderr)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        db.close()
+
+
+def import_catalog(path: str, batch_size: int) -> int:
+    """Importa ``path`` y muestra el informe. Devuelve el código de salida."""
+    db = SessionLocal()
+    source = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    try:
+        ctf_repo = CTFSqlRepository(db)
+        use_case = ImportCatalogUseCase(
+            ctf_repo,
+            WriteupSqlRepository(db),
+            AttachmentSqlRepository(db),
+            CTFService(ctf_repo),
+            batch_size=batch_size,
+        )
+        report = use_case.execute(source)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        db.close()
+
+    print(f"✅ Procesados: {report.processed}")
+    print(f"   Creados: {report.created}")
+    print(f"   Actualizados: {report.updated}")
+    if report.failed:
+        print(f"❌ Fallidos: {report.failed}")
+        for error in report.errors:
+            print(f"   línea {error.line}: {error.error}")
+        return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Importa/exporta el catálogo en JSONL.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Exporta el catálogo")
+    export_parser.add_argument("path", help="Fichero de salida ('-' para stdout)")
+    export_parser.add_argument(
+        "--types",
+        default=",".join(RECORD_KINDS),
+        help="Tipos separados por coma (por defecto: %(default)s)",
+    )
+
+    import_parser = subparsers.add_parser("import", help="Importa un fichero JSONL")
+    import_parser.add_argument("path", help="Fichero de entrada ('-' para stdin)")
+    import_parser.add_argument("--batch-size", type=int, default=100, help="Filas por transacción")
+
+    args = parser.parse_args()
+
+    if args.command == "export":
+        types = [t.strip() for t in args.types.split(",") if t.strip()]
+        unknown = set(types) - set(RECORD_KINDS)
+        if unknown:
+            parser.error(f"tipos desconocidos: {', '.join(sorted(unknown))}")
+        export_catalog(args.path, types)
+        return 0
+
+    if args.batch_size < 1:
+        parser.error("--batch-size debe ser positivo")
+    return import_catalog(args.path, args.batch_size)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""
+Job de reconciliación de puntuaciones (user_scores) contra ctf_solves.
+
+Uso:
+    # Solo informar de las diferencias (código de salida 1 si las hay):
+    python reconcile_scores.py
+
+    # Corregirlas:
+    python reconcile_scores.py --repair
+
+Pensado para ejecutarse periódicamente (cron). Usa la configuración de la
+aplicación (DATABASE_URL, SECRET_KEY... desde .env).
+"""
+import argparse
+import sys
+from dotenv import load_dotenv
+
+# Cargar variables de entorno antes de importar la configuración
+load_dotenv()
+
+from app.core.database import SessionLocal
+from app.infrastructure.persistence.user_scores import UserScoreLedger
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Reconcilia user_scores con los solves.")
+    parser.add_argument("--repair", action="store_true", help="Corrige las diferencias encontradas")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        result = UserScoreLedger(db).reconcile(repair=args.repair)
+    finally:
+        db.close()
+
+    print(f"Usuarios revisados: {result['checked']}")
+    if result["consistent"]:
+        print("✅ user_scores es consistente")
+        return 0
+
+    print(f"❌ Diferencias: {result['mismatched']}")
+    for user_id, difference in result["differences"].items():
+        print(f"   {user_id}: {difference['stored']} -> {difference['actual']}")
+    if result["repaired"]:
+        print("✅ Corregidas (los workers recargan el ranking al vencer su TTL)")
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -61,6 +61,17 @@ else
     log_warn "Uploads backup failed or volume empty"
 fi
 
+# Backup archived flag submissions (segments are immutable once written)
+log_info "Backing up submission archive..."
+if docker run --rm \
+    -v portfolio_archive_data:/data:ro \
+    -v "$BACKUP_DIR":/backup \
+    alpine tar -cf /backup/archive_$DATE.tar -C /data . 2>/dev/null; then
+    log_info "Archive backup completed: archive_$DATE.tar"
+else
+    log_warn "Archive backup failed or volume empty"
+fi
+
 # Backup Redis (optional)
 log_info "Backing up Redis..."
 if docker compose -f "$COMPOSE_FILE" exec -T redis redis-cli -a "${REDIS_PASSWORD}" BGSAVE 2>/dev/null; then